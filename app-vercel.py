@@ -1,21 +1,40 @@
 from flask import Flask, render_template, request, jsonify, send_file
 import json
 import os
-import openai
+import sys
 from datetime import datetime
 import re
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from snapshot import load_snapshot
+from template_service import get_template_service
+from ai_scheduler import INTERACTIVE, get_scheduler
+from openai_pool import shared_client
+from model_routing import resolve_route, complete_with_fallback
+from token_budget import compact_prompt, dedupe_fields, get_token_budget
+
 app = Flask(__name__)
 
-# Load configuration
-with open('config/ai-prompts.json', 'r') as f:
-    AI_PROMPTS = json.load(f)
+# Load configuration: a single import of the prebuilt snapshot on cold start,
+# falling back to parsing the JSON files when it is missing or stale
+SNAPSHOT = load_snapshot()
+if SNAPSHOT is not None:
+    AI_PROMPTS = SNAPSHOT.CONFIGS['ai-prompts.json']
+    COMPANY_INFO = SNAPSHOT.CONFIGS['company-info.json']
+    JOB_ROLES = SNAPSHOT.CONFIGS['job-roles.json']
+else:
+    with open('config/ai-prompts.json', 'r') as f:
+        AI_PROMPTS = json.load(f)
+
+    with open('config/company-info.json', 'r') as f:
+        COMPANY_INFO = json.load(f)
 
-with open('config/company-info.json', 'r') as f:
-    COMPANY_INFO = json.load(f)
+    with open('config/job-roles.json', 'r') as f:
+        JOB_ROLES = json.load(f)
 
-with open('config/job-roles.json', 'r') as f:
-    JOB_ROLES = json.load(f)
+# Template sources come from the shared service (snapshot when templates/ is not deployed)
+TEMPLATES = get_template_service('templates')
 
 # Load templates
 def load_template(template_name):
@@ -26,13 +45,7 @@ def load_template(template_name):
     }
     
     template_filename = template_mapping.get(template_name, f'{template_name}.md')
-    template_path = f'templates/{template_filename}'
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        return f.read()
-
-# Initialize OpenAI client
-openai.api_key = os.getenv('OPENAI_API_KEY')
+    return TEMPLATES.get_source(template_filename)
 
 # Demo mode - if no API key, use sample data
 DEMO_MODE = not bool(os.getenv('OPENAI_API_KEY'))
@@ -88,39 +101,49 @@ def generate_document_content(template_content, employee_data, document_type):
             focus_areas=employee_data.get('focusAreas', 'various areas')
         )
     
-    full_prompt = f"""
-    {prompt}
-    
-    Please use the following template structure and fill in the placeholders with the provided employee data:
-    
-    {template_content}
-    
-    Employee Data:
-    - Name: {employee_data['employeeName']}
-    - Job Title: {employee_data['jobTitle']}
-    - Team: {employee_data['team']}
-    - Career Level: {employee_data['careerLevel']}
-    - Salary: {employee_data['salary']}
-    - Start Date: {employee_data['startDate']}
-    - Reporting To: {employee_data['reportingTo']}
-    - Work Location: {employee_data['workLocation']}
-    - Employee ID: {employee_data['employeeId']}
-    - Job Description: {employee_data['jobDescription']}
-    - Focus Areas: {employee_data.get('focusAreas', 'Various areas')}
-    
-    Generate a complete, professional document that fills in all the template placeholders with the provided data.
-    """
+    employee_block = dedupe_fields({
+        "Name": employee_data['employeeName'],
+        "Job Title": employee_data['jobTitle'],
+        "Team": employee_data['team'],
+        "Career Level": employee_data['careerLevel'],
+        "Salary": employee_data['salary'],
+        "Start Date": employee_data['startDate'],
+        "Reporting To": employee_data['reportingTo'],
+        "Work Location": employee_data['workLocation'],
+        "Employee ID": employee_data['employeeId'],
+        "Job Description": employee_data['jobDescription'],
+        "Focus Areas": employee_data.get('focusAreas', 'Various areas')
+    }, prompt)
+    full_prompt = "\n\n".join([
+        compact_prompt(prompt),
+        "Please use the following template structure and fill in the placeholders with the provided employee data:",
+        compact_prompt(template_content),
+        f"Employee Data:\n{employee_block}",
+        "Generate a complete, professional document that fills in all the template placeholders with the provided data."
+    ])
     
+    route = resolve_route(AI_PROMPTS, f"document.{document_type}")
+    max_tokens, content_tokens = get_token_budget().completion_budget(route, template_content)
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[
+        # Created on first use so cold starts that never call the API skip the openai import;
+        # a client that cannot be built (missing key, bad base URL) falls back to demo content
+        client = shared_client()
+        
+        def create(**kwargs):
+            # Queued in the process-wide scheduler as an interactive call, like app.py's requests
+            with get_scheduler().slot(INTERACTIVE):
+                return client.chat.completions.create(**kwargs)
+        
+        response = complete_with_fallback(
+            route,
+            create,
+            [
                 {"role": "system", "content": "You are an HR document generator. Generate professional, complete documents based on the provided template and employee data."},
                 {"role": "user", "content": full_prompt}
             ],
-            max_tokens=2000,
-            temperature=0.3
+            max_tokens=max_tokens
         )
+        get_token_budget().record(route.call_type, content_tokens, max_tokens, response)
         
         return response.choices[0].message.content.strip()
     except Exception as e:
@@ -1,30 +1,65 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, g, Response
 import json
 import os
+import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 import re
-from typing import Dict, Any
-try:
-    import openai
-    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-    openai_client = openai.OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
-except Exception:
-    openai_client = None
-from jinja2 import Environment, FileSystemLoader
+import uuid
+from typing import Dict, Any, Optional
+OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL') or None
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from metrics import REGISTRY, FALLBACKS, AI_CALLS_IN_FLIGHT, record_ai_call
+from ai_scheduler import BULK, INTERACTIVE, get_scheduler
+from cancellation import Cancelled, JobRegistry, disconnect_probe
+from config_service import get_config_service
+from openai_pool import shared_client
+from model_routing import resolve_route, complete_with_fallback
+from role_catalog import KPI_AREAS
+from role_warmup import ROLE_CACHE_FILENAME, RoleContentCache, WarmUp, config_fingerprint, role_combinations
+from template_service import get_template_service
+from token_budget import compact_prompt, dedupe_fields, get_token_budget
 
 app = Flask(__name__)
 
-# Load configuration
-with open('config/ai-prompts.json', 'r') as f:
-    AI_PROMPTS = json.load(f)
-with open('config/company-info.json', 'r') as f:
-    COMPANY_INFO = json.load(f)
-with open('config/job-roles.json', 'r') as f:
-    JOB_ROLES = json.load(f)
+# Request metrics (AI, fallback and cache metrics live in scripts/metrics.py)
+HTTP_REQUESTS = REGISTRY.counter(
+    "hr_http_requests_total", "HTTP requests by endpoint, method and status", ("endpoint", "method", "status"))
+HTTP_LATENCY = REGISTRY.histogram(
+    "hr_http_request_duration_seconds", "HTTP request latency by endpoint", ("endpoint",))
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "hr_http_requests_in_flight", "HTTP requests currently being served", ("endpoint",))
+DOCUMENT_LATENCY = REGISTRY.histogram(
+    "hr_document_generation_duration_seconds", "Time to generate one document by type", ("document_type",))
+
+# Configuration: parsed once (from the snapshot when current) and hot-reloaded
+# when a file in config/ changes; call CONFIG.current() per request
+CONFIG = get_config_service('config')
 
-# Jinja environment for fallback rendering
-jinja_env = Environment(loader=FileSystemLoader('templates'), autoescape=False, trim_blocks=True, lstrip_blocks=True)
+# 'slots' (default): the model returns only the free-text fields as JSON and the
+# template is rendered locally; 'full': the model rewrites the whole document
+AI_GENERATION_MODE = os.getenv('AI_GENERATION_MODE', 'slots')
+
+# Free-text template fields the model fills per document type, with guidance
+DOCUMENT_SLOTS = {
+    'contract': {
+        'job_description': "Two or three paragraphs describing the role and its key responsibilities, referring to the employee as 'the Employee'"
+    },
+    'roles-responsibilities': {
+        f'{area.lower()}_activities': f"Three Markdown bullet points ('- ...') of concrete, measurable {area} KPI activities"
+        for area in KPI_AREAS
+    },
+    'confirmation': {
+        'personal_note': "One short, warm paragraph addressed to the employee about their role and expected contributions"
+    }
+}
+
+# Shared template service: raw sources for prompts, compiled templates for fallback rendering
+TEMPLATES = get_template_service('templates')
 
 # Load templates
 def load_template(template_name):
@@ -37,97 +72,234 @@ def load_template(template_name):
     }
 
     template_filename = template_mapping.get(template_name, f'{template_name}.md')
-    template_path = f'templates/{template_filename}'
+    return TEMPLATES.get_source(template_filename)
+
+# The shared OpenAI client (and the openai package) is created on the first AI call
+_openai_client = None
 
-    with open(template_path, 'r', encoding='utf-8') as f:
-        return f.read()
+def get_openai_client():
+    global _openai_client, DEMO_MODE
+    if _openai_client is None and not DEMO_MODE:
+        try:
+            _openai_client = shared_client(OPENAI_API_KEY, OPENAI_BASE_URL)
+        except Exception as e:
+            print(f"OpenAI client unavailable, switching to demo mode: {e}")
+            DEMO_MODE = True
+            DEMO_MODE_GAUGE.set(1)
+    return _openai_client
 
-DEMO_MODE = openai_client is None
+DEMO_MODE = not OPENAI_API_KEY
+DEMO_MODE_GAUGE = REGISTRY.gauge("hr_demo_mode", "1 when the app runs without an OpenAI client")
+DEMO_MODE_GAUGE.set(1 if DEMO_MODE else 0)
 
-def generate_document_content(template_content, employee_data, document_type):
+def generate_document_content(template_content, employee_data, document_type, cancel=None):
     """Generate document content using OpenAI API or demo mode"""
     # If in demo mode, we won't use AI here (return None to trigger fallback)
     if DEMO_MODE:
         return None
     
     # Prepare the prompt based on document type
+    ai_prompts = CONFIG.current().ai_prompts
     if document_type == 'contract':
-        prompt = AI_PROMPTS['contract_generation']['job_description'].format(
+        prompt = ai_prompts['contract_generation']['job_description'].format(
             role=employee_data['jobTitle'],
             company_name="Mereka",  # You can make this configurable
             team=employee_data['team'],
             responsibilities=employee_data['jobDescription']
         )
     elif document_type == 'confirmation':
-        prompt = AI_PROMPTS['confirmation_letter']['personalized'].format(
+        prompt = ai_prompts['confirmation_letter']['personalized'].format(
             employee_name=employee_data['employeeName'],
             role=employee_data['jobTitle'],
             company_name="Mereka"
         )
-    elif document_type == 'roles':
-        prompt = AI_PROMPTS['roles_responsibilities']['main_description'].format(
+    elif document_type in ('roles', 'roles-responsibilities'):
+        prompt = ai_prompts['roles_responsibilities']['main_description'].format(
             career_level=employee_data['careerLevel'],
             team=employee_data['team'],
             focus_areas=employee_data.get('focusAreas', 'various areas')
         )
     
-    # Add template context to the prompt
-    full_prompt = f"""
-    {prompt}
-    
-    Please use the following template structure and fill in the placeholders with the provided employee data:
-    
-    {template_content}
+    # Add template context to the prompt; employee fields the prompt already spells out are left out
+    employee_block = dedupe_fields({
+        "Name": employee_data['employeeName'],
+        "Job Title": employee_data['jobTitle'],
+        "Team": employee_data['team'],
+        "Career Level": employee_data['careerLevel'],
+        "Salary": employee_data['salary'],
+        "Start Date": employee_data['startDate'],
+        "Reporting To": employee_data['reportingTo'],
+        "Work Location": employee_data['workLocation'],
+        "Employee ID": employee_data['employeeId'],
+        "Job Description": employee_data['jobDescription'],
+        "Focus Areas": employee_data.get('focusAreas', 'Various areas')
+    }, prompt)
+    full_prompt = "\n\n".join([
+        compact_prompt(prompt),
+        "Please use the following template structure and fill in the placeholders with the provided employee data:",
+        compact_prompt(template_content),
+        f"Employee Data:\n{employee_block}",
+        "Generate a complete, professional document that fills in all the template placeholders with the provided data."
+    ])
     
-    Employee Data:
-    - Name: {employee_data['employeeName']}
-    - Job Title: {employee_data['jobTitle']}
-    - Team: {employee_data['team']}
-    - Career Level: {employee_data['careerLevel']}
-    - Salary: {employee_data['salary']}
-    - Start Date: {employee_data['startDate']}
-    - Reporting To: {employee_data['reportingTo']}
-    - Work Location: {employee_data['workLocation']}
-    - Employee ID: {employee_data['employeeId']}
-    - Job Description: {employee_data['jobDescription']}
-    - Focus Areas: {employee_data.get('focusAreas', 'Various areas')}
-    
-    Generate a complete, professional document that fills in all the template placeholders with the provided data.
-    """
+    openai_client = get_openai_client()
+    if openai_client is None:
+        return None
     
+    call_type = f"document.{document_type}"
+    route = resolve_route(CONFIG.current().ai_prompts, call_type)
+    # The reply is the filled-in template, so budget from the template's length
+    max_tokens, content_tokens = get_token_budget().completion_budget(route, template_content)
     try:
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
+        response = complete_with_fallback(
+            route,
+            routed_chat(openai_client, call_type, cancel),
+            [
                 {"role": "system", "content": "You are an HR document generator. Generate professional, complete documents based on the provided template and employee data."},
                 {"role": "user", "content": full_prompt}
             ],
-            max_tokens=2000,
-            temperature=0.3
+            max_tokens=max_tokens
         )
-
+        get_token_budget().record(call_type, content_tokens, max_tokens, response)
         return response.choices[0].message.content.strip()
     except Exception as e:
         print(f"OpenAI API error: {e}")
         return None
 
-def _normalize_kpis(kpi_breakdown: Dict[str, Any]) -> Dict[str, int]:
-    mapping = {"Vision": 0, "Delivery": 0, "Financial": 0, "Quality": 0, "LnD": 0, "ICO": 0}
-    for raw_key, val in (kpi_breakdown or {}).items():
-        key = raw_key.lower()
-        if "vision" in key:
-            mapping["Vision"] = val
-        elif "delivery" in key:
-            mapping["Delivery"] = val
-        elif "financial" in key or "fin" in key:
-            mapping["Financial"] = val
-        elif "quality" in key or "qua" in key:
-            mapping["Quality"] = val
-        elif "learning" in key or "lnd" in key:
-            mapping["LnD"] = val
-        elif "internal" in key or "ico" in key or "communications" in key:
-            mapping["ICO"] = val
-    return mapping
+def routed_chat(openai_client, call_type: str, cancel=None, priority: str = INTERACTIVE):
+    """One chat completion per call (``complete_with_fallback`` picks the model), with AI metrics
+
+    Web requests queue in the shared scheduler as ``interactive`` calls, ahead of any bulk work.
+    With a ``cancel`` token, a cancelled job stops waiting for its queued or in-flight call. An
+    abandoned call keeps its scheduler slot and in-flight count until its HTTP request really ends
+    (at the latest after the route's timeout), so cancelling cannot push concurrency past the limits.
+    """
+    def create(**kwargs):
+        model = kwargs.get('model', 'unknown')
+        scheduler = get_scheduler()
+        scheduler.acquire(priority, cancel)
+        AI_CALLS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+
+        def call():
+            try:
+                response = openai_client.chat.completions.create(**kwargs)
+            except Exception:
+                record_ai_call(call_type, model, time.perf_counter() - start, outcome="error")
+                raise
+            finally:
+                AI_CALLS_IN_FLIGHT.dec()
+                scheduler.release(priority)
+            record_ai_call(call_type, model, time.perf_counter() - start, usage=getattr(response, 'usage', None))
+            return response
+
+        return call() if cancel is None else cancel.run(call)
+    return create
+
+# Slots that depend only on career level and team, shared by every hire at that level
+ROLE_LEVEL_SLOTS = {'roles-responsibilities'}
+
+_role_cache = None
+_role_cache_version = None
+
+def role_cache() -> RoleContentCache:
+    """Role-level slots persisted in ``HR_ROLE_CACHE_FILE`` (shared with the CLI's role cache) for the current config"""
+    global _role_cache, _role_cache_version
+    config = CONFIG.current()
+    if _role_cache is None or _role_cache_version != config.version:
+        path = os.getenv('HR_ROLE_CACHE_FILE', os.path.join('output', ROLE_CACHE_FILENAME))
+        _role_cache = RoleContentCache(path, config_fingerprint(config.ai_prompts, config.job_roles))
+        _role_cache_version = config.version
+    return _role_cache
+
+def generate_document_slots(employee_data: Dict[str, Any], document_type: str,
+                            context: Dict[str, Any], cancel=None,
+                            priority: str = INTERACTIVE) -> Optional[Dict[str, str]]:
+    """Ask the model for just the document's free-text slots (as JSON); None on demo mode or failure"""
+    slots = DOCUMENT_SLOTS.get(document_type)
+    if DEMO_MODE or not slots:
+        return None
+    
+    role_key = None
+    if document_type in ROLE_LEVEL_SLOTS:
+        role_key = (f"slots.{document_type}", employee_data['careerLevel'], employee_data['team'])
+        cached = role_cache().get(role_key)
+        if cached is not None:
+            return dict(cached)
+    
+    ai_prompts = CONFIG.current().ai_prompts
+    company_name = context['company'].get('name', 'the company')
+    if document_type == 'contract':
+        prompt = ai_prompts['contract_generation']['job_description'].format(
+            role=employee_data['jobTitle'],
+            company_name=company_name,
+            team=employee_data['team'],
+            responsibilities=employee_data['jobDescription']
+        )
+    elif document_type == 'roles-responsibilities':
+        prompt = ai_prompts['roles_responsibilities']['kpi_breakdown'].format(
+            kpi_breakdown=", ".join(f"{area} {pct}%" for area, pct in context['kpi_breakdown'].items())
+        ) + f" The role is a {employee_data['careerLevel']} in the {employee_data['team']} team."
+    else:
+        prompt = ai_prompts['confirmation_letter']['personalized'].format(
+            employee_name=employee_data['employeeName'],
+            role=employee_data['jobTitle'],
+            company_name=company_name
+        )
+    fields = "\n".join(f"- {name}: {guidance}" for name, guidance in slots.items())
+    
+    openai_client = get_openai_client()
+    if openai_client is None:
+        return None
+    
+    call_type = f"slots.{document_type}"
+    try:
+        # A truncated, unparseable or empty reply escalates to the route's next model
+        response = complete_with_fallback(
+            resolve_route(ai_prompts, call_type),
+            routed_chat(openai_client, call_type, cancel, priority),
+            [
+                {"role": "system", "content": "You write short passages for HR documents. The document layout is fixed; return only the requested fields as JSON."},
+                {"role": "user", "content": f"{prompt}\n\nReturn a JSON object with these string fields:\n{fields}"}
+            ],
+            accept=lambda r: _parse_slots(r, slots) is not None,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": f"{document_type.replace('-', '_')}_slots",
+                    "strict": True,
+                    "schema": {
+                        "type": "object",
+                        "properties": {name: {"type": "string"} for name in slots},
+                        "required": list(slots),
+                        "additionalProperties": False
+                    }
+                }
+            }
+        )
+    except Exception as e:
+        print(f"OpenAI API error: {e}")
+        return None
+    filled = _parse_slots(response, slots)
+    if role_key is not None and filled is not None:
+        role_cache().put(role_key, filled)
+    return filled
+
+def _parse_slots(response, slots: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """Slot values from a JSON reply; None if truncated, invalid or empty"""
+    choice = response.choices[0]
+    if choice.finish_reason == "length":
+        return None
+    try:
+        values = json.loads(choice.message.content or "{}")
+    except ValueError:
+        return None
+    if not isinstance(values, dict):
+        return None
+    # Unknown keys are dropped and missing ones keep the locally built defaults
+    filled = {name: value.strip() for name, value in values.items()
+              if name in slots and isinstance(value, str) and value.strip()}
+    return filled or None
 
 def _default_kpi_activities(area: str) -> str:
     fallback = {
@@ -165,6 +337,9 @@ def _default_kpi_activities(area: str) -> str:
     return "\n".join([f"- {a}" for a in fallback.get(area, ["Perform assigned duties"])])
 
 def build_employee_context(data: Dict[str, Any]) -> Dict[str, Any]:
+    config = CONFIG.current()
+    company_info = config.company_info
+
     # Convert date format
     start_date_iso = data['startDate']
     try:
@@ -178,17 +353,18 @@ def build_employee_context(data: Dict[str, Any]) -> Dict[str, Any]:
 
     career_level = data['careerLevel']
     team = data['team']
-    role_data = JOB_ROLES.get('career_levels', {}).get(career_level, JOB_ROLES.get('career_levels', {}).get('Associate', {}))
-    team_data = JOB_ROLES.get('teams', {}).get(team, {})
+    levels = config.role_catalog['career_levels']
+    role = levels.get(career_level, levels.get('Associate', {}))
+    team_focus_areas = config.role_catalog['teams'].get(team)
 
-    kpis = _normalize_kpis(role_data.get('kpi_breakdown', {}))
+    kpis = dict(role.get('kpi_breakdown', {}))
     activities = {k: _default_kpi_activities(k) for k in kpis.keys()}
 
-    focus_areas = data.get('focusAreas') or ", ".join(team_data.get('focus_areas', []))
+    focus_areas = data.get('focusAreas') or ", ".join(team_focus_areas or [])
     if isinstance(focus_areas, str):
         focus_areas_list = [x.strip() for x in focus_areas.split(',') if x.strip()]
     else:
-        focus_areas_list = team_data.get('focus_areas', [])
+        focus_areas_list = team_focus_areas or []
 
     return {
         'employee_name': data['employeeName'],
@@ -202,18 +378,18 @@ def build_employee_context(data: Dict[str, Any]) -> Dict[str, Any]:
         'contract_date': start_date,
         'reporting_to': data['reportingTo'],
         'work_location': data['workLocation'],
-        'contract_term': COMPANY_INFO.get('contract_terms', {}).get('default_duration', '1-year full time contract'),
-
-        'company': COMPANY_INFO['company'],
-        'working_hours': COMPANY_INFO['working_hours'],
-        'overtime_policy': COMPANY_INFO['overtime_policy'],
-        'leave_entitlements': COMPANY_INFO['leave_entitlements'],
-        'benefits': COMPANY_INFO['benefits'],
-        'core_values': COMPANY_INFO['core_values'],
-        'termination': COMPANY_INFO['termination'],
-
-        'role_responsibilities': role_data.get('responsibilities', []),
-        'team_focus_areas': team_data.get('focus_areas', focus_areas_list),
+        'contract_term': company_info.get('contract_terms', {}).get('default_duration', '1-year full time contract'),
+
+        'company': company_info['company'],
+        'working_hours': company_info['working_hours'],
+        'overtime_policy': company_info['overtime_policy'],
+        'leave_entitlements': company_info['leave_entitlements'],
+        'benefits': company_info['benefits'],
+        'core_values': company_info['core_values'],
+        'termination': company_info['termination'],
+
+        'role_responsibilities': role.get('responsibilities', []),
+        'team_focus_areas': team_focus_areas if team_focus_areas is not None else focus_areas_list,
         'job_description': data.get('jobDescription', ''),
         'kpi_breakdown': kpis,
         'vision_activities': activities.get('Vision', ''),
@@ -226,7 +402,7 @@ def build_employee_context(data: Dict[str, Any]) -> Dict[str, Any]:
         'confirmation_date': datetime.now().strftime('%d/%m/%Y'),
         'effective_date': start_date,
         'next_review_date': (dt + timedelta(days=90)).strftime('%d/%m/%Y'),
-        'key_responsibilities': role_data.get('responsibilities', [])[:5],
+        'key_responsibilities': role.get('key_responsibilities', []),
         'hr_contact': {
             'name': 'Alan Roy Antony',
             'title': 'Human Resources, Senior Associate',
@@ -236,15 +412,68 @@ def build_employee_context(data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 def render_template_with_context(template_name: str, context: Dict[str, Any]) -> str:
-    template = jinja_env.get_template(template_name)
-    return template.render(**context)
+    return TEMPLATES.render(template_name, **context)
+
+def _endpoint_label() -> str:
+    return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+@app.before_request
+def _start_request_metrics():
+    g.metrics_start = time.perf_counter()
+    g.metrics_endpoint = _endpoint_label()
+    HTTP_IN_FLIGHT.inc(endpoint=g.metrics_endpoint)
+
+@app.after_request
+def _record_request_metrics(response):
+    endpoint = g.get('metrics_endpoint', _endpoint_label())
+    HTTP_REQUESTS.inc(endpoint=endpoint, method=request.method, status=str(response.status_code))
+    if 'metrics_start' in g:
+        HTTP_LATENCY.observe(time.perf_counter() - g.metrics_start, endpoint=endpoint)
+    return response
+
+@app.teardown_request
+def _finish_request_metrics(exc):
+    if 'metrics_endpoint' in g:
+        HTTP_IN_FLIGHT.dec(endpoint=g.metrics_endpoint)
+
+@app.route('/metrics')
+def metrics():
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/')
 def index():
     return send_file('hr_interface.html')
 
+# Running /generate-documents requests, cancelled on disconnect, supersede or DELETE /jobs/<id>
+JOBS = JobRegistry()
+
 @app.route('/generate-documents', methods=['POST'])
 def generate_documents():
+    # The client may pick the job ID (X-Job-Id) so it can cancel before the response arrives
+    job_id = request.headers.get('X-Job-Id') or uuid.uuid4().hex
+    cancel = JOBS.start(job_id, request.headers.get('X-Session-Id'), disconnect_probe(request.environ))
+    try:
+        return _generate_documents(job_id, cancel)
+    except Cancelled as e:
+        return jsonify({'error': 'Generation cancelled', 'job_id': job_id, 'reason': e.reason}), 409
+    finally:
+        JOBS.finish(job_id)
+        if _role_cache is not None:
+            _role_cache.flush()
+
+@app.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    if not JOBS.cancel(job_id):
+        return jsonify({'error': f'No running job {job_id}'}), 404
+    return jsonify({'job_id': job_id, 'cancelled': True})
+
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job_beacon(job_id):
+    """Cancel sent with navigator.sendBeacon (POST only) when the page is closed"""
+    JOBS.cancel(job_id, reason="disconnect")
+    return ('', 204)
+
+def _generate_documents(job_id, cancel):
     try:
         data = request.json
         
@@ -262,21 +491,33 @@ def generate_documents():
         generated_documents = []
         
         for doc_type in data['documents']:
+            cancel.raise_if_cancelled()
             try:
+                document_start = time.perf_counter()
+                
                 # Determine actual template key/name
                 template_key = 'roles-responsibilities' if doc_type == 'roles' else doc_type
-                template_content = load_template(template_key)
-                
-                # Generate content using OpenAI
-                generated_content = generate_document_content(template_content, data, template_key)
 
                 # Build template context
                 context = build_employee_context(data)
 
-                if generated_content:
-                    final_content = generated_content
+                if AI_GENERATION_MODE == 'full':
+                    # Generate the whole document with OpenAI
+                    template_content = load_template(template_key)
+                    generated_content = generate_document_content(template_content, data, template_key, cancel)
+                    if generated_content:
+                        final_content = generated_content
+                    else:
+                        FALLBACKS.inc(reason="demo_mode" if DEMO_MODE else "ai_error")
+                        final_content = render_template_with_context(f"{template_key}.md", context)
                 else:
-                    final_content = render_template_with_context(f"{template_key}.md", context)
+                    # Fill the free-text slots with OpenAI and render the template locally
+                    slots = generate_document_slots(data, template_key, context, cancel)
+                    if slots is None:
+                        FALLBACKS.inc(reason="demo_mode" if DEMO_MODE else "ai_error")
+                    final_content = render_template_with_context(f"{template_key}.md", {**context, **(slots or {})})
+                
+                DOCUMENT_LATENCY.observe(time.perf_counter() - document_start, document_type=template_key)
 
                 # Create timestamp for filename
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -296,6 +537,7 @@ def generate_documents():
         
         return jsonify({
             'success': True,
+            'job_id': job_id,
             'documents': generated_documents
         })
         
@@ -315,6 +557,42 @@ def download_file(filename):
     except Exception as e:
         return jsonify({'error': f'Download error: {str(e)}'}), 500
 
+def warm_up_roles() -> WarmUp:
+    """Warm-up of the role-level slots for every career level and team, queued as bulk work"""
+    config = CONFIG.current()
+    levels = config.role_catalog['career_levels']
+    tasks = []
+    for career_level, team in role_combinations(config.job_roles):
+        employee_data = {'careerLevel': career_level, 'team': team}
+        context = {'company': config.company_info['company'],
+                   'kpi_breakdown': dict(levels.get(career_level, {}).get('kpi_breakdown', {}))}
+        for document_type in ROLE_LEVEL_SLOTS:
+            def warm(employee_data=employee_data, document_type=document_type, context=context):
+                return generate_document_slots(employee_data, document_type, context, priority=BULK)
+            tasks.append((f"{career_level} / {team} / {document_type}", warm))
+    return WarmUp(tasks, workers=get_scheduler().bulk_slots, on_done=lambda: role_cache().flush())
+
+# HR_WARMUP=1 pre-generates role-level content in the background at startup; /health/ready reports when it is done
+WARMUP = warm_up_roles().start() if os.getenv('HR_WARMUP', '').lower() in ('1', 'true', 'yes') and not DEMO_MODE else None
+
+def _health() -> Dict[str, Any]:
+    return {
+        'status': 'ok',
+        'ready': WARMUP is None or WARMUP.ready,
+        'demo_mode': DEMO_MODE,
+        'warmup': WARMUP.status() if WARMUP is not None else {'status': 'disabled'},
+        'active_jobs': JOBS.active()
+    }
+
+@app.route('/health')
+def health():
+    return jsonify(_health())
+
+@app.route('/health/ready')
+def readiness():
+    report = _health()
+    return jsonify(report), 200 if report['ready'] else 503
+
 if __name__ == '__main__':
     # Check if OpenAI API key is set
     if not os.getenv('OPENAI_API_KEY'):
@@ -5,57 +5,130 @@ Integrates with OpenAI API to generate personalized content
 """
 
 import os
+import sys
 import json
+import time
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime, timedelta
-import openai
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import AI_CALLS_IN_FLIGHT, FALLBACKS, record_ai_call, record_cache
+from ai_scheduler import BULK, get_scheduler
+from config_service import get_config_service
+from openai_pool import shared_client
+from role_warmup import FallbackText
+from similarity_cache import DEFAULT_THRESHOLD, SimilarityIndex
+from markdown_sections import split_sections, split_padding, has_text
+from model_routing import Route, resolve_route, complete_with_fallback, response_text
+from token_budget import estimate_tokens, fit_context, get_token_budget
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Used when config/ai-prompts.json is missing
+FALLBACK_PROMPTS = {
+    "contract_generation": {
+        "job_description": "Generate a detailed job description for a {role} position."
+    },
+    "roles_responsibilities": {
+        "kpi_breakdown": "Create KPI activities for {kpi_breakdown}."
+    },
+    "content_improvement": {
+        "professional_tone": "Improve the professional tone."
+    },
+    "validation": {
+        "legal_compliance": "Review for legal compliance."
+    }
+}
+
+# Approximate USD prices per 1K tokens (prompt, completion) for cost estimates
+MODEL_PRICING = {
+    "gpt-4": (0.03, 0.06),
+    "gpt-4o": (0.0025, 0.01),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-3.5-turbo": (0.0005, 0.0015)
+}
+
+# Section-level rewrites: cache size (completion budgets come from the token budget planner)
+SECTION_CACHE_SIZE = 2048
+
+# Shortest job description accepted before escalating to the next model in the route
+MIN_JOB_DESCRIPTION_CHARS = 50
+
+_env_loaded = False
+
+def _load_environment() -> None:
+    """Load .env once, on first use rather than at import time"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
 class AIHelper:
     """AI-powered content generation helper for HR documents"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize AI helper with OpenAI API key"""
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, priority: str = BULK):
+        """Initialize AI helper with OpenAI API key and optional base URL (e.g. a local fake server)
+
+        Calls are queued in the process-wide scheduler under ``priority``
+        (``bulk`` for batch generation, ``interactive`` for web requests).
+        """
+        _load_environment()
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         if not self.api_key:
             # Make initialization optional; callers can detect disabled AI
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
 
-        # OpenAI v1 style client
-        self.client = openai.OpenAI(api_key=self.api_key)
+        # Shared OpenAI v1 client (one connection pool per process); OPENAI_BASE_URL points it at a compatible server
+        self.base_url = base_url or os.getenv('OPENAI_BASE_URL') or None
+        self.client = shared_client(self.api_key, self.base_url)
         
-        # Load AI prompts configuration
-        try:
-            with open('config/ai-prompts.json', 'r') as f:
-                self.prompts = json.load(f)
-        except FileNotFoundError:
+        self.priority = priority
+        self.scheduler = get_scheduler()
+        self.token_budget = get_token_budget()
+        
+        # Usage counters reported by get_usage_stats
+        self._usage_lock = threading.Lock()
+        self._usage = {"total_requests": 0, "failed_requests": 0, "prompt_tokens": 0,
+                       "completion_tokens": 0, "cost_estimate": 0.0}
+        
+        # Section rewrites run concurrently and are cached by content hash
+        self.section_workers = max(1, int(os.getenv('OPENAI_SECTION_CONCURRENCY', '4')))
+        self._section_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._section_cache_lock = threading.Lock()
+        
+        # Job descriptions reused for near-duplicate titles ("Mktg Associate"); HR_JD_SIMILARITY_THRESHOLD=off disables
+        threshold = os.getenv('HR_JD_SIMILARITY_THRESHOLD', str(DEFAULT_THRESHOLD))
+        self._job_descriptions = None if threshold.lower() == 'off' else SimilarityIndex(float(threshold))
+    
+    @property
+    def prompts(self) -> Dict[str, Any]:
+        """Current AI prompts from the shared config service (hot-reloaded)"""
+        prompts = get_config_service('config').current().ai_prompts
+        if not prompts:
             # Fallback prompts if file not found
-            self.prompts = {
-                "contract_generation": {
-                    "job_description": "Generate a detailed job description for a {role} position."
-                },
-                "roles_responsibilities": {
-                    "kpi_breakdown": "Create KPI activities for {kpi_breakdown}."
-                },
-                "content_improvement": {
-                    "professional_tone": "Improve the professional tone."
-                },
-                "validation": {
-                    "legal_compliance": "Review for legal compliance."
-                }
-            }
+            return FALLBACK_PROMPTS
+        return prompts
     
     def generate_job_description(self, role: str, team: str, career_level: str, 
                                 company_name: str, responsibilities: List[str]) -> str:
-        """Generate a detailed job description using AI"""
+        """Generate a detailed job description using AI (or reuse one generated for a near-identical title)"""
+        bucket = (team, career_level, company_name)
+        if self._job_descriptions is not None:
+            similar, score = self._job_descriptions.lookup(bucket, role, responsibilities)
+            record_cache("job_description_similarity", similar is not None)
+            if similar is not None:
+                logger.debug(f"Reusing job description for {role!r} (similarity {score:.2f})")
+                return similar
+        
         prompt = self.prompts['contract_generation']['job_description'].format(
             role=role,
             team=team,
@@ -64,18 +137,21 @@ class AIHelper:
         )
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
+            response = self._complete(
+                "job_description",
+                [
                     {"role": "system", "content": "You are an HR professional specializing in creating clear, professional job descriptions. Focus on practical, actionable responsibilities that align with the company's mission."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=500,
-                temperature=0.7
+                accept=lambda r: len(response_text(r)) >= MIN_JOB_DESCRIPTION_CHARS
             )
-            return response.choices[0].message.content.strip()
+            description = response.choices[0].message.content.strip()
+            if self._job_descriptions is not None:
+                self._job_descriptions.add(bucket, role, responsibilities, description)
+            return description
         except Exception as e:
             logger.error(f"Error generating job description: {e}")
+            FALLBACKS.inc(reason="ai_error")
             return self._get_fallback_job_description(role, team, career_level)
     
     def generate_kpi_activities(self, kpi_area: str, percentage: int, career_level: str) -> str:
@@ -85,41 +161,37 @@ class AIHelper:
         )
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
+            response = self._complete(
+                "kpi_activities",
+                [
                     {"role": "system", "content": "You are an HR professional creating specific, measurable KPI activities. Focus on actionable items that employees can track and achieve."},
                     {"role": "user", "content": prompt}
-                ],
-                max_tokens=300,
-                temperature=0.6
+                ]
             )
             return response.choices[0].message.content.strip()
         except Exception as e:
             logger.error(f"Error generating KPI activities: {e}")
+            FALLBACKS.inc(reason="ai_error")
             return self._get_fallback_kpi_activities(kpi_area, percentage)
     
     def enhance_content(self, content: str, enhancement_type: str = "professional_tone") -> str:
         """Enhance existing content using AI"""
+        return "".join(self.enhance_sections(split_sections(content), enhancement_type))
+    
+    def enhance_sections(self, sections: List[str], enhancement_type: str = "professional_tone") -> List[str]:
+        """Enhance already-split document sections (see ``markdown_sections.split_sections``)"""
         if enhancement_type not in self.prompts['content_improvement']:
-            return content
+            return list(sections)
         
         prompt = self.prompts['content_improvement'][enhancement_type]
         
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a professional document editor. Improve the given content while maintaining its formal and legal nature."},
-                    {"role": "user", "content": f"{prompt}\n\nContent to enhance:\n{content}"}
-                ],
-                max_tokens=1000,
-                temperature=0.5
-            )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Error enhancing content: {e}")
-            return content
+        return self._rewrite_sections(
+            "enhance_content", sections,
+            lambda section: [
+                {"role": "system", "content": "You are a professional document editor. Improve the given content while maintaining its formal and legal nature."},
+                {"role": "user", "content": f"{prompt}\n\nContent to enhance:\n{section}"}
+            ]
+        )
     
     def validate_document(self, document_content: str, document_type: str) -> Dict[str, Any]:
         """Validate document completeness and compliance"""
@@ -127,17 +199,21 @@ class AIHelper:
             return {"valid": True, "issues": [], "suggestions": []}
         
         prompt = self.prompts['validation'][document_type]
+        route = self.route("validate_document")
+        max_tokens, content_tokens = self.token_budget.completion_budget(route, document_content)
+        # Long documents are trimmed in the middle to fit the smallest context window in the route
+        document_content = fit_context(document_content, route, max_tokens + estimate_tokens(prompt) + 100)
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
+            response = self._complete(
+                "validate_document",
+                [
                     {"role": "system", "content": "You are a legal and HR compliance expert. Review documents for completeness, clarity, and legal compliance."},
                     {"role": "user", "content": f"{prompt}\n\nDocument to review:\n{document_content}"}
                 ],
-                max_tokens=800,
-                temperature=0.3
+                max_tokens=max_tokens
             )
+            self.token_budget.record("validate_document", content_tokens, max_tokens, response)
             
             # Parse the response to extract validation results
             validation_text = response.choices[0].message.content.strip()
@@ -164,24 +240,131 @@ class AIHelper:
     
     def generate_personalized_content(self, template_content: str, employee_data: Dict[str, Any]) -> str:
         """Generate personalized content based on employee data"""
+        return "".join(self.personalize_sections(split_sections(template_content), employee_data))
+    
+    def personalize_sections(self, sections: List[str], employee_data: Dict[str, Any]) -> List[str]:
+        """Personalize already-split document sections"""
+        name = employee_data.get('name', 'the employee')
+        return self._rewrite_sections(
+            "personalized_content", sections,
+            lambda section: [
+                {"role": "system", "content": "You are an HR professional creating personalized content. Adapt the template content to be specific to the employee while maintaining professionalism."},
+                {"role": "user", "content": f"Personalize this content for {name}:\n\n{section}"}
+            ]
+        )
+    
+    def _rewrite_sections(self, call_type: str, sections: List[str],
+                          build_messages: Callable[[str], List[Dict[str, str]]]) -> List[str]:
+        """Rewrite document sections concurrently, returning them in the same order
+        
+        Rewrites are cached by a hash of the request. A section whose call fails
+        or is truncated keeps its original text.
+        """
+        route = self.route(call_type)
+        results = list(sections)
+        pending = {}
+        for index, section in enumerate(sections):
+            lead, body, trail = split_padding(section)
+            if not has_text(body):
+                continue
+            messages = build_messages(body)
+            key = hashlib.sha256(json.dumps([call_type, route.models, route.temperature, messages]).encode('utf-8')).hexdigest()
+            with self._section_cache_lock:
+                cached = self._section_cache.get(key)
+                if cached is not None:
+                    self._section_cache.move_to_end(key)
+            record_cache("sections", cached is not None)
+            if cached is not None:
+                results[index] = lead + cached + trail
+            else:
+                pending[index] = (key, messages, body)
+        
+        def rewrite(item: tuple) -> Optional[str]:
+            key, messages, body = item
+            return self._rewrite_section(route, messages, body)
+        
+        if len(pending) == 1:
+            rewritten = {index: rewrite(item) for index, item in pending.items()}
+        elif pending:
+            with ThreadPoolExecutor(max_workers=min(self.section_workers, len(pending))) as pool:
+                rewritten = dict(zip(pending, pool.map(rewrite, pending.values())))
+        else:
+            rewritten = {}
+        
+        for index, text in rewritten.items():
+            if text is None:
+                continue
+            key = pending[index][0]
+            with self._section_cache_lock:
+                self._section_cache[key] = text
+                if len(self._section_cache) > SECTION_CACHE_SIZE:
+                    self._section_cache.popitem(last=False)
+            lead, _, trail = split_padding(sections[index])
+            results[index] = lead + text + trail
+        return results
+    
+    def _rewrite_section(self, route: Route, messages: List[Dict[str, str]], body: str) -> Optional[str]:
+        """One section rewrite, or None to keep the original text"""
+        # Budget the rewrite from the section's own length
+        max_tokens, content_tokens = self.token_budget.completion_budget(route, body)
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an HR professional creating personalized content. Adapt the template content to be specific to the employee while maintaining professionalism."},
-                    {"role": "user", "content": f"Personalize this content for {employee_data.get('name', 'the employee')}:\n\n{template_content}"}
-                ],
-                max_tokens=1000,
-                temperature=0.6
-            )
-            return response.choices[0].message.content.strip()
+            response = complete_with_fallback(route, self._chat_for(route.call_type), messages,
+                                              max_tokens=max_tokens)
         except Exception as e:
-            logger.error(f"Error generating personalized content: {e}")
-            return template_content
+            logger.error(f"Error in {route.call_type} for section: {e}")
+            FALLBACKS.inc(reason="ai_error")
+            return None
+        self.token_budget.record(route.call_type, content_tokens, max_tokens, response)
+        choice = response.choices[0]
+        text = (choice.message.content or "").strip()
+        if choice.finish_reason == "length" or not text:
+            # A truncated rewrite would cut the section short; keep the original
+            FALLBACKS.inc(reason="truncated")
+            return None
+        return text
+    
+    def route(self, call_type: str) -> Route:
+        """Model, budget and fallback chain for ``call_type`` from the ``model_routing`` config"""
+        return resolve_route(self.prompts, call_type)
+    
+    def _complete(self, call_type: str, messages: List[Dict[str, str]],
+                  accept: Optional[Callable[[Any], bool]] = None, **kwargs: Any) -> Any:
+        """Run a routed chat completion, escalating along the route's fallback chain"""
+        return complete_with_fallback(self.route(call_type), self._chat_for(call_type), messages, accept, **kwargs)
+    
+    def _chat_for(self, call_type: str) -> Callable[..., Any]:
+        return lambda **kwargs: self._chat(call_type, **kwargs)
+    
+    def _chat(self, call_type: str, **kwargs: Any) -> Any:
+        """Run one chat completion, recording latency, tokens and cost"""
+        model = kwargs.get('model', 'unknown')
+        start = time.perf_counter()
+        try:
+            with self.scheduler.slot(self.priority), AI_CALLS_IN_FLIGHT.track_inprogress():
+                response = self.client.chat.completions.create(**kwargs)
+        except Exception:
+            record_ai_call(call_type, model, time.perf_counter() - start, outcome="error")
+            with self._usage_lock:
+                self._usage["total_requests"] += 1
+                self._usage["failed_requests"] += 1
+            raise
+        
+        usage = getattr(response, 'usage', None)
+        record_ai_call(call_type, model, time.perf_counter() - start, usage=usage)
+        with self._usage_lock:
+            self._usage["total_requests"] += 1
+            if usage is not None:
+                prompt_tokens = usage.prompt_tokens or 0
+                completion_tokens = usage.completion_tokens or 0
+                prompt_price, completion_price = MODEL_PRICING.get(model, (0.0, 0.0))
+                self._usage["prompt_tokens"] += prompt_tokens
+                self._usage["completion_tokens"] += completion_tokens
+                self._usage["cost_estimate"] += (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000
+        return response
     
     def _get_fallback_job_description(self, role: str, team: str, career_level: str) -> str:
         """Fallback job description when AI generation fails"""
-        return f"The Employee will perform duties as a {role} in the {team} team at the {career_level} level. Responsibilities include supporting team objectives, contributing to project delivery, and maintaining professional standards."
+        return FallbackText(f"The Employee will perform duties as a {role} in the {team} team at the {career_level} level. Responsibilities include supporting team objectives, contributing to project delivery, and maintaining professional standards.")
     
     def _get_fallback_kpi_activities(self, kpi_area: str, percentage: int) -> str:
         """Fallback KPI activities when AI generation fails"""
@@ -218,18 +401,18 @@ class AIHelper:
             ]
         }
         
-        return "\n".join([f"- {activity}" for activity in activities.get(kpi_area, ["Perform assigned duties"])])
+        return FallbackText("\n".join(f"- {activity}" for activity in activities.get(kpi_area, ["Perform assigned duties"])))
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get API usage statistics"""
         try:
-            # This would require additional API calls to get usage data
-            # For now, return basic structure
-            return {
-                "total_requests": 0,
-                "tokens_used": 0,
-                "cost_estimate": 0.0
-            }
+            with self._usage_lock:
+                usage = dict(self._usage)
+            usage["tokens_used"] = usage["prompt_tokens"] + usage["completion_tokens"]
+            usage["cost_estimate"] = round(usage["cost_estimate"], 6)
+            if self._job_descriptions is not None:
+                usage["job_description_similarity"] = self._job_descriptions.stats()
+            return usage
         except Exception as e:
             logger.error(f"Error getting usage stats: {e}")
             return {"error": str(e)}
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+AI Call Scheduler for HR Document Generation
+Priority classes, weighted fair queueing and a bulk share cap in front of every OpenAI call
+"""
+
+import os
+import sys
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from cancellation import POLL_INTERVAL, CancelToken, Cancelled
+from metrics import AI_CANCELLED, AI_QUEUE_DEPTH, AI_QUEUE_WAIT
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, BULK)
+
+# Relative service rate of each class when both have calls queued
+DEFAULT_WEIGHTS = {INTERACTIVE: 8, BULK: 1}
+
+class _TokenBucket:
+    """Calls per minute with up to one second of burst (at least one call)"""
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        """Seconds until a call may start (0 when a token is available)"""
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+class _Ticket:
+    __slots__ = ("priority", "tag")
+
+    def __init__(self, priority: str, tag: float):
+        self.priority = priority
+        self.tag = tag
+
+class AIScheduler:
+    """Admission control for AI calls shared by everything in the process
+
+    Each call waits in its priority class's queue for a concurrency slot (and,
+    when ``rate_per_minute`` is set, a token from the rate budget). Queued calls
+    are granted in weighted-fair order: every call gets a virtual finish tag of
+    ``1 / weight`` past its class's previous one, and the smallest tag among the
+    class heads goes next, so interactive calls overtake a long bulk backlog
+    without starving it. Bulk calls are further capped at ``bulk_share`` of the
+    slots and of the rate budget; the rest stays free for interactive calls.
+    Because the bulk cap is a plain rate limit it also holds when the batch
+    runs in a different process on the same API key.
+    """
+
+    def __init__(self, max_concurrency: int = 8, rate_per_minute: Optional[float] = None,
+                 bulk_share: float = 0.5, weights: Optional[Dict[str, float]] = None):
+        if not 0 < bulk_share <= 1:
+            raise ValueError(f"bulk_share must be in (0, 1]: {bulk_share}")
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.bulk_share = bulk_share
+        self.bulk_slots = max(1, int(self.max_concurrency * bulk_share))
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self.rate_per_minute = rate_per_minute
+        self._budget = _TokenBucket(rate_per_minute) if rate_per_minute else None
+        self._bulk_budget = _TokenBucket(rate_per_minute * bulk_share) if rate_per_minute else None
+        self._cond = threading.Condition()
+        self._queues = {priority: deque() for priority in PRIORITIES}
+        self._finish = {priority: 0.0 for priority in PRIORITIES}
+        self._virtual_time = 0.0
+        self._in_flight = {priority: 0 for priority in PRIORITIES}
+
+    @classmethod
+    def from_env(cls) -> "AIScheduler":
+        """Scheduler configured from ``HR_AI_MAX_CONCURRENCY``, ``HR_AI_RATE_LIMIT`` and ``HR_AI_BULK_SHARE``"""
+        rate = os.getenv('HR_AI_RATE_LIMIT')
+        return cls(max_concurrency=int(os.getenv('HR_AI_MAX_CONCURRENCY', '8')),
+                   rate_per_minute=float(rate) if rate else None,
+                   bulk_share=float(os.getenv('HR_AI_BULK_SHARE', '0.5')))
+
+    def _delay(self, ticket: _Ticket) -> Optional[float]:
+        """0 when ``ticket`` is next; seconds to wait for rate tokens; None to wait for a release or grant"""
+        if sum(self._in_flight.values()) >= self.max_concurrency:
+            return None
+        budget_delay = self._budget.delay() if self._budget else 0.0
+        best, token_wait = None, None
+        for priority, queue in self._queues.items():
+            if not queue:
+                continue
+            head = queue[0]
+            delay = budget_delay
+            if priority == BULK:
+                if self._in_flight[BULK] >= self.bulk_slots:
+                    continue
+                if self._bulk_budget:
+                    delay = max(delay, self._bulk_budget.delay())
+            if delay > 0:
+                if head is ticket:
+                    token_wait = delay
+                continue
+            if best is None or head.tag < best.tag:
+                best = head
+        if best is ticket:
+            return 0.0
+        if best is not None:
+            # Another call is next; make sure it is awake to take its grant
+            self._cond.notify_all()
+        return token_wait
+
+    def acquire(self, priority: str = BULK, cancel: Optional[CancelToken] = None) -> float:
+        """Block until a call of ``priority`` may start; returns the seconds spent queued
+
+        A queued call whose ``cancel`` token fires leaves the queue and raises ``Cancelled``.
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority: {priority} (expected {', '.join(PRIORITIES)})")
+        start = time.perf_counter()
+        with self._cond:
+            tag = max(self._finish[priority], self._virtual_time) + 1.0 / self.weights[priority]
+            self._finish[priority] = tag
+            ticket = _Ticket(priority, tag)
+            self._queues[priority].append(ticket)
+            AI_QUEUE_DEPTH.inc(priority=priority)
+            try:
+                while True:
+                    delay = self._delay(ticket)
+                    if delay == 0:
+                        break
+                    if cancel is not None:
+                        if cancel.cancelled:
+                            AI_CANCELLED.inc(stage="queued")
+                            raise Cancelled(cancel.reason)
+                        delay = POLL_INTERVAL if delay is None else min(delay, POLL_INTERVAL)
+                    self._cond.wait(timeout=delay)
+            except BaseException:
+                self._queues[priority].remove(ticket)
+                AI_QUEUE_DEPTH.dec(priority=priority)
+                self._cond.notify_all()
+                raise
+            self._queues[priority].popleft()
+            AI_QUEUE_DEPTH.dec(priority=priority)
+            self._virtual_time = tag
+            self._in_flight[priority] += 1
+            if self._budget:
+                self._budget.take()
+            if priority == BULK and self._bulk_budget:
+                self._bulk_budget.take()
+            # The next head may be admissible too
+            self._cond.notify_all()
+        waited = time.perf_counter() - start
+        AI_QUEUE_WAIT.observe(waited, priority=priority)
+        return waited
+
+    def release(self, priority: str = BULK) -> None:
+        with self._cond:
+            self._in_flight[priority] -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority: str = BULK, cancel: Optional[CancelToken] = None):
+        """Hold a scheduler slot for one AI call"""
+        self.acquire(priority, cancel)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "bulk_slots": self.bulk_slots,
+                "rate_per_minute": self.rate_per_minute,
+                "in_flight": dict(self._in_flight),
+                "queued": {priority: len(queue) for priority, queue in self._queues.items()}
+            }
+
+_scheduler: Optional[AIScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> AIScheduler:
+    """Process-wide scheduler shared by the web app and every AIHelper"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = AIScheduler.from_env()
+    return _scheduler
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Batch Input Pre-flight for HR Document Generation
+Vectorized normalization and validation of the whole batch frame before any generation work
+"""
+
+import os
+import sys
+from typing import Dict, List, Any
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from document_rules import DATE_FORMAT, REVIEW_PERIOD_DAYS, SALARY_FORMAT
+from manifest import IDENTITY_FIELDS, employee_key
+
+CONTRACT_PERIOD_DAYS = 365
+
+# Columns generate_employee_data reads; missing ones are added empty so every check can run
+BATCH_COLUMNS = ('name', 'job_title', 'team', 'career_level', 'salary', 'start_date',
+                 'reporting_to', 'work_location', 'employee_id', 'job_description')
+
+class PreflightResult:
+    """Rows that passed pre-flight (normalized records) and every problem found in the rest"""
+
+    __slots__ = ("employees", "rejected", "rows")
+
+    def __init__(self, employees: List[Dict[str, Any]], rejected: List[Dict[str, Any]], rows: int):
+        self.employees = employees
+        self.rejected = rejected
+        self.rows = rows
+
+    @property
+    def issues(self) -> List[Dict[str, Any]]:
+        return [issue for row in self.rejected for issue in row['issues']]
+
+def preflight(df: Any, job_roles: Dict[str, Any]) -> PreflightResult:
+    """Normalize and validate a batch DataFrame (read with ``dtype=str``) in one vectorized pass
+
+    Strings are stripped and blank or NaN cells dropped from the records, so
+    generator defaults apply instead of the text "nan". Start dates are parsed
+    and re-formatted, and ``end_date``/``next_review_date`` are computed.
+    Rows are rejected for a missing name, an unparseable start date, a
+    career level or team not in ``job-roles.json``, a malformed or non-positive
+    salary, or an employee ID (storage key) shared with another row. Rejected
+    rows carry every issue found, with ``row`` as the CSV line number.
+    """
+    import pandas as pd
+
+    df = df.copy()
+    for column in BATCH_COLUMNS:
+        if column not in df.columns:
+            df[column] = pd.NA
+    for column in df.columns:
+        if df[column].dtype == object or pd.api.types.is_string_dtype(df[column]):
+            df[column] = df[column].str.strip().replace('', pd.NA)
+
+    problems = []
+
+    def flag(mask: Any, field: str, message: Any) -> None:
+        mask = mask.fillna(False).astype(bool)
+        if mask.any():
+            messages = message[mask] if isinstance(message, pd.Series) else pd.Series(message, index=df.index[mask])
+            problems.append(pd.DataFrame({'field': field, 'message': messages}, index=df.index[mask]))
+
+    flag(df['name'].isna(), 'name', "Name is required")
+
+    start = pd.to_datetime(df['start_date'], format=DATE_FORMAT, errors='coerce')
+    flag(df['start_date'].notna() & start.isna(), 'start_date',
+         "Start date is not DD/MM/YYYY: " + df['start_date'].astype(str))
+    parsed = start.notna()
+    df.loc[parsed, 'start_date'] = start[parsed].dt.strftime(DATE_FORMAT)
+    df.loc[parsed, 'end_date'] = (start[parsed] + pd.Timedelta(days=CONTRACT_PERIOD_DAYS)).dt.strftime(DATE_FORMAT)
+    df.loc[parsed, 'next_review_date'] = (start[parsed] + pd.Timedelta(days=REVIEW_PERIOD_DAYS)).dt.strftime(DATE_FORMAT)
+
+    for field, key in (('career_level', 'career_levels'), ('team', 'teams')):
+        known = list(job_roles.get(key, {}))
+        flag(df[field].notna() & ~df[field].isin(known), field,
+             f"Unknown {field.replace('_', ' ')} (expected one of {', '.join(known)}): " + df[field].astype(str))
+
+    amount = df['salary'].str.extract(SALARY_FORMAT, expand=False)
+    flag(df['salary'].notna() & amount.isna(), 'salary', "Unrecognised salary format: " + df['salary'].astype(str))
+    flag(pd.to_numeric(amount.str.replace(',', '', regex=False), errors='coerce') <= 0, 'salary',
+         "Salary is not positive: " + df['salary'].astype(str))
+
+    identity = df[['employee_id', 'name', *IDENTITY_FIELDS]].astype(object)
+    identity = identity.where(identity.notna(), None).to_dict('records')
+    keys = pd.Series([employee_key(row['employee_id'], row['name'] or '', row) for row in identity], index=df.index)
+    # Rows with neither an ID nor a name all fall back to the same key; they are rejected for the name alone
+    identified = df['employee_id'].notna() | df['name'].notna()
+    flag(identified & keys[identified].duplicated(keep=False).reindex(df.index, fill_value=False), 'employee_id',
+         "Duplicate employee ID (shared with another row): " + keys)
+
+    issues = pd.concat(problems) if problems else pd.DataFrame(columns=['field', 'message'])
+    bad = set(issues.index)
+    records = df.astype(object).where(df.notna(), None).to_dict('records')
+
+    employees, rejected = [], []
+    for index, record in zip(df.index, records):
+        record = {field: value for field, value in record.items() if value is not None}
+        if index not in bad:
+            employees.append(record)
+            continue
+        row = int(index) + 2  # header is line 1
+        found = issues.loc[[index]]
+        rejected.append({
+            'row': row,
+            'employee_info': record,
+            'issues': [{'row': row, 'employee': record.get('name'), 'field': field, 'message': message}
+                       for field, message in zip(found['field'], found['message'])]
+        })
+    return PreflightResult(employees, rejected, len(df))
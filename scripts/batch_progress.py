@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Batch Progress for HR Document Generation
+One batch-wide progress view (throughput, AI calls in flight, errors, ETA) as a Rich bar, JSON lines or nothing
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from typing import Dict, Any, Optional, TextIO
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import AI_CALLS_IN_FLIGHT
+
+PROGRESS_MODES = ("rich", "jsonl", "quiet")
+
+# Seconds between JSON progress lines (the final line is always written)
+DEFAULT_JSONL_INTERVAL = float(os.getenv('HR_PROGRESS_INTERVAL', '5'))
+
+class BatchProgress:
+    """Batch-wide counters; this base class displays nothing (``quiet`` mode)"""
+
+    def __init__(self, employees: int, documents_per_employee: int):
+        self.employees = employees
+        self.documents_per_employee = documents_per_employee
+        self.completed = 0
+        self.documents = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._started = None
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+
+    def advance(self, documents: int = 0, error: Optional[str] = None, employee: Optional[str] = None) -> None:
+        """Record one finished employee (``error`` set when it failed)"""
+        with self._lock:
+            self.completed += 1
+            self.documents += documents
+            if error is not None:
+                self.errors += 1
+
+    def stop(self) -> None:
+        pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters, rates and ETA"""
+        with self._lock:
+            completed, documents, errors = self.completed, self.documents, self.errors
+        elapsed = time.perf_counter() - self._started if self._started is not None else 0.0
+        employees_per_s = completed / elapsed if elapsed > 0 else 0.0
+        remaining = self.employees - completed
+        return {
+            "employees_done": completed,
+            "employees_total": self.employees,
+            "documents_done": documents,
+            "documents_total": self.employees * self.documents_per_employee,
+            "employees_per_s": round(employees_per_s, 3),
+            "documents_per_s": round(documents / elapsed, 3) if elapsed > 0 else 0.0,
+            "ai_calls_in_flight": int(AI_CALLS_IN_FLIGHT.value()),
+            "errors": errors,
+            "elapsed_s": round(elapsed, 1),
+            "eta_s": round(remaining / employees_per_s, 1) if employees_per_s > 0 else None
+        }
+
+    def __enter__(self) -> "BatchProgress":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+class JsonLinesProgress(BatchProgress):
+    """One JSON object per line: progress at most every ``interval`` seconds, each error, and a final line"""
+
+    def __init__(self, employees: int, documents_per_employee: int, stream: Optional[TextIO] = None,
+                 interval: float = DEFAULT_JSONL_INTERVAL):
+        super().__init__(employees, documents_per_employee)
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self._last = 0.0
+
+    def _emit(self, event: str, **extra: Any) -> None:
+        record = {"event": event, **self.snapshot(), **extra}
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
+
+    def start(self) -> None:
+        super().start()
+        self._last = self._started
+        self._emit("start")
+
+    def advance(self, documents: int = 0, error: Optional[str] = None, employee: Optional[str] = None) -> None:
+        super().advance(documents, error, employee)
+        if error is not None:
+            self._emit("error", employee=employee, error=error)
+        now = time.perf_counter()
+        if now - self._last >= self.interval:
+            self._last = now
+            self._emit("progress")
+
+    def stop(self) -> None:
+        self._emit("done")
+
+class RichProgress(BatchProgress):
+    """A single Rich progress bar with rates, AI calls in flight, errors and ETA"""
+
+    def __init__(self, employees: int, documents_per_employee: int, console: Any = None):
+        super().__init__(employees, documents_per_employee)
+        self.console = console
+        self._progress = None
+        self._task = None
+
+    def start(self) -> None:
+        from rich.progress import Progress, ProgressColumn, BarColumn, MofNCompleteColumn, TextColumn
+        from rich.text import Text
+
+        batch = self
+
+        class StatsColumn(ProgressColumn):
+            """Rates and ETA, read from the batch counters on every refresh"""
+
+            def render(self, task: Any) -> Text:
+                stats = batch.snapshot()
+                eta = "--" if stats["eta_s"] is None else f"{stats['eta_s']:.0f}s"
+                return Text(f"{stats['employees_per_s']:.2f} emp/s  {stats['documents_per_s']:.2f} docs/s  "
+                            f"AI in flight {stats['ai_calls_in_flight']}  errors {stats['errors']}  ETA {eta}")
+
+        super().start()
+        self._progress = Progress(TextColumn("[bold blue]Employees"), BarColumn(), MofNCompleteColumn(),
+                                  StatsColumn(), console=self.console)
+        self._task = self._progress.add_task("batch", total=self.employees)
+        self._progress.start()
+
+    def advance(self, documents: int = 0, error: Optional[str] = None, employee: Optional[str] = None) -> None:
+        super().advance(documents, error, employee)
+        if error is not None:
+            self._progress.console.print(f"[red]✗ {employee or 'Unknown'}: {error}[/red]")
+        self._progress.advance(self._task)
+
+    def stop(self) -> None:
+        if self._progress is not None:
+            self._progress.stop()
+
+def make_progress(mode: str, employees: int, documents_per_employee: int,
+                  console: Any = None, stream: Optional[TextIO] = None) -> BatchProgress:
+    """Progress display for ``mode`` (one of ``PROGRESS_MODES``)"""
+    if mode == "rich":
+        return RichProgress(employees, documents_per_employee, console)
+    if mode == "jsonl":
+        return JsonLinesProgress(employees, documents_per_employee, stream)
+    if mode == "quiet":
+        return BatchProgress(employees, documents_per_employee)
+    raise ValueError(f"Unknown progress mode: {mode} (expected {', '.join(PROGRESS_MODES)})")
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for HR Document Generation
+Times each pipeline stage against a deterministic stub AI backend and emits JSON
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import random
+import hashlib
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+import importlib.util
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+sys.path.append(str(SCRIPTS_DIR))
+
+DEFAULT_SIZES = [10, 100, 1000]
+TEMPLATES = ['contract.md', 'roles-responsibilities.md', 'confirmation.md']
+
+# Startup-sensitive entry points: (python arguments, modules that must stay unimported)
+STARTUP_TARGETS = {
+    "generate-documents --help": (
+        ["scripts/generate-documents.py", "--help"],
+        ["pandas", "jinja2", "rich", "openai", "dotenv", "weasyprint"]
+    ),
+    "pdf-converter --help": (
+        ["scripts/pdf-converter.py", "--help"],
+        ["markdown", "weasyprint", "rich"]
+    ),
+    "import ai_helper": (
+        ["-c", "import sys; sys.path.insert(0, 'scripts'); import ai_helper"],
+        ["openai", "dotenv"]
+    ),
+    "import app-vercel": (
+        ["-c", "import importlib.util as u; s = u.spec_from_file_location('app_vercel', 'app-vercel.py'); "
+               "s.loader.exec_module(u.module_from_spec(s))"],
+        ["openai"]
+    )
+}
+
+class StubAIHelper:
+    """Deterministic stand-in for AIHelper with configurable latency"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        """Initialize the stub; each call sleeps ``latency`` ± ``jitter`` seconds"""
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def _wait(self) -> None:
+        with self._lock:
+            self.calls += 1
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    @staticmethod
+    def _digest(*parts: Any) -> str:
+        return hashlib.sha1("|".join(str(p) for p in parts).encode('utf-8')).hexdigest()[:8]
+
+    def generate_job_description(self, role: str, team: str, career_level: str,
+                                 company_name: str, responsibilities: List[str]) -> str:
+        self._wait()
+        return (f"The Employee will perform duties as a {role} in the {team} team at the "
+                f"{career_level} level at {company_name}. [stub {self._digest(role, team, career_level)}]")
+
+    def generate_kpi_activities(self, kpi_area: str, percentage: int, career_level: str) -> str:
+        self._wait()
+        return "\n".join(f"- {kpi_area} activity {i} for {career_level} ({percentage}%)" for i in range(1, 4))
+
+    def enhance_content(self, content: str, enhancement_type: str = "professional_tone") -> str:
+        self._wait()
+        return content
+
+    def enhance_sections(self, sections: List[str], enhancement_type: str = "professional_tone") -> List[str]:
+        for _ in sections:
+            self._wait()
+        return list(sections)
+
+    def validate_document(self, document_content: str, document_type: str) -> Dict[str, Any]:
+        self._wait()
+        return {"valid": True, "issues": [], "suggestions": [], "review_text": "stub review"}
+
+    def generate_personalized_content(self, template_content: str, employee_data: Dict[str, Any]) -> str:
+        self._wait()
+        return template_content
+
+    def personalize_sections(self, sections: List[str], employee_data: Dict[str, Any]) -> List[str]:
+        for _ in sections:
+            self._wait()
+        return list(sections)
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        return {"total_requests": self.calls, "tokens_used": 0, "cost_estimate": 0.0}
+
+def load_script(filename: str, module_name: str):
+    """Import a hyphenated script from the scripts directory as a module"""
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+def summarize(durations: List[float], items: int = 0) -> Dict[str, Any]:
+    """Summarize a list of durations (seconds) as p50/p95 and throughput"""
+    total = sum(durations)
+    count = items or len(durations)
+    return {
+        "count": len(durations),
+        "total_s": round(total, 6),
+        "mean_ms": round(total / len(durations) * 1000, 3) if durations else 0.0,
+        "p50_ms": round(percentile(durations, 50) * 1000, 3),
+        "p95_ms": round(percentile(durations, 95) * 1000, 3),
+        "max_ms": round(max(durations) * 1000, 3) if durations else 0.0,
+        "throughput_per_s": round(count / total, 3) if total > 0 else None
+    }
+
+def timed(func: Callable, iterations: int) -> List[float]:
+    """Run ``func`` ``iterations`` times and return the individual durations"""
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+def synthetic_employees(count: int, job_roles: Dict[str, Any], seed: int = 0) -> List[Dict[str, Any]]:
+    """Build ``count`` deterministic employee rows covering every career level and team"""
+    rng = random.Random(seed)
+    levels = list(job_roles.get('career_levels', {})) or ['Associate']
+    teams = list(job_roles.get('teams', {})) or ['Mereka']
+    base_date = datetime(2025, 1, 1)
+    rows = []
+    for i in range(count):
+        level = levels[i % len(levels)]
+        team = teams[(i // len(levels)) % len(teams)]
+        rows.append({
+            'name': f"Bench Employee {i:05d}",
+            'job_title': f"{team} {level}",
+            'team': team,
+            'career_level': level,
+            'salary': f"RM {rng.randrange(3000, 12000, 100)}",
+            'start_date': (base_date + timedelta(days=i % 365)).strftime('%d/%m/%Y'),
+            'reporting_to': f"{team} Manager",
+            'work_location': 'Mereka PUBLIKA & Remotely',
+            'employee_id': f"BENCH{i:06d}"
+        })
+    return rows
+
+def write_csv(rows: List[Dict[str, Any]], path: Path) -> None:
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def measure_import_time(args: List[str]) -> Dict[str, Any]:
+    """Run ``python -X importtime <args>`` and summarize what was imported"""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=str(REPO_ROOT),
+                          capture_output=True, text=True)
+    wall = time.perf_counter() - start
+
+    modules: Dict[str, Dict[str, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = {
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2
+        }
+
+    top_level = sorted(((n, m) for n, m in modules.items() if m["depth"] == 0),
+                       key=lambda item: item[1]["cumulative_us"], reverse=True)
+    return {
+        "returncode": proc.returncode,
+        "wall_ms": round(wall * 1000, 3),
+        "import_ms": round(sum(m["self_us"] for m in modules.values()) / 1000, 3),
+        "module_count": len(modules),
+        "top_imports_ms": {n: round(m["cumulative_us"] / 1000, 3) for n, m in top_level[:10]},
+        "modules": sorted(modules)
+    }
+
+def run_startup_benchmarks() -> Dict[str, Any]:
+    """Import-time benchmark of the startup-sensitive entry points"""
+    results = {}
+    for name, (args, forbidden) in STARTUP_TARGETS.items():
+        measured = measure_import_time(args)
+        loaded = set(measured.pop("modules"))
+        measured["unexpected_imports"] = [m for m in forbidden if m in loaded]
+        results[name] = measured
+    return results
+
+def run_benchmarks(iterations: int = 50, sizes: Optional[List[int]] = None,
+                   ai_latency: float = 0.0, ai_jitter: float = 0.0, seed: int = 0) -> Dict[str, Any]:
+    """Run the stage and batch benchmarks and return the results as a dict"""
+    sizes = DEFAULT_SIZES if sizes is None else sizes
+    generator_module = load_script('generate-documents.py', 'generate_documents')
+    generator_module.console.quiet = True
+
+    results: Dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+            "ai_latency_s": ai_latency,
+            "ai_jitter_s": ai_jitter,
+            "seed": seed
+        },
+        "stages": {},
+        "batch": {}
+    }
+
+    with tempfile.TemporaryDirectory(prefix="hr-bench-") as tmp:
+        tmp_path = Path(tmp)
+
+        def make_generator(output_name: str):
+            generator = generator_module.HRDocumentGenerator(
+                config_dir=str(REPO_ROOT / 'config'),
+                templates_dir=str(REPO_ROOT / 'templates'),
+                output_dir=str(tmp_path / output_name)
+            )
+            generator.ai_helper = StubAIHelper(ai_latency, ai_jitter, seed)
+            generator.ai_enabled = True
+            return generator
+
+        generator = make_generator('stages')
+        employees = synthetic_employees(iterations, generator.job_roles, seed)
+        stages = results["stages"]
+
+        # Context build
+        contexts = []
+        stages["generate_employee_data"] = summarize(timed(
+            lambda: contexts.append(generator.generate_employee_data(employees[len(contexts)])), iterations))
+
+        # Template renders (no AI enhancement)
+        for name in TEMPLATES:
+            template = generator.templates.get_template(name)
+            index = iter(range(iterations))
+            stages[f"render.{name}"] = summarize(timed(
+                lambda: template.render(**contexts[next(index)]), iterations))
+
+        documents = {
+            'contract': generator.templates.get_template('contract.md').render(**contexts[0]),
+            'roles-responsibilities': generator.templates.get_template('roles-responsibilities.md').render(**contexts[0]),
+            'confirmation': generator.templates.get_template('confirmation.md').render(**contexts[0])
+        }
+
+        stages["validate_documents"] = summarize(timed(
+            lambda: generator.validate_documents(documents), iterations))
+
+        index = iter(range(iterations))
+        def save():
+            employee = employees[next(index)]
+            generator.save_documents(employee['name'], documents, employee_id=employee['employee_id'],
+                                     team=employee['team'], career_level=employee['career_level'])
+        stages["save_documents"] = summarize(timed(save, iterations))
+
+        # Markdown -> HTML -> PDF
+        try:
+            converter = load_script('pdf-converter.py', 'pdf_converter').PDFConverter()
+        except ImportError as e:
+            converter = None
+            stages["markdown_to_html"] = {"skipped": f"pdf-converter unavailable: {e}"}
+            stages["html_to_pdf"] = {"skipped": f"pdf-converter unavailable: {e}"}
+
+        if converter is not None:
+            stages["markdown_to_html"] = summarize(timed(
+                lambda: converter.markdown_to_html(documents['contract']), iterations))
+            html = converter.markdown_to_html(documents['contract'])
+            pdf_path = str(tmp_path / 'bench.pdf')
+            pdf_iterations = max(1, min(iterations, 5))
+            if converter.html_to_pdf(html, pdf_path):
+                stages["html_to_pdf"] = summarize(timed(
+                    lambda: converter.html_to_pdf(html, pdf_path), pdf_iterations))
+            else:
+                stages["html_to_pdf"] = {"skipped": "HTML to PDF conversion failed (is WeasyPrint installed?)"}
+
+        # End-to-end batch
+        for size in sizes:
+            rows = synthetic_employees(size, generator.job_roles, seed)
+            csv_path = tmp_path / f"batch_{size}.csv"
+            write_csv(rows, csv_path)
+            batch_generator = make_generator(f"batch_{size}")
+
+            start = time.perf_counter()
+            batch_results = batch_generator.generate_batch(str(csv_path), progress="quiet")
+            elapsed = time.perf_counter() - start
+
+            errors = sum(1 for r in batch_results if 'error' in r)
+            results["batch"][str(size)] = {
+                "employees": size,
+                "errors": errors,
+                "total_s": round(elapsed, 6),
+                "per_employee_ms": round(elapsed / size * 1000, 3) if size else 0.0,
+                "employees_per_s": round(size / elapsed, 3) if elapsed > 0 else None,
+                "ai_calls": batch_generator.ai_helper.calls
+            }
+
+    return results
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Benchmark the HR document generation pipeline')
+    parser.add_argument('--iterations', type=int, default=50, help='Iterations per stage benchmark')
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='Comma-separated batch sizes for the end-to-end benchmark')
+    parser.add_argument('--ai-latency', type=float, default=0.0, help='Stub AI latency per call (seconds)')
+    parser.add_argument('--ai-jitter', type=float, default=0.0, help='Stub AI latency jitter (seconds)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for synthetic data and jitter')
+    parser.add_argument('--skip-startup', action='store_true', help='Skip the -X importtime startup benchmark')
+    parser.add_argument('--output', help='Write JSON results to this file instead of stdout')
+
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+
+    results = run_benchmarks(args.iterations, sizes, args.ai_latency, args.ai_jitter, args.seed)
+    if not args.skip_startup:
+        results["startup"] = run_startup_benchmarks()
+    payload = json.dumps(results, indent=2)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Snapshot Builder
+Precompiles configs and templates into scripts/hr_snapshot.py for fast cold starts
+"""
+
+import os
+import sys
+import argparse
+import importlib.util
+
+# Add the scripts directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snapshot import SNAPSHOT_PATH, REPO_ROOT, stale_sources, write_snapshot
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Build the precompiled config and template snapshot')
+    parser.add_argument('--check', action='store_true',
+                        help='Exit with status 1 if the snapshot is missing or out of date instead of rebuilding')
+
+    args = parser.parse_args()
+
+    if args.check:
+        if not SNAPSHOT_PATH.exists():
+            print(f"Snapshot missing: {SNAPSHOT_PATH}. Run: python scripts/build-snapshot.py")
+            sys.exit(1)
+        spec = importlib.util.spec_from_file_location("hr_snapshot_check", SNAPSHOT_PATH)
+        snapshot = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(snapshot)
+        stale = stale_sources(snapshot, REPO_ROOT)
+        if stale:
+            print(f"Snapshot is stale ({', '.join(stale)} changed). Run: python scripts/build-snapshot.py")
+            sys.exit(1)
+        print(f"Snapshot is up to date: {SNAPSHOT_PATH}")
+        return
+
+    path = write_snapshot(REPO_ROOT, SNAPSHOT_PATH)
+    print(f"Snapshot written to {path}")
+
+if __name__ == "__main__":
+    main()
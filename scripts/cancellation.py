@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Request Cancellation for HR Document Generation
+Cancel tokens for web jobs, a registry for superseding and explicit cancels, and client-disconnect probes
+"""
+
+import os
+import sys
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, Optional, Callable
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import AI_CANCELLED, JOBS_CANCELLED
+
+# Seconds between cancellation checks while a call is queued or in flight
+POLL_INTERVAL = 0.1
+
+class Cancelled(BaseException):
+    """Raised inside cancelled work
+
+    Like ``asyncio.CancelledError`` this is not an ``Exception``, so the
+    ``except Exception`` fallbacks around AI calls let it through instead of
+    rendering a fallback document nobody will read.
+    """
+
+    def __init__(self, reason: str = "cancelled"):
+        super().__init__(reason)
+        self.reason = reason
+
+class CancelToken:
+    """Cancellation state of one job; ``probe`` reports a client disconnect when polled"""
+
+    def __init__(self, job_id: str, probe: Optional[Callable[[], bool]] = None):
+        self.job_id = job_id
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._probe = probe
+
+    def cancel(self, reason: str = "deleted") -> bool:
+        """Cancel the job; False if it was already cancelled"""
+        if self._event.is_set():
+            return False
+        self.reason = reason
+        self._event.set()
+        JOBS_CANCELLED.inc(reason=reason)
+        return True
+
+    @property
+    def cancelled(self) -> bool:
+        if not self._event.is_set() and self._probe is not None and self._probe():
+            self.cancel("disconnect")
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise Cancelled(self.reason)
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call ``func`` on the shared AI call threads and return its result, or raise ``Cancelled`` as soon as the job is
+
+        A started HTTP call cannot be aborted, so ``func`` always runs to
+        completion and must release what it holds (scheduler slot, in-flight
+        count) itself; only the caller stops waiting and its result is discarded.
+        """
+        future = _call_executor().submit(func, *args, **kwargs)
+        while not wait([future], timeout=POLL_INTERVAL).done:
+            if self.cancelled:
+                AI_CANCELLED.inc(stage="in_flight")
+                raise Cancelled(self.reason)
+        return future.result()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def _call_executor() -> ThreadPoolExecutor:
+    """Threads for cancellable AI calls, one per scheduler slot
+
+    Each call holds its slot until it really finishes, abandoned or not, so
+    ``max_concurrency`` threads are never all busy when a new call is submitted.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # Imported here: ai_scheduler imports this module
+                from ai_scheduler import get_scheduler
+                _executor = ThreadPoolExecutor(max_workers=get_scheduler().max_concurrency,
+                                               thread_name_prefix="ai-call")
+    return _executor
+
+class JobRegistry:
+    """Running web jobs by ID, with at most one job per session"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, CancelToken] = {}
+        self._sessions: Dict[str, str] = {}
+
+    def start(self, job_id: str, session: Optional[str] = None,
+              probe: Optional[Callable[[], bool]] = None) -> CancelToken:
+        """Register a job; a running job from the same session is cancelled as superseded"""
+        token = CancelToken(job_id, probe)
+        with self._lock:
+            previous = self._jobs.get(self._sessions.get(session)) if session else None
+            self._jobs[job_id] = token
+            if session:
+                self._sessions[session] = job_id
+        if previous is not None and previous.job_id != job_id:
+            previous.cancel("superseded")
+        return token
+
+    def cancel(self, job_id: str, reason: str = "deleted") -> bool:
+        """Cancel a running job; False if it is unknown or already finished"""
+        with self._lock:
+            token = self._jobs.get(job_id)
+        return token is not None and token.cancel(reason)
+
+    def finish(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            for session, current in list(self._sessions.items()):
+                if current == job_id:
+                    del self._sessions[session]
+
+    def active(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+def socket_disconnected(sock: Any) -> bool:
+    """True when the peer has closed ``sock`` (peeks without consuming; needs a server that exposes the socket)"""
+    try:
+        return sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT) == b""
+    except (BlockingIOError, InterruptedError):
+        return False
+    except OSError:
+        return True
+
+def disconnect_probe(environ: Dict[str, Any]) -> Optional[Callable[[], bool]]:
+    """Disconnect check for a WSGI request, if the server exposes the client socket (Werkzeug and gunicorn sync workers do)"""
+    sock = environ.get('gunicorn.socket') or environ.get('werkzeug.socket')
+    if sock is None or not hasattr(socket, 'MSG_DONTWAIT'):
+        return None
+    return lambda: socket_disconnected(sock)
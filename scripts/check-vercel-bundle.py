@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Vercel Bundle Check
+Imports app-vercel.py from only the files .vercelignore lets through, so a missing scripts/ module fails CI
+"""
+
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import posixpath
+import subprocess
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+def read_patterns(path: Path) -> List[Tuple[str, bool]]:
+    """``(pattern, negated)`` for each rule of an ignore file, in order"""
+    rules = []
+    for line in path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        negated = line.startswith('!')
+        rules.append((line[1:] if negated else line, negated))
+    return rules
+
+def _matches(pattern: str, path: str) -> bool:
+    """gitignore-style match of one pattern against a file path or any of its parent directories"""
+    dir_only = pattern.endswith('/')
+    pattern = pattern.strip('/')
+    anchored = '/' in pattern
+    parts = path.split('/')
+    candidates = ['/'.join(parts[:i]) for i in range(1, len(parts) + (0 if dir_only else 1))]
+    for candidate in candidates:
+        if fnmatch(candidate, pattern) if anchored else fnmatch(posixpath.basename(candidate), pattern):
+            return True
+    return False
+
+def ignored(path: str, rules: List[Tuple[str, bool]]) -> bool:
+    """Whether ``path`` is left out of the deployment (the last matching rule wins)"""
+    result = False
+    for pattern, negated in rules:
+        if _matches(pattern, path):
+            result = not negated
+    return result
+
+def bundle_files(root: Path) -> List[str]:
+    """Tracked files that Vercel would upload"""
+    tracked = subprocess.run(['git', 'ls-files'], cwd=str(root), capture_output=True, text=True, check=True)
+    rules = read_patterns(root / '.vercelignore')
+    return [path for path in tracked.stdout.splitlines() if not ignored(path, rules)]
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Import app-vercel.py using only the files .vercelignore keeps')
+    parser.add_argument('--list', action='store_true', help='Print the bundled files')
+
+    args = parser.parse_args()
+
+    files = bundle_files(REPO_ROOT)
+    if args.list:
+        print("\n".join(files))
+    with tempfile.TemporaryDirectory() as bundle:
+        for path in files:
+            target = Path(bundle, path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(REPO_ROOT / path, target)
+        env = {key: value for key, value in os.environ.items() if key not in ('OPENAI_API_KEY', 'PYTHONPATH')}
+        check = subprocess.run(
+            [sys.executable, '-c',
+             "import importlib.util as u; s = u.spec_from_file_location('app_vercel', 'app-vercel.py'); "
+             "s.loader.exec_module(u.module_from_spec(s))"],
+            cwd=bundle, env=env, capture_output=True, text=True)
+    if check.returncode != 0:
+        print(check.stderr.strip())
+        print(f"app-vercel.py does not import from the Vercel bundle ({len(files)} files); "
+              "re-include the missing module in .vercelignore")
+        sys.exit(1)
+    print(f"app-vercel.py imports from the Vercel bundle ({len(files)} files)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Cohort Planner for HR Document Generation
+Deduplicated AI work units, cost and time estimates, and dependency-ordered execution for a batch
+"""
+
+import os
+import sys
+import json
+import math
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from manifest import content_hash
+from markdown_sections import split_padding, has_text
+from metrics import AI_BUDGET_TOKENS, AI_CALL_DURATION, AI_TOKENS
+from model_routing import resolve_route
+from token_budget import CHARS_PER_TOKEN, get_token_budget
+
+try:
+    from ai_helper import MODEL_PRICING
+except ImportError:
+    MODEL_PRICING = {}
+
+logger = logging.getLogger(__name__)
+
+CALL_STATS_FILENAME = "ai-call-stats.json"
+
+# Estimates for call types with no recorded stats yet
+DEFAULT_LATENCY = 3.0
+DEFAULT_PROMPT_TOKENS = 150
+DEFAULT_COMPLETION_FILL = 0.6
+# Instructions wrapped around each section or document sent to the model
+PROMPT_OVERHEAD_TOKENS = 60
+
+def job_description_unit(job_title: str, team: str, career_level: str, company_name: str) -> tuple:
+    """Work-unit key of a generated job description"""
+    return ("job_description", job_title, team, career_level, company_name)
+
+def kpi_unit(area: str, percentage: int, career_level: str) -> tuple:
+    """Work-unit key of generated activities for one KPI area"""
+    return ("kpi_activities", area, percentage, career_level)
+
+class WorkUnit:
+    """One deduplicated AI call and the number of times the cohort asks for it"""
+
+    __slots__ = ("key", "call_type", "produce", "chars", "requests")
+
+    def __init__(self, key: tuple, call_type: str, produce: Optional[Callable[[], str]] = None, chars: int = 0):
+        self.key = key
+        self.call_type = call_type
+        self.produce = produce
+        self.chars = chars
+        self.requests = 0
+
+class CohortPlan:
+    """AI work and template renders for a whole batch, before anything is called
+
+    ``units`` are the context fields (job descriptions, KPI activities) every
+    document depends on; they run first. ``sections`` are the section rewrites
+    that remain after the boilerplate and section caches; they run per employee.
+    """
+
+    def __init__(self, employees: int, doc_types: List[str], review_rate: float = 0.0):
+        self.employees = employees
+        self.doc_types = doc_types
+        self.review_rate = review_rate
+        self.units: Dict[tuple, WorkUnit] = {}
+        self.sections: Dict[tuple, WorkUnit] = {}
+        # (call type, new section calls) per rendered document, in execution order
+        self.section_batches: List[tuple] = []
+        self.renders = 0
+        self.document_chars = 0
+        self.errors = 0
+        self.estimate: List[Dict[str, Any]] = []
+
+    @property
+    def ai_calls(self) -> int:
+        return len(self.units) + len(self.sections)
+
+    @property
+    def requested_calls(self) -> int:
+        """AI calls the cohort would make without deduplication"""
+        return sum(unit.requests for unit in self.units.values()) + \
+            sum(unit.requests for unit in self.sections.values())
+
+    def totals(self) -> Dict[str, Any]:
+        keys = ("calls", "requested", "prompt_tokens", "completion_tokens", "cost", "seconds")
+        return {key: sum(row[key] for row in self.estimate) for key in keys}
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "employees": self.employees,
+            "documents": self.doc_types,
+            "renders": self.renders,
+            "errors": self.errors,
+            "stages": self.estimate,
+            "total": self.totals()
+        }
+
+def _placeholder(key: tuple) -> str:
+    return f"[{key[0]} {content_hash(repr(key))[:12]}]"
+
+def build_plan(generator: Any, employees: List[Dict[str, Any]], rewrites: Dict[str, Optional[str]],
+               documents: Optional[List[str]] = None, review_rate: float = 0.0) -> CohortPlan:
+    """Collect the deduplicated AI work for ``employees`` without calling the model
+
+    Context fields are collected through ``generator.generate_employee_data``'s
+    ``ai_text`` hook; each unit keeps the first employee's producer so the plan
+    can be executed later, and units the generator already has cached (from
+    this run, an earlier one or a warm-up) are skipped. Documents are rendered
+    with a stable placeholder per unit, so two employees share a section
+    rewrite exactly when they would at run time. ``rewrites`` maps document
+    types to their content-improvement prompt (None for personalized documents).
+    """
+    doc_types = generator.document_types(documents)
+    fields = generator.required_fields(doc_types)
+    plan = CohortPlan(len(employees), doc_types, review_rate)
+
+    def collect(key: tuple, produce: Callable[[], str]) -> str:
+        # Units produced by an earlier run or warm-up cost nothing
+        cached = generator.cached_ai_text(key)
+        if cached is not None:
+            return cached
+        unit = plan.units.get(key)
+        if unit is None:
+            unit = plan.units[key] = WorkUnit(key, key[0], produce)
+        unit.requests += 1
+        return _placeholder(key)
+
+    for employee_info in employees:
+        try:
+            data = generator.generate_employee_data(employee_info, fields, collect)
+        except Exception as e:
+            # The same row fails when the plan runs; count it and move on
+            logger.warning(f"Planning skipped {employee_info.get('name', 'Unknown')}: {e}")
+            plan.errors += 1
+            continue
+        for doc_type in doc_types:
+            sections, invariant = generator.render_sections(doc_type, data)
+            plan.renders += 1
+            plan.document_chars += sum(len(section) for section in sections)
+            if not generator.ai_enabled:
+                continue
+            rewrite_key = rewrites.get(doc_type)
+            call_type = "enhance_content" if rewrite_key else "personalized_content"
+            new_calls = 0
+            for text, shared in zip(sections, invariant):
+                body = split_padding(text)[1]
+                if not has_text(body) or (shared and rewrite_key is None):
+                    continue
+                # Personalization prompts name the employee, so those never dedupe across people
+                owner = rewrite_key or data.get('employee_name')
+                key = (call_type, owner, content_hash(body))
+                unit = plan.sections.get(key)
+                if unit is None:
+                    unit = plan.sections[key] = WorkUnit(key, call_type, chars=len(body))
+                    new_calls += 1
+                unit.requests += 1
+            plan.section_batches.append((call_type, new_calls))
+    return plan
+
+def _per_call(call_type: str, prompts: Dict[str, Any], stats: Dict[str, Dict[str, float]],
+              chars: Optional[float] = None) -> Dict[str, float]:
+    """Expected latency and tokens of one call; text-sized calls (``chars``) scale with the text
+
+    The completion of a text-sized call follows the ratio the token budget
+    planner has learned for its call type (see ``TokenBudget.seed``).
+    """
+    route = resolve_route(prompts, call_type)
+    recorded = stats.get(call_type) or {}
+    calls = recorded.get("calls") or 0
+    latency = recorded["seconds"] / calls if calls else DEFAULT_LATENCY
+    if chars is not None:
+        content = chars / CHARS_PER_TOKEN
+        expected = get_token_budget().expected_completion(call_type, content)
+        prompt = content + PROMPT_OVERHEAD_TOKENS
+        completion = min(route.max_tokens, content if expected is None else expected)
+    elif calls:
+        prompt = recorded["prompt_tokens"] / calls
+        completion = recorded["completion_tokens"] / calls
+    else:
+        prompt = DEFAULT_PROMPT_TOKENS
+        completion = route.max_tokens * DEFAULT_COMPLETION_FILL
+    prompt_price, completion_price = MODEL_PRICING.get(route.model, (0.0, 0.0))
+    return {
+        "latency": latency,
+        "prompt_tokens": prompt,
+        "completion_tokens": completion,
+        "cost": (prompt * prompt_price + completion * completion_price) / 1000
+    }
+
+def estimate_plan(plan: CohortPlan, prompts: Dict[str, Any], stats: Dict[str, Dict[str, float]],
+                  workers: int = 4) -> List[Dict[str, Any]]:
+    """Fill ``plan.estimate`` with one row per stage and call type
+
+    Latency comes from recorded stats (see ``load_call_stats``) when available.
+    Context units run ``workers`` at a time; each document's section rewrites
+    run ``workers`` at a time, one document after another; AI reviews of a
+    ``review_rate`` sample run one at a time.
+    """
+    workers = max(1, workers)
+    rows = []
+
+    def add(stage: str, call_type: str, units: List[WorkUnit], seconds: float, sized: bool,
+            requested: Optional[float] = None) -> None:
+        per_call = [_per_call(call_type, prompts, stats, unit.chars if sized else None) for unit in units]
+        rows.append({
+            "stage": stage,
+            "call_type": call_type,
+            "calls": len(units),
+            "requested": sum(unit.requests for unit in units) if requested is None else requested,
+            "prompt_tokens": round(sum(call["prompt_tokens"] for call in per_call)),
+            "completion_tokens": round(sum(call["completion_tokens"] for call in per_call)),
+            "cost": round(sum(call["cost"] for call in per_call), 4),
+            "seconds": round(seconds, 1)
+        })
+
+    for call_type in sorted({unit.call_type for unit in plan.units.values()}):
+        units = [unit for unit in plan.units.values() if unit.call_type == call_type]
+        latency = _per_call(call_type, prompts, stats)["latency"]
+        add("context", call_type, units, math.ceil(len(units) / workers) * latency, sized=False)
+
+    for call_type in sorted({unit.call_type for unit in plan.sections.values()}):
+        units = [unit for unit in plan.sections.values() if unit.call_type == call_type]
+        latency = _per_call(call_type, prompts, stats)["latency"]
+        seconds = sum(math.ceil(n / workers) * latency for kind, n in plan.section_batches if kind == call_type)
+        add("sections", call_type, units, seconds, sized=True)
+
+    # Reviews only happen when AI is enabled, i.e. when the plan calls the model at all
+    reviews = plan.renders * plan.review_rate if plan.ai_calls else 0
+    if reviews:
+        mean_chars = plan.document_chars / plan.renders
+        sample = [WorkUnit(("validate_document", i), "validate_document", chars=mean_chars)
+                  for i in range(math.ceil(reviews))]
+        for unit in sample:
+            unit.requests = 1
+        latency = _per_call("validate_document", prompts, stats)["latency"]
+        add("review", "validate_document", sample, len(sample) * latency, sized=True, requested=len(sample))
+
+    plan.estimate = rows
+    return rows
+
+def run_units(generator: Any, plan: CohortPlan, workers: int = 4) -> int:
+    """Produce every context unit, ``workers`` at a time, into the generator's shared cache"""
+    units = list(plan.units.values())
+    if not units:
+        return 0
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(units)))) as pool:
+        list(pool.map(lambda unit: generator.ai_text(unit.key, unit.produce), units))
+    return len(units)
+
+def call_stats_snapshot() -> Dict[str, Dict[str, float]]:
+    """Per-call-type totals (successful calls, seconds, tokens, token budgets) recorded in this process so far"""
+    totals: Dict[str, Dict[str, float]] = {}
+    for labels, count, seconds in AI_CALL_DURATION.series():
+        if labels["outcome"] != "ok":
+            continue
+        entry = totals.setdefault(labels["call_type"],
+                                  {"calls": 0, "seconds": 0.0, "prompt_tokens": 0, "completion_tokens": 0})
+        entry["calls"] += count
+        entry["seconds"] += seconds
+    for labels, value in AI_TOKENS.series():
+        entry = totals.get(labels["call_type"])
+        if entry is not None:
+            entry[f"{labels['kind']}_tokens"] += value
+    for labels, value in AI_BUDGET_TOKENS.series():
+        entry = totals.get(labels["call_type"])
+        if entry is not None:
+            key = f"budget_{labels['kind']}_tokens"
+            entry[key] = entry.get(key, 0) + value
+    return totals
+
+def load_call_stats(path: Path) -> Dict[str, Dict[str, float]]:
+    """Recorded per-call-type totals from earlier runs ({} if none)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("call_types", {})
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable call stats {path}: {e}")
+        return {}
+
+def save_call_stats(path: Path, before: Dict[str, Dict[str, float]], after: Dict[str, Dict[str, float]]) -> None:
+    """Add the calls recorded between two snapshots to the stats file"""
+    stats = load_call_stats(path)
+    changed = False
+    for call_type, totals in after.items():
+        previous = before.get(call_type, {})
+        delta = {key: value - previous.get(key, 0) for key, value in totals.items()}
+        if delta["calls"] <= 0:
+            continue
+        entry = stats.setdefault(call_type, {key: 0 for key in delta})
+        for key, value in delta.items():
+            entry[key] = entry.get(key, 0) + value
+        changed = True
+    if not changed:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"updated_at": datetime.now().isoformat(timespec='seconds'), "call_types": stats}, f, indent=2)
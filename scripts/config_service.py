@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Config Service for HR Document Generation
+Process-wide cache of the parsed configs and derived indexes, hot-reloaded on mtime change
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from role_catalog import build_role_catalog
+from snapshot import CONFIG_FILES, REPO_ROOT, load_snapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECK_INTERVAL = float(os.getenv('HR_CONFIG_CHECK_INTERVAL', '2'))
+
+class ConfigVersion:
+    """One consistent set of configs plus the structures derived from them
+
+    Instances are never mutated; a reload builds a new one and swaps it in.
+    """
+
+    __slots__ = ("version", "configs", "mtimes", "role_catalog", "loaded_at")
+
+    def __init__(self, version: int, configs: Dict[str, Dict[str, Any]],
+                 mtimes: Dict[str, Optional[int]], role_catalog: Optional[Dict[str, Any]] = None):
+        self.version = version
+        self.configs = configs
+        self.mtimes = mtimes
+        self.role_catalog = role_catalog or build_role_catalog(configs.get('job-roles.json', {}))
+        self.loaded_at = time.time()
+
+    @property
+    def ai_prompts(self) -> Dict[str, Any]:
+        return self.configs.get('ai-prompts.json', {})
+
+    @property
+    def company_info(self) -> Dict[str, Any]:
+        return self.configs.get('company-info.json', {})
+
+    @property
+    def job_roles(self) -> Dict[str, Any]:
+        return self.configs.get('job-roles.json', {})
+
+class ConfigService:
+    """Serves the current ``ConfigVersion``, checking file mtimes at most once per ``check_interval``"""
+
+    def __init__(self, config_dir: str = "config", check_interval: float = DEFAULT_CHECK_INTERVAL):
+        self.config_dir = Path(config_dir).resolve()
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._checked = time.monotonic()
+        self._current = self._initial_version()
+
+    def _mtimes(self) -> Dict[str, Optional[int]]:
+        mtimes = {}
+        for name in CONFIG_FILES:
+            try:
+                mtimes[name] = (self.config_dir / name).stat().st_mtime_ns
+            except FileNotFoundError:
+                mtimes[name] = None
+        return mtimes
+
+    def _initial_version(self) -> ConfigVersion:
+        mtimes = self._mtimes()
+        if self.config_dir == (REPO_ROOT / "config").resolve():
+            snapshot = load_snapshot()
+            if snapshot is not None:
+                return ConfigVersion(1, dict(snapshot.CONFIGS), mtimes, snapshot.ROLE_CATALOG)
+        return ConfigVersion(1, self._read_all(mtimes, {}), mtimes)
+
+    def _read_all(self, mtimes: Dict[str, Optional[int]], previous: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Parse every config; files that are missing or invalid keep their previous contents"""
+        configs = {}
+        for name in CONFIG_FILES:
+            if mtimes.get(name) is None:
+                logger.error(f"Error loading config {name}: file not found")
+                configs[name] = previous.get(name, {})
+                continue
+            try:
+                with open(self.config_dir / name, 'r', encoding='utf-8') as f:
+                    configs[name] = json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading config {name}: {e}")
+                configs[name] = previous.get(name, {})
+        return configs
+
+    def current(self) -> ConfigVersion:
+        """The current configs, reloading them first if a file changed"""
+        now = time.monotonic()
+        if now - self._checked < self.check_interval:
+            return self._current
+        with self._lock:
+            if now - self._checked >= self.check_interval:
+                self.reload_if_changed()
+                self._checked = now
+        return self._current
+
+    def reload_if_changed(self) -> bool:
+        """Stat the config files and swap in a new version if any changed"""
+        current = self._current
+        mtimes = self._mtimes()
+        if mtimes == current.mtimes:
+            return False
+        changed = sorted(name for name in mtimes if mtimes[name] != current.mtimes.get(name))
+        new_version = ConfigVersion(current.version + 1, self._read_all(mtimes, current.configs), mtimes)
+        self._current = new_version
+        logger.info(f"Reloaded config version {new_version.version} ({', '.join(changed)} changed)")
+        return True
+
+_services: Dict[str, ConfigService] = {}
+_services_lock = threading.Lock()
+
+def get_config_service(config_dir: str = "config") -> ConfigService:
+    """Process-wide config service for ``config_dir``"""
+    key = str(Path(config_dir).resolve())
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = ConfigService(config_dir)
+        return service
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Rule-based Document Validation for HR Document Generation
+Fast local checks on rendered documents; AI review is an optional second tier
+"""
+
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+
+ERROR = "error"
+WARNING = "warning"
+
+DATE_FORMAT = "%d/%m/%Y"
+REVIEW_PERIOD_DAYS = 90
+
+# Accepted salary values, e.g. "RM 5,000" or "5000.00"; group 1 is the amount
+SALARY_FORMAT = r"^(?:RM|MYR|USD|SGD|\$)?\s?(\d{1,3}(?:,\d{3})+|\d+)(?:\.\d{1,2})?$"
+
+# Level-2 headings every rendered document of a type must contain
+REQUIRED_SECTIONS = {
+    'contract': (
+        "Job Specification",
+        "Job Description & Organization Strategic Area KPI",
+        "Role Expectations",
+        "Strategic Area KPI Breakdown",
+        "Working Hours",
+        "Remuneration & Payment Terms",
+        "Termination Clause",
+        "Leave Entitlement",
+        "Benefits",
+        "Confidentiality"
+    ),
+    'roles-responsibilities': (
+        "Role Overview",
+        "Strategic Area KPI Breakdown",
+        "Team-Specific Responsibilities",
+        "Performance Expectations"
+    ),
+    'confirmation': (
+        "Role Confirmation Details",
+        "Key Responsibilities",
+        "Next Steps",
+        "Contact Information"
+    )
+}
+
+KPI_SECTION = "Strategic Area KPI Breakdown"
+
+# Sections rendered from template loops; each must list at least one item
+LIST_SECTIONS = {
+    'contract': ("Role Expectations", "Strategic Area KPI Breakdown"),
+    'roles-responsibilities': ("Role Overview", "Team-Specific Responsibilities"),
+    'confirmation': ("Key Responsibilities", "Core Values Reminder")
+}
+
+_PLACEHOLDER = re.compile(r"\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\}")
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
+_LIST_ITEM = re.compile(r"^\s*(?:(?:[-*+]|\d+\.)\s+\S|\|\s*[^-\s|])")
+_LABEL = re.compile(r"^\*\*[^*]+:\*\*$")
+_KPI_HEADING = re.compile(r"^#{3,6}\s+.*?:\s*(\S*?)%\s*$")
+_KPI_ROW = re.compile(r"^\|\s*([^|]+?)\s*\|\s*([^|]*?)%\s*\|")
+_SALARY = re.compile(SALARY_FORMAT)
+_SALARY_LINE = re.compile(r"\*\*Salary\*\*:\s*(.+?);?\s*(?:and)?\s*$")
+_TABLE_DATE = re.compile(r"^\|\s*(Contract Start Date|Contract End Date)\s*\|\s*([^|]*?)\s*\|")
+_EFFECTIVE_DATE = re.compile(r"\*\*Effective Date\*\*:\s*(\S+)")
+_REVIEW_DATE = re.compile(r"review will be scheduled for\s+(\d{2}/\d{2}/\d{4})")
+
+def _issue(code: str, message: str, severity: str = ERROR, line: Optional[int] = None) -> Dict[str, Any]:
+    issue = {"code": code, "severity": severity, "message": message}
+    if line is not None:
+        issue["line"] = line
+    return issue
+
+def _parse_date(value: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(value.strip(), DATE_FORMAT)
+    except ValueError:
+        return None
+
+def _sections(lines: List[str]) -> Dict[str, Tuple[int, int]]:
+    """Map each level-2 heading to its (start, end) line range"""
+    starts = []
+    for index, line in enumerate(lines):
+        match = _HEADING.match(line)
+        if match and len(match.group(1)) <= 2:
+            starts.append((match.group(2), index))
+    sections = {}
+    for position, (title, start) in enumerate(starts):
+        end = starts[position + 1][1] if position + 1 < len(starts) else len(lines)
+        sections.setdefault(title, (start, end))
+    return sections
+
+def check_placeholders(lines: List[str]) -> List[Dict[str, Any]]:
+    """Unrendered Jinja expressions, statements or comments"""
+    return [_issue("unrendered_placeholder", f"Unrendered template syntax: {match.group(0)}", line=number)
+            for number, line in enumerate(lines, 1) for match in _PLACEHOLDER.finditer(line)]
+
+def check_sections(doc_type: str, sections: Dict[str, Tuple[int, int]]) -> List[Dict[str, Any]]:
+    """Required sections for the document type"""
+    return [_issue("missing_section", f"Missing required section: {title}")
+            for title in REQUIRED_SECTIONS.get(doc_type, ()) if title not in sections]
+
+def check_kpis(lines: List[str], sections: Dict[str, Tuple[int, int]]) -> List[Dict[str, Any]]:
+    """KPI percentages are present, numeric and sum to 100"""
+    if KPI_SECTION not in sections:
+        return []
+    start, end = sections[KPI_SECTION]
+    issues, total, found = [], 0.0, 0
+    for index in range(start + 1, end):
+        line = lines[index]
+        match = _KPI_HEADING.match(line) or _KPI_ROW.match(line)
+        if not match:
+            continue
+        value = match.groups()[-1].strip()
+        try:
+            total += float(value)
+            found += 1
+        except ValueError:
+            issues.append(_issue("kpi_percentage", f"KPI percentage is not a number: {value or '(blank)'}",
+                                 line=index + 1))
+    if found and not issues and abs(total - 100) > 0.01:
+        issues.append(_issue("kpi_total", f"KPI percentages sum to {total:g}%, expected 100%", line=start + 1))
+    return issues
+
+def check_dates(doc_type: str, lines: List[str]) -> List[Dict[str, Any]]:
+    """Contract end after start; confirmation review at effective date + 90 days"""
+    issues = []
+    if doc_type == 'contract':
+        dates = {}
+        for number, line in enumerate(lines, 1):
+            match = _TABLE_DATE.match(line)
+            if match:
+                parsed = _parse_date(match.group(2))
+                if parsed is None:
+                    issues.append(_issue("date_format", f"{match.group(1)} is not DD/MM/YYYY: {match.group(2)}",
+                                         line=number))
+                dates[match.group(1)] = parsed
+        start, end = dates.get("Contract Start Date"), dates.get("Contract End Date")
+        if start and end and end <= start:
+            issues.append(_issue("date_order", "Contract end date is not after the start date"))
+    elif doc_type == 'confirmation':
+        text = "\n".join(lines)
+        effective, review = _EFFECTIVE_DATE.search(text), _REVIEW_DATE.search(text)
+        effective_date = _parse_date(effective.group(1)) if effective else None
+        review_date = _parse_date(review.group(1)) if review else None
+        if effective_date and review_date and review_date != effective_date + timedelta(days=REVIEW_PERIOD_DAYS):
+            issues.append(_issue("review_date", f"Next review is not {REVIEW_PERIOD_DAYS} days after the effective date",
+                                 severity=WARNING))
+    return issues
+
+def check_salary(lines: List[str]) -> List[Dict[str, Any]]:
+    """Salary lines look like ``RM 5,000`` and are positive"""
+    issues = []
+    for number, line in enumerate(lines, 1):
+        match = _SALARY_LINE.search(line)
+        if not match:
+            continue
+        value = match.group(1).strip()
+        amount = _SALARY.match(value)
+        if not amount:
+            issues.append(_issue("salary_format", f"Unrecognised salary format: {value}", line=number))
+        elif float(amount.group(1).replace(",", "")) <= 0:
+            issues.append(_issue("salary_zero", f"Salary is not positive: {value}", severity=WARNING, line=number))
+    return issues
+
+def check_empty_lists(doc_type: str, lines: List[str], sections: Dict[str, Tuple[int, int]]) -> List[Dict[str, Any]]:
+    """Loop-rendered sections list something and ``**Label:**`` lines are followed by content"""
+    issues = []
+    for title in LIST_SECTIONS.get(doc_type, ()):
+        if title not in sections:
+            continue
+        start, end = sections[title]
+        if not any(_LIST_ITEM.match(line) for line in lines[start + 1:end]):
+            issues.append(_issue("empty_list", f"No items listed under: {title}", line=start + 1))
+    for index, line in enumerate(lines):
+        if not _LABEL.match(line.strip()):
+            continue
+        following = next((l.strip() for l in lines[index + 1:] if l.strip()), "")
+        if not following or _HEADING.match(following) or _LABEL.match(following):
+            issues.append(_issue("empty_list", f"Nothing listed after: {line.strip()}", line=index + 1))
+    return issues
+
+def validate_document(content: str, doc_type: str) -> Dict[str, Any]:
+    """Run every rule on a rendered document
+
+    Returns the same shape as ``AIHelper.validate_document`` (valid, issues,
+    suggestions); issues are dicts with ``code``, ``severity``, ``message`` and
+    optionally ``line``. Only ``error`` issues make a document invalid.
+    """
+    lines = content.splitlines()
+    sections = _sections(lines)
+    issues = []
+    if len(content.strip()) <= 100:
+        issues.append(_issue("too_short", "Document is nearly empty"))
+    issues += check_placeholders(lines)
+    issues += check_sections(doc_type, sections)
+    issues += check_kpis(lines, sections)
+    issues += check_dates(doc_type, lines)
+    issues += check_salary(lines)
+    issues += check_empty_lists(doc_type, lines, sections)
+    return {
+        "valid": not any(issue["severity"] == ERROR for issue in issues),
+        "issues": issues,
+        "suggestions": [],
+        "checked_by": "rules"
+    }
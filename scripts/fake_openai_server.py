@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Fake OpenAI Server for Load and Latency Testing
+Local stand-in for the chat-completions endpoint with configurable latency,
+token counts, error injection and streaming
+"""
+
+import sys
+import json
+import math
+import time
+import uuid
+import random
+import argparse
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+WORDS = (
+    "the employee will support team objectives deliver projects on time collaborate with "
+    "stakeholders maintain quality standards contribute to planning track progress against "
+    "agreed milestones share knowledge with colleagues and uphold company values"
+).split()
+
+class Distribution:
+    """Random distribution parsed from a spec like ``fixed:0.5`` or ``lognormal:-1,0.5``"""
+
+    KINDS = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+
+    def __init__(self, spec: str):
+        kind, _, params = spec.partition(':')
+        kind = kind.strip().lower()
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown distribution '{kind}'. Use one of: {', '.join(self.KINDS)}")
+        values = [float(p) for p in params.split(',') if p.strip()]
+        if len(values) != self.KINDS[kind]:
+            raise ValueError(f"Distribution '{kind}' takes {self.KINDS[kind]} parameter(s), got {len(values)}")
+        self.kind = kind
+        self.params = values
+        self.spec = spec
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a non-negative sample"""
+        if self.kind == "fixed":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(*self.params)
+        elif self.kind == "normal":
+            value = rng.gauss(*self.params)
+        elif self.kind == "lognormal":
+            value = rng.lognormvariate(*self.params)
+        else:
+            value = rng.expovariate(1.0 / self.params[0]) if self.params[0] > 0 else 0.0
+        return max(0.0, value)
+
+class FakeOpenAIState:
+    """Behaviour settings and counters shared by all request handlers"""
+
+    def __init__(self, latency: str = "fixed:0.2", token_latency: str = "fixed:0.0",
+                 completion_tokens: str = "uniform:50,300", rate_429: float = 0.0,
+                 rate_500: float = 0.0, retry_after: float = 1.0, seed: Optional[int] = None):
+        self.latency = Distribution(latency)
+        self.token_latency = Distribution(token_latency)
+        self.completion_tokens = Distribution(completion_tokens)
+        self.rate_429 = rate_429
+        self.rate_500 = rate_500
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "streamed": 0,
+            "errors_429": 0,
+            "errors_500": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "in_flight": 0,
+            "max_in_flight": 0
+        }
+
+    def draw(self) -> Tuple[str, float, float, int]:
+        """Pick the outcome for one request: (status, latency, per-token latency, completion tokens)"""
+        with self._lock:
+            roll = self._random.random()
+            if roll < self.rate_429:
+                status = "429"
+            elif roll < self.rate_429 + self.rate_500:
+                status = "500"
+            else:
+                status = "ok"
+            return (status, self.latency.sample(self._random), self.token_latency.sample(self._random),
+                    max(1, int(round(self.completion_tokens.sample(self._random)))))
+
+    def enter(self) -> None:
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+
+    def leave(self, **increments: int) -> None:
+        with self._lock:
+            self.stats["in_flight"] -= 1
+            for key, value in increments.items():
+                self.stats[key] += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats)
+
+def estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Rough prompt token count (about four characters per token)"""
+    chars = sum(len(str(m.get('content', ''))) for m in messages)
+    return max(1, math.ceil(chars / 4))
+
+def fake_text(tokens: int, seed: str) -> List[str]:
+    """Deterministic word pieces for ``tokens`` completion tokens"""
+    rng = random.Random(seed)
+    return [rng.choice(WORDS) + " " for _ in range(tokens)]
+
+def fake_object(response_format: Dict[str, Any], pieces: List[str]) -> Dict[str, str]:
+    """Share the completion's words among the string properties of a json_schema response format"""
+    schema = (response_format.get("json_schema") or {}).get("schema") or {}
+    keys = list((schema.get("properties") or {}).keys()) or ["content"]
+    share = max(1, len(pieces) // len(keys))
+    return {key: "".join(pieces[i * share:(i + 1) * share]).strip() for i, key in enumerate(keys)}
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """HTTP handler implementing the subset of the OpenAI API the generators use"""
+
+    server_version = "FakeOpenAI/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> FakeOpenAIState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str, error_type: str,
+                    headers: Optional[Dict[str, str]] = None) -> None:
+        self._send_json(status, {"error": {"message": message, "type": error_type, "code": None}}, headers)
+
+    def do_GET(self):
+        path = self.path.rstrip('/')
+        if path in ("/health", "/v1/health"):
+            self._send_json(200, {"status": "ok"})
+        elif path in ("/stats", "/v1/stats"):
+            self._send_json(200, self.state.snapshot())
+        elif path in ("/models", "/v1/models"):
+            self._send_json(200, {"object": "list", "data": [
+                {"id": model, "object": "model", "owned_by": "fake"}
+                for model in ("gpt-4", "gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo")
+            ]})
+        else:
+            self._send_error(404, f"Unknown path {self.path}", "invalid_request_error")
+
+    def do_POST(self):
+        if self.path.rstrip('/') not in ("/chat/completions", "/v1/chat/completions"):
+            self._send_error(404, f"Unknown path {self.path}", "invalid_request_error")
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_error(400, "Request body is not valid JSON", "invalid_request_error")
+            return
+
+        state = self.state
+        state.enter()
+        counters: Dict[str, int] = {}
+        try:
+            status, latency, token_latency, completion_tokens = state.draw()
+            time.sleep(latency)
+
+            if status == "429":
+                counters["errors_429"] = 1
+                self._send_error(429, "Rate limit reached (injected)", "rate_limit_exceeded",
+                                 {"Retry-After": str(state.retry_after)})
+                return
+            if status == "500":
+                counters["errors_500"] = 1
+                self._send_error(500, "Internal server error (injected)", "server_error")
+                return
+
+            messages = body.get("messages", [])
+            prompt_tokens = estimate_tokens(messages)
+            max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
+            finish_reason = "stop"
+            if max_tokens and completion_tokens >= int(max_tokens):
+                completion_tokens = int(max_tokens)
+                finish_reason = "length"
+
+            pieces = fake_text(completion_tokens, json.dumps(messages, sort_keys=True))
+            response_format = body.get("response_format") or {}
+            if response_format.get("type") == "json_object":
+                pieces = [json.dumps({"content": "".join(pieces).strip()})]
+            elif response_format.get("type") == "json_schema":
+                pieces = [json.dumps(fake_object(response_format, pieces))]
+
+            counters.update(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+            usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+            model = body.get("model", "gpt-4")
+
+            if body.get("stream"):
+                counters["streamed"] = 1
+                include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+                self._stream(model, pieces, token_latency, finish_reason, usage if include_usage else None)
+            else:
+                self._send_json(200, {
+                    "id": f"chatcmpl-{uuid.uuid4().hex}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "".join(pieces).strip()},
+                        "finish_reason": finish_reason
+                    }],
+                    "usage": usage
+                })
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Client disconnected")
+        finally:
+            state.leave(**counters)
+
+    def _stream(self, model: str, pieces: List[str], token_latency: float,
+                finish_reason: str, usage: Optional[Dict[str, int]]) -> None:
+        """Send the completion as server-sent events, one chunk per piece"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+
+        def chunk(delta: Dict[str, Any], reason: Optional[str] = None, chunk_usage=None) -> None:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [] if chunk_usage else [{"index": 0, "delta": delta, "finish_reason": reason}]
+            }
+            if chunk_usage:
+                payload["usage"] = chunk_usage
+            self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+
+        chunk({"role": "assistant", "content": ""})
+        for piece in pieces:
+            if token_latency:
+                time.sleep(token_latency)
+            chunk({"content": piece})
+        chunk({}, finish_reason)
+        if usage:
+            chunk({}, chunk_usage=usage)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+def create_server(host: str = "127.0.0.1", port: int = 8765, **settings: Any) -> ThreadingHTTPServer:
+    """Create (but do not start) a fake OpenAI server; ``port=0`` picks a free port"""
+    server = ThreadingHTTPServer((host, port), FakeOpenAIHandler)
+    server.daemon_threads = True
+    server.state = FakeOpenAIState(**settings)
+    return server
+
+def start_background(host: str = "127.0.0.1", port: int = 0, **settings: Any) -> Tuple[ThreadingHTTPServer, str]:
+    """Start a server on a background thread and return it with its base URL"""
+    server = create_server(host, port, **settings)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/v1"
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Run a local fake OpenAI chat-completions server')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--latency', default='fixed:0.2',
+                        help='Time to first byte, e.g. fixed:0.5, uniform:0.2,1.5, normal:0.8,0.2, lognormal:-0.5,0.6, exponential:0.4')
+    parser.add_argument('--token-latency', default='fixed:0.0', help='Delay between streamed chunks (same syntax)')
+    parser.add_argument('--completion-tokens', default='uniform:50,300',
+                        help='Completion token count distribution (capped at the request max_tokens)')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--rate-500', type=float, default=0.0, help='Fraction of requests answered with 500')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds sent with 429s')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible runs')
+
+    args = parser.parse_args()
+
+    try:
+        server = create_server(
+            args.host, args.port,
+            latency=args.latency,
+            token_latency=args.token_latency,
+            completion_tokens=args.completion_tokens,
+            rate_429=args.rate_429,
+            rate_500=args.rate_500,
+            retry_after=args.retry_after,
+            seed=args.seed
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"Fake OpenAI server listening on http://{args.host}:{server.server_address[1]}/v1")
+    print(f"Point the generators at it with: export OPENAI_BASE_URL=http://{args.host}:{server.server_address[1]}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServer stopped")
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,13 @@ import sys
 import json
 import argparse
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Dict, List, Any, Optional, Set, Tuple, Callable
 from datetime import datetime, timedelta
 from pathlib import Path
-import pandas as pd
-from jinja2 import Environment, FileSystemLoader, Template
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+
+# Heavy dependencies (pandas, jinja2, rich, openai) are imported where they are
+# first needed so that --help and the single-employee path start quickly
 
 # Add the scripts directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -34,38 +33,90 @@ except ImportError:
             return "- Participate in development activities\n- Learn modern development practices\n- Contribute to real projects"
         def enhance_content(self, content, *args, **kwargs):
             return content
+        def enhance_sections(self, sections, *args, **kwargs):
+            return list(sections)
         def validate_document(self, *args, **kwargs):
             return {"valid": True, "issues": [], "suggestions": []}
         def generate_personalized_content(self, content, *args, **kwargs):
             return content
+        def personalize_sections(self, sections, *args, **kwargs):
+            return list(sections)
+
+from manifest import DocumentManifest, MANIFEST_FILENAME, content_hash, employee_key, shard_path
+from document_rules import REVIEW_PERIOD_DAYS, validate_document as validate_with_rules
+from profiling import Profiler, NULL_PROFILER
+from lazy_console import LazyConsole
+from role_catalog import normalize_kpis
+from template_service import get_template_service
+from config_service import get_config_service
+from sharding import SUMMARY_FILENAME, merge_shards, parse_shard, shard_file, shard_of, write_summary
+from batch_input import CONTRACT_PERIOD_DAYS, PreflightResult, preflight
+from batch_progress import PROGRESS_MODES, make_progress
+from token_budget import get_token_budget
+from role_warmup import (ROLE_CACHE_FILENAME, FallbackText, RoleContentCache, WarmUp, base_job_title,
+                         config_fingerprint, role_combinations)
+from cohort_planner import (CALL_STATS_FILENAME, build_plan, call_stats_snapshot, estimate_plan,
+                            job_description_unit, kpi_unit, load_call_stats, run_units, save_call_stats)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Initialize Rich console
-console = Console()
+# Initialize Rich console (rich is imported on first print)
+console = LazyConsole()
+
+# Context fields that come only from company config; a template section that uses
+# nothing else renders identically for every employee
+COMPANY_FIELDS = frozenset({
+    'company', 'working_hours', 'overtime_policy', 'leave_entitlements', 'benefits',
+    'core_values', 'termination', 'contract_term', 'hr_contact'
+})
+
+# Document types in generation order and the template each one renders
+DOCUMENT_TEMPLATES = {
+    'contract': 'contract.md',
+    'roles-responsibilities': 'roles-responsibilities.md',
+    'confirmation': 'confirmation.md'
+}
+
+# Content-improvement prompt each document's sections are rewritten with; None
+# means the document is personalized for the employee instead
+DOCUMENT_REWRITES = {
+    'contract': 'professional_tone',
+    'roles-responsibilities': 'clarity_check',
+    'confirmation': None
+}
 
 class HRDocumentGenerator:
     """Main class for generating HR documents"""
     
-    def __init__(self, config_dir: str = "config", templates_dir: str = "templates", output_dir: str = "output"):
-        """Initialize the document generator"""
+    def __init__(self, config_dir: str = "config", templates_dir: str = "templates", output_dir: str = "output",
+                 profiler: Optional[Profiler] = None, ai_review_rate: Optional[float] = None,
+                 shard: Optional[Tuple[int, int]] = None):
+        """Initialize the document generator
+        
+        ``ai_review_rate`` is the fraction of documents that pass the local rules but
+        still get an AI review (default ``HR_AI_REVIEW_RATE`` or 0); documents the
+        rules flag are always reviewed when AI is enabled.
+        
+        With ``shard`` ``(I, N)`` batches only process the employees whose key
+        hashes to shard I of N, and the manifest, summary and call stats are
+        written to per-shard files (see ``sharding.merge_shards``).
+        """
         self.config_dir = Path(config_dir)
         self.templates_dir = Path(templates_dir)
         self.output_dir = Path(output_dir)
+        self.shard = shard
+        self.profiler = profiler or NULL_PROFILER
+        if ai_review_rate is None:
+            ai_review_rate = float(os.getenv('HR_AI_REVIEW_RATE', '0'))
+        self.ai_review_rate = ai_review_rate
         
-        # Load configurations
-        self.company_info = self._load_config("company-info.json")
-        self.job_roles = self._load_config("job-roles.json")
+        # Shared config service (parsed once per process, reloaded when files change)
+        self.config = get_config_service(str(self.config_dir))
         
-        # Initialize Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            autoescape=False,  # Markdown templates; avoid escaping
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        # Shared template service (bytecode-cached, reloads edited templates)
+        self.templates = get_template_service(str(self.templates_dir))
         
         # Initialize AI helper
         try:
@@ -76,38 +127,144 @@ class HRDocumentGenerator:
             self.ai_helper = None
             self.ai_enabled = False
 
+        self._manifest = None
+        # AI rewrites of company-invariant sections, reused across employees
+        self._boilerplate: Dict[tuple, str] = {}
+        # AI-generated context fields keyed by their inputs (see cohort_planner), shared across employees
+        self._ai_units: Dict[tuple, str] = {}
+        self._ai_units_lock = threading.Lock()
+        # The same units persisted across runs (see role_cache)
+        self._role_cache: Optional[RoleContentCache] = None
+        self._role_cache_version = None
+        # AI reviews keyed by (validation focus, content hash); identical documents are reviewed once
+        self._reviews: Dict[tuple, Dict[str, Any]] = {}
+
+    @property
+    def jinja_env(self):
+        """The shared Jinja environment behind ``self.templates``"""
+        return self.templates.env
+
+    @property
+    def manifest(self) -> DocumentManifest:
+        """SQLite manifest indexing the documents under the output directory"""
+        if self._manifest is None:
+            self._manifest = DocumentManifest(str(self.output_dir / shard_file(MANIFEST_FILENAME, self.shard)))
+        return self._manifest
+
     @staticmethod
     def _normalize_kpis(kpi_breakdown: Dict[str, Any]) -> Dict[str, int]:
         """Normalize KPI keys from config to simple keys used by templates"""
-        mapping = {"Vision": 0, "Delivery": 0, "Financial": 0, "Quality": 0, "LnD": 0, "ICO": 0}
-        for raw_key, val in (kpi_breakdown or {}).items():
-            key = raw_key.lower()
-            if "vision" in key:
-                mapping["Vision"] = val
-            elif "delivery" in key:
-                mapping["Delivery"] = val
-            elif "financial" in key or "fin" in key:
-                mapping["Financial"] = val
-            elif "quality" in key or "qua" in key:
-                mapping["Quality"] = val
-            elif "learning" in key or "lnd" in key:
-                mapping["LnD"] = val
-            elif "internal" in key or "ico" in key or "communications" in key:
-                mapping["ICO"] = val
-        return mapping
-    
-    def _load_config(self, filename: str) -> Dict[str, Any]:
-        """Load configuration file"""
-        config_path = self.config_dir / filename
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading config {filename}: {e}")
-            return {}
+        return normalize_kpis(kpi_breakdown)
+    
+    @property
+    def company_info(self) -> Dict[str, Any]:
+        """Current company-info.json"""
+        return self.config.current().company_info
+
+    @property
+    def job_roles(self) -> Dict[str, Any]:
+        """Current job-roles.json"""
+        return self.config.current().job_roles
+    
+    @staticmethod
+    def document_types(documents: Optional[List[str]] = None) -> List[str]:
+        """Requested document types in generation order (all when ``documents`` is None)"""
+        if documents is None:
+            return list(DOCUMENT_TEMPLATES)
+        unknown = [doc for doc in documents if doc not in DOCUMENT_TEMPLATES]
+        if unknown:
+            raise ValueError(f"Unknown document type(s): {', '.join(unknown)} "
+                             f"(expected {', '.join(DOCUMENT_TEMPLATES)})")
+        return [doc for doc in DOCUMENT_TEMPLATES if doc in documents]
+    
+    def required_fields(self, documents: Optional[List[str]] = None) -> Set[str]:
+        """Context fields referenced by the templates of the requested documents"""
+        fields = set()
+        for doc_type in self.document_types(documents):
+            fields |= self.templates.referenced_variables(DOCUMENT_TEMPLATES[doc_type])
+        return fields
+    
+    @property
+    def role_cache(self) -> Optional[RoleContentCache]:
+        """Role-level AI text persisted under the output directory for the current config (None if ``HR_ROLE_CACHE=0``)"""
+        if os.getenv('HR_ROLE_CACHE', '1').lower() in ('0', 'false', 'off'):
+            return None
+        config = self.config.current()
+        with self._ai_units_lock:
+            if self._role_cache is None or self._role_cache_version != config.version:
+                self._role_cache = RoleContentCache(self.output_dir / ROLE_CACHE_FILENAME,
+                                                    config_fingerprint(config.ai_prompts, config.job_roles))
+                self._role_cache_version = config.version
+            return self._role_cache
+    
+    def save_role_cache(self) -> None:
+        """Write role-level text produced since the last save to the persisted role cache"""
+        if self._role_cache is not None:
+            self._role_cache.flush()
+    
+    def cached_ai_text(self, key: tuple) -> Optional[str]:
+        """Text already produced for a work unit in this run or an earlier one (no model call)"""
+        with self._ai_units_lock:
+            cached = self._ai_units.get(key)
+        role_cache = self.role_cache
+        if cached is None and role_cache is not None:
+            cached = role_cache.peek(key)
+        return cached
     
-    def generate_employee_data(self, employee_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate complete employee data structure for templates"""
+    def ai_text(self, key: tuple, produce: Callable[[], str]) -> str:
+        """AI-generated text for a work unit, produced once and shared by every employee with the same inputs
+        
+        Units are looked up in the persisted role cache first; new AI text (not
+        fallbacks) is added there and saved by ``save_role_cache`` for later runs
+        and warm-ups.
+        """
+        with self._ai_units_lock:
+            cached = self._ai_units.get(key)
+        if cached is None:
+            role_cache = self.role_cache
+            cached = role_cache.get(key) if role_cache is not None else None
+            if cached is None:
+                cached = produce()
+                if role_cache is not None:
+                    role_cache.put(key, cached)
+            with self._ai_units_lock:
+                cached = self._ai_units.setdefault(key, cached)
+        return cached
+    
+    def warm_up_roles(self) -> WarmUp:
+        """Warm-up of the base job description and KPI activities for every career level and team
+        
+        Call ``run()`` (or ``start()`` for a background thread) on the result;
+        everything produced lands in the persisted role cache.
+        """
+        tasks = []
+        for career_level, team in role_combinations(self.job_roles):
+            employee_info = {'name': f"{team} {career_level} (warm-up)", 'team': team, 'career_level': career_level,
+                             'job_title': base_job_title(career_level, team)}
+            
+            def warm(employee_info: Dict[str, Any] = employee_info) -> Dict[str, Any]:
+                return self.generate_employee_data(employee_info, {'job_description', 'kpi_activities'})
+            
+            tasks.append((f"{career_level} / {team}", warm))
+        return WarmUp(tasks, self.ai_workers, on_done=self.save_role_cache)
+    
+    def generate_employee_data(self, employee_info: Dict[str, Any], fields: Optional[Set[str]] = None,
+                               ai_text: Optional[Callable[[tuple, Callable[[], str]], str]] = None) -> Dict[str, Any]:
+        """Generate complete employee data structure for templates
+        
+        With ``fields`` (see ``required_fields``) the AI-backed job description and
+        KPI activity blocks are only produced when a requested template uses them.
+        AI fields go through ``ai_text(unit_key, produce)`` (default ``self.ai_text``);
+        the cohort planner passes its own to collect work units without calling the model.
+        """
+        def needed(field: str) -> bool:
+            return fields is None or field in fields
+        ai_text = ai_text or self.ai_text
+        
+        # One config version for the whole employee, even if a reload lands mid-way
+        config = self.config.current()
+        company_info, job_roles = config.company_info, config.job_roles
+        
         # Extract basic info
         employee_name = employee_info.get('name', 'Employee Name')
         job_title = employee_info.get('job_title', 'Job Title')
@@ -119,14 +276,17 @@ class HRDocumentGenerator:
         work_location = employee_info.get('work_location', 'Mereka, PUBLIKA & Remotely')
         employee_id = employee_info.get('employee_id', 'ID Number')
         
-        # Calculate contract dates
-        start_date_obj = datetime.strptime(start_date, '%d/%m/%Y')
-        end_date_obj = start_date_obj + timedelta(days=365)
-        end_date = end_date_obj.strftime('%d/%m/%Y')
+        # Calculate contract dates (batch pre-flight already computed them)
+        end_date = employee_info.get('end_date')
+        next_review_date = employee_info.get('next_review_date')
+        if not (end_date and next_review_date):
+            start_date_obj = datetime.strptime(start_date, '%d/%m/%Y')
+            end_date = (start_date_obj + timedelta(days=CONTRACT_PERIOD_DAYS)).strftime('%d/%m/%Y')
+            next_review_date = (start_date_obj + timedelta(days=REVIEW_PERIOD_DAYS)).strftime('%d/%m/%Y')
         
         # Get role-specific data
-        role_data = self.job_roles.get('career_levels', {}).get(career_level, {})
-        team_data = self.job_roles.get('teams', {}).get(team, {})
+        role_data = job_roles.get('career_levels', {}).get(career_level, {})
+        team_data = job_roles.get('teams', {}).get(team, {})
         
         # Generate KPI breakdown (normalized)
         raw_kpis = role_data.get('kpi_breakdown', {})
@@ -134,12 +294,17 @@ class HRDocumentGenerator:
         
         # Generate AI-enhanced content if available
         job_description = employee_info.get('job_description', '')
-        if not job_description and self.ai_enabled:
+        if not job_description and self.ai_enabled and needed('job_description'):
             responsibilities = role_data.get('responsibilities', [])
-            job_description = self.ai_helper.generate_job_description(
-                job_title, team, career_level, 
-                self.company_info['company']['name'], responsibilities
-            )
+            company_name = company_info['company']['name']
+            
+            def produce_job_description() -> str:
+                with self.profiler.span("ai.generate_job_description", employee_name):
+                    return self.ai_helper.generate_job_description(
+                        job_title, team, career_level, company_name, responsibilities)
+            
+            job_description = ai_text(job_description_unit(job_title, team, career_level, company_name),
+                                      produce_job_description)
         
         # Generate KPI activities (always provide content; fall back if AI disabled)
         kpi_activities = {}
@@ -179,11 +344,17 @@ class HRDocumentGenerator:
             return "\n".join([f"- {a}" for a in fallback.get(area, ["Perform assigned duties"])])
 
         for area, percentage in kpi_breakdown.items():
+            if not (needed('kpi_activities') or needed(f"{area.lower()}_activities")):
+                continue
             if self.ai_enabled:
-                try:
-                    activities = self.ai_helper.generate_kpi_activities(area, percentage, career_level)
-                except Exception:
-                    activities = fallback_kpi_activities(area, percentage)
+                def produce_kpi_activities(area: str = area, percentage: int = percentage) -> str:
+                    try:
+                        with self.profiler.span("ai.generate_kpi_activities", employee_name):
+                            return self.ai_helper.generate_kpi_activities(area, percentage, career_level)
+                    except Exception:
+                        return FallbackText(fallback_kpi_activities(area, percentage))
+                
+                activities = ai_text(kpi_unit(area, percentage, career_level), produce_kpi_activities)
             else:
                 activities = fallback_kpi_activities(area, percentage)
             kpi_activities[area] = activities
@@ -202,16 +373,16 @@ class HRDocumentGenerator:
             'contract_date': start_date,
             'reporting_to': reporting_to,
             'work_location': work_location,
-            'contract_term': self.company_info.get('contract_terms', {}).get('default_duration', '1-year full time contract'),
+            'contract_term': company_info.get('contract_terms', {}).get('default_duration', '1-year full time contract'),
             
             # Company information
-            'company': self.company_info['company'],
-            'working_hours': self.company_info['working_hours'],
-            'overtime_policy': self.company_info['overtime_policy'],
-            'leave_entitlements': self.company_info['leave_entitlements'],
-            'benefits': self.company_info['benefits'],
-            'core_values': self.company_info['core_values'],
-            'termination': self.company_info['termination'],
+            'company': company_info['company'],
+            'working_hours': company_info['working_hours'],
+            'overtime_policy': company_info['overtime_policy'],
+            'leave_entitlements': company_info['leave_entitlements'],
+            'benefits': company_info['benefits'],
+            'core_values': company_info['core_values'],
+            'termination': company_info['termination'],
             
             # Role-specific information
             'role_responsibilities': role_data.get('responsibilities', []),
@@ -230,7 +401,7 @@ class HRDocumentGenerator:
             # Confirmation letter specific
             'confirmation_date': datetime.now().strftime('%d/%m/%Y'),
             'effective_date': start_date,
-            'next_review_date': (start_date_obj + timedelta(days=90)).strftime('%d/%m/%Y'),
+            'next_review_date': next_review_date,
             'key_responsibilities': role_data.get('responsibilities', [])[:5],  # Top 5 responsibilities
             'hr_contact': {
                 'name': 'Alan Roy Antony',
@@ -244,60 +415,112 @@ class HRDocumentGenerator:
     
     def generate_contract(self, employee_data: Dict[str, Any]) -> str:
         """Generate employment contract"""
-        template = self.jinja_env.get_template('contract.md')
-        content = template.render(**employee_data)
-        
-        # Enhance with AI if available
-        if self.ai_enabled:
-            content = self.ai_helper.enhance_content(content, "professional_tone")
-        
-        return content
+        return self._generate_document(
+            'contract', employee_data, "ai.enhance_content",
+            lambda sections: self.ai_helper.enhance_sections(sections, DOCUMENT_REWRITES['contract']))
     
     def generate_roles_responsibilities(self, employee_data: Dict[str, Any]) -> str:
         """Generate roles and responsibilities document"""
-        template = self.jinja_env.get_template('roles-responsibilities.md')
-        content = template.render(**employee_data)
-        
-        # Enhance with AI if available
-        if self.ai_enabled:
-            content = self.ai_helper.enhance_content(content, "clarity_check")
-        
-        return content
+        return self._generate_document(
+            'roles-responsibilities', employee_data, "ai.enhance_content",
+            lambda sections: self.ai_helper.enhance_sections(sections, DOCUMENT_REWRITES['roles-responsibilities']))
     
     def generate_confirmation_letter(self, employee_data: Dict[str, Any]) -> str:
         """Generate confirmation letter"""
-        template = self.jinja_env.get_template('confirmation.md')
-        content = template.render(**employee_data)
+        return self._generate_document(
+            'confirmation', employee_data, "ai.generate_personalized_content",
+            lambda sections: self.ai_helper.personalize_sections(sections, employee_data))
+    
+    def render_sections(self, doc_type: str, employee_data: Dict[str, Any]) -> Tuple[List[str], List[bool]]:
+        """Rendered sections of a document and whether each one is company-invariant
+        
+        A section is invariant when its template only references ``COMPANY_FIELDS``
+        (working hours, leave, benefits, ...), so it renders identically for every employee.
+        """
+        template_name = DOCUMENT_TEMPLATES[doc_type]
+        section_templates = self.templates.section_templates(template_name)
+        sections = self.templates.render_sections(template_name, **employee_data)
+        invariant = [variables <= COMPANY_FIELDS for _, variables, _ in section_templates]
+        if len(invariant) != len(sections):
+            # Template reloaded between the two calls; treat everything as employee-specific
+            invariant = [False] * len(sections)
+        return sections, invariant
+    
+    def _generate_document(self, doc_type: str, employee_data: Dict[str, Any], ai_stage: str, rewrite: Any) -> str:
+        """Render a document and, if AI is available, rewrite it section by section
+        
+        Company-invariant sections (see ``render_sections``) are rewritten once per
+        config version and reused for every employee; only the employee-specific
+        sections go to the model. Personalized documents (``DOCUMENT_REWRITES`` None,
+        whose output names the employee) keep invariant sections as rendered instead.
+        """
+        template_name = DOCUMENT_TEMPLATES[doc_type]
+        rewrite_key = DOCUMENT_REWRITES[doc_type]
+        employee = employee_data.get('employee_name')
+        if not self.ai_enabled:
+            with self.profiler.span(f"render.{doc_type}", employee):
+                return self.templates.render(template_name, **employee_data)
         
-        # Personalize with AI if available
-        if self.ai_enabled:
-            content = self.ai_helper.generate_personalized_content(content, employee_data)
+        with self.profiler.span(f"render.{doc_type}", employee):
+            sections, invariant = self.render_sections(doc_type, employee_data)
         
-        return content
+        version = self.config.current().version
+        results = list(sections)
+        keys, todo = {}, []
+        for index, text in enumerate(sections):
+            if invariant[index]:
+                if rewrite_key is None:
+                    continue
+                keys[index] = (template_name, index, rewrite_key, version, content_hash(text))
+                cached = self._boilerplate.get(keys[index])
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            todo.append(index)
+        
+        if todo:
+            with self.profiler.span(ai_stage, employee):
+                rewritten = rewrite([sections[index] for index in todo])
+            for index, text in zip(todo, rewritten):
+                results[index] = text
+                if index in keys:
+                    self._boilerplate[keys[index]] = text
+        
+        return "".join(results)
     
-    def save_documents(self, employee_name: str, documents: Dict[str, str]) -> str:
-        """Save generated documents to output directory"""
-        # Create employee-specific output directory
-        employee_dir = self.output_dir / employee_name.replace(' ', '_')
+    def save_documents(self, employee_name: str, documents: Dict[str, str],
+                       employee_id: Optional[str] = None, team: Optional[str] = None,
+                       career_level: Optional[str] = None,
+                       validation_results: Optional[Dict[str, Any]] = None,
+                       details: Optional[Dict[str, Any]] = None) -> str:
+        """Save generated documents to the sharded output tree and record them in the manifest"""
+        # Shard on employee ID (falls back to the name plus a hash of the row's details when no ID is given)
+        key = employee_key(employee_id, employee_name, details)
+        relative_dir = shard_path(key)
+        employee_dir = self.output_dir / relative_dir
         employee_dir.mkdir(parents=True, exist_ok=True)
         
         # Save each document
-        saved_files = []
+        paths = {}
         for doc_type, content in documents.items():
             filename = f"{doc_type}.md"
             filepath = employee_dir / filename
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(content)
-            saved_files.append(str(filepath))
+            paths[doc_type] = str(relative_dir / filename)
+        
+        self.manifest.record(key, employee_name, team, career_level, documents, paths, validation_results)
         
         return str(employee_dir)
     
-    def validate_documents(self, documents: Dict[str, str]) -> Dict[str, Any]:
-        """Validate generated documents"""
+    def validate_documents(self, documents: Dict[str, str], employee: Optional[str] = None) -> Dict[str, Any]:
+        """Validate generated documents with the local rules, then AI-review flagged or sampled ones"""
         validation_results = {}
         
-        if self.ai_enabled:
-            for doc_type, content in documents.items():
+        for doc_type, content in documents.items():
+            with self.profiler.span("validate.rules", employee):
+                result = validate_with_rules(content, doc_type)
+            if self.ai_enabled and (not result['valid'] or self._sampled_for_review(content)):
                 # Map doc types to validation focus
                 if doc_type == 'contract':
                     key = 'legal_compliance'
@@ -305,62 +528,66 @@ class HRDocumentGenerator:
                     key = 'policy_consistency'
                 else:
                     key = 'completeness'
-                validation_results[doc_type] = self.ai_helper.validate_document(content, key)
-        else:
-            # Basic validation without AI
-            for doc_type, content in documents.items():
-                validation_results[doc_type] = {
-                    "valid": len(content.strip()) > 100,  # Basic length check
-                    "issues": [],
-                    "suggestions": []
-                }
+                review_key = (key, content_hash(content))
+                review = self._reviews.get(review_key)
+                if review is None:
+                    with self.profiler.span("ai.validate_document", employee):
+                        review = self._reviews[review_key] = self.ai_helper.validate_document(content, key)
+                result['issues'] += [{"code": "ai_review", "severity": "error", "message": str(issue)}
+                                     for issue in review.get('issues', [])]
+                result['suggestions'] += review.get('suggestions', [])
+                result['valid'] = result['valid'] and review.get('valid', True)
+                result['checked_by'] = "rules+ai"
+                if 'review_text' in review:
+                    result['review_text'] = review['review_text']
+            validation_results[doc_type] = result
         
         return validation_results
     
-    def generate_for_employee(self, employee_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate all documents for a single employee"""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+    def _sampled_for_review(self, content: str) -> bool:
+        """Deterministic sample (by content hash) of documents sent to AI review"""
+        if self.ai_review_rate <= 0:
+            return False
+        return int(content_hash(content)[:8], 16) / 0xFFFFFFFF < self.ai_review_rate
+    
+    def generate_for_employee(self, employee_info: Dict[str, Any],
+                              documents: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Generate the requested documents (default: all) for a single employee
+        
+        Displays nothing; batches report progress once for the whole run (see ``generate_batch``).
+        """
+        employee = employee_info.get('name')
+        profiler = self.profiler
+        doc_types = self.document_types(documents)
+        fields = self.required_fields(doc_types)
+        generators = {
+            'contract': self.generate_contract,
+            'roles-responsibilities': self.generate_roles_responsibilities,
+            'confirmation': self.generate_confirmation_letter
+        }
+        
+        with profiler.span("employee", employee):
             # Generate employee data
-            task = progress.add_task("Preparing employee data...", total=None)
-            employee_data = self.generate_employee_data(employee_info)
-            progress.update(task, description="Employee data prepared")
-            
-            # Generate documents
-            task = progress.add_task("Generating documents...", total=3)
-            
-            # Contract
-            progress.update(task, description="Generating employment contract...")
-            contract = self.generate_contract(employee_data)
-            progress.advance(task)
+            with profiler.span("context", employee):
+                employee_data = self.generate_employee_data(employee_info, fields)
             
-            # Roles & Responsibilities
-            progress.update(task, description="Generating roles & responsibilities...")
-            roles_resp = self.generate_roles_responsibilities(employee_data)
-            progress.advance(task)
-            
-            # Confirmation Letter
-            progress.update(task, description="Generating confirmation letter...")
-            confirmation = self.generate_confirmation_letter(employee_data)
-            progress.advance(task)
+            # Generate the requested documents
+            documents = {doc_type: generators[doc_type](employee_data) for doc_type in doc_types}
             
             # Validate documents
-            task = progress.add_task("Validating documents...", total=None)
-            documents = {
-                'contract': contract,
-                'roles-responsibilities': roles_resp,
-                'confirmation': confirmation
-            }
-            validation_results = self.validate_documents(documents)
-            progress.update(task, description="Documents validated")
+            with profiler.span("validate", employee):
+                validation_results = self.validate_documents(documents, employee)
             
             # Save documents
-            task = progress.add_task("Saving documents...", total=None)
-            output_dir = self.save_documents(employee_info['name'], documents)
-            progress.update(task, description="Documents saved")
+            with profiler.span("save", employee):
+                output_dir = self.save_documents(
+                    employee_info['name'], documents,
+                    employee_id=employee_info.get('employee_id'),
+                    team=employee_data['team'],
+                    career_level=employee_data['career_level'],
+                    validation_results=validation_results,
+                    details=employee_info
+                )
         
         return {
             'employee_data': employee_data,
@@ -369,26 +596,91 @@ class HRDocumentGenerator:
             'output_directory': output_dir
         }
     
-    def generate_batch(self, csv_file: str) -> List[Dict[str, Any]]:
-        """Generate documents for multiple employees from CSV file"""
+    @property
+    def ai_workers(self) -> int:
+        """Concurrent AI calls per stage (the AI helper's section concurrency)"""
+        return getattr(self.ai_helper, 'section_workers', 4)
+    
+    @property
+    def call_stats_path(self) -> Path:
+        """Per-call-type latency and token totals recorded by earlier batches (merged across shards)"""
+        return self.output_dir / CALL_STATS_FILENAME
+    
+    def read_batch(self, csv_file: str) -> PreflightResult:
+        """Read a batch CSV and pre-flight it: normalized clean rows plus every rejected row and why"""
+        import pandas as pd
+        
+        with self.profiler.span("read_csv"):
+            df = pd.read_csv(csv_file, dtype=str)
+        with self.profiler.span("preflight"):
+            batch = preflight(df, self.job_roles)
+        if self.shard is not None:
+            # Checked on the whole file (duplicate IDs span shards), then partitioned by employee key
+            index, count = self.shard
+            
+            def owned(info: Dict[str, Any]) -> bool:
+                return shard_of(employee_key(info.get('employee_id'), info.get('name', ''), info), count) == index
+            
+            batch.employees = [info for info in batch.employees if owned(info)]
+            batch.rejected = [row for row in batch.rejected if owned(row['employee_info'])]
+        return batch
+    
+    def plan_batch(self, employees: List[Dict[str, Any]], documents: Optional[List[str]] = None):
+        """Deduplicated AI work units for a cohort with token, cost and time estimates (no AI calls)"""
+        with self.profiler.span("plan"):
+            plan = build_plan(self, employees, DOCUMENT_REWRITES, documents, self.ai_review_rate)
+            stats = load_call_stats(self.call_stats_path)
+            get_token_budget().seed(stats)
+            estimate_plan(plan, self.config.current().ai_prompts, stats, self.ai_workers)
+        return plan
+    
+    def generate_batch(self, csv_file: str, documents: Optional[List[str]] = None,
+                       plan: Any = None, progress: str = "rich",
+                       batch: Optional[PreflightResult] = None) -> List[Dict[str, Any]]:
+        """Generate documents (default: all types) for multiple employees from CSV file
+        
+        Runs the cohort plan (see ``plan_batch``; built here unless given) in
+        dependency order: the deduplicated context units first, concurrently,
+        then each employee's documents, which reuse them. Rows rejected by the
+        pre-flight (see ``read_batch``; pass its result as ``batch`` to avoid
+        reading the CSV again) are returned as errors without generating.
+        ``progress`` is one of ``PROGRESS_MODES``: a single Rich bar, JSON lines
+        on stderr, or nothing.
+        """
         try:
-            df = pd.read_csv(csv_file)
-            results = []
+            if batch is None:
+                batch = self.read_batch(csv_file)
+            employees = batch.employees
+            if plan is None:
+                plan = self.plan_batch(employees, documents)
+            stats_before = call_stats_snapshot()
+            results = [{'error': "; ".join(issue['message'] for issue in row['issues']),
+                        'employee_info': row['employee_info']} for row in batch.rejected]
             
-            console.print(f"[bold blue]Processing {len(df)} employees from {csv_file}[/bold blue]")
+            if progress == "rich":
+                console.print(f"[bold blue]Processing {len(employees)} employees from {csv_file}"
+                              f"{f' ({len(batch.rejected)} rejected)' if batch.rejected else ''}[/bold blue]")
             
-            for index, row in df.iterrows():
-                employee_info = row.to_dict()
-                console.print(f"\n[bold green]Processing: {employee_info.get('name', 'Unknown')}[/bold green]")
+            with make_progress(progress, len(employees), len(plan.doc_types), console.instance) as display:
+                with self.profiler.span("ai.context_units"):
+                    run_units(self, plan, self.ai_workers)
                 
-                try:
-                    result = self.generate_for_employee(employee_info)
-                    results.append(result)
-                    console.print(f"[green]✓ Completed[/green]")
-                except Exception as e:
-                    console.print(f"[red]✗ Error: {e}[/red]")
-                    results.append({'error': str(e), 'employee_info': employee_info})
+                for employee_info in employees:
+                    employee = employee_info.get('name', 'Unknown')
+                    try:
+                        result = self.generate_for_employee(employee_info, documents)
+                        results.append(result)
+                        error = None
+                    except Exception as e:
+                        results.append({'error': str(e), 'employee_info': employee_info})
+                        error = str(e)
+                    with self.profiler.span("console.progress", employee):
+                        display.advance(len(result['documents']) if error is None else 0, error, employee)
             
+            self.save_role_cache()
+            save_call_stats(self.output_dir / shard_file(CALL_STATS_FILENAME, self.shard),
+                            stats_before, call_stats_snapshot())
+            write_summary(self.output_dir / shard_file(SUMMARY_FILENAME, self.shard), csv_file, self.shard, results)
             return results
         except Exception as e:
             logger.error(f"Error processing batch file: {e}")
@@ -421,16 +713,151 @@ def main():
     parser.add_argument('--interactive', action='store_true', help='Interactive mode')
     parser.add_argument('--batch', help='CSV file for batch processing')
     parser.add_argument('--output', default='output', help='Output directory')
+    parser.add_argument('--documents', metavar='TYPES',
+                        help=f"Comma-separated document types to generate (default: all of {','.join(DOCUMENT_TEMPLATES)})")
+    parser.add_argument('--list', metavar='DOC_TYPE', help="List generated documents from the manifest ('all' for every type)")
+    parser.add_argument('--team', help='Filter --list results by team')
+    parser.add_argument('--shard', metavar='I/N',
+                        help='With --batch: process only shard I of N (employees partitioned by a hash of employee_id)')
+    parser.add_argument('--merge-shards', action='store_true',
+                        help='Merge the per-shard manifests, summaries and call stats under --output')
+    parser.add_argument('--warm-up', action='store_true',
+                        help='Pre-generate job descriptions and KPI activities for every career level and team '
+                             'into the role cache (<output>/role-content-cache.json)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='With --batch: print the deduplicated work plan and cost/time estimate without generating')
+    parser.add_argument('--progress', choices=PROGRESS_MODES, default='rich',
+                        help='Batch progress display: one Rich bar, JSON lines on stderr, or nothing (default: rich)')
+    parser.add_argument('--quiet', action='store_const', dest='progress', const='quiet',
+                        help='Same as --progress quiet')
+    parser.add_argument('--ai-review-rate', type=float, metavar='RATE',
+                        help='Fraction of rule-clean documents also sent for AI review (default: HR_AI_REVIEW_RATE or 0)')
+    parser.add_argument('--profile', action='store_true', help='Record per-stage timing spans and print a summary table')
+    parser.add_argument('--profile-pstats', metavar='FILE', help='Also dump cProfile statistics to FILE (implies --profile)')
+    parser.add_argument('--profile-trace', metavar='FILE', help='Also write a Chrome-trace JSON file (implies --profile)')
     
     args = parser.parse_args()
     
+    if not (args.list or args.batch or args.interactive or args.employee or args.merge_shards or args.warm_up):
+        # Show help without loading any generator dependencies
+        parser.print_help()
+        return
+    
+    documents = None
+    if args.documents:
+        documents = [doc.strip() for doc in args.documents.split(',') if doc.strip()]
+        try:
+            HRDocumentGenerator.document_types(documents)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    from rich.table import Table
+    
+    if args.merge_shards:
+        merged = merge_shards(args.output)
+        table = Table(title=f"Merged Batch Results (shards {', '.join(merged['shards'])})")
+        table.add_column("Employee", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Output Directory", style="blue")
+        for row in merged['employees']:
+            table.add_row(row['employee'], row['status'], row.get('output_directory') or str(row.get('error')))
+        console.print(table)
+        failed = sum(row['status'] != "Success" for row in merged['employees'])
+        console.print(f"{len(merged['employees'])} employees, {failed} failed")
+        if merged['missing_shards']:
+            console.print(f"[yellow]Missing shards: {', '.join(merged['missing_shards'])}[/yellow]")
+        return
+    
+    profiler = None
+    if args.profile or args.profile_pstats or args.profile_trace:
+        profiler = Profiler(cprofile=bool(args.profile_pstats))
+        profiler.start()
+    
+    generator = None
     try:
         # Initialize generator
-        generator = HRDocumentGenerator(output_dir=args.output)
+        generator = HRDocumentGenerator(output_dir=args.output, profiler=profiler,
+                                        ai_review_rate=args.ai_review_rate, shard=shard)
         
-        if args.batch:
-            # Batch processing
-            results = generator.generate_batch(args.batch)
+        if args.warm_up:
+            if not generator.ai_enabled:
+                console.print("[red]Warm-up needs AI (set OPENAI_API_KEY)[/red]")
+                sys.exit(1)
+            warm_up = generator.warm_up_roles()
+            with console.status(f"Warming {len(warm_up.tasks)} career level / team combinations..."):
+                status = warm_up.run()
+            role_cache = generator.role_cache
+            console.print(f"Warmed {status['done']} combinations in {status['seconds']:.1f}s ({status['errors']} failed); "
+                          f"role cache: {role_cache.path if role_cache else 'disabled (HR_ROLE_CACHE=0)'}")
+            
+        elif args.list:
+            # Manifest lookup
+            doc_type = None if args.list == 'all' else args.list
+            rows = generator.manifest.list_documents(doc_type=doc_type, team=args.team)
+            
+            table = Table(title="Generated Documents")
+            table.add_column("Employee", style="cyan")
+            table.add_column("Team")
+            table.add_column("Document")
+            table.add_column("Valid")
+            table.add_column("Generated At")
+            table.add_column("Path", style="blue")
+            
+            for row in rows:
+                valid = "-" if row['valid'] is None else ("Yes" if row['valid'] else "No")
+                table.add_row(row['employee_name'], row['team'] or "", row['doc_type'],
+                              valid, row['generated_at'], str(generator.output_dir / row['path']))
+            
+            console.print(table)
+            
+        elif args.batch:
+            # Pre-flight the input, plan the clean rows, then run them (or stop at the plan with --dry-run)
+            batch = generator.read_batch(args.batch)
+            plan = generator.plan_batch(batch.employees, documents)
+            
+            if args.progress == 'jsonl':
+                for issue in batch.issues:
+                    sys.stderr.write(json.dumps({"event": "rejected", **issue}) + "\n")
+                sys.stderr.write(json.dumps({"event": "plan", **plan.summary()}) + "\n")
+            elif args.progress == 'rich' or args.dry_run:
+                if batch.rejected:
+                    table = Table(title=f"Rejected Rows ({len(batch.rejected)} of {batch.rows})")
+                    table.add_column("Row", justify="right")
+                    table.add_column("Employee", style="cyan")
+                    table.add_column("Field")
+                    table.add_column("Problem", style="red")
+                    for issue in batch.issues:
+                        table.add_row(str(issue['row']), issue['employee'] or "", issue['field'], issue['message'])
+                    console.print(table)
+                
+                table = Table(title=f"Batch Plan ({plan.employees} employees, {plan.renders} documents)")
+                table.add_column("Stage", style="cyan")
+                table.add_column("Call Type")
+                table.add_column("AI Calls", justify="right")
+                table.add_column("Without Dedup", justify="right")
+                table.add_column("Tokens (in/out)", justify="right")
+                table.add_column("Cost (USD)", justify="right")
+                table.add_column("Time (s)", justify="right")
+                for row in plan.estimate + [dict(plan.totals(), stage="total", call_type="")]:
+                    table.add_row(row['stage'], row['call_type'], str(row['calls']), f"{row['requested']:g}",
+                                  f"{row['prompt_tokens']:,}/{row['completion_tokens']:,}",
+                                  f"{row['cost']:.4f}", f"{row['seconds']:.1f}")
+                console.print(table)
+                if plan.errors:
+                    console.print(f"[yellow]{plan.errors} row(s) could not be planned and will fail[/yellow]")
+            if args.dry_run:
+                return
+            
+            results = generator.generate_batch(args.batch, documents, plan, args.progress, batch)
+            if args.progress != 'rich':
+                return
             
             # Display summary
             table = Table(title="Batch Processing Results")
@@ -457,7 +884,8 @@ def main():
         elif args.interactive:
             # Interactive mode
             employee_info = interactive_input()
-            result = generator.generate_for_employee(employee_info)
+            with console.status("Generating documents..."):
+                result = generator.generate_for_employee(employee_info, documents)
             
             console.print(f"\n[bold green]Documents generated successfully![/bold green]")
             console.print(f"Output directory: {result['output_directory']}")
@@ -472,19 +900,28 @@ def main():
                 'team': 'Mereka'
             }
             
-            result = generator.generate_for_employee(employee_info)
+            with console.status("Generating documents..."):
+                result = generator.generate_for_employee(employee_info, documents)
             
             console.print(f"\n[bold green]Documents generated for {args.employee}![/bold green]")
             console.print(f"Output directory: {result['output_directory']}")
-            
-        else:
-            # Show help
-            parser.print_help()
     
     except Exception as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
         logger.error(f"Application error: {e}")
         sys.exit(1)
+    finally:
+        if generator is not None:
+            generator.save_role_cache()
+        if profiler is not None:
+            profiler.stop()
+            profiler.print_report(console)
+            if args.profile_pstats:
+                profiler.dump_pstats(args.profile_pstats)
+                console.print(f"cProfile statistics written to {args.profile_pstats}")
+            if args.profile_trace:
+                profiler.write_chrome_trace(args.profile_trace)
+                console.print(f"Chrome trace written to {args.profile_trace}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,3316 @@
+"""
+Generated by scripts/build-snapshot.py -- do not edit.
+Rebuild with: python scripts/build-snapshot.py
+"""
+
+SNAPSHOT_FORMAT = 1
+JINJA2_VERSION = '3.1.6'
+PYTHON_VERSION = (3, 11)
+ENV_OPTIONS = {'autoescape': False, 'trim_blocks': True, 'lstrip_blocks': True}
+SOURCE_HASHES = {'config/ai-prompts.json': '4cead24cb2a0da1e7ac3ee2d2e1ace5c834278a13ed9f47d61136f263c579fdc',
+ 'config/company-info.json': '2ea5d46a4196b1d39a9d6ce688b399739eda8ec6c5b369f3a5bae56c5ec14e62',
+ 'config/job-roles.json': '3d85756f58101b94b4281d2f629a2e652c6f0dbd13d714a9d79848815cd99547',
+ 'templates/contract.md': '42c2b50d6f17a4692ed5a097e3900fc13f54f061c99aaa9b5ff56c30da08ec51',
+ 'templates/roles-responsibilities.md': 'd7dfcdb6bb86d02c577910dc0180bf2ea20cfe2d81cb91a3700448a17bcc5aca',
+ 'templates/confirmation.md': 'f0ad27646645bcdc94285ac457aaee1059586b64f9d8920dc0486246da8a7c1d'}
+CONFIGS = {'ai-prompts.json': {'contract_generation': {'job_description': 'Generate a detailed job '
+                                                                'description for a {role} position '
+                                                                'at {company_name}. The employee '
+                                                                'will be working in the {team} '
+                                                                'team. Key responsibilities should '
+                                                                'include: {responsibilities}. '
+                                                                'Focus on practical, actionable '
+                                                                'tasks that align with the '
+                                                                "company's mission of innovative "
+                                                                'education.',
+                                             'kpi_section': 'Create a KPI breakdown section for a '
+                                                            '{career_level} role with the '
+                                                            'following percentages: '
+                                                            '{kpi_breakdown}. Each KPI area should '
+                                                            'have 2-3 specific, measurable '
+                                                            'activities that the employee will be '
+                                                            'responsible for.',
+                                             'review_contract': 'Review this employment contract '
+                                                                'for completeness, clarity, and '
+                                                                'legal compliance. Ensure all '
+                                                                'sections are properly filled out '
+                                                                'and the language is professional '
+                                                                'and clear. Highlight any missing '
+                                                                'information or areas that need '
+                                                                'clarification.'},
+                     'roles_responsibilities': {'main_description': 'Create a comprehensive roles '
+                                                                    'and responsibilities document '
+                                                                    'for a {career_level} position '
+                                                                    'in the {team} team. The '
+                                                                    "employee's main focus will be "
+                                                                    '{focus_areas}. Include '
+                                                                    'specific, measurable '
+                                                                    'responsibilities that align '
+                                                                    "with the company's strategic "
+                                                                    'objectives.',
+                                                'kpi_breakdown': 'Generate detailed KPI breakdowns '
+                                                                 'for each strategic area with '
+                                                                 'specific activities and '
+                                                                 'measurable outcomes. The '
+                                                                 'percentages are: '
+                                                                 '{kpi_breakdown}. Each area '
+                                                                 'should have clear, actionable '
+                                                                 'items that the employee can '
+                                                                 'track and achieve.',
+                                                'enhance_description': 'Enhance this job '
+                                                                       'description to be more '
+                                                                       'specific and actionable. '
+                                                                       'Add concrete examples of '
+                                                                       'what success looks like in '
+                                                                       'this role. Make it more '
+                                                                       'engaging and clear for the '
+                                                                       'new employee.'},
+                     'confirmation_letter': {'personalized': 'Write a personalized confirmation '
+                                                             'letter for {employee_name} who has '
+                                                             'been appointed as {role} at '
+                                                             '{company_name}. The letter should be '
+                                                             'warm, professional, and encouraging. '
+                                                             'Mention their specific role and '
+                                                             'express confidence in their future '
+                                                             'contributions.',
+                                             'review_letter': 'Review this confirmation letter for '
+                                                              'tone, clarity, and completeness. '
+                                                              "Ensure it's professional yet warm, "
+                                                              'and includes all necessary '
+                                                              'information about the appointment.'},
+                     'content_improvement': {'professional_tone': 'Improve the professional tone '
+                                                                  'of this document while '
+                                                                  'maintaining its legal and '
+                                                                  'formal nature. Make it more '
+                                                                  'engaging and clear for the '
+                                                                  'reader.',
+                                             'clarity_check': 'Review this document for clarity '
+                                                              'and completeness. Identify any '
+                                                              'ambiguous language or missing '
+                                                              'information that should be '
+                                                              'addressed.',
+                                             'consistency_check': 'Ensure consistency in '
+                                                                  'terminology, formatting, and '
+                                                                  'style throughout this document. '
+                                                                  'Check for any inconsistencies '
+                                                                  'in job titles, company '
+                                                                  'references, or policy '
+                                                                  'statements.'},
+                     'validation': {'legal_compliance': 'Review this employment contract for legal '
+                                                        'compliance and completeness. Ensure all '
+                                                        'required sections are present and '
+                                                        'properly formatted according to Malaysian '
+                                                        'employment law.',
+                                    'policy_consistency': 'Verify that all policies and procedures '
+                                                          'mentioned in this document are '
+                                                          "consistent with the company's standard "
+                                                          'policies and legal requirements.',
+                                    'completeness': 'Check this document for completeness. Ensure '
+                                                    'all required fields are filled, all sections '
+                                                    'are properly completed, and no information is '
+                                                    'missing.'},
+                     'model_routing': {'default': {'model': 'gpt-4o-mini',
+                                                   'max_tokens': 800,
+                                                   'temperature': 0.3,
+                                                   'timeout': 30,
+                                                   'fallback': ['gpt-4o']},
+                                       'job_description': {'max_tokens': 500, 'temperature': 0.7},
+                                       'kpi_activities': {'max_tokens': 300,
+                                                          'temperature': 0.6,
+                                                          'timeout': 20},
+                                       'enhance_content': {'max_tokens': 4000,
+                                                           'temperature': 0.5,
+                                                           'timeout': 60},
+                                       'personalized_content': {'max_tokens': 4000,
+                                                                'temperature': 0.6,
+                                                                'timeout': 60},
+                                       'validate_document': {'model': 'gpt-4o',
+                                                             'fallback': ['gpt-4'],
+                                                             'max_tokens': 2000,
+                                                             'timeout': 60},
+                                       'document': {'max_tokens': 8000, 'timeout': 60},
+                                       'slots': {'max_tokens': 600},
+                                       'slots.contract': {'max_tokens': 400},
+                                       'slots.confirmation': {'max_tokens': 200}}},
+ 'company-info.json': {'company': {'name': 'MEREKA INNOVATIVE EDUCATION SDN BHD',
+                                   'registration_number': '1239397-T',
+                                   'address': 'Mereka, PUBLIKA',
+                                   'email': 'finance@mereka.my',
+                                   'website': 'https://mereka.my'},
+                       'working_hours': {'general': 'Monday – Sunday, 10 am to 8 pm',
+                                         'weekly_hours': 40,
+                                         'start_time': '10:00 AM'},
+                       'overtime_policy': {'replacement_leave': {'< 4 hours': '1 to 3 Off-hours '
+                                                                              'the next day',
+                                                                 '4 hours': 'Half-day Leave',
+                                                                 '8 hours': '1 Full-day Leave'}},
+                       'leave_entitlements': {'annual_leave': 18,
+                                              'medical_leave': 14,
+                                              'hospitalization_leave': 60,
+                                              'paternity_leave': 30,
+                                              'maternity_leave': 98,
+                                              'compassionate_leave': 10,
+                                              'study_leave': 60},
+                       'benefits': {'wellness_claim': 'RM500 annually',
+                                    'epf': True,
+                                    'socso': True,
+                                    'eis': True},
+                       'core_values': [{'name': 'Drive Change With Purpose',
+                                        'description': 'We set clear, intentional goals that drive '
+                                                       'meaningful and sustainable progress for '
+                                                       'our clients, communities, and the '
+                                                       'environment.'},
+                                       {'name': 'Innovate As Standard',
+                                        'description': 'We approach every challenge with '
+                                                       'creativity, consistently pushing '
+                                                       'boundaries to deliver results.'},
+                                       {'name': 'Foster Authentic Connections',
+                                        'description': 'We cultivate trust through honest and '
+                                                       'transparent interactions, ensuring '
+                                                       'integrity remains at the heart of all we '
+                                                       'undertake.'},
+                                       {'name': 'Redefine Resilience',
+                                        'description': 'We embody adaptability and strength, '
+                                                       'turning challenges into opportunities for '
+                                                       'growth and excellence.'},
+                                       {'name': 'Champion Growth For All',
+                                        'description': 'We are committed to collective success, '
+                                                       'advancing together toward a prosperous and '
+                                                       'sustainable future for all.'}],
+                       'termination': {'notice_period': '90 days',
+                                       'immediate_termination': 'Violation of Code of Conduct'},
+                       'contract_terms': {'default_duration': '1-year full time contract',
+                                          'extension_basis': 'Performance and organizational '
+                                                             'needs'}},
+ 'job-roles.json': {'career_levels': {'Manager': {'description': 'Senior leadership role with '
+                                                                 'strategic responsibilities',
+                                                  'kpi_breakdown': {'Vision (VIS)': 10,
+                                                                    'Delivery & Impact Creation (DEL)': 40,
+                                                                    'Financial (FIN)': 10,
+                                                                    'Quality (QUA)': 15,
+                                                                    'Learning Development & Personal Career Growth (LnD)': 15,
+                                                                    'Internal Communication & Management (ICO)': 10},
+                                                  'responsibilities': ['Drive and implement '
+                                                                       'business/department '
+                                                                       'objectives, new '
+                                                                       'initiatives',
+                                                                       'Identify new business '
+                                                                       'opportunities, client '
+                                                                       'propositions',
+                                                                       'Manage external '
+                                                                       'partnerships',
+                                                                       'Lead and manage the team '
+                                                                       'activities to deliver '
+                                                                       'Company Strategic Plan',
+                                                                       'Oversee department '
+                                                                       'branding and budgeting '
+                                                                       'activities',
+                                                                       'Drive and support '
+                                                                       'department/business growth',
+                                                                       'Establish relationships '
+                                                                       'and manage contracts with '
+                                                                       'clients/stakeholders',
+                                                                       'Possess and demonstrate '
+                                                                       "knowledge of the Company's "
+                                                                       'products and services',
+                                                                       'Gain understanding of '
+                                                                       'market and competitive '
+                                                                       'landscape',
+                                                                       'Establish and maintain '
+                                                                       'high level of relevant '
+                                                                       'domain knowledge',
+                                                                       'Synchronize business '
+                                                                       'priorities with cross '
+                                                                       'department',
+                                                                       'Propose and implement '
+                                                                       'department best practices, '
+                                                                       'processes and rules']},
+                                      'Associate': {'description': 'Mid-level professional with '
+                                                                   'operational responsibilities',
+                                                    'kpi_breakdown': {'Vision (VIS)': 5,
+                                                                      'Delivery & Impact Creation (DEL)': 55,
+                                                                      'Financial (FIN)': 5,
+                                                                      'Quality (QUA)': 5,
+                                                                      'Internal Communications & Management (ICO)': 10,
+                                                                      'Learning & Development (LnD)': 20},
+                                                    'responsibilities': ['Assist Direct Leader to '
+                                                                         'strategize for '
+                                                                         'business/department '
+                                                                         'objectives',
+                                                                         'Lead and execute in the '
+                                                                         'full spectrum of the job '
+                                                                         'functions',
+                                                                         'Supervise and delegate '
+                                                                         'tasks to interns (if '
+                                                                         'any)',
+                                                                         'Serve as a business '
+                                                                         'partner with '
+                                                                         'stakeholders and cross '
+                                                                         'department',
+                                                                         'Work on department '
+                                                                         'objectives',
+                                                                         'Responsible for '
+                                                                         'developing and '
+                                                                         'implementing policies '
+                                                                         'and systems',
+                                                                         'Improve overall '
+                                                                         'efficiency of the '
+                                                                         'department',
+                                                                         'Manage administration '
+                                                                         'works and audit the work '
+                                                                         'climate',
+                                                                         'Exercise independent '
+                                                                         'judgment in handling '
+                                                                         'day-to-day operations',
+                                                                         'Perform any other ad-hoc '
+                                                                         'duties as assigned']},
+                                      'Senior Associate': {'description': 'Experienced '
+                                                                          'professional with '
+                                                                          'specialized expertise',
+                                                           'kpi_breakdown': {'Vision (VIS)': 8,
+                                                                             'Delivery & Impact Creation (DEL)': 45,
+                                                                             'Financial (FIN)': 8,
+                                                                             'Quality (QUA)': 12,
+                                                                             'Learning Development & Personal Career Growth (LnD)': 17,
+                                                                             'Internal Communication & Management (ICO)': 10},
+                                                           'responsibilities': ['Lead specific '
+                                                                                'projects and '
+                                                                                'initiatives',
+                                                                                'Mentor junior '
+                                                                                'team members',
+                                                                                'Develop '
+                                                                                'specialized '
+                                                                                'expertise in '
+                                                                                'assigned areas',
+                                                                                'Contribute to '
+                                                                                'strategic '
+                                                                                'planning and '
+                                                                                'decision-making',
+                                                                                'Manage complex '
+                                                                                'stakeholder '
+                                                                                'relationships',
+                                                                                'Drive innovation '
+                                                                                'and process '
+                                                                                'improvements',
+                                                                                'Represent the '
+                                                                                'organization in '
+                                                                                'external '
+                                                                                'engagements']},
+                                      'Junior Associate': {'description': 'Entry-level '
+                                                                          'professional with '
+                                                                          'learning focus',
+                                                           'kpi_breakdown': {'Vision (VIS)': 3,
+                                                                             'Delivery & Impact Creation (DEL)': 60,
+                                                                             'Financial (FIN)': 3,
+                                                                             'Quality (QUA)': 3,
+                                                                             'Internal Communications & Management (ICO)': 8,
+                                                                             'Learning & Development (LnD)': 23},
+                                                           'responsibilities': ['Support senior '
+                                                                                'team members in '
+                                                                                'daily operations',
+                                                                                'Learn and develop '
+                                                                                'core competencies',
+                                                                                'Assist in project '
+                                                                                'execution and '
+                                                                                'delivery',
+                                                                                'Contribute to '
+                                                                                'team objectives '
+                                                                                'under supervision',
+                                                                                'Participate in '
+                                                                                'training and '
+                                                                                'development '
+                                                                                'programs',
+                                                                                'Follow '
+                                                                                'established '
+                                                                                'processes and '
+                                                                                'procedures']}},
+                    'teams': {'Mereka': {'description': 'Main business unit',
+                                         'focus_areas': ['Education',
+                                                         'Innovation',
+                                                         'Community Engagement']},
+                              'Marketing': {'description': 'Marketing and communications team',
+                                            'focus_areas': ['Brand Management',
+                                                            'Digital Marketing',
+                                                            'Content Creation']},
+                              'Operations': {'description': 'Operational excellence team',
+                                             'focus_areas': ['Process Management',
+                                                             'Quality Assurance',
+                                                             'Efficiency']}}}}
+ROLE_CATALOG = {'career_levels': {'Manager': {'kpi_breakdown': {'Vision': 10,
+                                                 'Delivery': 40,
+                                                 'Financial': 10,
+                                                 'Quality': 15,
+                                                 'LnD': 15,
+                                                 'ICO': 10},
+                               'responsibilities': ['Drive and implement business/department '
+                                                    'objectives, new initiatives',
+                                                    'Identify new business opportunities, client '
+                                                    'propositions',
+                                                    'Manage external partnerships',
+                                                    'Lead and manage the team activities to '
+                                                    'deliver Company Strategic Plan',
+                                                    'Oversee department branding and budgeting '
+                                                    'activities',
+                                                    'Drive and support department/business growth',
+                                                    'Establish relationships and manage contracts '
+                                                    'with clients/stakeholders',
+                                                    'Possess and demonstrate knowledge of the '
+                                                    "Company's products and services",
+                                                    'Gain understanding of market and competitive '
+                                                    'landscape',
+                                                    'Establish and maintain high level of relevant '
+                                                    'domain knowledge',
+                                                    'Synchronize business priorities with cross '
+                                                    'department',
+                                                    'Propose and implement department best '
+                                                    'practices, processes and rules'],
+                               'key_responsibilities': ['Drive and implement business/department '
+                                                        'objectives, new initiatives',
+                                                        'Identify new business opportunities, '
+                                                        'client propositions',
+                                                        'Manage external partnerships',
+                                                        'Lead and manage the team activities to '
+                                                        'deliver Company Strategic Plan',
+                                                        'Oversee department branding and budgeting '
+                                                        'activities']},
+                   'Associate': {'kpi_breakdown': {'Vision': 5,
+                                                   'Delivery': 55,
+                                                   'Financial': 5,
+                                                   'Quality': 5,
+                                                   'LnD': 20,
+                                                   'ICO': 10},
+                                 'responsibilities': ['Assist Direct Leader to strategize for '
+                                                      'business/department objectives',
+                                                      'Lead and execute in the full spectrum of '
+                                                      'the job functions',
+                                                      'Supervise and delegate tasks to interns (if '
+                                                      'any)',
+                                                      'Serve as a business partner with '
+                                                      'stakeholders and cross department',
+                                                      'Work on department objectives',
+                                                      'Responsible for developing and implementing '
+                                                      'policies and systems',
+                                                      'Improve overall efficiency of the '
+                                                      'department',
+                                                      'Manage administration works and audit the '
+                                                      'work climate',
+                                                      'Exercise independent judgment in handling '
+                                                      'day-to-day operations',
+                                                      'Perform any other ad-hoc duties as '
+                                                      'assigned'],
+                                 'key_responsibilities': ['Assist Direct Leader to strategize for '
+                                                          'business/department objectives',
+                                                          'Lead and execute in the full spectrum '
+                                                          'of the job functions',
+                                                          'Supervise and delegate tasks to interns '
+                                                          '(if any)',
+                                                          'Serve as a business partner with '
+                                                          'stakeholders and cross department',
+                                                          'Work on department objectives']},
+                   'Senior Associate': {'kpi_breakdown': {'Vision': 8,
+                                                          'Delivery': 45,
+                                                          'Financial': 8,
+                                                          'Quality': 12,
+                                                          'LnD': 17,
+                                                          'ICO': 10},
+                                        'responsibilities': ['Lead specific projects and '
+                                                             'initiatives',
+                                                             'Mentor junior team members',
+                                                             'Develop specialized expertise in '
+                                                             'assigned areas',
+                                                             'Contribute to strategic planning and '
+                                                             'decision-making',
+                                                             'Manage complex stakeholder '
+                                                             'relationships',
+                                                             'Drive innovation and process '
+                                                             'improvements',
+                                                             'Represent the organization in '
+                                                             'external engagements'],
+                                        'key_responsibilities': ['Lead specific projects and '
+                                                                 'initiatives',
+                                                                 'Mentor junior team members',
+                                                                 'Develop specialized expertise in '
+                                                                 'assigned areas',
+                                                                 'Contribute to strategic planning '
+                                                                 'and decision-making',
+                                                                 'Manage complex stakeholder '
+                                                                 'relationships']},
+                   'Junior Associate': {'kpi_breakdown': {'Vision': 3,
+                                                          'Delivery': 60,
+                                                          'Financial': 3,
+                                                          'Quality': 3,
+                                                          'LnD': 23,
+                                                          'ICO': 8},
+                                        'responsibilities': ['Support senior team members in daily '
+                                                             'operations',
+                                                             'Learn and develop core competencies',
+                                                             'Assist in project execution and '
+                                                             'delivery',
+                                                             'Contribute to team objectives under '
+                                                             'supervision',
+                                                             'Participate in training and '
+                                                             'development programs',
+                                                             'Follow established processes and '
+                                                             'procedures'],
+                                        'key_responsibilities': ['Support senior team members in '
+                                                                 'daily operations',
+                                                                 'Learn and develop core '
+                                                                 'competencies',
+                                                                 'Assist in project execution and '
+                                                                 'delivery',
+                                                                 'Contribute to team objectives '
+                                                                 'under supervision',
+                                                                 'Participate in training and '
+                                                                 'development programs']}},
+ 'teams': {'Mereka': ['Education', 'Innovation', 'Community Engagement'],
+           'Marketing': ['Brand Management', 'Digital Marketing', 'Content Creation'],
+           'Operations': ['Process Management', 'Quality Assurance', 'Efficiency']}}
+TEMPLATE_SOURCES = {'contract.md': '# EMPLOYMENT CONTRACT\n'
+                '\n'
+                'This Contract of Services ("the Contract") is made and entered into effective as '
+                'of {{ contract_date }} between \n'
+                '{{ employee_name }} (NRIC/Passport No: {{ employee_id }}) ("the Employee"), and '
+                '{{ company.name }} ({{ company.registration_number }}) ("the Employer") ("the '
+                'Organization"). \n'
+                '\n'
+                'WHEREAS, the Employee desires to perform such services by the Employer as {{ '
+                'job_title }} pursuant to the terms and conditions set forth in the Contract.\n'
+                '\n'
+                'WHEREAS, the Employer desires to have a need from the Employee in such capacity '
+                'pursuant to the terms and conditions set forth in the Contract.\n'
+                '\n'
+                'IT IS HEREBY AGREED as follows: \n'
+                '\n'
+                '## Job Specification\n'
+                '\n'
+                '| Field | Value |\n'
+                '|-------|-------|\n'
+                '| Job Title | {{ job_title }} |\n'
+                '| Team | {{ team }} |\n'
+                '| Career Level | {{ career_level }} |\n'
+                '| Contract Term | {{ contract_term }} |\n'
+                '| Contract Start Date | {{ start_date }} |\n'
+                '| Contract End Date | {{ end_date }} |\n'
+                '| Reporting To | {{ reporting_to }} |\n'
+                '| Work Location | {{ work_location }} |\n'
+                '\n'
+                '## Job Description & Organization Strategic Area KPI\n'
+                '\n'
+                '{{ job_description }}\n'
+                '\n'
+                'The Employee is required to attend regular meetings with the project team '
+                'regarding the strategy and growth of the project. The Employee is also required '
+                'to manage the project by:\n'
+                '- Facilitating communication between the relevant teams, partners, and '
+                'stakeholders;\n'
+                '- Reporting potential problems or issues timely; or solving them where possible; '
+                'and\n'
+                '- Ensuring the relevant teams, partners and stakeholders are aware of all '
+                'processes and policies that apply to them.\n'
+                '\n'
+                '## Role Expectations\n'
+                '\n'
+                'As a/an {{ career_level }}, the Employee is expected to perform the following:\n'
+                '{% for responsibility in role_responsibilities %}\n'
+                '- {{ responsibility }}\n'
+                '{% endfor %}\n'
+                '\n'
+                '## Strategic Area KPI Breakdown\n'
+                '\n'
+                'The Employee is responsible to oversee and execute the roles according to the '
+                'organization strategic areas KPI, including but not limited to:\n'
+                '\n'
+                '| Strategic Area | KPI (%) | Role Focus |\n'
+                '|----------------|---------|------------|\n'
+                '{% for area, details in kpi_breakdown.items() %}\n'
+                '| {{ area }} | {{ details.percentage if details is mapping else details }}% | {{ '
+                "details.description if details is mapping else '' }} |\n"
+                '{% endfor %}\n'
+                '\n'
+                '## Media Consent\n'
+                '\n'
+                'By signing this Contract, you hereby consent for {{ company.name }}, and/or its '
+                'partners to take your photographs, digital images and/or audio and/or video '
+                'footage (the images) of and to store the images, make copies of the images and '
+                'publish the images in any form, in whole or in part, and distribute them in any '
+                'medium including, but not limited to, print media, the Internet, CD-ROM, other '
+                'multimedia uses or graphic representation, cinematography or video.\n'
+                '\n'
+                '## Working Hours\n'
+                '\n'
+                'The Organization general hours of operation are {{ working_hours.general }}.\n'
+                'The Employee may work flexible hours on a weekly basis as long as the weekly '
+                'hours amount to {{ working_hours.weekly_hours }} hours.\n'
+                '\n'
+                'However, there might be occasions where project work requires the Employee to '
+                'work more than {{ working_hours.weekly_hours }} hours ("Overtime"). In such a '
+                'situation, the Employee will be informed beforehand and could apply for '
+                'Replacement Leave. The Employee will need to inform the Manager. (see section J. '
+                'Leave Entitlements).\n'
+                '\n'
+                '### Overtime Replacement Leave\n'
+                '| Overtime Hours | Replacement Leave |\n'
+                '|----------------|-------------------|\n'
+                '{% for hours, leave in overtime_policy.replacement_leave.items() %}\n'
+                '| {{ hours }} | {{ leave }} |\n'
+                '{% endfor %}\n'
+                '\n'
+                'The Employee is expected to start work by {{ working_hours.start_time }} daily or '
+                'earlier if required. If the Employee has obligations outstation (meetings, site '
+                'visits, etc.), the Employee has to inform his or her manager in advance at all '
+                'times.\n'
+                '\n'
+                "## The Contract Terms & Organization's Policies\n"
+                '\n'
+                "The Employee is required to comply with the Organization's policy at all times as "
+                'enlisted in, but not limited to, the Code of Conduct and Standard Operating '
+                'Procedures. Failure to do so may result in immediate termination of employment.\n'
+                '\n'
+                'The Contract extension term and salary increment are to be determined by the '
+                "manager and to be approved by the Board, based on the Employee's scope of work "
+                "(responsibility), overall performance and the Organization's performance.\n"
+                '\n'
+                '## Remuneration & Payment Terms\n'
+                '\n'
+                "The Employee's fee will be paid in the fourth week of the month and/or first week "
+                'of the following month. Pro-rata if the Employee starts or ends in the middle of '
+                'the month.\n'
+                '\n'
+                "Salary increment is to be determined by the Employee's manager and to be approved "
+                "by the Board, based on the Employee's services, overall performance and the "
+                "Organization's performance. \n"
+                '\n'
+                'The salary (after EPF, PCB, SOCSO and EIS deduction) will be paid monthly.\n'
+                '\n'
+                'As proposed, the salary is as follows:\n'
+                '- **Salary**: {{ salary }}; and\n'
+                '- Your salary of {{ salary }} per month is inclusive of payment for every '
+                'statutory and general Public Holiday in Malaysia.\n'
+                '\n'
+                "However, such benefit policies are subject to management's annual review.\n"
+                '\n'
+                '## Termination Clause\n'
+                '\n'
+                'The Employee shall be required to give {{ termination.notice_period }} written '
+                'notice to the Organization for termination of this Contract.\n'
+                '\n'
+                "The Organization may terminate the Employee's employment by giving a {{ "
+                'termination.notice_period }} notice period (or payment in lieu) depending on '
+                'service. \n'
+                '\n'
+                'Following the termination of your employment, the Employee will be required to '
+                'return all organization and {{ company.name }} property.\n'
+                '\n'
+                "Any violation of the Organization's Code of Conduct (refer to Appendix A) "
+                'policies and procedures will result in an immediate termination of this '
+                'Contract.\n'
+                '\n'
+                '## Leave Entitlement\n'
+                '\n'
+                'You are entitled to {{ leave_entitlements.annual_leave }} days of Annual Leave '
+                'per year if you start to work full-time in January. If the employment period '
+                'starts at any other month, the annual leave will be automatically prorated.\n'
+                '\n'
+                'During the first year of employment, you will acquire leave entitlement on an '
+                'accrual basis.\n'
+                '\n'
+                'In the second year of employment, you will be awarded full leave permission at '
+                'the beginning of each year and may carry forward 10 days of leave per year.\n'
+                '\n'
+                'You are entitled to {{ leave_entitlements.medical_leave }} days of Medical Leave, '
+                '{{ leave_entitlements.hospitalization_leave }} days of Hospitalization leave '
+                '(non-maternal), {{ leave_entitlements.paternity_leave }} days of paternity leave, '
+                '{{ leave_entitlements.maternity_leave }} days of maternity leave, {{ '
+                'leave_entitlements.compassionate_leave }} days of compassionate leave, and {{ '
+                'leave_entitlements.study_leave }} days of study leave. However, such leave '
+                'policies are subject to annual review.\n'
+                '\n'
+                'For maternity leave, please provide a 2-month notice to notify the pregnancy to '
+                'the Supervisor and/or Direct Leader and/or Employer.\n'
+                '\n'
+                "If you worked overtime and on Public Holidays, you may, with your manager's "
+                'approval, apply for Replacement Leave on the Organizations platform. You may '
+                'utilize all Replacement Leaves in the same month or the following week and do not '
+                'accumulate after 2-month.\n'
+                '\n'
+                '## Benefits\n'
+                '\n'
+                'During the Employment Term, the Executive will be entitled to participate in the '
+                'Holistic Wellness benefit plans. The Employee may have the option to participate '
+                'in the: \n'
+                '- {{ benefits.wellness_claim }} wellness claim annually\n'
+                '\n'
+                'The Organization is liable to contribute to the Employees Provident Fund (EPF), '
+                'Social Security Organization (SOCSO) and Employment Insurance System (EIS), for '
+                'the Organization contribution portion.\n'
+                '\n'
+                '## Performance Management\n'
+                '\n'
+                'The Employee to jointly agree on the yearly strategic plan and KPIs with the '
+                'Organization.\n'
+                '\n'
+                'The Employee shall deliver the above set KPIs whilst being guided by the Core '
+                'Values of the Organization. The core values are as follows:\n'
+                '\n'
+                '| Item | Core Values | Description |\n'
+                '|------|-------------|-------------|\n'
+                '{% for value in core_values %}\n'
+                '| {{ loop.index }}. | {{ value.name }} | {{ value.description }} |\n'
+                '{% endfor %}\n'
+                '\n'
+                '## Confidentiality\n'
+                '\n'
+                'All confidential and proprietary information relating to the business or '
+                'operations of the Organization or off its affiliates shall be kept and treated as '
+                'confidential both during and after the employment.\n'
+                '\n'
+                '---\n'
+                '\n'
+                '*** This part is intentionally left blank. ***\n'
+                '\n'
+                'The Organization and the Employee hereby declare that they understand thoroughly '
+                'the above provisions and agree to sign to abide by such provisions. They shall '
+                'each retain a copy of this contract for future reference.\n'
+                '\n'
+                '**Signature of Employee**: _________________\n'
+                '\n'
+                '**NRIC / Passport Number**: {{ employee_id }}\n'
+                '\n'
+                '**Date**: _________________\n'
+                '\n'
+                "**Organization's Initial**: {{ company.name }} ({{ company.registration_number "
+                '}})\n'
+                '\n'
+                '**Date**: _________________\n'
+                '\n'
+                '---\n'
+                '\n'
+                '## APPENDIX A: CODE OF CONDUCT\n'
+                '\n'
+                'Between {{ company.name }} (hereinafter referred to as the "Organization" and '
+                '"We")\n'
+                '\n'
+                'and {{ employee_name }} (hereinafter referred to as "the Employee" and "You")\n'
+                '\n'
+                '### Sustainable Working Environment\n'
+                '\n'
+                'We maintain an inclusive work environment and achieve excellence by attracting '
+                'and retaining people of all backgrounds in our workforce.\n'
+                '\n'
+                'We have identified mutual respect, honest communication and professional conduct '
+                'as essential pillars in the culture.\n'
+                '\n'
+                'We prohibit sexual, physical, emotional or any other kind of harassment by any '
+                'person in the workplace or while conducting business.\n'
+                '\n'
+                'We strive to avoid favouritism or the appearance of favouritism in the workplace '
+                'in accordance with the policies and procedures adopted.\n'
+                '\n'
+                'We comply with all policies and procedures at all times.\n'
+                '\n'
+                'We comply with Malaysian and international law at all times.\n'
+                '\n'
+                'We strive to be a contributing member of the global community. We support the '
+                'human rights movement and aim to maximize positive social impact on our '
+                'projects.\n'
+                '\n'
+                "We are committed to doing our part to help preserve the Earth's finite resources "
+                'and maintain the wellbeing of our planet for generations to come.\n'
+                '\n'
+                '### Equal Employment Opportunities\n'
+                '\n'
+                'We provide employment opportunities to all qualified persons on an equal basis. '
+                'This includes, but is not limited to, recruitment, hiring, promotion, transfer, '
+                'compensation, training, demotion or layoff. We will not discriminate against any '
+                'Contractor, Employee or applicant for employment because of:\n'
+                '- Gender or Gender Identity\n'
+                '- Race, Ethnicity or National Origin\n'
+                '- Religion\n'
+                '- Age\n'
+                '- Sexual Orientation\n'
+                '- Disability\n'
+                '- Marital Status\n'
+                '\n'
+                'We do not use child labour. Child labour is defined as employing any person '
+                'younger than the minimum age allowed by law in the jurisdiction in question. '
+                'However, in no event will we knowingly employ or hire anyone younger than sixteen '
+                '(16) years of age.\n'
+                '\n'
+                '### Health & Safety\n'
+                '\n'
+                'We strive to eliminate potential hazards from the workplace and to comply with '
+                'all applicable occupational safety and health laws and standards.\n'
+                '\n'
+                'We help maintain a safe, healthy and productive work environment for all team '
+                'members and others, by:\n'
+                '- prohibiting any acts that could be perceived as violent, threatening, degrading '
+                'or intimidating.\n'
+                '- prohibiting the spreading of unconfirmed information, gossip or information '
+                'that has no other purpose than damaging morale.\n'
+                '- prohibiting bullying\n'
+                '- prohibiting the possession, use, sale or transfer of illegal drugs or drug '
+                'paraphernalia\n'
+                '- prohibiting the conduct of business while under the influence of alcohol\n'
+                '- prohibiting the possession or use of weapons/firearms, explosive devices or '
+                'ammunition.\n'
+                '\n'
+                'All Contractors/Employees/Interns are required to comply with and understand the '
+                'importance to follow the Health and Safety guidelines and requirements, including '
+                'the use of PPE set by the Organization.\n'
+                '\n'
+                '☐ I have read and understood the code of conduct and I agree to adhere to its '
+                'contents for the duration of my affiliation with {{ company.name }}. I understand '
+                'that failure to do so may result in the immediate termination of my professional '
+                'relationship with the Organization.\n'
+                '\n'
+                '**Name**: {{ employee_name }}\n'
+                '\n'
+                '**Date**: _________________\n'
+                '\n'
+                '**Signature**: _________________\n'
+                '\n'
+                '---\n'
+                '\n'
+                '## APPENDIX B: THE NON-DISCLOSURE AGREEMENT\n'
+                '\n'
+                'The NON-DISCLOSURE AGREEMENT, (hereinafter known as "the Agreement", is entered '
+                'into between {{ employee_name }} (hereinafter known as "the '
+                'Contractor/Intern/Employee") and {{ company.name }} (hereinafter known as "the '
+                'Organization"), (collectively known as "the Parties"), as of this {{ '
+                'contract_date }}.\n'
+                '\n'
+                '### (A) Scope of the Agreement\n'
+                '\n'
+                'The Agreement acknowledges that certain information, trade secrets, and '
+                'proprietary data (hereinafter known as "Confidential Information") of or '
+                "regarding the Organization and/or the Organization's business may be discussed "
+                'between the Contractor/Intern/Employee and the Organization.\n'
+                '\n'
+                '### (B) Confidential Information\n'
+                '\n'
+                'For the purpose of this clause, Confidential Information includes (but shall not '
+                'be limited to) trade secrets, technical know-how, any information relating to '
+                'customers, operations and financial information and commercial methods of the '
+                'Organization, any material, knowledge, and data (verbal, electronic, written '
+                "and/or in any other form) concerning the Organization or the Organization's "
+                'businesses, not generally known to the public.\n'
+                '\n'
+                'Except in carrying out your duties for the Organization, you must keep '
+                'confidential and must not either during the course of your employment or at any '
+                'time thereafter directly or indirectly disclose, publish or use for your own '
+                'benefit or for the benefit of others either:\n'
+                "(i) Any of the Organization's and/or Organization's businesses Confidential "
+                'Information or that of its customers without first having obtained the '
+                "Organization's written consent to such disclosure, publication or use; or\n"
+                '(ii) Any information which has been disclosed to the Organization and/or the '
+                "Organization's business by others under an agreement which requires the "
+                "Organization and/or the Organization's business to keep such information "
+                'confidential.\n'
+                '\n'
+                '### (C) Previous Agreements\n'
+                '\n'
+                'The Agreement constitutes the entirety of the Agreement and the signing thereof '
+                'by both the Parties nullifies any and all previous agreements made between the '
+                'Organization and the Contractor/Intern/Employee.\n'
+                '\n'
+                '### (D) Modifications and Amendments\n'
+                '\n'
+                'No modifications, amendments, rectifications, changes and/or alterations shall be '
+                'made to the Agreement by either party unless in writing and signed by authorized '
+                'representatives of both the Parties.\n'
+                '\n'
+                '### (E) Successors and Assigns\n'
+                '\n'
+                'The Agreement shall be binding upon the successors, subsidiaries, assigns and/or '
+                'corporations controlling or controlled by the Parties. The Organization may '
+                'assign the Agreement to any party at any time, whereas the '
+                'Contractor/Intern/Employee is prohibited from assigning any of his/her rights or '
+                'obligations in the Agreement without prior written consent from the '
+                'Organization.\n'
+                '\n'
+                '### (F) Nature of Contractual Relationship between the Parties\n'
+                '\n'
+                'The Agreement:-\n'
+                '(i) does not constitute a contract of employment, nor does it guarantee the '
+                "Contractor's/Intern's/Employees continuation of employment with the Organization; "
+                'and\n'
+                '(ii) does not create a partnership or joint venture between the Organization and '
+                'the Contractor/Intern/Employee.\n'
+                '\n'
+                '### (G) Severability\n'
+                '\n'
+                'Any provision within the Agreement (or any portion thereof) deemed invalid, '
+                'unlawful or otherwise unusable by a court of law shall be dissolved from the '
+                'Agreement and the remainder of the Agreement shall continue to be enforceable.\n'
+                '\n'
+                '### (H) Governing Law\n'
+                '\n'
+                'The Agreement shall be governed by the Malaysian laws.\n'
+                '\n'
+                '### (I) Immunity\n'
+                '\n'
+                'Disclosing Confidential Information to an attorney, government representative or '
+                'court official in confidence while assisting or taking part in a case involving a '
+                'suspected violation of law connected or related to the Organization and/or '
+                "Organization's business is considered as a breach of the Agreement unless the "
+                'Contractor/Intern/Employee is required to disclose Confidential Information by '
+                'law.\n'
+                '\n'
+                '### (J) Cause of Action\n'
+                '\n'
+                'The Contractor/Intern/Employee understands that the use or disclosure of any '
+                'Confidential Information may be cause for an action at law in an appropriate '
+                'forum or in any court of law, and that the Organization shall be entitled to an '
+                'injunction prohibiting the use or disclosure of the Confidential Information.\n'
+                '\n'
+                '### (K) Indemnification\n'
+                '\n'
+                'The Contractor/Intern/Employee understands and agrees that if the use or '
+                'disclosure of Confidential Information by him/her or any affiliate, or '
+                'representative of the Contractor/Intern/Employee causes damage, loss, cost or '
+                "expense to the Organization and/or the Organization's business, the "
+                'Contractor/Intern/Employee shall be held responsible and shall indemnify the '
+                'Organization.\n'
+                '\n'
+                '### (L) Injunctive Relief\n'
+                '\n'
+                'The Contractor/Intern/Employee understands and agrees that the use or disclosure '
+                'of Confidential Information could cause the Organization irreparable harm and the '
+                'Organization has the right to pursue legal action beyond remedies of a monetary '
+                'nature in the form of an injunctive or equitable relief.\n'
+                '\n'
+                '### (M) Notice of Unauthorized Use or Disclosure\n'
+                '\n'
+                'The Contractor/Intern/Employee is bound by the Agreement to notify the '
+                'Organization in the event of a breach of the Agreement involving the '
+                'dissemination of Confidential Information, either by the '
+                'Contractor/Intern/Employee or a third party, the Contractor/Intern/Employee will '
+                'do everything possible to help the Organization regains possession of the '
+                'Confidential Information.\n'
+                '\n'
+                '### (N) Costs and Expenses\n'
+                '\n'
+                'In a dispute arising out of or in relation to the Agreement, if either party '
+                'brings an action to enforce their rights under the Agreement, the winning party '
+                "shall recover its costs and expenses (including reasonable attorney's fees) "
+                'incurred in connection with the action and/or any appeal, from the losing party.\n'
+                '\n'
+                'IN WITNESS WHEREOF, the Contractor/Intern/Employee hereto agrees to the terms of '
+                'the Agreement and signed on the date written below.\n'
+                '\n'
+                '**By**: _________________\n'
+                '\n'
+                '**Name**: {{ employee_name }}\n'
+                '\n'
+                '**Date**: _________________\n',
+ 'roles-responsibilities.md': '# {{ job_title }}\n'
+                              '\n'
+                              '## Role Overview\n'
+                              '\n'
+                              'As a {{ career_level }}, the Employee is expected to perform the '
+                              "following responsibilities in alignment with {{ company.name }}'s "
+                              'mission and strategic objectives:\n'
+                              '\n'
+                              '{% for responsibility in role_responsibilities %}\n'
+                              '- {{ responsibility }}\n'
+                              '{% endfor %}\n'
+                              '\n'
+                              '## Strategic Area KPI Breakdown\n'
+                              '\n'
+                              'The Employee is responsible to oversee and execute the roles '
+                              'according to the organization strategic areas KPI, including but '
+                              'not limited to:\n'
+                              '\n'
+                              '### Vision (VIS) : {{ kpi_breakdown.Vision }}%\n'
+                              'To achieve the strategic vision of the Business Unit - Strategic '
+                              'Planning, Business Model Planning, Group, Business Unit HR '
+                              'Planning, Strategic Partnerships, Corporate Communications & '
+                              'Marketing, Industry Networking, LinkedIn\n'
+                              '\n'
+                              '**Key Activities:**\n'
+                              '{{ vision_activities }}\n'
+                              '\n'
+                              '### Delivery & Impact Creation (DEL) : {{ kpi_breakdown.Delivery '
+                              '}}%\n'
+                              'To achieve the actual program, platform or business unit '
+                              'deliverables - Project / product / platform delivery, Project HR & '
+                              'Budget planning, Project-specific communications (Individual '
+                              'Education programs that have been secured), Client meetings, '
+                              'communications, emails to program partners, etc, Program specific '
+                              'content creation, Comms materials for the project / program '
+                              '(posters, landing pages, forms, etc), Community Engagement, Student '
+                              'recruitment, etc\n'
+                              '\n'
+                              '**Key Activities:**\n'
+                              '{{ delivery_activities }}\n'
+                              '\n'
+                              '### Financial (FIN) : {{ kpi_breakdown.Financial }}%\n'
+                              'To achieve the financial objective of the business unit - Business '
+                              'Development, Proposal writing, Funding and fundraising activities, '
+                              'Accounting & Finance Planning, Pitching activities\n'
+                              '\n'
+                              '**Key Activities:**\n'
+                              '{{ financial_activities }}\n'
+                              '\n'
+                              '### Quality (QUA) : {{ kpi_breakdown.Quality }}%\n'
+                              'To achieve the desired quality within each Business Unit - Check & '
+                              'Balances, Work Review etc. - Post-program satisfaction forms, '
+                              'Client feedback forms, Management team reviews of Delivery, Report '
+                              'generation and analysis.\n'
+                              '\n'
+                              '**Key Activities:**\n'
+                              '{{ quality_activities }}\n'
+                              '\n'
+                              '### Learning Development & Personal Career Growth (LnD) : {{ '
+                              'kpi_breakdown.LnD }}%\n'
+                              'To achieve the desired growth levels within each team - Attending '
+                              'training sessions, Participating in webinars, courses, etc, Lunch & '
+                              'Learn sessions, HR career chats, Team review sessions, feedback '
+                              'sessions, Activities that are in accordance with an Individuals '
+                              'Career Development Plans\n'
+                              '\n'
+                              '**Key Activities:**\n'
+                              '{{ lnd_activities }}\n'
+                              '\n'
+                              '### Internal Communication & Management (ICO) : {{ '
+                              'kpi_breakdown.ICO }}%\n'
+                              'Using the appropriate planning and management tools.\n'
+                              '\n'
+                              '**Key Activities:**\n'
+                              '{{ ico_activities }}\n'
+                              '\n'
+                              '## Team-Specific Responsibilities\n'
+                              '\n'
+                              'As part of the {{ team }} team, the Employee will focus on:\n'
+                              '\n'
+                              '{% for focus_area in team_focus_areas %}\n'
+                              '- {{ focus_area }}\n'
+                              '{% endfor %}\n'
+                              '\n'
+                              '## Performance Expectations\n'
+                              '\n'
+                              '### Key Success Metrics\n'
+                              '- **Timely Delivery**: Complete assigned tasks within agreed '
+                              'timelines\n'
+                              '- **Quality Standards**: Maintain high quality in all deliverables\n'
+                              '- **Collaboration**: Work effectively with cross-functional teams\n'
+                              '- **Innovation**: Contribute new ideas and improvements\n'
+                              '- **Learning**: Actively participate in professional development '
+                              'activities\n'
+                              '\n'
+                              '### Reporting Structure\n'
+                              '- **Direct Report**: {{ reporting_to }}\n'
+                              '- **Team**: {{ team }}\n'
+                              '- **Career Level**: {{ career_level }}\n'
+                              '\n'
+                              '## Professional Development\n'
+                              '\n'
+                              'The Employee is encouraged to:\n'
+                              '- Participate in relevant training programs and workshops\n'
+                              '- Attend industry conferences and networking events\n'
+                              '- Pursue certifications relevant to their role\n'
+                              '- Contribute to knowledge sharing within the organization\n'
+                              '- Mentor junior team members (where applicable)\n'
+                              '\n'
+                              '## Tools and Resources\n'
+                              '\n'
+                              'The Employee will have access to:\n'
+                              '- Project management tools and platforms\n'
+                              '- Communication and collaboration software\n'
+                              '- Learning and development resources\n'
+                              '- Industry-specific tools and software\n'
+                              '- Professional development budget (as applicable)\n'
+                              '\n'
+                              '## Compliance and Standards\n'
+                              '\n'
+                              'The Employee must:\n'
+                              '- Adhere to all company policies and procedures\n'
+                              '- Maintain confidentiality of sensitive information\n'
+                              '- Follow health and safety guidelines\n'
+                              '- Comply with relevant industry regulations\n'
+                              "- Uphold the company's core values and code of conduct\n"
+                              '\n'
+                              '---\n'
+                              '\n'
+                              '*This document should be reviewed and updated annually or when '
+                              'there are significant changes to the role or organizational '
+                              'structure.*\n',
+ 'confirmation.md': '# Letter of Confirmation\n'
+                    '\n'
+                    '**Date**: {{ confirmation_date }}\n'
+                    '\n'
+                    '**To**: {{ employee_name }}\n'
+                    '\n'
+                    '**Subject**: Confirmation of Appointment as {{ job_title }}\n'
+                    '\n'
+                    'Dear {{ employee_name }},\n'
+                    '\n'
+                    'Congratulations! We are delighted to confirm your appointment as a {{ '
+                    'job_title }} at {{ company.name }}, effective {{ effective_date }}.\n'
+                    '\n'
+                    'This milestone reflects your dedication, performance, and the positive impact '
+                    'you have made during your probationary period. We are confident that your '
+                    'journey ahead will be even more rewarding. As you step into this new phase, '
+                    'we encourage you to continue leveraging your strengths, exploring new '
+                    'opportunities, and making a lasting impact.\n'
+                    '\n'
+                    '{% if personal_note %}\n'
+                    '{{ personal_note }}\n'
+                    '\n'
+                    '{% endif %}\n'
+                    '## Role Confirmation Details\n'
+                    '\n'
+                    '- **Position**: {{ job_title }}\n'
+                    '- **Team**: {{ team }}\n'
+                    '- **Career Level**: {{ career_level }}\n'
+                    '- **Reporting To**: {{ reporting_to }}\n'
+                    '- **Effective Date**: {{ effective_date }}\n'
+                    '\n'
+                    '## Key Responsibilities\n'
+                    '\n'
+                    'In your confirmed role, you will be responsible for:\n'
+                    '{% for responsibility in key_responsibilities %}\n'
+                    '- {{ responsibility }}\n'
+                    '{% endfor %}\n'
+                    '\n'
+                    '## Performance Expectations\n'
+                    '\n'
+                    'As a confirmed team member, we expect you to:\n'
+                    '- Deliver high-quality work that aligns with our strategic objectives\n'
+                    '- Contribute actively to team collaboration and knowledge sharing\n'
+                    '- Maintain professional standards and uphold our core values\n'
+                    '- Continue your professional development and growth\n'
+                    '- Demonstrate leadership qualities and initiative in your work\n'
+                    '\n'
+                    '## Next Steps\n'
+                    '\n'
+                    '1. **Performance Review**: Your next performance review will be scheduled for '
+                    '{{ next_review_date }}\n'
+                    '2. **Career Development**: We encourage you to discuss your career goals with '
+                    'your manager\n'
+                    '3. **Training Opportunities**: Take advantage of available training and '
+                    'development programs\n'
+                    '4. **Feedback**: Continue to provide and receive constructive feedback for '
+                    'continuous improvement\n'
+                    '\n'
+                    '## Support and Resources\n'
+                    '\n'
+                    'You will continue to have access to:\n'
+                    '- All necessary tools and resources for your role\n'
+                    '- Professional development opportunities\n'
+                    '- Support from your manager and team members\n'
+                    '- Company benefits and policies as outlined in your employment contract\n'
+                    '\n'
+                    'Your employment terms and conditions remain unchanged as per your initial '
+                    'contract unless communicated otherwise. Should you have any questions or '
+                    'require further clarification, please do not hesitate to reach out to your '
+                    'manager or the HR team.\n'
+                    '\n'
+                    '## Core Values Reminder\n'
+                    '\n'
+                    'As a confirmed member of our team, we remind you of our core values that '
+                    'guide everything we do:\n'
+                    '\n'
+                    '{% for value in core_values %}\n'
+                    '- **{{ value.name }}**: {{ value.description }}\n'
+                    '{% endfor %}\n'
+                    '\n'
+                    'Once again, congratulations on this achievement! We look forward to your '
+                    'continued success and are excited to see the great things you will accomplish '
+                    'at {{ company.name }}.\n'
+                    '\n'
+                    '## Contact Information\n'
+                    '\n'
+                    'If you have any questions about your confirmation or need support, please '
+                    'contact:\n'
+                    '\n'
+                    '**{{ hr_contact.name }}**  \n'
+                    '{{ hr_contact.title }}  \n'
+                    'Email: {{ hr_contact.email }}  \n'
+                    'Phone: {{ hr_contact.phone }}\n'
+                    '\n'
+                    'Sincerely,\n'
+                    '\n'
+                    '---\n'
+                    '\n'
+                    '**{{ hr_contact.name }}**  \n'
+                    '{{ hr_contact.title }}  \n'
+                    '{{ company.name }}\n'
+                    '\n'
+                    '---\n'
+                    '\n'
+                    '*This confirmation letter is part of your employment records and should be '
+                    'kept for future reference.*\n'}
+TEMPLATE_CODE = {'contract.md': 'from jinja2.runtime import LoopContext, Macro, Markup, Namespace, '
+                'TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, '
+                'identity, internalcode, markup_join, missing, str_join\n'
+                "name = 'contract.md'\n"
+                '\n'
+                'def root(context, missing=missing, environment=environment):\n'
+                '    resolve = context.resolve_or_missing\n'
+                '    undefined = environment.undefined\n'
+                '    concat = environment.concat\n'
+                '    cond_expr_undefined = Undefined\n'
+                '    if 0: yield None\n'
+                "    l_0_contract_date = resolve('contract_date')\n"
+                "    l_0_employee_name = resolve('employee_name')\n"
+                "    l_0_employee_id = resolve('employee_id')\n"
+                "    l_0_company = resolve('company')\n"
+                "    l_0_job_title = resolve('job_title')\n"
+                "    l_0_team = resolve('team')\n"
+                "    l_0_career_level = resolve('career_level')\n"
+                "    l_0_contract_term = resolve('contract_term')\n"
+                "    l_0_start_date = resolve('start_date')\n"
+                "    l_0_end_date = resolve('end_date')\n"
+                "    l_0_reporting_to = resolve('reporting_to')\n"
+                "    l_0_work_location = resolve('work_location')\n"
+                "    l_0_job_description = resolve('job_description')\n"
+                "    l_0_role_responsibilities = resolve('role_responsibilities')\n"
+                "    l_0_kpi_breakdown = resolve('kpi_breakdown')\n"
+                "    l_0_working_hours = resolve('working_hours')\n"
+                "    l_0_overtime_policy = resolve('overtime_policy')\n"
+                "    l_0_salary = resolve('salary')\n"
+                "    l_0_termination = resolve('termination')\n"
+                "    l_0_leave_entitlements = resolve('leave_entitlements')\n"
+                "    l_0_benefits = resolve('benefits')\n"
+                "    l_0_core_values = resolve('core_values')\n"
+                '    try:\n'
+                "        t_1 = environment.tests['mapping']\n"
+                '    except KeyError:\n'
+                '        @internalcode\n'
+                '        def t_1(*unused):\n'
+                '            raise TemplateRuntimeError("No test named \'mapping\' found.")\n'
+                '    pass\n'
+                '    yield \'# EMPLOYMENT CONTRACT\\n\\nThis Contract of Services ("the Contract") '
+                "is made and entered into effective as of '\n"
+                "    yield str((undefined(name='contract_date') if l_0_contract_date is missing "
+                'else l_0_contract_date))\n'
+                "    yield ' between \\n'\n"
+                "    yield str((undefined(name='employee_name') if l_0_employee_name is missing "
+                'else l_0_employee_name))\n'
+                "    yield ' (NRIC/Passport No: '\n"
+                "    yield str((undefined(name='employee_id') if l_0_employee_id is missing else "
+                'l_0_employee_id))\n'
+                '    yield \') ("the Employee"), and \'\n'
+                "    yield str(environment.getattr((undefined(name='company') if l_0_company is "
+                "missing else l_0_company), 'name'))\n"
+                "    yield ' ('\n"
+                "    yield str(environment.getattr((undefined(name='company') if l_0_company is "
+                "missing else l_0_company), 'registration_number'))\n"
+                '    yield \') ("the Employer") ("the Organization"). \\n\\nWHEREAS, the Employee '
+                "desires to perform such services by the Employer as '\n"
+                "    yield str((undefined(name='job_title') if l_0_job_title is missing else "
+                'l_0_job_title))\n'
+                "    yield ' pursuant to the terms and conditions set forth in the "
+                'Contract.\\n\\nWHEREAS, the Employer desires to have a need from the Employee in '
+                'such capacity pursuant to the terms and conditions set forth in the '
+                'Contract.\\n\\nIT IS HEREBY AGREED as follows: \\n\\n## Job Specification\\n\\n| '
+                "Field | Value |\\n|-------|-------|\\n| Job Title | '\n"
+                "    yield str((undefined(name='job_title') if l_0_job_title is missing else "
+                'l_0_job_title))\n'
+                "    yield ' |\\n| Team | '\n"
+                "    yield str((undefined(name='team') if l_0_team is missing else l_0_team))\n"
+                "    yield ' |\\n| Career Level | '\n"
+                "    yield str((undefined(name='career_level') if l_0_career_level is missing else "
+                'l_0_career_level))\n'
+                "    yield ' |\\n| Contract Term | '\n"
+                "    yield str((undefined(name='contract_term') if l_0_contract_term is missing "
+                'else l_0_contract_term))\n'
+                "    yield ' |\\n| Contract Start Date | '\n"
+                "    yield str((undefined(name='start_date') if l_0_start_date is missing else "
+                'l_0_start_date))\n'
+                "    yield ' |\\n| Contract End Date | '\n"
+                "    yield str((undefined(name='end_date') if l_0_end_date is missing else "
+                'l_0_end_date))\n'
+                "    yield ' |\\n| Reporting To | '\n"
+                "    yield str((undefined(name='reporting_to') if l_0_reporting_to is missing else "
+                'l_0_reporting_to))\n'
+                "    yield ' |\\n| Work Location | '\n"
+                "    yield str((undefined(name='work_location') if l_0_work_location is missing "
+                'else l_0_work_location))\n'
+                "    yield ' |\\n\\n## Job Description & Organization Strategic Area KPI\\n\\n'\n"
+                "    yield str((undefined(name='job_description') if l_0_job_description is "
+                'missing else l_0_job_description))\n'
+                "    yield '\\n\\nThe Employee is required to attend regular meetings with the "
+                'project team regarding the strategy and growth of the project. The Employee is '
+                'also required to manage the project by:\\n- Facilitating communication between '
+                'the relevant teams, partners, and stakeholders;\\n- Reporting potential problems '
+                'or issues timely; or solving them where possible; and\\n- Ensuring the relevant '
+                'teams, partners and stakeholders are aware of all processes and policies that '
+                "apply to them.\\n\\n## Role Expectations\\n\\nAs a/an '\n"
+                "    yield str((undefined(name='career_level') if l_0_career_level is missing else "
+                'l_0_career_level))\n'
+                "    yield ', the Employee is expected to perform the following:\\n'\n"
+                "    for l_1_responsibility in (undefined(name='role_responsibilities') if "
+                'l_0_role_responsibilities is missing else l_0_role_responsibilities):\n'
+                '        _loop_vars = {}\n'
+                '        pass\n'
+                "        yield '- '\n"
+                '        yield str(l_1_responsibility)\n'
+                "        yield '\\n'\n"
+                '    l_1_responsibility = missing\n'
+                "    yield '\\n## Strategic Area KPI Breakdown\\n\\nThe Employee is responsible to "
+                'oversee and execute the roles according to the organization strategic areas KPI, '
+                'including but not limited to:\\n\\n| Strategic Area | KPI (%) | Role Focus '
+                "|\\n|----------------|---------|------------|\\n'\n"
+                '    for (l_1_area, l_1_details) in '
+                "context.call(environment.getattr((undefined(name='kpi_breakdown') if "
+                "l_0_kpi_breakdown is missing else l_0_kpi_breakdown), 'items')):\n"
+                '        _loop_vars = {}\n'
+                '        pass\n'
+                "        yield '| '\n"
+                '        yield str(l_1_area)\n'
+                "        yield ' | '\n"
+                "        yield str((environment.getattr(l_1_details, 'percentage') if "
+                't_1(l_1_details) else l_1_details))\n'
+                "        yield '% | '\n"
+                "        yield str((environment.getattr(l_1_details, 'description') if "
+                "t_1(l_1_details) else ''))\n"
+                "        yield ' |\\n'\n"
+                '    l_1_area = l_1_details = missing\n'
+                "    yield '\\n## Media Consent\\n\\nBy signing this Contract, you hereby consent "
+                "for '\n"
+                "    yield str(environment.getattr((undefined(name='company') if l_0_company is "
+                "missing else l_0_company), 'name'))\n"
+                "    yield ', and/or its partners to take your photographs, digital images and/or "
+                'audio and/or video footage (the images) of and to store the images, make copies '
+                'of the images and publish the images in any form, in whole or in part, and '
+                'distribute them in any medium including, but not limited to, print media, the '
+                'Internet, CD-ROM, other multimedia uses or graphic representation, cinematography '
+                'or video.\\n\\n## Working Hours\\n\\nThe Organization general hours of operation '
+                "are '\n"
+                "    yield str(environment.getattr((undefined(name='working_hours') if "
+                "l_0_working_hours is missing else l_0_working_hours), 'general'))\n"
+                "    yield '.\\nThe Employee may work flexible hours on a weekly basis as long as "
+                "the weekly hours amount to '\n"
+                "    yield str(environment.getattr((undefined(name='working_hours') if "
+                "l_0_working_hours is missing else l_0_working_hours), 'weekly_hours'))\n"
+                "    yield ' hours.\\n\\nHowever, there might be occasions where project work "
+                "requires the Employee to work more than '\n"
+                "    yield str(environment.getattr((undefined(name='working_hours') if "
+                "l_0_working_hours is missing else l_0_working_hours), 'weekly_hours'))\n"
+                '    yield \' hours ("Overtime"). In such a situation, the Employee will be '
+                'informed beforehand and could apply for Replacement Leave. The Employee will need '
+                'to inform the Manager. (see section J. Leave Entitlements).\\n\\n### Overtime '
+                'Replacement Leave\\n| Overtime Hours | Replacement Leave '
+                "|\\n|----------------|-------------------|\\n'\n"
+                '    for (l_1_hours, l_1_leave) in '
+                "context.call(environment.getattr(environment.getattr((undefined(name='overtime_policy') "
+                'if l_0_overtime_policy is missing else l_0_overtime_policy), '
+                "'replacement_leave'), 'items')):\n"
+                '        _loop_vars = {}\n'
+                '        pass\n'
+                "        yield '| '\n"
+                '        yield str(l_1_hours)\n'
+                "        yield ' | '\n"
+                '        yield str(l_1_leave)\n'
+                "        yield ' |\\n'\n"
+                '    l_1_hours = l_1_leave = missing\n'
+                "    yield '\\nThe Employee is expected to start work by '\n"
+                "    yield str(environment.getattr((undefined(name='working_hours') if "
+                "l_0_working_hours is missing else l_0_working_hours), 'start_time'))\n"
+                '    yield " daily or earlier if required. If the Employee has obligations '
+                'outstation (meetings, site visits, etc.), the Employee has to inform his or her '
+                "manager in advance at all times.\\n\\n## The Contract Terms & Organization's "
+                "Policies\\n\\nThe Employee is required to comply with the Organization's policy "
+                'at all times as enlisted in, but not limited to, the Code of Conduct and Standard '
+                'Operating Procedures. Failure to do so may result in immediate termination of '
+                'employment.\\n\\nThe Contract extension term and salary increment are to be '
+                'determined by the manager and to be approved by the Board, based on the '
+                "Employee's scope of work (responsibility), overall performance and the "
+                "Organization's performance.\\n\\n## Remuneration & Payment Terms\\n\\nThe "
+                "Employee's fee will be paid in the fourth week of the month and/or first week of "
+                'the following month. Pro-rata if the Employee starts or ends in the middle of the '
+                "month.\\n\\nSalary increment is to be determined by the Employee's manager and to "
+                "be approved by the Board, based on the Employee's services, overall performance "
+                "and the Organization's performance. \\n\\nThe salary (after EPF, PCB, SOCSO and "
+                'EIS deduction) will be paid monthly.\\n\\nAs proposed, the salary is as '
+                'follows:\\n- **Salary**: "\n'
+                "    yield str((undefined(name='salary') if l_0_salary is missing else "
+                'l_0_salary))\n'
+                "    yield '; and\\n- Your salary of '\n"
+                "    yield str((undefined(name='salary') if l_0_salary is missing else "
+                'l_0_salary))\n'
+                '    yield " per month is inclusive of payment for every statutory and general '
+                'Public Holiday in Malaysia.\\n\\nHowever, such benefit policies are subject to '
+                "management's annual review.\\n\\n## Termination Clause\\n\\nThe Employee shall be "
+                'required to give "\n'
+                "    yield str(environment.getattr((undefined(name='termination') if "
+                "l_0_termination is missing else l_0_termination), 'notice_period'))\n"
+                '    yield " written notice to the Organization for termination of this '
+                "Contract.\\n\\nThe Organization may terminate the Employee's employment by giving "
+                'a "\n'
+                "    yield str(environment.getattr((undefined(name='termination') if "
+                "l_0_termination is missing else l_0_termination), 'notice_period'))\n"
+                "    yield ' notice period (or payment in lieu) depending on service. "
+                '\\n\\nFollowing the termination of your employment, the Employee will be required '
+                "to return all organization and '\n"
+                "    yield str(environment.getattr((undefined(name='company') if l_0_company is "
+                "missing else l_0_company), 'name'))\n"
+                '    yield " property.\\n\\nAny violation of the Organization\'s Code of Conduct '
+                '(refer to Appendix A) policies and procedures will result in an immediate '
+                'termination of this Contract.\\n\\n## Leave Entitlement\\n\\nYou are entitled to '
+                '"\n'
+                "    yield str(environment.getattr((undefined(name='leave_entitlements') if "
+                "l_0_leave_entitlements is missing else l_0_leave_entitlements), 'annual_leave'))\n"
+                "    yield ' days of Annual Leave per year if you start to work full-time in "
+                'January. If the employment period starts at any other month, the annual leave '
+                'will be automatically prorated.\\n\\nDuring the first year of employment, you '
+                'will acquire leave entitlement on an accrual basis.\\n\\nIn the second year of '
+                'employment, you will be awarded full leave permission at the beginning of each '
+                "year and may carry forward 10 days of leave per year.\\n\\nYou are entitled to '\n"
+                "    yield str(environment.getattr((undefined(name='leave_entitlements') if "
+                'l_0_leave_entitlements is missing else l_0_leave_entitlements), '
+                "'medical_leave'))\n"
+                "    yield ' days of Medical Leave, '\n"
+                "    yield str(environment.getattr((undefined(name='leave_entitlements') if "
+                'l_0_leave_entitlements is missing else l_0_leave_entitlements), '
+                "'hospitalization_leave'))\n"
+                "    yield ' days of Hospitalization leave (non-maternal), '\n"
+                "    yield str(environment.getattr((undefined(name='leave_entitlements') if "
+                'l_0_leave_entitlements is missing else l_0_leave_entitlements), '
+                "'paternity_leave'))\n"
+                "    yield ' days of paternity leave, '\n"
+                "    yield str(environment.getattr((undefined(name='leave_entitlements') if "
+                'l_0_leave_entitlements is missing else l_0_leave_entitlements), '
+                "'maternity_leave'))\n"
+                "    yield ' days of maternity leave, '\n"
+                "    yield str(environment.getattr((undefined(name='leave_entitlements') if "
+                'l_0_leave_entitlements is missing else l_0_leave_entitlements), '
+                "'compassionate_leave'))\n"
+                "    yield ' days of compassionate leave, and '\n"
+                "    yield str(environment.getattr((undefined(name='leave_entitlements') if "
+                "l_0_leave_entitlements is missing else l_0_leave_entitlements), 'study_leave'))\n"
+                '    yield " days of study leave. However, such leave policies are subject to '
+                'annual review.\\n\\nFor maternity leave, please provide a 2-month notice to '
+                'notify the pregnancy to the Supervisor and/or Direct Leader and/or '
+                'Employer.\\n\\nIf you worked overtime and on Public Holidays, you may, with your '
+                "manager's approval, apply for Replacement Leave on the Organizations platform. "
+                'You may utilize all Replacement Leaves in the same month or the following week '
+                'and do not accumulate after 2-month.\\n\\n## Benefits\\n\\nDuring the Employment '
+                'Term, the Executive will be entitled to participate in the Holistic Wellness '
+                'benefit plans. The Employee may have the option to participate in the: \\n- "\n'
+                "    yield str(environment.getattr((undefined(name='benefits') if l_0_benefits is "
+                "missing else l_0_benefits), 'wellness_claim'))\n"
+                "    yield ' wellness claim annually\\n\\nThe Organization is liable to contribute "
+                'to the Employees Provident Fund (EPF), Social Security Organization (SOCSO) and '
+                'Employment Insurance System (EIS), for the Organization contribution '
+                'portion.\\n\\n## Performance Management\\n\\nThe Employee to jointly agree on the '
+                'yearly strategic plan and KPIs with the Organization.\\n\\nThe Employee shall '
+                'deliver the above set KPIs whilst being guided by the Core Values of the '
+                'Organization. The core values are as follows:\\n\\n| Item | Core Values | '
+                "Description |\\n|------|-------------|-------------|\\n'\n"
+                '    l_1_loop = missing\n'
+                "    for l_1_value, l_1_loop in LoopContext((undefined(name='core_values') if "
+                'l_0_core_values is missing else l_0_core_values), undefined):\n'
+                '        _loop_vars = {}\n'
+                '        pass\n'
+                "        yield '| '\n"
+                "        yield str(environment.getattr(l_1_loop, 'index'))\n"
+                "        yield '. | '\n"
+                "        yield str(environment.getattr(l_1_value, 'name'))\n"
+                "        yield ' | '\n"
+                "        yield str(environment.getattr(l_1_value, 'description'))\n"
+                "        yield ' |\\n'\n"
+                '    l_1_loop = l_1_value = missing\n'
+                "    yield '\\n## Confidentiality\\n\\nAll confidential and proprietary "
+                'information relating to the business or operations of the Organization or off its '
+                'affiliates shall be kept and treated as confidential both during and after the '
+                'employment.\\n\\n---\\n\\n*** This part is intentionally left blank. ***\\n\\nThe '
+                'Organization and the Employee hereby declare that they understand thoroughly the '
+                'above provisions and agree to sign to abide by such provisions. They shall each '
+                'retain a copy of this contract for future reference.\\n\\n**Signature of '
+                "Employee**: _________________\\n\\n**NRIC / Passport Number**: '\n"
+                "    yield str((undefined(name='employee_id') if l_0_employee_id is missing else "
+                'l_0_employee_id))\n'
+                '    yield "\\n\\n**Date**: _________________\\n\\n**Organization\'s Initial**: "\n'
+                "    yield str(environment.getattr((undefined(name='company') if l_0_company is "
+                "missing else l_0_company), 'name'))\n"
+                "    yield ' ('\n"
+                "    yield str(environment.getattr((undefined(name='company') if l_0_company is "
+                "missing else l_0_company), 'registration_number'))\n"
+                "    yield ')\\n\\n**Date**: _________________\\n\\n---\\n\\n## APPENDIX A: CODE "
+                "OF CONDUCT\\n\\nBetween '\n"
+                "    yield str(environment.getattr((undefined(name='company') if l_0_company is "
+                "missing else l_0_company), 'name'))\n"
+                '    yield \' (hereinafter referred to as the "Organization" and "We")\\n\\nand '
+                "'\n"
+                "    yield str((undefined(name='employee_name') if l_0_employee_name is missing "
+                'else l_0_employee_name))\n'
+                '    yield \' (hereinafter referred to as "the Employee" and "You")\\n\\n### '
+                'Sustainable Working Environment\\n\\nWe maintain an inclusive work environment '
+                'and achieve excellence by attracting and retaining people of all backgrounds in '
+                'our workforce.\\n\\nWe have identified mutual respect, honest communication and '
+                'professional conduct as essential pillars in the culture.\\n\\nWe prohibit '
+                'sexual, physical, emotional or any other kind of harassment by any person in the '
+                'workplace or while conducting business.\\n\\nWe strive to avoid favouritism or '
+                'the appearance of favouritism in the workplace in accordance with the policies '
+                'and procedures adopted.\\n\\nWe comply with all policies and procedures at all '
+                'times.\\n\\nWe comply with Malaysian and international law at all times.\\n\\nWe '
+                'strive to be a contributing member of the global community. We support the human '
+                'rights movement and aim to maximize positive social impact on our '
+                "projects.\\n\\nWe are committed to doing our part to help preserve the Earth\\'s "
+                'finite resources and maintain the wellbeing of our planet for generations to '
+                'come.\\n\\n### Equal Employment Opportunities\\n\\nWe provide employment '
+                'opportunities to all qualified persons on an equal basis. This includes, but is '
+                'not limited to, recruitment, hiring, promotion, transfer, compensation, training, '
+                'demotion or layoff. We will not discriminate against any Contractor, Employee or '
+                'applicant for employment because of:\\n- Gender or Gender Identity\\n- Race, '
+                'Ethnicity or National Origin\\n- Religion\\n- Age\\n- Sexual Orientation\\n- '
+                'Disability\\n- Marital Status\\n\\nWe do not use child labour. Child labour is '
+                'defined as employing any person younger than the minimum age allowed by law in '
+                'the jurisdiction in question. However, in no event will we knowingly employ or '
+                'hire anyone younger than sixteen (16) years of age.\\n\\n### Health & '
+                'Safety\\n\\nWe strive to eliminate potential hazards from the workplace and to '
+                'comply with all applicable occupational safety and health laws and '
+                'standards.\\n\\nWe help maintain a safe, healthy and productive work environment '
+                'for all team members and others, by:\\n- prohibiting any acts that could be '
+                'perceived as violent, threatening, degrading or intimidating.\\n- prohibiting the '
+                'spreading of unconfirmed information, gossip or information that has no other '
+                'purpose than damaging morale.\\n- prohibiting bullying\\n- prohibiting the '
+                'possession, use, sale or transfer of illegal drugs or drug paraphernalia\\n- '
+                'prohibiting the conduct of business while under the influence of alcohol\\n- '
+                'prohibiting the possession or use of weapons/firearms, explosive devices or '
+                'ammunition.\\n\\nAll Contractors/Employees/Interns are required to comply with '
+                'and understand the importance to follow the Health and Safety guidelines and '
+                'requirements, including the use of PPE set by the Organization.\\n\\n☐ I have '
+                'read and understood the code of conduct and I agree to adhere to its contents for '
+                "the duration of my affiliation with '\n"
+                "    yield str(environment.getattr((undefined(name='company') if l_0_company is "
+                "missing else l_0_company), 'name'))\n"
+                "    yield '. I understand that failure to do so may result in the immediate "
+                'termination of my professional relationship with the Organization.\\n\\n**Name**: '
+                "'\n"
+                "    yield str((undefined(name='employee_name') if l_0_employee_name is missing "
+                'else l_0_employee_name))\n'
+                "    yield '\\n\\n**Date**: _________________\\n\\n**Signature**: "
+                '_________________\\n\\n---\\n\\n## APPENDIX B: THE NON-DISCLOSURE '
+                'AGREEMENT\\n\\nThe NON-DISCLOSURE AGREEMENT, (hereinafter known as "the '
+                'Agreement", is entered into between \'\n'
+                "    yield str((undefined(name='employee_name') if l_0_employee_name is missing "
+                'else l_0_employee_name))\n'
+                '    yield \' (hereinafter known as "the Contractor/Intern/Employee") and \'\n'
+                "    yield str(environment.getattr((undefined(name='company') if l_0_company is "
+                "missing else l_0_company), 'name'))\n"
+                '    yield \' (hereinafter known as "the Organization"), (collectively known as '
+                '"the Parties"), as of this \'\n'
+                "    yield str((undefined(name='contract_date') if l_0_contract_date is missing "
+                'else l_0_contract_date))\n'
+                "    yield '.\\n\\n### (A) Scope of the Agreement\\n\\nThe Agreement acknowledges "
+                'that certain information, trade secrets, and proprietary data (hereinafter known '
+                'as "Confidential Information") of or regarding the Organization and/or the '
+                "Organization\\'s business may be discussed between the Contractor/Intern/Employee "
+                'and the Organization.\\n\\n### (B) Confidential Information\\n\\nFor the purpose '
+                'of this clause, Confidential Information includes (but shall not be limited to) '
+                'trade secrets, technical know-how, any information relating to customers, '
+                'operations and financial information and commercial methods of the Organization, '
+                'any material, knowledge, and data (verbal, electronic, written and/or in any '
+                "other form) concerning the Organization or the Organization\\'s businesses, not "
+                'generally known to the public.\\n\\nExcept in carrying out your duties for the '
+                'Organization, you must keep confidential and must not either during the course of '
+                'your employment or at any time thereafter directly or indirectly disclose, '
+                'publish or use for your own benefit or for the benefit of others either:\\n(i) '
+                "Any of the Organization\\'s and/or Organization\\'s businesses Confidential "
+                'Information or that of its customers without first having obtained the '
+                "Organization\\'s written consent to such disclosure, publication or use; "
+                'or\\n(ii) Any information which has been disclosed to the Organization and/or the '
+                "Organization\\'s business by others under an agreement which requires the "
+                "Organization and/or the Organization\\'s business to keep such information "
+                'confidential.\\n\\n### (C) Previous Agreements\\n\\nThe Agreement constitutes the '
+                'entirety of the Agreement and the signing thereof by both the Parties nullifies '
+                'any and all previous agreements made between the Organization and the '
+                'Contractor/Intern/Employee.\\n\\n### (D) Modifications and Amendments\\n\\nNo '
+                'modifications, amendments, rectifications, changes and/or alterations shall be '
+                'made to the Agreement by either party unless in writing and signed by authorized '
+                'representatives of both the Parties.\\n\\n### (E) Successors and Assigns\\n\\nThe '
+                'Agreement shall be binding upon the successors, subsidiaries, assigns and/or '
+                'corporations controlling or controlled by the Parties. The Organization may '
+                'assign the Agreement to any party at any time, whereas the '
+                'Contractor/Intern/Employee is prohibited from assigning any of his/her rights or '
+                'obligations in the Agreement without prior written consent from the '
+                'Organization.\\n\\n### (F) Nature of Contractual Relationship between the '
+                'Parties\\n\\nThe Agreement:-\\n(i) does not constitute a contract of employment, '
+                "nor does it guarantee the Contractor\\'s/Intern\\'s/Employees continuation of "
+                'employment with the Organization; and\\n(ii) does not create a partnership or '
+                'joint venture between the Organization and the '
+                'Contractor/Intern/Employee.\\n\\n### (G) Severability\\n\\nAny provision within '
+                'the Agreement (or any portion thereof) deemed invalid, unlawful or otherwise '
+                'unusable by a court of law shall be dissolved from the Agreement and the '
+                'remainder of the Agreement shall continue to be enforceable.\\n\\n### (H) '
+                'Governing Law\\n\\nThe Agreement shall be governed by the Malaysian '
+                'laws.\\n\\n### (I) Immunity\\n\\nDisclosing Confidential Information to an '
+                'attorney, government representative or court official in confidence while '
+                'assisting or taking part in a case involving a suspected violation of law '
+                "connected or related to the Organization and/or Organization\\'s business is "
+                'considered as a breach of the Agreement unless the Contractor/Intern/Employee is '
+                'required to disclose Confidential Information by law.\\n\\n### (J) Cause of '
+                'Action\\n\\nThe Contractor/Intern/Employee understands that the use or disclosure '
+                'of any Confidential Information may be cause for an action at law in an '
+                'appropriate forum or in any court of law, and that the Organization shall be '
+                'entitled to an injunction prohibiting the use or disclosure of the Confidential '
+                'Information.\\n\\n### (K) Indemnification\\n\\nThe Contractor/Intern/Employee '
+                'understands and agrees that if the use or disclosure of Confidential Information '
+                'by him/her or any affiliate, or representative of the Contractor/Intern/Employee '
+                'causes damage, loss, cost or expense to the Organization and/or the '
+                "Organization\\'s business, the Contractor/Intern/Employee shall be held "
+                'responsible and shall indemnify the Organization.\\n\\n### (L) Injunctive '
+                'Relief\\n\\nThe Contractor/Intern/Employee understands and agrees that the use or '
+                'disclosure of Confidential Information could cause the Organization irreparable '
+                'harm and the Organization has the right to pursue legal action beyond remedies of '
+                'a monetary nature in the form of an injunctive or equitable relief.\\n\\n### (M) '
+                'Notice of Unauthorized Use or Disclosure\\n\\nThe Contractor/Intern/Employee is '
+                'bound by the Agreement to notify the Organization in the event of a breach of the '
+                'Agreement involving the dissemination of Confidential Information, either by the '
+                'Contractor/Intern/Employee or a third party, the Contractor/Intern/Employee will '
+                'do everything possible to help the Organization regains possession of the '
+                'Confidential Information.\\n\\n### (N) Costs and Expenses\\n\\nIn a dispute '
+                'arising out of or in relation to the Agreement, if either party brings an action '
+                'to enforce their rights under the Agreement, the winning party shall recover its '
+                "costs and expenses (including reasonable attorney\\'s fees) incurred in "
+                'connection with the action and/or any appeal, from the losing party.\\n\\nIN '
+                'WITNESS WHEREOF, the Contractor/Intern/Employee hereto agrees to the terms of the '
+                'Agreement and signed on the date written below.\\n\\n**By**: '
+                "_________________\\n\\n**Name**: '\n"
+                "    yield str((undefined(name='employee_name') if l_0_employee_name is missing "
+                'else l_0_employee_name))\n'
+                "    yield '\\n\\n**Date**: _________________'\n"
+                '\n'
+                'blocks = {}\n'
+                'debug_info = '
+                "'3=40&4=42&6=50&16=52&17=54&18=56&19=58&20=60&21=62&22=64&23=66&27=68&36=70&37=72&38=76&47=80&48=84&53=92&57=94&58=96&60=98&65=100&66=104&69=110&86=112&87=114&93=116&95=118&97=120&103=122&109=124&118=136&130=139&131=143&146=151&150=153&158=157&160=159&207=161&209=163&219=165&287=171'",
+ 'roles-responsibilities.md': 'from jinja2.runtime import LoopContext, Macro, Markup, Namespace, '
+                              'TemplateNotFound, TemplateReference, TemplateRuntimeError, '
+                              'Undefined, escape, identity, internalcode, markup_join, missing, '
+                              'str_join\n'
+                              "name = 'roles-responsibilities.md'\n"
+                              '\n'
+                              'def root(context, missing=missing, environment=environment):\n'
+                              '    resolve = context.resolve_or_missing\n'
+                              '    undefined = environment.undefined\n'
+                              '    concat = environment.concat\n'
+                              '    cond_expr_undefined = Undefined\n'
+                              '    if 0: yield None\n'
+                              "    l_0_job_title = resolve('job_title')\n"
+                              "    l_0_career_level = resolve('career_level')\n"
+                              "    l_0_company = resolve('company')\n"
+                              "    l_0_role_responsibilities = resolve('role_responsibilities')\n"
+                              "    l_0_kpi_breakdown = resolve('kpi_breakdown')\n"
+                              "    l_0_vision_activities = resolve('vision_activities')\n"
+                              "    l_0_delivery_activities = resolve('delivery_activities')\n"
+                              "    l_0_financial_activities = resolve('financial_activities')\n"
+                              "    l_0_quality_activities = resolve('quality_activities')\n"
+                              "    l_0_lnd_activities = resolve('lnd_activities')\n"
+                              "    l_0_ico_activities = resolve('ico_activities')\n"
+                              "    l_0_team = resolve('team')\n"
+                              "    l_0_team_focus_areas = resolve('team_focus_areas')\n"
+                              "    l_0_reporting_to = resolve('reporting_to')\n"
+                              '    pass\n'
+                              "    yield '# '\n"
+                              "    yield str((undefined(name='job_title') if l_0_job_title is "
+                              'missing else l_0_job_title))\n'
+                              "    yield '\\n\\n## Role Overview\\n\\nAs a '\n"
+                              "    yield str((undefined(name='career_level') if l_0_career_level "
+                              'is missing else l_0_career_level))\n'
+                              "    yield ', the Employee is expected to perform the following "
+                              "responsibilities in alignment with '\n"
+                              "    yield str(environment.getattr((undefined(name='company') if "
+                              "l_0_company is missing else l_0_company), 'name'))\n"
+                              '    yield "\'s mission and strategic objectives:\\n\\n"\n'
+                              '    for l_1_responsibility in '
+                              "(undefined(name='role_responsibilities') if "
+                              'l_0_role_responsibilities is missing else '
+                              'l_0_role_responsibilities):\n'
+                              '        _loop_vars = {}\n'
+                              '        pass\n'
+                              "        yield '- '\n"
+                              '        yield str(l_1_responsibility)\n'
+                              "        yield '\\n'\n"
+                              '    l_1_responsibility = missing\n'
+                              "    yield '\\n## Strategic Area KPI Breakdown\\n\\nThe Employee is "
+                              'responsible to oversee and execute the roles according to the '
+                              'organization strategic areas KPI, including but not limited '
+                              "to:\\n\\n### Vision (VIS) : '\n"
+                              "    yield str(environment.getattr((undefined(name='kpi_breakdown') "
+                              'if l_0_kpi_breakdown is missing else l_0_kpi_breakdown), '
+                              "'Vision'))\n"
+                              "    yield '%\\nTo achieve the strategic vision of the Business Unit "
+                              '- Strategic Planning, Business Model Planning, Group, Business Unit '
+                              'HR Planning, Strategic Partnerships, Corporate Communications & '
+                              'Marketing, Industry Networking, LinkedIn\\n\\n**Key '
+                              "Activities:**\\n'\n"
+                              "    yield str((undefined(name='vision_activities') if "
+                              'l_0_vision_activities is missing else l_0_vision_activities))\n'
+                              "    yield '\\n\\n### Delivery & Impact Creation (DEL) : '\n"
+                              "    yield str(environment.getattr((undefined(name='kpi_breakdown') "
+                              'if l_0_kpi_breakdown is missing else l_0_kpi_breakdown), '
+                              "'Delivery'))\n"
+                              "    yield '%\\nTo achieve the actual program, platform or business "
+                              'unit deliverables - Project / product / platform delivery, Project '
+                              'HR & Budget planning, Project-specific communications (Individual '
+                              'Education programs that have been secured), Client meetings, '
+                              'communications, emails to program partners, etc, Program specific '
+                              'content creation, Comms materials for the project / program '
+                              '(posters, landing pages, forms, etc), Community Engagement, Student '
+                              "recruitment, etc\\n\\n**Key Activities:**\\n'\n"
+                              "    yield str((undefined(name='delivery_activities') if "
+                              'l_0_delivery_activities is missing else l_0_delivery_activities))\n'
+                              "    yield '\\n\\n### Financial (FIN) : '\n"
+                              "    yield str(environment.getattr((undefined(name='kpi_breakdown') "
+                              'if l_0_kpi_breakdown is missing else l_0_kpi_breakdown), '
+                              "'Financial'))\n"
+                              "    yield '%\\nTo achieve the financial objective of the business "
+                              'unit - Business Development, Proposal writing, Funding and '
+                              'fundraising activities, Accounting & Finance Planning, Pitching '
+                              "activities\\n\\n**Key Activities:**\\n'\n"
+                              "    yield str((undefined(name='financial_activities') if "
+                              'l_0_financial_activities is missing else '
+                              'l_0_financial_activities))\n'
+                              "    yield '\\n\\n### Quality (QUA) : '\n"
+                              "    yield str(environment.getattr((undefined(name='kpi_breakdown') "
+                              'if l_0_kpi_breakdown is missing else l_0_kpi_breakdown), '
+                              "'Quality'))\n"
+                              "    yield '%\\nTo achieve the desired quality within each Business "
+                              'Unit - Check & Balances, Work Review etc. - Post-program '
+                              'satisfaction forms, Client feedback forms, Management team reviews '
+                              'of Delivery, Report generation and analysis.\\n\\n**Key '
+                              "Activities:**\\n'\n"
+                              "    yield str((undefined(name='quality_activities') if "
+                              'l_0_quality_activities is missing else l_0_quality_activities))\n'
+                              "    yield '\\n\\n### Learning Development & Personal Career Growth "
+                              "(LnD) : '\n"
+                              "    yield str(environment.getattr((undefined(name='kpi_breakdown') "
+                              "if l_0_kpi_breakdown is missing else l_0_kpi_breakdown), 'LnD'))\n"
+                              "    yield '%\\nTo achieve the desired growth levels within each "
+                              'team - Attending training sessions, Participating in webinars, '
+                              'courses, etc, Lunch & Learn sessions, HR career chats, Team review '
+                              'sessions, feedback sessions, Activities that are in accordance with '
+                              'an Individuals Career Development Plans\\n\\n**Key '
+                              "Activities:**\\n'\n"
+                              "    yield str((undefined(name='lnd_activities') if "
+                              'l_0_lnd_activities is missing else l_0_lnd_activities))\n'
+                              "    yield '\\n\\n### Internal Communication & Management (ICO) : '\n"
+                              "    yield str(environment.getattr((undefined(name='kpi_breakdown') "
+                              "if l_0_kpi_breakdown is missing else l_0_kpi_breakdown), 'ICO'))\n"
+                              "    yield '%\\nUsing the appropriate planning and management "
+                              "tools.\\n\\n**Key Activities:**\\n'\n"
+                              "    yield str((undefined(name='ico_activities') if "
+                              'l_0_ico_activities is missing else l_0_ico_activities))\n'
+                              "    yield '\\n\\n## Team-Specific Responsibilities\\n\\nAs part of "
+                              "the '\n"
+                              "    yield str((undefined(name='team') if l_0_team is missing else "
+                              'l_0_team))\n'
+                              "    yield ' team, the Employee will focus on:\\n\\n'\n"
+                              "    for l_1_focus_area in (undefined(name='team_focus_areas') if "
+                              'l_0_team_focus_areas is missing else l_0_team_focus_areas):\n'
+                              '        _loop_vars = {}\n'
+                              '        pass\n'
+                              "        yield '- '\n"
+                              '        yield str(l_1_focus_area)\n'
+                              "        yield '\\n'\n"
+                              '    l_1_focus_area = missing\n'
+                              "    yield '\\n## Performance Expectations\\n\\n### Key Success "
+                              'Metrics\\n- **Timely Delivery**: Complete assigned tasks within '
+                              'agreed timelines\\n- **Quality Standards**: Maintain high quality '
+                              'in all deliverables\\n- **Collaboration**: Work effectively with '
+                              'cross-functional teams\\n- **Innovation**: Contribute new ideas and '
+                              'improvements\\n- **Learning**: Actively participate in professional '
+                              'development activities\\n\\n### Reporting Structure\\n- **Direct '
+                              "Report**: '\n"
+                              "    yield str((undefined(name='reporting_to') if l_0_reporting_to "
+                              'is missing else l_0_reporting_to))\n'
+                              "    yield '\\n- **Team**: '\n"
+                              "    yield str((undefined(name='team') if l_0_team is missing else "
+                              'l_0_team))\n'
+                              "    yield '\\n- **Career Level**: '\n"
+                              "    yield str((undefined(name='career_level') if l_0_career_level "
+                              'is missing else l_0_career_level))\n'
+                              '    yield "\\n\\n## Professional Development\\n\\nThe Employee is '
+                              'encouraged to:\\n- Participate in relevant training programs and '
+                              'workshops\\n- Attend industry conferences and networking events\\n- '
+                              'Pursue certifications relevant to their role\\n- Contribute to '
+                              'knowledge sharing within the organization\\n- Mentor junior team '
+                              'members (where applicable)\\n\\n## Tools and Resources\\n\\nThe '
+                              'Employee will have access to:\\n- Project management tools and '
+                              'platforms\\n- Communication and collaboration software\\n- Learning '
+                              'and development resources\\n- Industry-specific tools and '
+                              'software\\n- Professional development budget (as '
+                              'applicable)\\n\\n## Compliance and Standards\\n\\nThe Employee '
+                              'must:\\n- Adhere to all company policies and procedures\\n- '
+                              'Maintain confidentiality of sensitive information\\n- Follow health '
+                              'and safety guidelines\\n- Comply with relevant industry '
+                              "regulations\\n- Uphold the company's core values and code of "
+                              'conduct\\n\\n---\\n\\n*This document should be reviewed and updated '
+                              'annually or when there are significant changes to the role or '
+                              'organizational structure.*"\n'
+                              '\n'
+                              'blocks = {}\n'
+                              'debug_info = '
+                              "'1=26&5=28&7=32&8=36&15=40&19=42&21=44&25=46&27=48&31=50&33=52&37=54&39=56&43=58&45=60&49=62&53=64&55=66&56=70&69=74&70=76&71=78'",
+ 'confirmation.md': 'from jinja2.runtime import LoopContext, Macro, Markup, Namespace, '
+                    'TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, '
+                    'identity, internalcode, markup_join, missing, str_join\n'
+                    "name = 'confirmation.md'\n"
+                    '\n'
+                    'def root(context, missing=missing, environment=environment):\n'
+                    '    resolve = context.resolve_or_missing\n'
+                    '    undefined = environment.undefined\n'
+                    '    concat = environment.concat\n'
+                    '    cond_expr_undefined = Undefined\n'
+                    '    if 0: yield None\n'
+                    "    l_0_confirmation_date = resolve('confirmation_date')\n"
+                    "    l_0_employee_name = resolve('employee_name')\n"
+                    "    l_0_job_title = resolve('job_title')\n"
+                    "    l_0_company = resolve('company')\n"
+                    "    l_0_effective_date = resolve('effective_date')\n"
+                    "    l_0_personal_note = resolve('personal_note')\n"
+                    "    l_0_team = resolve('team')\n"
+                    "    l_0_career_level = resolve('career_level')\n"
+                    "    l_0_reporting_to = resolve('reporting_to')\n"
+                    "    l_0_key_responsibilities = resolve('key_responsibilities')\n"
+                    "    l_0_next_review_date = resolve('next_review_date')\n"
+                    "    l_0_core_values = resolve('core_values')\n"
+                    "    l_0_hr_contact = resolve('hr_contact')\n"
+                    '    pass\n'
+                    "    yield '# Letter of Confirmation\\n\\n**Date**: '\n"
+                    "    yield str((undefined(name='confirmation_date') if l_0_confirmation_date "
+                    'is missing else l_0_confirmation_date))\n'
+                    "    yield '\\n\\n**To**: '\n"
+                    "    yield str((undefined(name='employee_name') if l_0_employee_name is "
+                    'missing else l_0_employee_name))\n'
+                    "    yield '\\n\\n**Subject**: Confirmation of Appointment as '\n"
+                    "    yield str((undefined(name='job_title') if l_0_job_title is missing else "
+                    'l_0_job_title))\n'
+                    "    yield '\\n\\nDear '\n"
+                    "    yield str((undefined(name='employee_name') if l_0_employee_name is "
+                    'missing else l_0_employee_name))\n'
+                    "    yield ',\\n\\nCongratulations! We are delighted to confirm your "
+                    "appointment as a '\n"
+                    "    yield str((undefined(name='job_title') if l_0_job_title is missing else "
+                    'l_0_job_title))\n'
+                    "    yield ' at '\n"
+                    "    yield str(environment.getattr((undefined(name='company') if l_0_company "
+                    "is missing else l_0_company), 'name'))\n"
+                    "    yield ', effective '\n"
+                    "    yield str((undefined(name='effective_date') if l_0_effective_date is "
+                    'missing else l_0_effective_date))\n'
+                    "    yield '.\\n\\nThis milestone reflects your dedication, performance, and "
+                    'the positive impact you have made during your probationary period. We are '
+                    'confident that your journey ahead will be even more rewarding. As you step '
+                    'into this new phase, we encourage you to continue leveraging your strengths, '
+                    "exploring new opportunities, and making a lasting impact.\\n\\n'\n"
+                    "    if (undefined(name='personal_note') if l_0_personal_note is missing else "
+                    'l_0_personal_note):\n'
+                    '        pass\n'
+                    "        yield str((undefined(name='personal_note') if l_0_personal_note is "
+                    'missing else l_0_personal_note))\n'
+                    "        yield '\\n\\n'\n"
+                    "    yield '## Role Confirmation Details\\n\\n- **Position**: '\n"
+                    "    yield str((undefined(name='job_title') if l_0_job_title is missing else "
+                    'l_0_job_title))\n'
+                    "    yield '\\n- **Team**: '\n"
+                    "    yield str((undefined(name='team') if l_0_team is missing else l_0_team))\n"
+                    "    yield '\\n- **Career Level**: '\n"
+                    "    yield str((undefined(name='career_level') if l_0_career_level is missing "
+                    'else l_0_career_level))\n'
+                    "    yield '\\n- **Reporting To**: '\n"
+                    "    yield str((undefined(name='reporting_to') if l_0_reporting_to is missing "
+                    'else l_0_reporting_to))\n'
+                    "    yield '\\n- **Effective Date**: '\n"
+                    "    yield str((undefined(name='effective_date') if l_0_effective_date is "
+                    'missing else l_0_effective_date))\n'
+                    "    yield '\\n\\n## Key Responsibilities\\n\\nIn your confirmed role, you "
+                    "will be responsible for:\\n'\n"
+                    "    for l_1_responsibility in (undefined(name='key_responsibilities') if "
+                    'l_0_key_responsibilities is missing else l_0_key_responsibilities):\n'
+                    '        _loop_vars = {}\n'
+                    '        pass\n'
+                    "        yield '- '\n"
+                    '        yield str(l_1_responsibility)\n'
+                    "        yield '\\n'\n"
+                    '    l_1_responsibility = missing\n'
+                    "    yield '\\n## Performance Expectations\\n\\nAs a confirmed team member, we "
+                    'expect you to:\\n- Deliver high-quality work that aligns with our strategic '
+                    'objectives\\n- Contribute actively to team collaboration and knowledge '
+                    'sharing\\n- Maintain professional standards and uphold our core values\\n- '
+                    'Continue your professional development and growth\\n- Demonstrate leadership '
+                    'qualities and initiative in your work\\n\\n## Next Steps\\n\\n1. '
+                    "**Performance Review**: Your next performance review will be scheduled for '\n"
+                    "    yield str((undefined(name='next_review_date') if l_0_next_review_date is "
+                    'missing else l_0_next_review_date))\n'
+                    "    yield '\\n2. **Career Development**: We encourage you to discuss your "
+                    'career goals with your manager\\n3. **Training Opportunities**: Take '
+                    'advantage of available training and development programs\\n4. **Feedback**: '
+                    'Continue to provide and receive constructive feedback for continuous '
+                    'improvement\\n\\n## Support and Resources\\n\\nYou will continue to have '
+                    'access to:\\n- All necessary tools and resources for your role\\n- '
+                    'Professional development opportunities\\n- Support from your manager and team '
+                    'members\\n- Company benefits and policies as outlined in your employment '
+                    'contract\\n\\nYour employment terms and conditions remain unchanged as per '
+                    'your initial contract unless communicated otherwise. Should you have any '
+                    'questions or require further clarification, please do not hesitate to reach '
+                    'out to your manager or the HR team.\\n\\n## Core Values Reminder\\n\\nAs a '
+                    'confirmed member of our team, we remind you of our core values that guide '
+                    "everything we do:\\n\\n'\n"
+                    "    for l_1_value in (undefined(name='core_values') if l_0_core_values is "
+                    'missing else l_0_core_values):\n'
+                    '        _loop_vars = {}\n'
+                    '        pass\n'
+                    "        yield '- **'\n"
+                    "        yield str(environment.getattr(l_1_value, 'name'))\n"
+                    "        yield '**: '\n"
+                    "        yield str(environment.getattr(l_1_value, 'description'))\n"
+                    "        yield '\\n'\n"
+                    '    l_1_value = missing\n'
+                    "    yield '\\nOnce again, congratulations on this achievement! We look "
+                    'forward to your continued success and are excited to see the great things you '
+                    "will accomplish at '\n"
+                    "    yield str(environment.getattr((undefined(name='company') if l_0_company "
+                    "is missing else l_0_company), 'name'))\n"
+                    "    yield '.\\n\\n## Contact Information\\n\\nIf you have any questions about "
+                    "your confirmation or need support, please contact:\\n\\n**'\n"
+                    "    yield str(environment.getattr((undefined(name='hr_contact') if "
+                    "l_0_hr_contact is missing else l_0_hr_contact), 'name'))\n"
+                    "    yield '**  \\n'\n"
+                    "    yield str(environment.getattr((undefined(name='hr_contact') if "
+                    "l_0_hr_contact is missing else l_0_hr_contact), 'title'))\n"
+                    "    yield '  \\nEmail: '\n"
+                    "    yield str(environment.getattr((undefined(name='hr_contact') if "
+                    "l_0_hr_contact is missing else l_0_hr_contact), 'email'))\n"
+                    "    yield '  \\nPhone: '\n"
+                    "    yield str(environment.getattr((undefined(name='hr_contact') if "
+                    "l_0_hr_contact is missing else l_0_hr_contact), 'phone'))\n"
+                    "    yield '\\n\\nSincerely,\\n\\n---\\n\\n**'\n"
+                    "    yield str(environment.getattr((undefined(name='hr_contact') if "
+                    "l_0_hr_contact is missing else l_0_hr_contact), 'name'))\n"
+                    "    yield '**  \\n'\n"
+                    "    yield str(environment.getattr((undefined(name='hr_contact') if "
+                    "l_0_hr_contact is missing else l_0_hr_contact), 'title'))\n"
+                    "    yield '  \\n'\n"
+                    "    yield str(environment.getattr((undefined(name='company') if l_0_company "
+                    "is missing else l_0_company), 'name'))\n"
+                    "    yield '\\n\\n---\\n\\n*This confirmation letter is part of your "
+                    "employment records and should be kept for future reference.*'\n"
+                    '\n'
+                    'blocks = {}\n'
+                    'debug_info = '
+                    "'3=25&5=27&7=29&9=31&11=33&15=39&16=41&21=44&22=46&23=48&24=50&25=52&30=54&31=58&45=62&64=64&65=68&68=74&74=76&75=78&76=80&77=82&83=84&84=86&85=88'"}
+TEMPLATE_BYTECODE = {'contract.md': b'c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00'
+                b'\x00\xf3^\x00\x00\x00\x97\x00d\x00d\x01l\x00m\x01Z\x01m\x02Z\x02m\x03Z\x03m\x04'
+                b'Z\x04m\x05Z\x05m\x06Z\x06m\x07Z\x07m\x08Z\x08m\tZ\tm\nZ\nm\x0bZ\x0bm\x0cZ\x0cm\r'
+                b'Z\rm\x0eZ\x0e\x01\x00d\x02Z\x0fe\re\x10f\x02d\x03\x84\x01Z\x11i\x00Z\x12'
+                b'd\x04Z\x13d\x05S\x00)\x06\xe9\x00\x00\x00\x00)\x0e\xda\x0bLoopContext\xda\x05Macr'
+                b'o\xda\x06Markup\xda\tNamespace\xda\x10TemplateNotFound\xda\x11TemplateReferenc'
+                b'e\xda\x14TemplateRuntimeError\xda\tUndefined\xda\x06escape\xda\x08identity'
+                b'\xda\x0cinternalcode\xda\x0bmarkup_join\xda\x07missing\xda\x08str_joinz\x0bcont'
+                b'ract.mdc\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\t\x00\x00\x00'
+                b'#\x00\x00\x00\xf3\xb2\x17\x00\x00K\x00\x01\x00\x97\x00|\x00j\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00}\x03|\x02j\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x04|'
+                b'\x02j\x02\x00\x00\x00\x00\x00\x00\x00\x00}\x05t\x06\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00}\x06\t\x00\x02\x00|\x03d\x02\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x07\x02\x00|\x03d\x03\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x08\x02\x00|\x03d\x04\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\t\x02\x00|\x03d'
+                b'\x05\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\n\x02\x00|'
+                b'\x03d\x06\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x0b\x02'
+                b'\x00|\x03d\x07\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}'
+                b'\x0c\x02\x00|\x03d\x08\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00}\r\x02\x00|\x03d\t\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}'
+                b'\x0e\x02\x00|\x03d\n\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00}\x0f\x02\x00|\x03d\x0b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00}\x10\x02\x00|\x03d\x0c\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00}\x11\x02\x00|\x03d\r\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00}\x12\x02\x00|\x03d\x0e\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x13\x02\x00|\x03d\x0f\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x14\x02\x00|\x03d\x10\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x15\x02\x00|\x03d'
+                b'\x11\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x16\x02\x00|'
+                b'\x03d\x12\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x17\x02'
+                b'\x00|\x03d\x13\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}'
+                b'\x18\x02\x00|\x03d\x14\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00}\x19\x02\x00|\x03d\x15\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00}\x1a\x02\x00|\x03d\x16\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00}\x1b\x02\x00|\x03d\x17\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00}\x1c\t\x00|\x02j\x04\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00d\x18\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00}\x1dn #\x00t\n\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00$\x00r\x13\x01\x00t\x0c\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00d\x19\x84\x00\xa6\x00\x00\x00\xab\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00}\x1dY\x00n\x04w\x00x\x03Y\x00w\x01\t\x00d\x1aV'
+                b'\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x07|\x01u\x00r'
+                b'\x0c\x02\x00|\x04d\x02\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00n\x01|\x07\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00V\x00\x97\x01\x01\x00d\x1cV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00|\x08|\x01u\x00r\x0c\x02\x00|\x04d\x03\xac\x1b\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x08\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d\x1dV'
+                b'\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\t|\x01u\x00r'
+                b'\x0c\x02\x00|\x04d\x04\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00n\x01|\t\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00V\x00\x97\x01\x01\x00d\x1eV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\n|\x01u\x00r\x0c\x02\x00|\x04d'
+                b'\x05\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                b'\nd\x1f\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d V'
+                b'\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0'
+                b'\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00|\n|\x01u\x00r\x0c\x02\x00|\x04d\x05\xac\x1b\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00n\x01|\nd!\xa6\x02\x00\x00\xab\x02\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00V\x00\x97\x01\x01\x00d"V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00|\x0b|\x01u\x00r\x0c\x02\x00|\x04d\x06\xac\x1b\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0b\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d#V\x00\x97\x01\x01\x00t\x0f\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0b|\x01u\x00r\x0c\x02\x00|\x04d\x06\xac'
+                b'\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0b\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                b'$V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0c|\x01u'
+                b'\x00r\x0c\x02\x00|\x04d\x07\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00n\x01|\x0c\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00V\x00\x97\x01\x01\x00d%V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\r|\x01u\x00r\x0c\x02\x00|\x04d\x08\xac\x1b\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\r\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d&V\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0e|\x01u\x00r\x0c\x02\x00|\x04d'
+                b'\t\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                b'\x0e\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01'
+                b"\x00d'V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0f|"
+                b'\x01u\x00r\x0c\x02\x00|\x04d\n\xac\x1b\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00n\x01|\x0f\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d(V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00|\x10|\x01u\x00r\x0c\x02\x00|\x04d\x0b\xac\x1b\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x10\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d)V'
+                b'\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x11|\x01u\x00r'
+                b'\x0c\x02\x00|\x04d\x0c\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00n\x01|\x11\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00V\x00\x97\x01\x01\x00d*V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00|\x12|\x01u\x00r\x0c\x02\x00|\x04d\r\xac\x1b\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x12\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d+V\x00\x97\x01\x01\x00t\x0f\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x13|\x01u\x00r\x0c\x02\x00|\x04d\x0e\xac'
+                b'\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x13\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                b',V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\r|\x01u'
+                b'\x00r\x0c\x02\x00|\x04d\x08\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00n\x01|\r\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00V\x00\x97\x01\x01\x00d-V\x00\x97\x01\x01\x00|\x14|\x01u\x00r'
+                b'\x0c\x02\x00|\x04d\x0f\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00n\x01|\x14D\x00]\x1e}\x1ei\x00}\x1f\t\x00d.V\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x1e\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d/V\x00\x97\x01\x01\x00\x8c\x1f|'
+                b'\x01}\x1ed0V\x00\x97\x01\x01\x00|\x00\xa0\t\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x15|\x01u'
+                b'\x00r\x0c\x02\x00|\x04d\x10\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00n\x01|\x15d1\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00D'
+                b'\x00]\x8d\\\x02\x00\x00} }!i\x00}\x1f\t\x00d2V\x00\x97\x01\x01\x00t\x0f\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00| \xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d3V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x02\x00|\x1d|!\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00r\x16|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|!d4\xa6\x02\x00'
+                b'\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00n\x01|!\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d5V\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00|\x1d|!\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00r\x16|\x02\xa0\x08\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|!d'
+                b'6\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00n\x01d7\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                b'8V\x00\x97\x01\x01\x00\x8c\x8e|\x01x\x01} }!d9V\x00\x97\x01\x01\x00t\x0f\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\n|\x01u\x00r\x0c\x02\x00|'
+                b'\x04d\x05\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n'
+                b'\x01|\nd\x1f\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                b':V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|'
+                b'\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00|\x16|\x01u\x00r\x0c\x02\x00|\x04d\x11\xac\x1b\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x16d;\xa6\x02\x00\x00\xab'
+                b'\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00V\x00\x97\x01\x01\x00d<V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x16|\x01u\x00r\x0c\x02\x00|\x04d\x11\xac'
+                b'\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x16d'
+                b'=\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d>V\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x16|\x01u'
+                b'\x00r\x0c\x02\x00|\x04d\x11\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00n\x01|\x16d=\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                b'\x00\x97\x01\x01\x00d?V\x00\x97\x01\x01\x00|\x00\xa0\t\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0'
+                b'\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x17|\x01u\x00r\x0c\x02\x00|\x04d\x12\xac\x1b\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x17d@\xa6\x02\x00'
+                b'\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00d1\xa6\x02\x00\x00\xab\x02\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00D\x00]6\\\x02\x00\x00}"}#i\x00}\x1f\t\x00d2V\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|"\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d3V\x00\x97\x01\x01\x00t\x0f\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|#\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d8V\x00\x97\x01\x01\x00\x8c7|\x01x'
+                b'\x01}"}#dAV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x16|\x01u\x00r\x0c\x02\x00|\x04d\x11\xac\x1b\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x16dB\xa6\x02\x00'
+                b'\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00dCV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00|\x18|\x01u\x00r\x0c\x02\x00|\x04d\x13\xac\x1b\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x18\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00dDV'
+                b'\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x18|\x01u\x00r'
+                b'\x0c\x02\x00|\x04d\x13\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00n\x01|\x18\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00V\x00\x97\x01\x01\x00dEV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00|\x19|\x01u\x00r\x0c\x02\x00|\x04d\x14\xac\x1b\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x19dF\xa6'
+                b'\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00dGV\x00\x97\x01\x01\x00t\x0f\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x19|\x01u\x00r\x0c\x02\x00|'
+                b'\x04d\x14\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n'
+                b'\x01|\x19dF\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                b'HV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|'
+                b'\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00|\n|\x01u\x00r\x0c\x02\x00|\x04d\x05\xac\x1b\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\nd\x1f\xa6\x02\x00\x00\xab'
+                b'\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00V\x00\x97\x01\x01\x00dIV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x1a|\x01u\x00r\x0c\x02\x00|\x04d\x15\xac'
+                b'\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x1ad'
+                b'J\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00dKV\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x1a|\x01u'
+                b'\x00r\x0c\x02\x00|\x04d\x15\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00n\x01|\x1adL\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                b'\x00\x97\x01\x01\x00dMV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x1a|\x01u\x00r\x0c\x02\x00|\x04d\x15\xac'
+                b'\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x1ad'
+                b'N\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00dOV\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x1a|\x01u'
+                b'\x00r\x0c\x02\x00|\x04d\x15\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00n\x01|\x1adP\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                b'\x00\x97\x01\x01\x00dQV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x1a|\x01u\x00r\x0c\x02\x00|\x04d\x15\xac'
+                b'\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x1ad'
+                b'R\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00dSV\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x1a|\x01u'
+                b'\x00r\x0c\x02\x00|\x04d\x15\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00n\x01|\x1adT\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                b'\x00\x97\x01\x01\x00dUV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x1a|\x01u\x00r\x0c\x02\x00|\x04d\x15\xac'
+                b'\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x1ad'
+                b'V\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00dWV\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x1b|\x01u'
+                b'\x00r\x0c\x02\x00|\x04d\x16\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00n\x01|\x1bdX\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                b'\x00\x97\x01\x01\x00dYV\x00\x97\x01\x01\x00|\x01}$t\x15\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x1c|\x01u\x00r\x0c\x02\x00|\x04d\x17\xac\x1b\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x1c|\x04\xa6\x02\x00'
+                b'\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00D\x00]\x87\\\x02\x00\x00}%}$i'
+                b'\x00}\x1f\t\x00d2V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|$dZ\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                b'\x01\x01\x00d[V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|'
+                b'\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00|%d\x1f\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01'
+                b'\x00d3V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0'
+                b'\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00|%d6\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                b'8V\x00\x97\x01\x01\x00\x8c\x88|\x01x\x01}$}%d\\V\x00\x97\x01\x01\x00t\x0f\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\t|\x01u\x00r\x0c\x02\x00|\x04d\x04\xac'
+                b'\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\t\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                b']V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|'
+                b'\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00|\n|\x01u\x00r\x0c\x02\x00|\x04d\x05\xac\x1b\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\nd\x1f\xa6\x02\x00\x00\xab'
+                b'\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00V\x00\x97\x01\x01\x00d V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\n|\x01u\x00r\x0c\x02\x00|\x04d\x05\xac'
+                b'\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\nd'
+                b'!\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d^V\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\n|\x01u'
+                b'\x00r\x0c\x02\x00|\x04d\x05\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00n\x01|\nd\x1f\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                b'\x00\x97\x01\x01\x00d_V\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x08|\x01u\x00r\x0c\x02\x00|\x04d\x03\xac\x1b\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x08\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d`V\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x08\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\n|\x01u'
+                b'\x00r\x0c\x02\x00|\x04d\x05\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00n\x01|\nd\x1f\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                b'\x00\x97\x01\x01\x00daV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00\x00|\x08|\x01u\x00r\x0c\x02\x00|\x04d\x03\xac\x1b\xa6\x01\x00'
+                b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x08\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00dbV\x00\x97\x01\x01\x00t'
+                b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x08|\x01u\x00r\x0c\x02\x00|\x04d'
+                b'\x03\xac\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                b'\x08\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01'
+                b'\x00dcV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0'
+                b'\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00|\n|\x01u\x00r\x0c\x02\x00|\x04d\x05\xac\x1b\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00n\x01|\nd\x1f\xa6\x02\x00\x00\xab\x02\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00V\x00\x97\x01\x01\x00ddV\x00\x97\x01\x01\x00t\x0f\x00\x00\x00\x00\x00\x00\x00'
+                b'\x00\x00\x00|\x07|\x01u\x00r\x0c\x02\x00|\x04d\x02\xac\x1b\xa6\x01\x00\x00\xab'
+                b'\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x07\xa6\x01\x00\x00\xab\x01\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00deV\x00\x97\x01\x01\x00t\x0f\x00'
+                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x08|\x01u\x00r\x0c\x02\x00|\x04d\x03\xac'
+                b'\x1b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x08\xa6'
+                b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                b'fV\x00\x97\x01\x01\x00d\x00S\x00)gNr\x01\x00\x00\x00\xda\rcontract_date\xda\rempl'
+                b'oyee_name\xda\x0bemployee_id\xda\x07company\xda\tjob_title\xda\x04team\xda\x0cca'
+                b'reer_level\xda\rcontract_term\xda\nstart_date\xda\x08end_date\xda\x0creporting_t'
+                b'o\xda\rwork_location\xda\x0fjob_description\xda\x15role_responsibilities\xda\rkp'
+                b'i_breakdown\xda\rworking_hours\xda\x0fovertime_policy\xda\x06salary\xda\x0bter'
+                b'mination\xda\x12leave_entitlements\xda\x08benefits\xda\x0bcore_values\xda\x07map'
+                b'pingc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x17\x00\x00'
+                b'\x00\xf3 \x00\x00\x00\x97\x00t\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                b'd\x01\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00\x82\x01)\x02Nz\x1eN'
+                b"o test named 'mapping' found.)\x01r\x08\x00\x00\x00)\x01\xda\x06unuseds\x01"
+                b'\x00\x00\x00 \xfa\x15templates/contract.md\xda\x03t_1z\x11root.<locals>.t_1#'
+                b"\x00\x00\x00s\x11\x00\x00\x00\x80\x00\xe5\x12&\xd0'G\xd1\x12H\xd4\x12H\xd0\x0c"
+                b'H\xf3\x00\x00\x00\x00zk# EMPLOYMENT CONTRACT\n\nThis Contract of Services ("the C'
+                b'ontract") is made and entered into effective as of )\x01\xda\x04namez\n betwee'
+                b'n \nz\x14 (NRIC/Passport No: z\x18) ("the Employee"), and r-\x00\x00\x00z\x02 ('
+                b'\xda\x13registration_numberzu) ("the Employer") ("the Organization"). \n\nWHEREA'
+                b'S, the Employee desires to perform such services by the Employer as a=\x01\x00'
+                b'\x00 pursuant to the terms and conditions set forth in the Contract.\n\nWHEREAS, '
+                b'the Employer desires to have a need from the Employee in such capacity pursuant '
+                b'to the terms and conditions set forth in the Contract.\n\nIT IS HEREBY AGREED '
+                b'as follows: \n\n## Job Specification\n\n| Field | Value |\n|-------|-------|\n'
+                b'| Job Title | z\x0c |\n| Team | z\x14 |\n| Career Level | z\x15 |\n| Contract Te'
+                b'rm | z\x1b |\n| Contract Start Date | z\x19 |\n| Contract End Date | z\x14 |\n| '
+                b'Reporting To | z\x15 |\n| Work Location | z: |\n\n## Job Description & Organiz'
+                b'ation Strategic Area KPI\n\na\xf4\x01\x00\x00\n\nThe Employee is required to att'
+                b'end regular meetings with the project team regarding the strategy and growth of '
+                b'the project. The Employee is also required to manage the project by:\n- Facilitat'
+                b'ing communication between the relevant teams, partners, and stakeholders;\n- Repo'
+                b'rting potential problems or issues timely; or solving them where possible; and\n-'
+                b' Ensuring the relevant teams, partners and stakeholders are aware of all process'
+                b'es and policies that apply to them.\n\n## Role Expectations\n\nAs a/an z5, the E'
+                b'mployee is expected to perform the following:\nz\x02- \xfa\x01\na\x05\x01'
+                b'\x00\x00\n## Strategic Area KPI Breakdown\n\nThe Employee is responsible to overs'
+                b'ee and execute the roles according to the organization strategic areas KPI, incl'
+                b'uding but not limited to:\n\n| Strategic Area | KPI (%) | Role Focus |\n|------'
+                b'----------|---------|------------|\n\xda\x05itemsz\x02| z\x03 | \xda\npercentagez'
+                b'\x04% | \xda\x0bdescription\xda\x00z\x03 |\nzD\n## Media Consent\n\nBy signing'
+                b' this Contract, you hereby consent for a\xce\x01\x00\x00, and/or its partners to'
+                b' take your photographs, digital images and/or audio and/or video footage (the im'
+                b'ages) of and to store the images, make copies of the images and publish the imag'
+                b'es in any form, in whole or in part, and distribute them in any medium including'
+                b', but not limited to, print media, the Internet, CD-ROM, other multimedia uses o'
+                b'r graphic representation, cinematography or video.\n\n## Working Hours\n\nThe Or'
+                b'ganization general hours of operation are \xda\x07generalz_.\nThe Employee may '
+                b'work flexible hours on a weekly basis as long as the weekly hours amount to '
+                b'\xda\x0cweekly_hourszf hours.\n\nHowever, there might be occasions where project'
+                b' work requires the Employee to work more than a;\x01\x00\x00 hours ("Overtime"). '
+                b'In such a situation, the Employee will be informed beforehand and could apply fo'
+                b'r Replacement Leave. The Employee will need to inform the Manager. (see section '
+                b'J. Leave Entitlements).\n\n### Overtime Replacement Leave\n| Overtime Hours | R'
+                b'eplacement Leave |\n|----------------|-------------------|\n\xda\x11replacement_'
+                b'leavez+\nThe Employee is expected to start work by \xda\nstart_timea\xc5'
+                b'\x04\x00\x00 daily or earlier if required. If the Employee has obligations outsta'
+                b'tion (meetings, site visits, etc.), the Employee has to inform his or her manage'
+                b"r in advance at all times.\n\n## The Contract Terms & Organization's Policies\n"
+                b"\nThe Employee is required to comply with the Organization's policy at all times "
+                b'as enlisted in, but not limited to, the Code of Conduct and Standard Operating P'
+                b'rocedures. Failure to do so may result in immediate termination of employmen'
+                b't.\n\nThe Contract extension term and salary increment are to be determined by'
+                b" the manager and to be approved by the Board, based on the Employee's scope of w"
+                b"ork (responsibility), overall performance and the Organization's performance"
+                b".\n\n## Remuneration & Payment Terms\n\nThe Employee's fee will be paid in the f"
+                b'ourth week of the month and/or first week of the following month. Pro-rata if th'
+                b'e Employee starts or ends in the middle of the month.\n\nSalary increment is t'
+                b"o be determined by the Employee's manager and to be approved by the Board, based"
+                b" on the Employee's services, overall performance and the Organization's performa"
+                b'nce. \n\nThe salary (after EPF, PCB, SOCSO and EIS deduction) will be paid mon'
+                b'thly.\n\nAs proposed, the salary is as follows:\n- **Salary**: z\x17; and\n- Yo'
+                b'ur salary of z\xe9 per month is inclusive of payment for every statutory and ge'
+                b'neral Public Holiday in Malaysia.\n\nHowever, such benefit policies are subjec'
+                b"t to management's annual review.\n\n## Termination Clause\n\nThe Employee shall "
+                b'be required to give \xda\rnotice_periodz\x8c written notice to the Organization'
+                b' for termination of this Contract.\n\nThe Organization may terminate the Emplo'
+                b"yee's employment by giving a z\xa7 notice period (or payment in lieu) depending"
+                b' on service. \n\nFollowing the termination of your employment, the Employee wi'
+                b'll be required to return all organization and z\xd3 property.\n\nAny violation of'
+                b" the Organization's Code of Conduct (refer to Appendix A) policies and procedure"
+                b's will result in an immediate termination of this Contract.\n\n## Leave Entitl'
+                b'ement\n\nYou are entitled to \xda\x0cannual_leavea\xbe\x01\x00\x00 days of Annua'
+                b'l Leave per year if you start to work full-time in January. If the employment pe'
+                b'riod starts at any other month, the annual leave will be automatically prorated.'
+                b'\n\nDuring the first year of employment, you will acquire leave entitlement on'
+                b' an accrual basis.\n\nIn the second year of employment, you will be awarded fu'
+                b'll leave permission at the beginning of each year and may carry forward 10 days '
+                b'of leave per year.\n\nYou are entitled to \xda\rmedical_leavez\x18 days of Medica'
+                b'l Leave, \xda\x15hospitalization_leavez/ days of Hospitalization leave (non-ma'
+                b'ternal), \xda\x0fpaternity_leavez\x1a days of paternity leave, \xda\x0fmaternit'
+                b'y_leavez\x1a days of maternity leave, \xda\x13compassionate_leavez" days of compa'
+                b'ssionate leave, and \xda\x0bstudy_leavea\x98\x02\x00\x00 days of study leave. '
+                b'However, such leave policies are subject to annual review.\n\nFor maternity le'
+                b'ave, please provide a 2-month notice to notify the pregnancy to the Supervisor a'
+                b'nd/or Direct Leader and/or Employer.\n\nIf you worked overtime and on Public H'
+                b"olidays, you may, with your manager's approval, apply for Replacement Leave on t"
+                b'he Organizations platform. You may utilize all Replacement Leaves in the same mo'
+                b'nth or the following week and do not accumulate after 2-month.\n\n## Benefits\n'
+                b'\nDuring the Employment Term, the Executive will be entitled to participate in th'
+                b'e Holistic Wellness benefit plans. The Employee may have the option to participa'
+                b'te in the: \n- \xda\x0ewellness_claima.\x02\x00\x00 wellness claim annually\n'
+                b'\nThe Organization is liable to contribute to the Employees Provident Fund (EPF),'
+                b' Social Security Organization (SOCSO) and Employment Insurance System (EIS), for'
+                b' the Organization contribution portion.\n\n## Performance Management\n\nThe Empl'
+                b'oyee to jointly agree on the yearly strategic plan and KPIs with the Organizatio'
+                b'n.\n\nThe Employee shall deliver the above set KPIs whilst being guided by the'
+                b' Core Values of the Organization. The core values are as follows:\n\n| Item | '
+                b'Core Values | Description |\n|------|-------------|-------------|\n\xda\x05index'
+                b'z\x04. | a>\x02\x00\x00\n## Confidentiality\n\nAll confidential and proprietary'
+                b' information relating to the business or operations of the Organization or off i'
+                b'ts affiliates shall be kept and treated as confidential both during and after th'
+                b'e employment.\n\n---\n\n*** This part is intentionally left blank. ***\n\nThe '
+                b'Organization and the Employee hereby declare that they understand thoroughly the'
+                b' above provisions and agree to sign to abide by such provisions. They shall each'
+                b' retain a copy of this contract for future reference.\n\n**Signature of Employ'
+                b'ee**: _________________\n\n**NRIC / Passport Number**: z;\n\n**Date**: _________'
+                b"________\n\n**Organization's Initial**: zM)\n\n**Date**: _________________\n\n"
+                b'---\n\n## APPENDIX A: CODE OF CONDUCT\n\nBetween z? (hereinafter referred to as '
+                b'the "Organization" and "We")\n\nand uE\x0b\x00\x00 (hereinafter referred to as '
+                b'"the Employee" and "You")\n\n### Sustainable Working Environment\n\nWe maintain '
+                b'an inclusive work environment and achieve excellence by attracting and retaining'
+                b' people of all backgrounds in our workforce.\n\nWe have identified mutual resp'
+                b'ect, honest communication and professional conduct as essential pillars in the c'
+                b'ulture.\n\nWe prohibit sexual, physical, emotional or any other kind of harass'
+                b'ment by any person in the workplace or while conducting business.\n\nWe strive'
+                b' to avoid favouritism or the appearance of favouritism in the workplace in accor'
+                b'dance with the policies and procedures adopted.\n\nWe comply with all policies'
+                b' and procedures at all times.\n\nWe comply with Malaysian and international la'
+                b'w at all times.\n\nWe strive to be a contributing member of the global communi'
+                b'ty. We support the human rights movement and aim to maximize positive social imp'
+                b'act on our projects.\n\nWe are committed to doing our part to help preserve th'
+                b"e Earth's finite resources and maintain the wellbeing of our planet for generati"
+                b'ons to come.\n\n### Equal Employment Opportunities\n\nWe provide employment oppo'
+                b'rtunities to all qualified persons on an equal basis. This includes, but is not '
+                b'limited to, recruitment, hiring, promotion, transfer, compensation, training, de'
+                b'motion or layoff. We will not discriminate against any Contractor, Employee or a'
+                b'pplicant for employment because of:\n- Gender or Gender Identity\n- Race, Ethn'
+                b'icity or National Origin\n- Religion\n- Age\n- Sexual Orientation\n- Disability\n'
+                b'- Marital Status\n\nWe do not use child labour. Child labour is defined as emp'
+                b'loying any person younger than the minimum age allowed by law in the jurisdictio'
+                b'n in question. However, in no event will we knowingly employ or hire anyone youn'
+                b'ger than sixteen (16) years of age.\n\n### Health & Safety\n\nWe strive to elimi'
+                b'nate potential hazards from the workplace and to comply with all applicable occu'
+                b'pational safety and health laws and standards.\n\nWe help maintain a safe, hea'
+                b'lthy and productive work environment for all team members and others, by:\n- proh'
+                b'ibiting any acts that could be perceived as violent, threatening, degrading or i'
+                b'ntimidating.\n- prohibiting the spreading of unconfirmed information, gossip or i'
+                b'nformation that has no other purpose than damaging morale.\n- prohibiting bullyin'
+                b'g\n- prohibiting the possession, use, sale or transfer of illegal drugs or drug p'
+                b'araphernalia\n- prohibiting the conduct of business while under the influence of '
+                b'alcohol\n- prohibiting the possession or use of weapons/firearms, explosive devic'
+                b'es or ammunition.\n\nAll Contractors/Employees/Interns are required to comply '
+                b'with and understand the importance to follow the Health and Safety guidelines an'
+                b'd requirements, including the use of PPE set by the Organization.\n\n\xe2'
+                b'\x98\x90 I have read and understood the code of conduct and I agree to adhere '
+                b'to its contents for the duration of my affiliation with z\x8f. I understand tha'
+                b't failure to do so may result in the immediate termination of my professional re'
+                b'lationship with the Organization.\n\n**Name**: z\xd0\n\n**Date**: _____________'
+                b'____\n\n**Signature**: _________________\n\n---\n\n## APPENDIX B: THE NON-DISC'
+                b'LOSURE AGREEMENT\n\nThe NON-DISCLOSURE AGREEMENT, (hereinafter known as "the A'
+                b'greement", is entered into between z= (hereinafter known as "the Contractor/Inte'
+                b'rn/Employee") and z^ (hereinafter known as "the Organization"), (collectively kn'
+                b'own as "the Parties"), as of this a\xa2\x15\x00\x00.\n\n### (A) Scope of the A'
+                b'greement\n\nThe Agreement acknowledges that certain information, trade secrets'
+                b', and proprietary data (hereinafter known as "Confidential Information") of or r'
+                b"egarding the Organization and/or the Organization's business may be discussed be"
+                b'tween the Contractor/Intern/Employee and the Organization.\n\n### (B) Confiden'
+                b'tial Information\n\nFor the purpose of this clause, Confidential Information i'
+                b'ncludes (but shall not be limited to) trade secrets, technical know-how, any inf'
+                b'ormation relating to customers, operations and financial information and commerc'
+                b'ial methods of the Organization, any material, knowledge, and data (verbal, elec'
+                b'tronic, written and/or in any other form) concerning the Organization or the Org'
+                b"anization's businesses, not generally known to the public.\n\nExcept in carryi"
+                b'ng out your duties for the Organization, you must keep confidential and must not'
+                b' either during the course of your employment or at any time thereafter directly '
+                b'or indirectly disclose, publish or use for your own benefit or for the benefit o'
+                b"f others either:\n(i) Any of the Organization's and/or Organization's businesses "
+                b'Confidential Information or that of its customers without first having obtained '
+                b"the Organization's written consent to such disclosure, publication or use; or\n(i"
+                b'i) Any information which has been disclosed to the Organization and/or the Organ'
+                b"ization's business by others under an agreement which requires the Organization "
+                b"and/or the Organization's business to keep such information confidential.\n\n#"
+                b'## (C) Previous Agreements\n\nThe Agreement constitutes the entirety of the Ag'
+                b'reement and the signing thereof by both the Parties nullifies any and all previo'
+                b'us agreements made between the Organization and the Contractor/Intern/Employee.\n'
+                b'\n### (D) Modifications and Amendments\n\nNo modifications, amendments, rectifi'
+                b'cations, changes and/or alterations shall be made to the Agreement by either par'
+                b'ty unless in writing and signed by authorized representatives of both the Partie'
+                b's.\n\n### (E) Successors and Assigns\n\nThe Agreement shall be binding upon the '
+                b'successors, subsidiaries, assigns and/or corporations controlling or controlled '
+                b'by the Parties. The Organization may assign the Agreement to any party at any ti'
+                b'me, whereas the Contractor/Intern/Employee is prohibited from assigning any of h'
+                b'is/her rights or obligations in the Agreement without prior written consent from'
+                b' the Organization.\n\n### (F) Nature of Contractual Relationship between the P'
+                b'arties\n\nThe Agreement:-\n(i) does not constitute a contract of employment, no'
+                b"r does it guarantee the Contractor's/Intern's/Employees continuation of employme"
+                b'nt with the Organization; and\n(ii) does not create a partnership or joint ventur'
+                b'e between the Organization and the Contractor/Intern/Employee.\n\n### (G) Seve'
+                b'rability\n\nAny provision within the Agreement (or any portion thereof) deemed'
+                b' invalid, unlawful or otherwise unusable by a court of law shall be dissolved fr'
+                b'om the Agreement and the remainder of the Agreement shall continue to be enforce'
+                b'able.\n\n### (H) Governing Law\n\nThe Agreement shall be governed by the Malaysi'
+                b'an laws.\n\n### (I) Immunity\n\nDisclosing Confidential Information to an attorn'
+                b'ey, government representative or court official in confidence while assisting or'
+                b' taking part in a case involving a suspected violation of law connected or relat'
+                b"ed to the Organization and/or Organization's business is considered as a breach "
+                b'of the Agreement unless the Contractor/Intern/Employee is required to disclose C'
+                b'onfidential Information by law.\n\n### (J) Cause of Action\n\nThe Contractor/Int'
+                b'ern/Employee understands that the use or disclosure of any Confidential Informat'
+                b'ion may be cause for an action at law in an appropriate forum or in any court of'
+                b' law, and that the Organization shall be entitled to an injunction prohibiting t'
+                b'he use or disclosure of the Confidential Information.\n\n### (K) Indemnificati'
+                b'on\n\nThe Contractor/Intern/Employee understands and agrees that if the use or'
+                b' disclosure of Confidential Information by him/her or any affiliate, or represen'
+                b'tative of the Contractor/Intern/Employee causes damage, loss, cost or expense to'
+                b" the Organization and/or the Organization's business, the Contractor/Intern/Empl"
+                b'oyee shall be held responsible and shall indemnify the Organization.\n\n### (L'
+                b') Injunctive Relief\n\nThe Contractor/Intern/Employee understands and agrees t'
+                b'hat the use or disclosure of Confidential Information could cause the Organizati'
+                b'on irreparable harm and the Organization has the right to pursue legal action be'
+                b'yond remedies of a monetary nature in the form of an injunctive or equitable rel'
+                b'ief.\n\n### (M) Notice of Unauthorized Use or Disclosure\n\nThe Contractor/Inter'
+                b'n/Employee is bound by the Agreement to notify the Organization in the event of '
+                b'a breach of the Agreement involving the dissemination of Confidential Informatio'
+                b'n, either by the Contractor/Intern/Employee or a third party, the Contractor/Int'
+                b'ern/Employee will do everything possible to help the Organization regains posses'
+                b'sion of the Confidential Information.\n\n### (N) Costs and Expenses\n\nIn a disp'
+                b'ute arising out of or in relation to the Agreement, if either party brings an ac'
+                b'tion to enforce their rights under the Agreement, the winning party shall recove'
+                b"r its costs and expenses (including reasonable attorney's fees) incurred in conn"
+                b'ection with the action and/or any appeal, from the losing party.\n\nIN WITNESS'
+                b' WHEREOF, the Contractor/Intern/Employee hereto agrees to the terms of the Agree'
+                b'ment and signed on the date written below.\n\n**By**: _________________\n\n**Nam'
+                b'e**: z\x1d\n\n**Date**: _________________)\x0b\xda\x12resolve_or_missing\xda\t'
+                b'undefined\xda\x06concatr\t\x00\x00\x00\xda\x05tests\xda\x08KeyErrorr'
+                b'\x0c\x00\x00\x00\xda\x03str\xda\x07getattr\xda\x04callr\x02\x00\x00\x00)&\xda'
+                b'\x07contextr\x0e\x00\x00\x00\xda\x0benvironment\xda\x07resolverC\x00\x00\x00'
+                b'rD\x00\x00\x00\xda\x13cond_expr_undefined\xda\x11l_0_contract_date\xda\x11l_0_e'
+                b'mployee_name\xda\x0fl_0_employee_id\xda\x0bl_0_company\xda\rl_0_job_titl'
+                b'e\xda\x08l_0_team\xda\x10l_0_career_level\xda\x11l_0_contract_term\xda\x0el_0_st'
+                b'art_date\xda\x0cl_0_end_date\xda\x10l_0_reporting_to\xda\x11l_0_work_location\xda'
+                b'\x13l_0_job_description\xda\x19l_0_role_responsibilities\xda\x11l_0_kpi_breakdo'
+                b'wn\xda\x11l_0_working_hours\xda\x13l_0_overtime_policy\xda\nl_0_salary\xda\x0f'
+                b'l_0_termination\xda\x16l_0_leave_entitlements\xda\x0cl_0_benefits\xda\x0fl_0_c'
+                b'ore_valuesr+\x00\x00\x00\xda\x12l_1_responsibility\xda\n_loop_vars\xda\x08l_1_are'
+                b'a\xda\x0bl_1_details\xda\tl_1_hours\xda\tl_1_leave\xda\x08l_1_loop\xda\tl_1_valu'
+                b'es&\x00\x00\x00                                      r*\x00\x00\x00\xda\x04rootr'
+                b'l\x00\x00\x00\x04\x00\x00\x00sd\x14\x00\x00\xe8\x00\xe8\x00\x80\x00\xd8'
+                b'\x0e\x15\xd4\x0e(\x80G\xd8\x10\x1b\xd4\x10%\x80I\xd8\r\x18\xd4\r\x1f\x80F\xdd'
+                b'\x1a#\xd0\x04\x17\xd8\x04\x14\xd8\x18\x1f\x98\x07\xa0\x0f\xd1\x180\xd4\x18'
+                b'0\xd0\x04\x15\xd8\x18\x1f\x98\x07\xa0\x0f\xd1\x180\xd4\x180\xd0\x04\x15'
+                b"\xd8\x16\x1d\x90g\x98m\xd1\x16,\xd4\x16,\x80O\xd8\x12\x19\x90'\x98)\xd1\x12"
+                b'$\xd4\x12$\x80K\xd8\x14\x1b\x90G\x98K\xd1\x14(\xd4\x14(\x80M\xd8\x0f\x16'
+                b'\x88w\x90v\x89\x7f\x8c\x7f\x80H\xd8\x17\x1e\x90w\x98~\xd1\x17.\xd4\x17.\xd0'
+                b'\x04\x14\xd8\x18\x1f\x98\x07\xa0\x0f\xd1\x180\xd4\x180\xd0\x04\x15\xd8\x15'
+                b'\x1c\x90W\x98\\\xd1\x15*\xd4\x15*\x80N\xd8\x13\x1a\x907\x98:\xd1\x13&\xd4'
+                b'\x13&\x80L\xd8\x17\x1e\x90w\x98~\xd1\x17.\xd4\x17.\xd0\x04\x14\xd8\x18\x1f\x98'
+                b'\x07\xa0\x0f\xd1\x180\xd4\x180\xd0\x04\x15\xd8\x1a!\x98\'\xd0"3\xd1\x1a4\xd4'
+                b"\x1a4\xd0\x04\x17\xd8 '\xa0\x07\xd0(?\xd1 @\xd4 @\xd0\x04\x1d\xd8\x18"
+                b'\x1f\x98\x07\xa0\x0f\xd1\x180\xd4\x180\xd0\x04\x15\xd8\x18\x1f\x98\x07\xa0'
+                b'\x0f\xd1\x180\xd4\x180\xd0\x04\x15\xd8\x1a!\x98\'\xd0"3\xd1\x1a4\xd4\x1a4'
+                b'\xd0\x04\x17\xd8\x11\x18\x90\x17\x98\x18\xd1\x11"\xd4\x11"\x80J\xd8\x16'
+                b'\x1d\x90g\x98m\xd1\x16,\xd4\x16,\x80O\xd8\x1d$\x98W\xd0%9\xd1\x1d:\xd4\x1d:\xd0'
+                b'\x04\x1a\xd8\x13\x1a\x907\x98:\xd1\x13&\xd4\x13&\x80L\xd8\x16\x1d\x90g\x98m'
+                b'\xd1\x16,\xd4\x16,\x80O\xf0\x02\x05\x05I\x01\xd8\x0e\x19\xd4\x0e\x1f'
+                b'\xa0\t\xd4\x0e*\x88\x03\x88\x03\xf8\xdd\x0b\x13\xf0\x00\x03\x05I\x01\xf0'
+                b'\x00\x03\x05I\x01\xf0\x00\x03\x05I\x01\xdd\t\x15\xf0\x02\x01\tI\x01\xf0\x00\x01\t'
+                b'I\x01\xf1\x03\x00\n\x16\x8c\x1c\xf0\x02\x01\tI\x01\xf0\x00\x01\tI\x01\xf0\x00\x01'
+                b'\tI\x01\xf0\x05\x03\x05I\x01\xf8\xf8\xf8\xf0\x08\x00\x05\t\xd8\ny\xd0\x04y\xd0'
+                b'\x04y\xd0\x04y\xdd\n\r\xd02C\xc0w\xd02N\xd02N\x88y\x88y\x98o\xd0\x0f.'
+                b'\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng\xd4\ng\xd0\x04g\xd0\x04g\xd0\x04g\xd8'
+                b'\n\x17\xd0\x04\x17\xd0\x04\x17\xd0\x04\x17\xdd\n\r\xd02C\xc0w\xd02N\xd02'
+                b'N\x88y\x88y\x98o\xd0\x0f.\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng\xd4\ng'
+                b'\xd0\x04g\xd0\x04g\xd0\x04g\xd8\n \xd0\x04 \xd0\x04 \xd0\x04 \xdd\n\r'
+                b'\xb0\x0f\xc07\xd00J\xd00J\x88y\x88y\x98m\xd0\x0f,\xd1\x0f,\xd4\x0f,\xd0\x0f,'
+                b'\xd0P_\xd1\na\xd4\na\xd0\x04a\xd0\x04a\xd0\x04a\xd8\n$\xd0\x04$\xd0\x04$\xd0'
+                b'\x04$\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa09\xb0'
+                b')\xd0#<\xd1#<\xd4#<\xd0#<\xd0\\g\xd0jp\xd1\x0eq\xd4\x0eq\xd1\nr\xd4\nr\xd0'
+                b'\x04r\xd0\x04r\xd0\x04r\xd8\n\x0e\x80J\x80J\x80J\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!'
+                b'\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa09\xb0)\xd0#<\xd1#<\xd4#<\xd0#<\xd0\\g\xd0'
+                b'j\x7f\xf1\x00\x00\x0fA\x02\xf4\x00\x00\x0fA\x02\xf1\x00\x00\x0bB\x02'
+                b'\xf4\x00\x00\x0bB\x02\xf0\x00\x00\x05B\x02\xf0\x00\x00\x05B\x02\xf0\x00'
+                b'\x00\x05B\x02\xf0\x02\x00\x0bD\x02\xf0\x00\x00\x05D\x02\xf0\x00\x00\x05'
+                b'D\x02\xf0\x00\x00\x05D\x02\xdd\n\r\xa8m\xb8w\xd0.F\xd0.F\x88y\x88y\x98k\xd0'
+                b'\x0f*\xd1\x0f*\xd4\x0f*\xd0\x0f*\xc8M\xd1\n[\xd4\n[\xd0\x04[\xd0\x04[\xd0\x04['
+                b'\xf0\x02\x00\x0bT\x05\xf0\x00\x00\x05T\x05\xf0\x00\x00\x05T\x05\xf0\x00'
+                b'\x00\x05T\x05\xdd\n\r\xa8m\xb8w\xd0.F\xd0.F\x88y\x88y\x98k\xd0\x0f*\xd1\x0f'
+                b'*\xd4\x0f*\xd0\x0f*\xc8M\xd1\n[\xd4\n[\xd0\x04[\xd0\x04[\xd0\x04[\xd8\n\x19\xd0'
+                b'\x04\x19\xd0\x04\x19\xd0\x04\x19\xdd\n\r\xa8\x18\xb0W\xd0)<\xd0)<\x88y\x88'
+                b'y\x98f\xd0\x0f%\xd1\x0f%\xd4\x0f%\xd0\x0f%\xc0(\xd1\nL\xd4\nL\xd0\x04L\xd0\x04'
+                b'L\xd0\x04L\xd8\n!\xd0\x04!\xd0\x04!\xd0\x04!\xdd\n\r\xd01A\xc0W\xd01L\xd01L\x88y'
+                b'\x88y\x98n\xd0\x0f-\xd1\x0f-\xd4\x0f-\xd0\x0f-\xd0Rb\xd1\nd\xd4\nd\xd0\x04d'
+                b'\xd0\x04d\xd0\x04d\xd8\n"\xd0\x04"\xd0\x04"\xd0\x04"\xdd\n\r\xd02C\xc0w\xd02'
+                b'N\xd02N\x88y\x88y\x98o\xd0\x0f.\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng'
+                b'\xd4\ng\xd0\x04g\xd0\x04g\xd0\x04g\xd8\n(\xd0\x04(\xd0\x04(\xd0\x04(\xdd\n\r\xa8'
+                b'~\xc0\x17\xd0/H\xd0/H\x88y\x88y\x98l\xd0\x0f+\xd1\x0f+\xd4\x0f+\xd0\x0f+\xc8'
+                b'n\xd1\n^\xd4\n^\xd0\x04^\xd0\x04^\xd0\x04^\xd8\n&\xd0\x04&\xd0\x04&\xd0\x04&'
+                b'\xdd\n\r\xa8\\\xb8W\xd0-D\xd0-D\x88y\x88y\x98j\xd0\x0f)\xd1\x0f)\xd4\x0f)'
+                b'\xd0\x0f)\xc8,\xd1\nX\xd4\nX\xd0\x04X\xd0\x04X\xd0\x04X\xd8\n!\xd0\x04!\xd0\x04'
+                b'!\xd0\x04!\xdd\n\r\xd01A\xc0W\xd01L\xd01L\x88y\x88y\x98n\xd0\x0f-\xd1'
+                b'\x0f-\xd4\x0f-\xd0\x0f-\xd0Rb\xd1\nd\xd4\nd\xd0\x04d\xd0\x04d\xd0\x04d\xd8\n'
+                b'"\xd0\x04"\xd0\x04"\xd0\x04"\xdd\n\r\xd02C\xc0w\xd02N\xd02N\x88y\x88y'
+                b'\x98o\xd0\x0f.\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng\xd4\ng\xd0\x04g\xd0\x04'
+                b'g\xd0\x04g\xd8\nJ\xd0\x04J\xd0\x04J\xd0\x04J\xdd\n\r\xd04G\xc87\xd04R\xd04R\x88y'
+                b'\x88y\xd0\x1e/\xd0\x0f0\xd1\x0f0\xd4\x0f0\xd0\x0f0\xd0Xk\xd1\nm\xd4\nm\xd0\x04'
+                b'm\xd0\x04m\xd0\x04m\xf0\x02\x00\x0bJ\x08\xf0\x00\x00\x05J\x08\xf0\x00\x00\x05J'
+                b'\x08\xf0\x00\x00\x05J\x08\xdd\n\r\xd01A\xc0W\xd01L\xd01L\x88y\x88y\x98n\xd0'
+                b'\x0f-\xd1\x0f-\xd4\x0f-\xd0\x0f-\xd0Rb\xd1\nd\xd4\nd\xd0\x04d\xd0\x04d\xd0\x04'
+                b'd\xd8\nB\xd0\x04B\xd0\x04B\xd0\x04B\xd8Jc\xd0gn\xd0Jn\xd0Jn\x98y\x98y\xd0.E'
+                b'\xd0\x1fF\xd1\x1fF\xd4\x1fF\xd0\x1fF\xf0\x00\x00u\x01N\x02\xf0\x00\x05\x05\x13'
+                b'\xf0\x00\x05\x05\x13\xd0\x08\x1a\xd8\x15\x17\x88\n\xd8\x08\x0c\xd8\x0e\x12\x88'
+                b'\n\x88\n\x88\n\xdd\x0e\x11\xd0\x12$\xd1\x0e%\xd4\x0e%\xd0\x08%\xd0\x08%\xd0'
+                b'\x08%\xd8\x0e\x12\x88\n\x88\n\x88\n\x88\n\xd8\x19 \xd0\x04\x16\xf0\x02\x00\x0bY'
+                b'\x04\xf0\x00\x00\x05Y\x04\xf0\x00\x00\x05Y\x04\xf0\x00\x00\x05Y\x04\xd8#*\xa7<'
+                b'\xa2<\xb0\x0b\xd70C\xd20C\xd0hy\xf0\x00\x00~\x01E\x02\xf0\x00\x00i\x01E\x02\xf0'
+                b'\x00\x00i\x01E\x02\xc0Y\xc0Y\xd0Tc\xd0Ed\xd1Ed\xd4Ed\xd0Ed\xf0\x00\x00K\x02\\\x02'
+                b'\xf0\x00\x00_\x02f\x02\xf1\x00\x001g\x02\xf4\x00\x001g\x02\xf1\x00\x00$h'
+                b'\x02\xf4\x00\x00$h\x02\xf0\x00\t\x05\x15\xf0\x00\t\x05\x15\xd1\x08\x1f'
+                b'\x88\x18\x90;\xd8\x15\x17\x88\n\xd8\x08\x0c\xd8\x0e\x12\x88\n\x88\n\x88'
+                b'\n\xdd\x0e\x11\x90(\x89m\x8cm\xd0\x08\x1b\xd0\x08\x1b\xd0\x08\x1b\xd8'
+                b'\x0e\x13\x88\x0b\x88\x0b\x88\x0b\xdd\x0e\x11\xc0S\xc0S\xc8\x1b\xd1EU\xd4EU\xd0'
+                b'\x13f\x90;\xd7\x13&\xd2\x13&\xa0{\xb0L\xd1\x13A\xd4\x13A\xd0\x13A\xd0[f\xd1\x0e'
+                b'h\xd4\x0eh\xd0\x08h\xd0\x08h\xd0\x08h\xd8\x0e\x14\x88\x0c\x88\x0c\x88\x0c\xdd\x0e'
+                b'\x11\xc0c\xc0c\xc8+\xd1FV\xd4FV\xd0\x13^\x90;\xd7\x13&\xd2\x13&\xa0{\xb0M'
+                b'\xd1\x13B\xd4\x13B\xd0\x13B\xd0\\^\xd1\x0e`\xd4\x0e`\xd0\x08`\xd0\x08`'
+                b'\xd0\x08`\xd8\x0e\x14\x88\x0c\x88\x0c\x88\x0c\x88\x0c\xd8\x1d$\xd0\x04$\x80H\x88{'
+                b'\xd8\nS\xd0\x04S\xd0\x04S\xd0\x04S\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0'
+                b'\x0b\xc8w\xd0@V\xd0@V\xa09\xa09\xb0)\xd0#<\xd1#<\xd4#<\xd0#<\xd0\\g\xd0j'
+                b'p\xd1\x0eq\xd4\x0eq\xd1\nr\xd4\nr\xd0\x04r\xd0\x04r\xd0\x04r\xf0\x02\x00\x0b_\x07'
+                b'\xf0\x00\x00\x05_\x07\xf0\x00\x00\x05_\x07\xf0\x00\x00\x05_\x07\xdd\n\r\x88k\xd7'
+                b'\x0e!\xd2\x0e!\xd0FW\xd0[b\xd0Fb\xd0Fb\xa09\xa09\xb0/\xd0#B\xd1#B\xd4#B\xd0#B\xd0'
+                b'hy\xf0\x00\x00}\x01F\x02\xf1\x00\x00\x0fG\x02\xf4\x00\x00\x0fG\x02\xf1\x00\x00'
+                b'\x0bH\x02\xf4\x00\x00\x0bH\x02\xf0\x00\x00\x05H\x02\xf0\x00\x00\x05H'
+                b'\x02\xf0\x00\x00\x05H\x02\xd8\nl\xd0\x04l\xd0\x04l\xd0\x04l\xdd\n\r\x88k'
+                b'\xd7\x0e!\xd2\x0e!\xd0FW\xd0[b\xd0Fb\xd0Fb\xa09\xa09\xb0/\xd0#B\xd1#B\xd4#B\xd0#B'
+                b'\xd0hy\xf0\x00\x00}\x01K\x02\xf1\x00\x00\x0fL\x02\xf4\x00\x00\x0fL\x02\xf1\x00'
+                b'\x00\x0bM\x02\xf4\x00\x00\x0bM\x02\xf0\x00\x00\x05M\x02\xf0\x00\x00\x05'
+                b'M\x02\xf0\x00\x00\x05M\x02\xd8\nt\xd0\x04t\xd0\x04t\xd0\x04t\xdd\n\r\x88'
+                b'k\xd7\x0e!\xd2\x0e!\xd0FW\xd0[b\xd0Fb\xd0Fb\xa09\xa09\xb0/\xd0#B\xd1#B\xd4#B\xd0#'
+                b'B\xd0hy\xf0\x00\x00}\x01K\x02\xf1\x00\x00\x0fL\x02\xf4\x00\x00\x0fL\x02\xf1'
+                b'\x00\x00\x0bM\x02\xf4\x00\x00\x0bM\x02\xf0\x00\x00\x05M\x02\xf0\x00\x00'
+                b'\x05M\x02\xf0\x00\x00\x05M\x02\xf0\x02\x00\x0bM\x05\xf0\x00\x00\x05M'
+                b'\x05\xf0\x00\x00\x05M\x05\xf0\x00\x00\x05M\x05\xd8")\xa7,\xa2,\xa8{\xd7/B\xd2/B'
+                b'\xc0;\xd7CV\xd2CV\xf0\x00\x00~\x01Q\x02\xf0\x00\x00U\x02\\\x02\xf0\x00\x00~\x01\\'
+                b'\x02\xf0\x00\x00~\x01\\\x02\xd0Xa\xd0Xa\xd0gx\xd0Xy\xd1Xy\xd4Xy\xd0Xy\xf0\x00\x00'
+                b'b\x02u\x02\xf0\x00\x00x\x02K\x03\xf1\x00\x00D\x01L\x03\xf4\x00\x00D\x01L'
+                b'\x03\xf0\x00\x00N\x03U\x03\xf1\x00\x000V\x03\xf4\x00\x000V\x03\xf1\x00\x00#'
+                b'W\x03\xf4\x00\x00#W\x03\xf0\x00\x07\x05\x15\xf0\x00\x07\x05\x15\xd1\x08'
+                b'\x1e\x88\x19\x90I\xd8\x15\x17\x88\n\xd8\x08\x0c\xd8\x0e\x12\x88\n\x88\n'
+                b'\x88\n\xdd\x0e\x11\x90)\x89n\x8cn\xd0\x08\x1c\xd0\x08\x1c\xd0\x08\x1c'
+                b'\xd8\x0e\x13\x88\x0b\x88\x0b\x88\x0b\xdd\x0e\x11\x90)\x89n\x8cn\xd0\x08'
+                b'\x1c\xd0\x08\x1c\xd0\x08\x1c\xd8\x0e\x14\x88\x0c\x88\x0c\x88\x0c\x88\x0c\xd8\x1c'
+                b'#\xd0\x04#\x80I\x90\t\xd8\n8\xd0\x048\xd0\x048\xd0\x048\xdd\n\r\x88k\xd7\x0e!'
+                b'\xd2\x0e!\xd0FW\xd0[b\xd0Fb\xd0Fb\xa09\xa09\xb0/\xd0#B\xd1#B\xd4#B\xd0#B\xd0hy'
+                b'\xf0\x00\x00}\x01I\x02\xf1\x00\x00\x0fJ\x02\xf4\x00\x00\x0fJ\x02\xf1\x00\x00\x0bK'
+                b'\x02\xf4\x00\x00\x0bK\x02\xf0\x00\x00\x05K\x02\xf0\x00\x00\x05K\x02\xf0'
+                b'\x00\x00\x05K\x02\xf0\x02\x00\x0bc\x13\xf0\x00\x00\x05c\x13\xf0\x00\x00'
+                b'\x05c\x13\xf0\x00\x00\x05c\x13\xdd\n\r\xa8:\xb8\x17\xd0+@\xd0+@\x88y\x88y\x98h'
+                b"\xd0\x0f'\xd1\x0f'\xd4\x0f'\xd0\x0f'\xc0j\xd1\nR\xd4\nR\xd0\x04R\xd0\x04R\xd0\x04"
+                b'R\xd8\n$\xd0\x04$\xd0\x04$\xd0\x04$\xdd\n\r\xa8:\xb8\x17\xd0+@\xd0+@\x88y'
+                b"\x88y\x98h\xd0\x0f'\xd1\x0f'\xd4\x0f'\xd0\x0f'\xc0j\xd1\nR\xd4\nR\xd0\x04R\xd0"
+                b'\x04R\xd0\x04R\xf0\x02\x00\x0b|\x03\xf0\x00\x00\x05|\x03\xf0\x00\x00\x05|\x03\xf0'
+                b'\x00\x00\x05|\x03\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0O\xd0W^\xd0D^\xd0D^\xa0'
+                b'9\xa09\xb0-\xd0#@\xd1#@\xd4#@\xd0#@\xd0ds\xf0\x00\x00w\x01F\x02\xf1\x00\x00\x0fG'
+                b'\x02\xf4\x00\x00\x0fG\x02\xf1\x00\x00\x0bH\x02\xf4\x00\x00\x0bH\x02\xf0'
+                b'\x00\x00\x05H\x02\xf0\x00\x00\x05H\x02\xf0\x00\x00\x05H\x02\xf0\x02\x00'
+                b'\x0b[\x02\xf0\x00\x00\x05[\x02\xf0\x00\x00\x05[\x02\xf0\x00\x00\x05[\x02\xdd\n\r'
+                b'\x88k\xd7\x0e!\xd2\x0e!\xc0O\xd0W^\xd0D^\xd0D^\xa09\xa09\xb0-\xd0#@\xd1#@\xd4'
+                b'#@\xd0#@\xd0ds\xf0\x00\x00w\x01F\x02\xf1\x00\x00\x0fG\x02\xf4\x00\x00'
+                b'\x0fG\x02\xf1\x00\x00\x0bH\x02\xf4\x00\x00\x0bH\x02\xf0\x00\x00\x05H'
+                b'\x02\xf0\x00\x00\x05H\x02\xf0\x00\x00\x05H\x02\xf0\x02\x00\x0bv\x02\xf0'
+                b'\x00\x00\x05v\x02\xf0\x00\x00\x05v\x02\xf0\x00\x00\x05v\x02\xdd\n\r\x88k\xd7\x0e'
+                b'!\xd2\x0e!\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa09\xb0)\xd0#<\xd1#<\xd4#<\xd0#<'
+                b'\xd0\\g\xd0jp\xd1\x0eq\xd4\x0eq\xd1\nr\xd4\nr\xd0\x04r\xd0\x04r\xd0\x04r\xf0'
+                b'\x02\x00\x0bf\x03\xf0\x00\x00\x05f\x03\xf0\x00\x00\x05f\x03\xf0\x00\x00'
+                b'\x05f\x03\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xd0Ka\xd0el\xd0Kl\xd0Kl\xa09\xa09\xd02'
+                b'F\xd0#G\xd1#G\xd4#G\xd0#G\xf0\x00\x00s\x01I\x02\xf0\x00\x00L\x02Z\x02\xf1'
+                b'\x00\x00\x0f[\x02\xf4\x00\x00\x0f[\x02\xf1\x00\x00\x0b\\\x02\xf4\x00\x00'
+                b'\x0b\\\x02\xf0\x00\x00\x05\\\x02\xf0\x00\x00\x05\\\x02\xf0\x00\x00\x05\\'
+                b'\x02\xf0\x02\x00\x0bQ\x07\xf0\x00\x00\x05Q\x07\xf0\x00\x00\x05Q\x07\xf0'
+                b'\x00\x00\x05Q\x07\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xd0Ka\xd0el\xd0Kl\xd0Kl'
+                b'\xa09\xa09\xd02F\xd0#G\xd1#G\xd4#G\xd0#G\xf0\x00\x00s\x01I\x02\xf0\x00\x00L\x02['
+                b'\x02\xf1\x00\x00\x0f\\\x02\xf4\x00\x00\x0f\\\x02\xf1\x00\x00\x0b]\x02\xf4'
+                b'\x00\x00\x0b]\x02\xf0\x00\x00\x05]\x02\xf0\x00\x00\x05]\x02\xf0\x00\x00'
+                b'\x05]\x02\xd8\n$\xd0\x04$\xd0\x04$\xd0\x04$\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xd0K'
+                b'a\xd0el\xd0Kl\xd0Kl\xa09\xa09\xd02F\xd0#G\xd1#G\xd4#G\xd0#G\xf0\x00\x00s\x01I\x02'
+                b'\xf0\x00\x00L\x02c\x02\xf1\x00\x00\x0fd\x02\xf4\x00\x00\x0fd\x02\xf1\x00\x00\x0be'
+                b'\x02\xf4\x00\x00\x0be\x02\xf0\x00\x00\x05e\x02\xf0\x00\x00\x05e\x02\xf0'
+                b'\x00\x00\x05e\x02\xd8\n;\xd0\x04;\xd0\x04;\xd0\x04;\xdd\n\r\x88k\xd7\x0e'
+                b'!\xd2\x0e!\xd0Ka\xd0el\xd0Kl\xd0Kl\xa09\xa09\xd02F\xd0#G\xd1#G\xd4#G\xd0#G\xf0'
+                b'\x00\x00s\x01I\x02\xf0\x00\x00L\x02]\x02\xf1\x00\x00\x0f^\x02\xf4\x00\x00\x0f^'
+                b'\x02\xf1\x00\x00\x0b_\x02\xf4\x00\x00\x0b_\x02\xf0\x00\x00\x05_\x02\xf0'
+                b'\x00\x00\x05_\x02\xf0\x00\x00\x05_\x02\xd8\n&\xd0\x04&\xd0\x04&\xd0\x04&\xdd'
+                b'\n\r\x88k\xd7\x0e!\xd2\x0e!\xd0Ka\xd0el\xd0Kl\xd0Kl\xa09\xa09\xd02F\xd0#G'
+                b'\xd1#G\xd4#G\xd0#G\xf0\x00\x00s\x01I\x02\xf0\x00\x00L\x02]\x02\xf1\x00\x00\x0f^'
+                b'\x02\xf4\x00\x00\x0f^\x02\xf1\x00\x00\x0b_\x02\xf4\x00\x00\x0b_\x02\xf0'
+                b'\x00\x00\x05_\x02\xf0\x00\x00\x05_\x02\xf0\x00\x00\x05_\x02\xd8\n&\xd0\x04&\xd0'
+                b'\x04&\xd0\x04&\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xd0Ka\xd0el\xd0Kl\xd0Kl\xa09\xa09'
+                b'\xd02F\xd0#G\xd1#G\xd4#G\xd0#G\xf0\x00\x00s\x01I\x02\xf0\x00\x00L\x02a'
+                b'\x02\xf1\x00\x00\x0fb\x02\xf4\x00\x00\x0fb\x02\xf1\x00\x00\x0bc\x02\xf4'
+                b'\x00\x00\x0bc\x02\xf0\x00\x00\x05c\x02\xf0\x00\x00\x05c\x02\xf0\x00\x00'
+                b'\x05c\x02\xd8\n.\xd0\x04.\xd0\x04.\xd0\x04.\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xd0K'
+                b'a\xd0el\xd0Kl\xd0Kl\xa09\xa09\xd02F\xd0#G\xd1#G\xd4#G\xd0#G\xf0\x00\x00s\x01I\x02'
+                b'\xf0\x00\x00L\x02Y\x02\xf1\x00\x00\x0fZ\x02\xf4\x00\x00\x0fZ\x02\xf1\x00\x00\x0b['
+                b'\x02\xf4\x00\x00\x0b[\x02\xf0\x00\x00\x05[\x02\xf0\x00\x00\x05[\x02\xf0'
+                b'\x00\x00\x05[\x02\xf0\x02\x00\x0bn\n\xf0\x00\x00\x05n\n\xf0\x00\x00\x05n\n\xf0'
+                b'\x00\x00\x05n\n\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0\x1c\xd0QX\xd0AX\xd0AX\xa0'
+                b'9\xa09\xb0*\xd0#=\xd1#=\xd4#=\xd0#=\xd0^j\xd0m}\xd1\x0e~\xd4\x0e~\xd1\n\x7f'
+                b'\xd4\n\x7f\xd0\x04\x7f\xd0\x04\x7f\xd0\x04\x7f\xf0\x02\x00\x0bG\t\xf0\x00'
+                b'\x00\x05G\t\xf0\x00\x00\x05G\t\xf0\x00\x00\x05G\t\xd8\x0f\x16\x80H\xdd\x1f*'
+                b'\xc8_\xd0`g\xd0Mg\xd0Mg\xa8I\xa8I\xb8=\xd0,I\xd1,I\xd4,I\xd0,I\xd0m|\xf0\x00\x00@'
+                b'\x02I\x02\xf1\x00\x00 J\x02\xf4\x00\x00 J\x02\xf0\x00\t\x05\x15\xf0\x00\t\x05'
+                b'\x15\xd1\x08\x1b\x88\t\x908\xd8\x15\x17\x88\n\xd8\x08\x0c\xd8\x0e\x12\x88'
+                b'\n\x88\n\x88\n\xdd\x0e\x11\x90+\xd7\x12%\xd2\x12%\xa0h\xb0\x07\xd1\x128\xd4'
+                b'\x128\xd1\x0e9\xd4\x0e9\xd0\x089\xd0\x089\xd0\x089\xd8\x0e\x14\x88\x0c\x88\x0c'
+                b'\x88\x0c\xdd\x0e\x11\x90+\xd7\x12%\xd2\x12%\xa0i\xb0\x16\xd1\x128\xd4\x128\xd1'
+                b'\x0e9\xd4\x0e9\xd0\x089\xd0\x089\xd0\x089\xd8\x0e\x13\x88\x0b\x88\x0b\x88\x0b\xdd'
+                b'\x0e\x11\x90+\xd7\x12%\xd2\x12%\xa0i\xb0\x1d\xd1\x12?\xd4\x12?\xd1\x0e@\xd4'
+                b'\x0e@\xd0\x08@\xd0\x08@\xd0\x08@\xd8\x0e\x14\x88\x0c\x88\x0c\x88\x0c'
+                b'\x88\x0c\xd8\x1b"\xd0\x04"\x80H\x88y\xf0\x02\x00\x0bX\t\xf0\x00\x00\x05X\t'
+                b'\xf0\x00\x00\x05X\t\xf0\x00\x00\x05X\t\xdd\n\r\xb0\x0f\xc07\xd00J\xd00J\x88y\x88'
+                b'y\x98m\xd0\x0f,\xd1\x0f,\xd4\x0f,\xd0\x0f,\xd0P_\xd1\na\xd4\na\xd0\x04a\xd0'
+                b'\x04a\xd0\x04a\xd8\nK\xd0\x04K\xd0\x04K\xd0\x04K\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!'
+                b'\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa09\xb0)\xd0#<\xd1#<\xd4#<\xd0#<\xd0\\g\xd0'
+                b'jp\xd1\x0eq\xd4\x0eq\xd1\nr\xd4\nr\xd0\x04r\xd0\x04r\xd0\x04r\xd8\n\x0e\x80J'
+                b'\x80J\x80J\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa0'
+                b'9\xb0)\xd0#<\xd1#<\xd4#<\xd0#<\xd0\\g\xd0j\x7f\xf1\x00\x00\x0fA\x02\xf4'
+                b'\x00\x00\x0fA\x02\xf1\x00\x00\x0bB\x02\xf4\x00\x00\x0bB\x02\xf0\x00\x00'
+                b'\x05B\x02\xf0\x00\x00\x05B\x02\xf0\x00\x00\x05B\x02\xd8\na\xd0\x04a\xd0\x04a'
+                b'\xd0\x04a\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa09'
+                b'\xb0)\xd0#<\xd1#<\xd4#<\xd0#<\xd0\\g\xd0jp\xd1\x0eq\xd4\x0eq\xd1\nr\xd4\nr'
+                b'\xd0\x04r\xd0\x04r\xd0\x04r\xd8\nM\xd0\x04M\xd0\x04M\xd0\x04M\xdd\n\r\xd02C\xc0'
+                b'w\xd02N\xd02N\x88y\x88y\x98o\xd0\x0f.\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng\xd4'
+                b'\ng\xd0\x04g\xd0\x04g\xd0\x04g\xf0\x02\x00\x0bB.\xf0\x00\x00\x05B.\xf0'
+                b'\x00\x00\x05B.\xf0\x00\x00\x05B.\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0\x0b\xc8w\xd0@'
+                b'V\xd0@V\xa09\xa09\xb0)\xd0#<\xd1#<\xd4#<\xd0#<\xd0\\g\xd0jp\xd1\x0eq\xd4'
+                b'\x0eq\xd1\nr\xd4\nr\xd0\x04r\xd0\x04r\xd0\x04r\xf0\x02\x00\x0b^\x02\xf0'
+                b'\x00\x00\x05^\x02\xf0\x00\x00\x05^\x02\xf0\x00\x00\x05^\x02\xdd\n\r\xd02C\xc0'
+                b'w\xd02N\xd02N\x88y\x88y\x98o\xd0\x0f.\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng\xd4'
+                b'\ng\xd0\x04g\xd0\x04g\xd0\x04g\xf0\x02\x00\x0bg\x03\xf0\x00\x00\x05g\x03\xf0'
+                b'\x00\x00\x05g\x03\xf0\x00\x00\x05g\x03\xdd\n\r\xd02C\xc0w\xd02N\xd02N\x88y\x88'
+                b'y\x98o\xd0\x0f.\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng\xd4\ng\xd0\x04g\xd0'
+                b'\x04g\xd0\x04g\xd8\nI\xd0\x04I\xd0\x04I\xd0\x04I\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!'
+                b'\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa09\xb0)\xd0#<\xd1#<\xd4#<\xd0#<\xd0\\g\xd0'
+                b'jp\xd1\x0eq\xd4\x0eq\xd1\nr\xd4\nr\xd0\x04r\xd0\x04r\xd0\x04r\xd8\nj\xd0\x04'
+                b'j\xd0\x04j\xd0\x04j\xdd\n\r\xd02C\xc0w\xd02N\xd02N\x88y\x88y\x98o\xd0'
+                b'\x0f.\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng\xd4\ng\xd0\x04g\xd0\x04g\xd0\x04'
+                b'g\xf0\x02\x00\x0b\x7fW\x01\xf0\x00\x00\x05\x7fW\x01\xf0\x00\x00\x05\x7f'
+                b'W\x01\xf0\x00\x00\x05\x7fW\x01\xdd\n\r\xd02C\xc0w\xd02N\xd02N\x88y\x88y\x98'
+                b'o\xd0\x0f.\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng\xd4\ng\xd0\x04g\xd0\x04g'
+                b'\xd0\x04g\xd8\n+\xd0\x04+\xd0\x04+\xd0\x04+\xd0\x04+\xd0\x04+s\x12\x00'
+                b'\x00\x00\xc4\x13\rD!\x00\xc4!\x1aD>\x03\xc4=\x01D>\x03a\x1a\x01\x00\x003=40&4='
+                b'42&6=50&16=52&17=54&18=56&19=58&20=60&21=62&22=64&23=66&27=68&36=70&37=72&38=76&'
+                b'47=80&48=84&53=92&57=94&58=96&60=98&65=100&66=104&69=110&86=112&87=114&93=116&95'
+                b'=118&97=120&103=122&109=124&118=136&130=139&131=143&146=151&150=153&158=157&160='
+                b'159&207=161&209=163&219=165&287=171N)\x14\xda\x0ejinja2.runtimer\x02\x00\x00\x00r'
+                b'\x03\x00\x00\x00r\x04\x00\x00\x00r\x05\x00\x00\x00r\x06\x00\x00\x00r'
+                b'\x07\x00\x00\x00r\x08\x00\x00\x00r\t\x00\x00\x00r\n\x00\x00\x00r\x0b\x00\x00\x00'
+                b'r\x0c\x00\x00\x00r\r\x00\x00\x00r\x0e\x00\x00\x00r\x0f\x00\x00\x00r-\x00\x00'
+                b'\x00rK\x00\x00\x00rl\x00\x00\x00\xda\x06blocks\xda\ndebug_info\xa9\x00r,\x00'
+                b'\x00\x00r*\x00\x00\x00\xfa\x08<module>rq\x00\x00\x00\x01\x00\x00\x00s\xfb'
+                b'\x00\x00\x00\xf0\x03\x01\x01\x01\xf0\x02\x00\x01G\x03\xf0\x00\x00\x01G\x03'
+                b'\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00'
+                b'\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01'
+                b'G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03'
+                b'\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00'
+                b'\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01'
+                b'G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03'
+                b'\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00'
+                b'\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01'
+                b'G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03'
+                b'\xd8\x07\x14\x80\x04\xe0\x1a!\xa8{\xf0\x00h\x02\x01,\xf0\x00h\x02\x01,\xf0\x00'
+                b'h\x02\x01,\xf0\x00h\x02\x01,\xf0T\x05\x00\n\x0c\x80\x06\xf0\x02\x00\x0ej\x04'
+                b'\x80\n\x80\n\x80\nr,\x00\x00\x00',
+ 'roles-responsibilities.md': b'c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00'
+                              b'\x00\x00\x00\x00\x00\xf3^\x00\x00\x00\x97\x00d\x00d\x01l\x00m\x01'
+                              b'Z\x01m\x02Z\x02m\x03Z\x03m\x04Z\x04m\x05Z\x05m\x06Z\x06m\x07'
+                              b'Z\x07m\x08Z\x08m\tZ\tm\nZ\nm\x0bZ\x0bm\x0cZ\x0cm\rZ\rm\x0e'
+                              b'Z\x0e\x01\x00d\x02Z\x0fe\re\x10f\x02d\x03\x84\x01Z\x11i\x00Z\x12'
+                              b'd\x04Z\x13d\x05S\x00)\x06\xe9\x00\x00\x00\x00)\x0e\xda\x0bLoopConte'
+                              b'xt\xda\x05Macro\xda\x06Markup\xda\tNamespace\xda\x10TemplateNotFou'
+                              b'nd\xda\x11TemplateReference\xda\x14TemplateRuntimeError\xda\tUnd'
+                              b'efined\xda\x06escape\xda\x08identity\xda\x0cinternalcode\xda\x0b'
+                              b'markup_join\xda\x07missing\xda\x08str_joinz\x19roles-responsibiliti'
+                              b'es.mdc\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00'
+                              b'\x00\x00#\x00\x00\x00\xf3\xf4\x08\x00\x00K\x00\x01\x00\x97'
+                              b'\x00|\x00j\x00\x00\x00\x00\x00\x00\x00\x00\x00}\x03|\x02j\x01\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00}\x04|\x02j\x02\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00}\x05t\x06\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00}\x06\t\x00\x02\x00|\x03d\x02\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x07\x02\x00|'
+                              b'\x03d\x03\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00}\x08\x02\x00|\x03d\x04\xa6\x01\x00\x00\xab\x01\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00}\t\x02\x00|\x03d\x05\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\n\x02'
+                              b'\x00|\x03d\x06\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00}\x0b\x02\x00|\x03d\x07\xa6\x01\x00\x00\xab'
+                              b'\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x0c\x02\x00|\x03d'
+                              b'\x08\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}'
+                              b'\r\x02\x00|\x03d\t\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00}\x0e\x02\x00|\x03d\n\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x0f\x02\x00|'
+                              b'\x03d\x0b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00}\x10\x02\x00|\x03d\x0c\xa6\x01\x00\x00\xab\x01\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00}\x11\x02\x00|\x03d\r\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x12\x02'
+                              b'\x00|\x03d\x0e\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00}\x13\x02\x00|\x03d\x0f\xa6\x01\x00\x00\xab'
+                              b'\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x14\t\x00d\x10V'
+                              b'\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00|\x07|\x01u\x00r\x0c\x02\x00|\x04d\x02\xac\x11\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x07\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                              b'\x01\x01\x00d\x12V\x00\x97\x01\x01\x00t\t\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00|\x08|\x01u\x00r\x0c\x02\x00|\x04d'
+                              b'\x03\xac\x11\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00n\x01|\x08\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00V\x00\x97\x01\x01\x00d\x13V\x00\x97\x01\x01\x00t\t\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00|\t|\x01u\x00r\x0c\x02\x00|\x04d\x04\xac\x11\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\td'
+                              b'\x14\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                              b'\x01\x01\x00d\x15V\x00\x97\x01\x01\x00|\n|\x01u\x00r\x0c\x02'
+                              b'\x00|\x04d\x05\xac\x11\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00n\x01|\nD\x00]\x1e}\x15i\x00}\x16\t\x00d\x16V'
+                              b'\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00|\x15\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00V\x00\x97\x01\x01\x00d\x17V\x00\x97\x01\x01\x00\x8c\x1f|\x01}'
+                              b'\x15d\x18V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0b|'
+                              b'\x01u\x00r\x0c\x02\x00|\x04d\x06\xac\x11\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0bd'
+                              b'\x19\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                              b'\x01\x01\x00d\x1aV\x00\x97\x01\x01\x00t\t\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00|\x0c|\x01u\x00r\x0c\x02\x00|\x04d'
+                              b'\x07\xac\x11\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00n\x01|\x0c\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00V\x00\x97\x01\x01\x00d\x1bV\x00\x97\x01\x01\x00t\t\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00|\x0b|\x01u\x00r\x0c\x02\x00|\x04d\x06\xac\x11\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0bd'
+                              b'\x1c\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                              b'\x01\x01\x00d\x1dV\x00\x97\x01\x01\x00t\t\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00|\r|\x01u\x00r\x0c\x02\x00|\x04d'
+                              b'\x08\xac\x11\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00n\x01|\r\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00V\x00\x97\x01\x01\x00d\x1eV\x00\x97\x01\x01\x00t\t\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00|\x0b|\x01u\x00r\x0c\x02\x00|\x04d\x06\xac\x11\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0bd'
+                              b'\x1f\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                              b'\x01\x01\x00d V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00|\x0e|\x01u\x00r\x0c\x02\x00|\x04d\t\xac\x11\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                              b'\x0e\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                              b'\x00\x97\x01\x01\x00d!V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0b|'
+                              b'\x01u\x00r\x0c\x02\x00|\x04d\x06\xac\x11\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0bd'
+                              b'"\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                              b'\x01\x01\x00d#V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00|\x0f|\x01u\x00r\x0c\x02\x00|\x04d\n\xac\x11\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                              b'\x0f\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                              b'\x00\x97\x01\x01\x00d$V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0b|'
+                              b'\x01u\x00r\x0c\x02\x00|\x04d\x06\xac\x11\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0bd'
+                              b'%\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                              b'\x01\x01\x00d&V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00|\x10|\x01u\x00r\x0c\x02\x00|\x04d\x0b\xac\x11\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                              b'\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                              b"\x00\x97\x01\x01\x00d'V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00"
+                              b'\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0b|'
+                              b'\x01u\x00r\x0c\x02\x00|\x04d\x06\xac\x11\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0bd'
+                              b'(\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                              b'\x01\x01\x00d)V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00|\x11|\x01u\x00r\x0c\x02\x00|\x04d\x0c\xac\x11\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                              b'\x11\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                              b'\x00\x97\x01\x01\x00d*V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00|\x12|\x01u\x00r\x0c\x02\x00|\x04d\r\xac'
+                              b'\x11\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n'
+                              b'\x01|\x12\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00V\x00\x97\x01\x01\x00d+V\x00\x97\x01\x01\x00|\x13|\x01u'
+                              b'\x00r\x0c\x02\x00|\x04d\x0e\xac\x11\xa6\x01\x00\x00\xab'
+                              b'\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x13D\x00]\x1e}\x17i'
+                              b'\x00}\x16\t\x00d\x16V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00|\x17\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d\x17V\x00\x97'
+                              b'\x01\x01\x00\x8c\x1f|\x01}\x17d,V\x00\x97\x01\x01\x00t\t\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x14|\x01u\x00r\x0c\x02\x00|'
+                              b'\x04d\x0f\xac\x11\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                              b'\x00\x00\x00n\x01|\x14\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d-V\x00\x97\x01\x01\x00t'
+                              b'\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x12|\x01u\x00r\x0c\x02'
+                              b'\x00|\x04d\r\xac\x11\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                              b'\x00\x00\x00\x00\x00n\x01|\x12\xa6\x01\x00\x00\xab\x01\x00'
+                              b'\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d.V'
+                              b'\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                              b'\x00|\x08|\x01u\x00r\x0c\x02\x00|\x04d\x03\xac\x11\xa6\x01\x00'
+                              b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x08\xa6'
+                              b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                              b'\x01\x01\x00d/V\x00\x97\x01\x01\x00d\x00S\x00)0Nr\x01'
+                              b'\x00\x00\x00\xda\tjob_title\xda\x0ccareer_level\xda\x07compan'
+                              b'y\xda\x15role_responsibilities\xda\rkpi_breakdown\xda\x11vision_'
+                              b'activities\xda\x13delivery_activities\xda\x14financial_activitie'
+                              b's\xda\x12quality_activities\xda\x0elnd_activities\xda\x0eico_activ'
+                              b'ities\xda\x04team\xda\x10team_focus_areas\xda\x0creporting_toz'
+                              b'\x02# )\x01\xda\x04namez\x19\n\n## Role Overview\n\nAs a zW, the Em'
+                              b'ployee is expected to perform the following responsibilities in '
+                              b"alignment with r\x1f\x00\x00\x00z&'s mission and strategic objec"
+                              b'tives:\n\nz\x02- \xfa\x01\nz\xc4\n## Strategic Area KPI Breakdow'
+                              b'n\n\nThe Employee is responsible to oversee and execute the roles '
+                              b'according to the organization strategic areas KPI, including but'
+                              b' not limited to:\n\n### Vision (VIS) : \xda\x06Visionz\xf9%\nTo '
+                              b'achieve the strategic vision of the Business Unit - Strategic Pl'
+                              b'anning, Business Model Planning, Group, Business Unit HR Plannin'
+                              b'g, Strategic Partnerships, Corporate Communications & Marketing,'
+                              b' Industry Networking, LinkedIn\n\n**Key Activities:**\nz)\n\n### '
+                              b'Delivery & Impact Creation (DEL) : \xda\x08Deliverya\xe0\x01'
+                              b'\x00\x00%\nTo achieve the actual program, platform or business unit'
+                              b' deliverables - Project / product / platform delivery, Project H'
+                              b'R & Budget planning, Project-specific communications (Individual'
+                              b' Education programs that have been secured), Client meetings, co'
+                              b'mmunications, emails to program partners, etc, Program specific '
+                              b'content creation, Comms materials for the project / program (pos'
+                              b'ters, landing pages, forms, etc), Community Engagement, Student '
+                              b'recruitment, etc\n\n**Key Activities:**\nz\x18\n\n### Financial '
+                              b'(FIN) : \xda\tFinancialz\xd0%\nTo achieve the financial objectiv'
+                              b'e of the business unit - Business Development, Proposal writing,'
+                              b' Funding and fundraising activities, Accounting & Finance Planni'
+                              b'ng, Pitching activities\n\n**Key Activities:**\nz\x16\n\n### Qua'
+                              b'lity (QUA) : \xda\x07Qualityz\xf4%\nTo achieve the desired quality'
+                              b' within each Business Unit - Check & Balances, Work Review etc. '
+                              b'- Post-program satisfaction forms, Client feedback forms, Manage'
+                              b'ment team reviews of Delivery, Report generation and analysis.\n\n'
+                              b'**Key Activities:**\nz<\n\n### Learning Development & Personal Care'
+                              b'er Growth (LnD) : \xda\x03LnDa6\x01\x00\x00%\nTo achieve the des'
+                              b'ired growth levels within each team - Attending training session'
+                              b's, Participating in webinars, courses, etc, Lunch & Learn sessio'
+                              b'ns, HR career chats, Team review sessions, feedback sessions, Ac'
+                              b'tivities that are in accordance with an Individuals Career Devel'
+                              b'opment Plans\n\n**Key Activities:**\nz2\n\n### Internal Communica'
+                              b'tion & Management (ICO) : \xda\x03ICOzL%\nUsing the appropriate pla'
+                              b'nning and management tools.\n\n**Key Activities:**\nz4\n\n## Team'
+                              b'-Specific Responsibilities\n\nAs part of the z$ team, the Employee'
+                              b' will focus on:\n\na\xb4\x01\x00\x00\n## Performance Expectatio'
+                              b'ns\n\n### Key Success Metrics\n- **Timely Delivery**: Complete assi'
+                              b'gned tasks within agreed timelines\n- **Quality Standards**: Main'
+                              b'tain high quality in all deliverables\n- **Collaboration**: Work '
+                              b'effectively with cross-functional teams\n- **Innovation**: Contri'
+                              b'bute new ideas and improvements\n- **Learning**: Actively partici'
+                              b'pate in professional development activities\n\n### Reporting Struc'
+                              b'ture\n- **Direct Report**: z\r\n- **Team**: z\x15\n- **Career Level'
+                              b'**: a\xfc\x03\x00\x00\n\n## Professional Development\n\nThe Empl'
+                              b'oyee is encouraged to:\n- Participate in relevant training progra'
+                              b'ms and workshops\n- Attend industry conferences and networking ev'
+                              b'ents\n- Pursue certifications relevant to their role\n- Contribute'
+                              b' to knowledge sharing within the organization\n- Mentor junior te'
+                              b'am members (where applicable)\n\n## Tools and Resources\n\nThe E'
+                              b'mployee will have access to:\n- Project management tools and plat'
+                              b'forms\n- Communication and collaboration software\n- Learning and '
+                              b'development resources\n- Industry-specific tools and software\n- P'
+                              b'rofessional development budget (as applicable)\n\n## Compliance an'
+                              b'd Standards\n\nThe Employee must:\n- Adhere to all company policies'
+                              b' and procedures\n- Maintain confidentiality of sensitive informat'
+                              b'ion\n- Follow health and safety guidelines\n- Comply with relevant'
+                              b" industry regulations\n- Uphold the company's core values and cod"
+                              b'e of conduct\n\n---\n\n*This document should be reviewed and upd'
+                              b'ated annually or when there are significant changes to the role '
+                              b'or organizational structure.*)\x06\xda\x12resolve_or_missing\xda'
+                              b'\tundefined\xda\x06concatr\t\x00\x00\x00\xda\x03str\xda\x07getatt'
+                              b'r)\x18\xda\x07contextr\x0e\x00\x00\x00\xda\x0benvironment\xda\x07'
+                              b'resolver(\x00\x00\x00r)\x00\x00\x00\xda\x13cond_expr_undefin'
+                              b'ed\xda\rl_0_job_title\xda\x10l_0_career_level\xda\x0bl_0_company'
+                              b'\xda\x19l_0_role_responsibilities\xda\x11l_0_kpi_breakdown\xda\x15'
+                              b'l_0_vision_activities\xda\x17l_0_delivery_activities\xda\x18l_0_'
+                              b'financial_activities\xda\x16l_0_quality_activities\xda\x12l_0_ln'
+                              b'd_activities\xda\x12l_0_ico_activities\xda\x08l_0_team\xda\x14l_0_'
+                              b'team_focus_areas\xda\x10l_0_reporting_to\xda\x12l_1_responsibili'
+                              b'ty\xda\n_loop_vars\xda\x0el_1_focus_areas\x18\x00\x00\x00         '
+                              b'               \xfa#templates/roles-responsibilities.md\xda\x04ro'
+                              b'otrB\x00\x00\x00\x04\x00\x00\x00s\x16\x08\x00\x00\xe8\x00\xe8\x00'
+                              b'\x80\x00\xd8\x0e\x15\xd4\x0e(\x80G\xd8\x10\x1b\xd4\x10%\x80I\xd8\r'
+                              b'\x18\xd4\r\x1f\x80F\xdd\x1a#\xd0\x04\x17\xd8\x04\x14\xd8'
+                              b'\x14\x1b\x90G\x98K\xd1\x14(\xd4\x14(\x80M\xd8\x17\x1e\x90w\x98'
+                              b"~\xd1\x17.\xd4\x17.\xd0\x04\x14\xd8\x12\x19\x90'\x98)\xd1\x12$"
+                              b"\xd4\x12$\x80K\xd8 '\xa0\x07\xd0(?\xd1 @\xd4 @\xd0\x04\x1d\xd8\x18"
+                              b'\x1f\x98\x07\xa0\x0f\xd1\x180\xd4\x180\xd0\x04\x15\xd8\x1c'
+                              b'#\x98G\xd0$7\xd1\x1c8\xd4\x1c8\xd0\x04\x19\xd8\x1e%\x98g\xd0&;\xd1'
+                              b"\x1e<\xd4\x1e<\xd0\x04\x1b\xd8\x1f&\x98w\xd0'=\xd1\x1f>\xd4"
+                              b'\x1f>\xd0\x04\x1c\xd8\x1d$\x98W\xd0%9\xd1\x1d:\xd4\x1d:\xd0'
+                              b'\x04\x1a\xd8\x19 \x98\x17\xd0!1\xd1\x192\xd4\x192\xd0\x04\x16\xd8'
+                              b'\x19 \x98\x17\xd0!1\xd1\x192\xd4\x192\xd0\x04\x16\xd8\x0f\x16\x88'
+                              b'w\x90v\x89\x7f\x8c\x7f\x80H\xd8\x1b"\x987\xd0#5\xd1\x1b6'
+                              b'\xd4\x1b6\xd0\x04\x18\xd8\x17\x1e\x90w\x98~\xd1\x17.\xd4\x17.\xd0'
+                              b'\x04\x14\xd8\x04\x08\xd8\n\x0e\x80J\x80J\x80J\xdd\n\r\xa8m\xb8'
+                              b'w\xd0.F\xd0.F\x88y\x88y\x98k\xd0\x0f*\xd1\x0f*\xd4\x0f*\xd0\x0f'
+                              b'*\xc8M\xd1\n[\xd4\n[\xd0\x04[\xd0\x04[\xd0\x04[\xd8\n)\xd0\x04)'
+                              b'\xd0\x04)\xd0\x04)\xdd\n\r\xd01A\xc0W\xd01L\xd01L\x88y\x88y'
+                              b'\x98n\xd0\x0f-\xd1\x0f-\xd4\x0f-\xd0\x0f-\xd0Rb\xd1\nd\xd4\nd\xd0'
+                              b'\x04d\xd0\x04d\xd0\x04d\xd8\nc\xd0\x04c\xd0\x04c\xd0\x04c'
+                              b'\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa0'
+                              b'9\xb0)\xd0#<\xd1#<\xd4#<\xd0#<\xd0\\g\xd0jp\xd1\x0eq\xd4\x0eq\xd1'
+                              b'\nr\xd4\nr\xd0\x04r\xd0\x04r\xd0\x04r\xd8\n4\xd0\x044\xd0\x044\xd0'
+                              b'\x044\xd8Jc\xd0gn\xd0Jn\xd0Jn\x98y\x98y\xd0.E\xd0\x1fF\xd1\x1fF\xd4'
+                              b'\x1fF\xd0\x1fF\xf0\x00\x00u\x01N\x02\xf0\x00\x05\x05'
+                              b'\x13\xf0\x00\x05\x05\x13\xd0\x08\x1a\xd8\x15\x17\x88\n\xd8\x08'
+                              b'\x0c\xd8\x0e\x12\x88\n\x88\n\x88\n\xdd\x0e\x11\xd0\x12$'
+                              b'\xd1\x0e%\xd4\x0e%\xd0\x08%\xd0\x08%\xd0\x08%\xd8\x0e\x12\x88\n'
+                              b'\x88\n\x88\n\x88\n\xd8\x19 \xd0\x04\x16\xf0\x02\x00\x0b'
+                              b'V\x03\xf0\x00\x00\x05V\x03\xf0\x00\x00\x05V\x03\xf0\x00'
+                              b'\x00\x05V\x03\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xd0FW\xd0[b\xd0Fb'
+                              b'\xd0Fb\xa09\xa09\xb0/\xd0#B\xd1#B\xd4#B\xd0#B\xd0hy\xf0\x00\x00}'
+                              b'\x01E\x02\xf1\x00\x00\x0fF\x02\xf4\x00\x00\x0fF\x02\xf1'
+                              b'\x00\x00\x0bG\x02\xf4\x00\x00\x0bG\x02\xf0\x00\x00\x05G'
+                              b'\x02\xf0\x00\x00\x05G\x02\xf0\x00\x00\x05G\x02\xf0\x02\x00'
+                              b'\x0bJ\x04\xf0\x00\x00\x05J\x04\xf0\x00\x00\x05J\x04\xf0'
+                              b'\x00\x00\x05J\x04\xdd\n\r\xd06K\xc8w\xd06V\xd06V\x88y\x88y\xd0'
+                              b'\x1e1\xd0\x0f2\xd1\x0f2\xd4\x0f2\xd0\x0f2\xd0\\q\xd1\ns\xd4\ns\xd0'
+                              b'\x04s\xd0\x04s\xd0\x04s\xd8\n7\xd0\x047\xd0\x047\xd0\x047'
+                              b'\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xd0FW\xd0[b\xd0Fb\xd0Fb\xa0'
+                              b'9\xa09\xb0/\xd0#B\xd1#B\xd4#B\xd0#B\xd0hy\xf0\x00\x00}\x01G\x02\xf1'
+                              b'\x00\x00\x0fH\x02\xf4\x00\x00\x0fH\x02\xf1\x00\x00\x0bI'
+                              b'\x02\xf4\x00\x00\x0bI\x02\xf0\x00\x00\x05I\x02\xf0\x00\x00'
+                              b'\x05I\x02\xf0\x00\x00\x05I\x02\xf0\x02\x00\x0bq\x07\xf0'
+                              b'\x00\x00\x05q\x07\xf0\x00\x00\x05q\x07\xf0\x00\x00\x05q\x07\xdd\n\r'
+                              b'\xd08O\xd0SZ\xd08Z\xd08Z\x88y\x88y\xd0\x1e3\xd0\x0f4\xd1\x0f'
+                              b'4\xd4\x0f4\xd0\x0f4\xd0`w\xd1\ny\xd4\ny\xd0\x04y\xd0\x04y\xd0\x04'
+                              b'y\xd8\n&\xd0\x04&\xd0\x04&\xd0\x04&\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!'
+                              b'\xd0FW\xd0[b\xd0Fb\xd0Fb\xa09\xa09\xb0/\xd0#B\xd1#B\xd4#B\xd0'
+                              b'#B\xd0hy\xf0\x00\x00}\x01H\x02\xf1\x00\x00\x0fI\x02\xf4\x00'
+                              b'\x00\x0fI\x02\xf1\x00\x00\x0bJ\x02\xf4\x00\x00\x0bJ\x02'
+                              b'\xf0\x00\x00\x05J\x02\xf0\x00\x00\x05J\x02\xf0\x00\x00\x05'
+                              b'J\x02\xf0\x02\x00\x0ba\x03\xf0\x00\x00\x05a\x03\xf0\x00'
+                              b'\x00\x05a\x03\xf0\x00\x00\x05a\x03\xdd\n\r\xd09Q\xd0U\\\xd09\\\xd09'
+                              b'\\\x88y\x88y\xd0\x1e4\xd0\x0f5\xd1\x0f5\xd4\x0f5\xd0\x0f5\xd0bz\xd1'
+                              b'\n|\xd4\n|\xd0\x04|\xd0\x04|\xd0\x04|\xd8\n$\xd0\x04$\xd0\x04$\xd0'
+                              b'\x04$\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xd0FW\xd0[b\xd0Fb\xd0F'
+                              b'b\xa09\xa09\xb0/\xd0#B\xd1#B\xd4#B\xd0#B\xd0hy\xf0\x00\x00}\x01F'
+                              b'\x02\xf1\x00\x00\x0fG\x02\xf4\x00\x00\x0fG\x02\xf1\x00\x00'
+                              b'\x0bH\x02\xf4\x00\x00\x0bH\x02\xf0\x00\x00\x05H\x02\xf0'
+                              b'\x00\x00\x05H\x02\xf0\x00\x00\x05H\x02\xf0\x02\x00\x0bE'
+                              b'\x04\xf0\x00\x00\x05E\x04\xf0\x00\x00\x05E\x04\xf0\x00\x00'
+                              b'\x05E\x04\xdd\n\r\xd07M\xd0QX\xd07X\xd07X\x88y\x88y\xd0\x1e'
+                              b'2\xd0\x0f3\xd1\x0f3\xd4\x0f3\xd0\x0f3\xd0^t\xd1\nv\xd4\nv\xd0\x04'
+                              b'v\xd0\x04v\xd0\x04v\xd8\nJ\xd0\x04J\xd0\x04J\xd0\x04J\xdd\n\r\x88k'
+                              b'\xd7\x0e!\xd2\x0e!\xd0FW\xd0[b\xd0Fb\xd0Fb\xa09\xa09\xb0/\xd0#B\xd1'
+                              b'#B\xd4#B\xd0#B\xd0hy\xf0\x00\x00}\x01B\x02\xf1\x00\x00\x0fC\x02'
+                              b'\xf4\x00\x00\x0fC\x02\xf1\x00\x00\x0bD\x02\xf4\x00\x00\x0b'
+                              b'D\x02\xf0\x00\x00\x05D\x02\xf0\x00\x00\x05D\x02\xf0\x00'
+                              b'\x00\x05D\x02\xf0\x02\x00\x0bG\x05\xf0\x00\x00\x05G\x05'
+                              b'\xf0\x00\x00\x05G\x05\xf0\x00\x00\x05G\x05\xdd\n\r\xd03E\xc8\x17'
+                              b'\xd03P\xd03P\x88y\x88y\xd0\x1e.\xd0\x0f/\xd1\x0f/\xd4\x0f/\xd0\x0f'
+                              b'/\xd0Vh\xd1\nj\xd4\nj\xd0\x04j\xd0\x04j\xd0\x04j\xd8\n@\xd0\x04'
+                              b'@\xd0\x04@\xd0\x04@\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xd0FW\xd0[b'
+                              b'\xd0Fb\xd0Fb\xa09\xa09\xb0/\xd0#B\xd1#B\xd4#B\xd0#B\xd0hy\xf0'
+                              b'\x00\x00}\x01B\x02\xf1\x00\x00\x0fC\x02\xf4\x00\x00\x0f'
+                              b'C\x02\xf1\x00\x00\x0bD\x02\xf4\x00\x00\x0bD\x02\xf0\x00'
+                              b'\x00\x05D\x02\xf0\x00\x00\x05D\x02\xf0\x00\x00\x05D\x02\xd8\n\\\xd0'
+                              b'\x04\\\xd0\x04\\\xd0\x04\\\xdd\n\r\xd03E\xc8\x17\xd03P\xd03P\x88y'
+                              b'\x88y\xd0\x1e.\xd0\x0f/\xd1\x0f/\xd4\x0f/\xd0\x0f/\xd0Vh\xd1\nj\xd4'
+                              b'\nj\xd0\x04j\xd0\x04j\xd0\x04j\xd8\nD\xd0\x04D\xd0\x04D'
+                              b'\xd0\x04D\xdd\n\r\xa8\x18\xb0W\xd0)<\xd0)<\x88y\x88y\x98f\xd0\x0f'
+                              b'%\xd1\x0f%\xd4\x0f%\xd0\x0f%\xc0(\xd1\nL\xd4\nL\xd0\x04L\xd0\x04L'
+                              b'\xd0\x04L\xd8\n2\xd0\x042\xd0\x042\xd0\x042\xd8AU\xd0Y`\xd0A`'
+                              b'\xd0A`\x989\x989\xd0*<\xd0\x1b=\xd1\x1b=\xd4\x1b=\xd0\x1b=\xd0f'
+                              b'z\xf0\x00\x05\x05\x13\xf0\x00\x05\x05\x13\x88\x0e\xd8\x15\x17'
+                              b'\x88\n\xd8\x08\x0c\xd8\x0e\x12\x88\n\x88\n\x88\n\xdd\x0e'
+                              b'\x11\x90.\xd1\x0e!\xd4\x0e!\xd0\x08!\xd0\x08!\xd0\x08!\xd8\x0e'
+                              b'\x12\x88\n\x88\n\x88\n\x88\n\xd8\x15\x1c\x80N\xf0\x02\x00\x0bL\x07'
+                              b'\xf0\x00\x00\x05L\x07\xf0\x00\x00\x05L\x07\xf0\x00\x00\x05'
+                              b'L\x07\xdd\n\r\xd01A\xc0W\xd01L\xd01L\x88y\x88y\x98n\xd0\x0f'
+                              b'-\xd1\x0f-\xd4\x0f-\xd0\x0f-\xd0Rb\xd1\nd\xd4\nd\xd0\x04d\xd0\x04'
+                              b'd\xd0\x04d\xd8\n\x1a\xd0\x04\x1a\xd0\x04\x1a\xd0\x04\x1a'
+                              b'\xdd\n\r\xa8\x18\xb0W\xd0)<\xd0)<\x88y\x88y\x98f\xd0\x0f%\xd1\x0f'
+                              b'%\xd4\x0f%\xd0\x0f%\xc0(\xd1\nL\xd4\nL\xd0\x04L\xd0\x04L\xd0\x04L'
+                              b'\xd8\n"\xd0\x04"\xd0\x04"\xd0\x04"\xdd\n\r\xd01A\xc0W\xd01L\xd0'
+                              b'1L\x88y\x88y\x98n\xd0\x0f-\xd1\x0f-\xd4\x0f-\xd0\x0f-\xd0Rb\xd1'
+                              b'\nd\xd4\nd\xd0\x04d\xd0\x04d\xd0\x04d\xf0\x02\x00\x0bh\x10'
+                              b'\xf0\x00\x00\x05h\x10\xf0\x00\x00\x05h\x10\xf0\x00\x00\x05'
+                              b'h\x10\xf0\x00\x00\x05h\x10\xf0\x00\x00\x05h\x10\xf3\x00'
+                              b'\x00\x00\x00z\x7f1=26&5=28&7=32&8=36&15=40&19=42&21=44&25=46&27='
+                              b'48&31=50&33=52&37=54&39=56&43=58&45=60&49=62&53=64&55=66&56=70&6'
+                              b'9=74&70=76&71=78N)\x14\xda\x0ejinja2.runtimer\x02\x00\x00\x00'
+                              b'r\x03\x00\x00\x00r\x04\x00\x00\x00r\x05\x00\x00\x00r'
+                              b'\x06\x00\x00\x00r\x07\x00\x00\x00r\x08\x00\x00\x00r\t\x00\x00\x00r'
+                              b'\n\x00\x00\x00r\x0b\x00\x00\x00r\x0c\x00\x00\x00r\r\x00\x00\x00r'
+                              b'\x0e\x00\x00\x00r\x0f\x00\x00\x00r\x1f\x00\x00\x00r-\x00\x00\x00r'
+                              b'B\x00\x00\x00\xda\x06blocks\xda\ndebug_info\xa9\x00rC\x00\x00\x00r'
+                              b'A\x00\x00\x00\xfa\x08<module>rH\x00\x00\x00\x01\x00\x00\x00s'
+                              b'\xff\x00\x00\x00\xf0\x03\x01\x01\x01\xf0\x02\x00\x01G\x03\xf0'
+                              b'\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G'
+                              b'\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00'
+                              b'\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0'
+                              b'\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G'
+                              b'\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00'
+                              b'\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0'
+                              b'\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G'
+                              b'\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00'
+                              b'\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0'
+                              b'\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G'
+                              b'\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00'
+                              b'\x01G\x03\xf0\x00\x00\x01G\x03\xd8\x07"\x80\x04\xe0\x1a!\xa8{\xf0'
+                              b'\x00K\x01\x01h\x10\xf0\x00K\x01\x01h\x10\xf0\x00K\x01\x01h\x10'
+                              b'\xf0\x00K\x01\x01h\x10\xf0Z\x02\x00\n\x0c\x80\x06\xf0\x02\x00\x0eO'
+                              b'\x02\x80\n\x80\n\x80\nrC\x00\x00\x00',
+ 'confirmation.md': b'c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00'
+                    b'\x00\xf3^\x00\x00\x00\x97\x00d\x00d\x01l\x00m\x01Z\x01m\x02Z\x02m\x03'
+                    b'Z\x03m\x04Z\x04m\x05Z\x05m\x06Z\x06m\x07Z\x07m\x08Z\x08m\tZ\tm\nZ\nm\x0b'
+                    b'Z\x0bm\x0cZ\x0cm\rZ\rm\x0eZ\x0e\x01\x00d\x02Z\x0fe\re\x10f\x02d\x03'
+                    b'\x84\x01Z\x11i\x00Z\x12d\x04Z\x13d\x05S\x00)\x06\xe9\x00\x00\x00\x00)'
+                    b'\x0e\xda\x0bLoopContext\xda\x05Macro\xda\x06Markup\xda\tNamespace\xda\x10Te'
+                    b'mplateNotFound\xda\x11TemplateReference\xda\x14TemplateRuntimeError\xda\tUnd'
+                    b'efined\xda\x06escape\xda\x08identity\xda\x0cinternalcode\xda\x0bmarkup_j'
+                    b'oin\xda\x07missing\xda\x08str_joinz\x0fconfirmation.mdc\x03\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00#\x00\x00\x00\xf3\xb6\n\x00'
+                    b'\x00K\x00\x01\x00\x97\x00|\x00j\x00\x00\x00\x00\x00\x00\x00\x00\x00}'
+                    b'\x03|\x02j\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x04|\x02j\x02\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00}\x05t\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00}\x06\t\x00\x02\x00|\x03d\x02\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00}\x07\x02\x00|\x03d\x03\xa6\x01\x00\x00\xab\x01\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00}\x08\x02\x00|\x03d\x04\xa6\x01\x00\x00\xab'
+                    b'\x01\x00\x00\x00\x00\x00\x00\x00\x00}\t\x02\x00|\x03d\x05\xa6\x01\x00'
+                    b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\n\x02\x00|\x03d\x06\xa6'
+                    b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x0b\x02\x00|\x03d'
+                    b'\x07\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x0c\x02\x00|'
+                    b'\x03d\x08\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}\r\x02'
+                    b'\x00|\x03d\t\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00}'
+                    b'\x0e\x02\x00|\x03d\n\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00}\x0f\x02\x00|\x03d\x0b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00}\x10\x02\x00|\x03d\x0c\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00}\x11\x02\x00|\x03d\r\xa6\x01\x00\x00\xab\x01\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00}\x12\x02\x00|\x03d\x0e\xa6\x01\x00\x00\xab'
+                    b'\x01\x00\x00\x00\x00\x00\x00\x00\x00}\x13\t\x00d\x0fV\x00\x97\x01\x01'
+                    b'\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x07|\x01u\x00r\x0c\x02\x00|'
+                    b'\x04d\x02\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n'
+                    b'\x01|\x07\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                    b'\x01\x01\x00d\x11V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00|\x08|\x01u\x00r\x0c\x02\x00|\x04d\x03\xac\x10\xa6'
+                    b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x08\xa6\x01\x00'
+                    b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d\x12V'
+                    b'\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\t|\x01u\x00r'
+                    b'\x0c\x02\x00|\x04d\x04\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00n\x01|\t\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00V\x00\x97\x01\x01\x00d\x13V\x00\x97\x01\x01\x00t\t\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00|\x08|\x01u\x00r\x0c\x02\x00|\x04d'
+                    b'\x03\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                    b'\x08\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01'
+                    b'\x00d\x14V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\t|'
+                    b'\x01u\x00r\x0c\x02\x00|\x04d\x04\xac\x10\xa6\x01\x00\x00\xab\x01\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00n\x01|\t\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d\x15V\x00\x97\x01\x01\x00t'
+                    b'\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\n|\x01u'
+                    b'\x00r\x0c\x02\x00|\x04d\x05\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00n\x01|\nd\x16\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                    b'\x00\x97\x01\x01\x00d\x17V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00|\x0b|\x01u\x00r\x0c\x02\x00|\x04d\x06\xac'
+                    b'\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0b\xa6'
+                    b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                    b'\x18V\x00\x97\x01\x01\x00|\x0c|\x01u\x00r\r\x02\x00|\x04d\x07\xac\x10\xa6'
+                    b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00r)n\x02|\x0cr&\t\x00t'
+                    b'\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0c|\x01u\x00r\x0c\x02\x00|\x04d'
+                    b'\x07\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                    b'\x0c\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01'
+                    b'\x00d\x19V\x00\x97\x01\x01\x00d\x1aV\x00\x97\x01\x01\x00t\t\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\t|\x01u\x00r\x0c\x02\x00|\x04d\x04\xac'
+                    b'\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\t\xa6'
+                    b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                    b'\x1bV\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\r|\x01u'
+                    b'\x00r\x0c\x02\x00|\x04d\x08\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00n\x01|\r\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00V\x00\x97\x01\x01\x00d\x1cV\x00\x97\x01\x01\x00t\t\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0e|\x01u\x00r\x0c\x02\x00|\x04d\t\xac'
+                    b'\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0e\xa6'
+                    b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                    b'\x1dV\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|'
+                    b'\x0f|\x01u\x00r\x0c\x02\x00|\x04d\n\xac\x10\xa6\x01\x00\x00\xab'
+                    b'\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x0f\xa6\x01\x00\x00\xab\x01\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d\x1eV\x00\x97\x01\x01'
+                    b'\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x0b|\x01u\x00r\x0c\x02\x00|'
+                    b'\x04d\x06\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n'
+                    b'\x01|\x0b\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                    b'\x01\x01\x00d\x1fV\x00\x97\x01\x01\x00|\x10|\x01u\x00r\x0c\x02\x00|\x04d'
+                    b'\x0b\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                    b'\x10D\x00]\x1e}\x14i\x00}\x15\t\x00d V\x00\x97\x01\x01\x00t\t\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x14\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d!V\x00\x97\x01\x01\x00\x8c'
+                    b'\x1f|\x01}\x14d"V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00|\x11|\x01u\x00r\x0c\x02\x00|\x04d\x0c\xac\x10\xa6\x01\x00'
+                    b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x11\xa6\x01\x00\x00\xab'
+                    b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d#V\x00\x97'
+                    b'\x01\x01\x00|\x12|\x01u\x00r\x0c\x02\x00|\x04d\r\xac\x10\xa6\x01\x00\x00\xab'
+                    b'\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x12D\x00][}\x16i\x00}\x15\t\x00d$V'
+                    b'\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0'
+                    b'\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00|\x16d\x16\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97'
+                    b'\x01\x01\x00d%V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00|\x02\xa0\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00|\x16d&\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                    b"\x00\x97\x01\x01\x00d!V\x00\x97\x01\x01\x00\x8c\\|\x01}\x16d'V\x00\x97"
+                    b'\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x05\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|'
+                    b'\n|\x01u\x00r\x0c\x02\x00|\x04d\x05\xac\x10\xa6\x01\x00\x00\xab'
+                    b'\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\nd\x16\xa6\x02\x00\x00\xab'
+                    b'\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d(V\x00\x97\x01\x01'
+                    b'\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x13|'
+                    b'\x01u\x00r\x0c\x02\x00|\x04d\x0e\xac\x10\xa6\x01\x00\x00\xab\x01\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00n\x01|\x13d\x16\xa6\x02\x00\x00\xab\x02\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d)V\x00\x97\x01\x01\x00t'
+                    b'\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x13|\x01u'
+                    b'\x00r\x0c\x02\x00|\x04d\x0e\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00n\x01|\x13d*\xa6\x02\x00\x00\xab\x02\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V'
+                    b'\x00\x97\x01\x01\x00d+V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00|\x02\xa0\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x13|\x01u\x00r\x0c\x02\x00|'
+                    b'\x04d\x0e\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n'
+                    b'\x01|\x13d,\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                    b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                    b'-V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|'
+                    b'\x02\xa0\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00|\x13|\x01u\x00r\x0c\x02\x00|\x04d'
+                    b'\x0e\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                    b'\x13d.\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00'
+                    b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d/V'
+                    b'\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0'
+                    b'\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00|\x13|\x01u\x00r\x0c\x02\x00|\x04d\x0e\xac'
+                    b'\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\x13d'
+                    b'\x16\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6'
+                    b'\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d'
+                    b')V\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|'
+                    b'\x02\xa0\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00\x00\x00|\x13|\x01u\x00r\x0c\x02\x00|\x04d'
+                    b'\x0e\xac\x10\xa6\x01\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|'
+                    b'\x13d*\xa6\x02\x00\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00'
+                    b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d0V'
+                    b'\x00\x97\x01\x01\x00t\t\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|\x02\xa0'
+                    b'\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+                    b'\x00\x00\x00\x00\x00|\n|\x01u\x00r\x0c\x02\x00|\x04d\x05\xac\x10\xa6\x01\x00'
+                    b'\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00n\x01|\nd\x16\xa6\x02\x00'
+                    b'\x00\xab\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x01\x00\x00\xab'
+                    b'\x01\x00\x00\x00\x00\x00\x00\x00\x00V\x00\x97\x01\x01\x00d1V\x00\x97'
+                    b'\x01\x01\x00d\x00S\x00)2Nr\x01\x00\x00\x00\xda\x11confirmation_date\xda\rempl'
+                    b'oyee_name\xda\tjob_title\xda\x07company\xda\x0eeffective_date\xda\rpersonal_'
+                    b'note\xda\x04team\xda\x0ccareer_level\xda\x0creporting_to\xda\x14key_responsi'
+                    b'bilities\xda\x10next_review_date\xda\x0bcore_values\xda\nhr_contactz$# Lette'
+                    b'r of Confirmation\n\n**Date**: )\x01\xda\x04namez\n\n\n**To**: z.\n\n**Subje'
+                    b'ct**: Confirmation of Appointment as z\x07\n\nDear zF,\n\nCongratulations! '
+                    b'We are delighted to confirm your appointment as a z\x04 at r\x1e\x00\x00'
+                    b'\x00z\x0c, effective aZ\x01\x00\x00.\n\nThis milestone reflects your dedicati'
+                    b'on, performance, and the positive impact you have made during your probation'
+                    b'ary period. We are confident that your journey ahead will be even more rewar'
+                    b'ding. As you step into this new phase, we encourage you to continue leveragi'
+                    b'ng your strengths, exploring new opportunities, and making a lasting impact.'
+                    b'\n\nz\x02\n\nz.## Role Confirmation Details\n\n- **Position**: z\r\n- **Tea'
+                    b'm**: z\x15\n- **Career Level**: z\x15\n- **Reporting To**: z\x17\n- **Effect'
+                    b'ive Date**: zP\n\n## Key Responsibilities\n\nIn your confirmed role, you wil'
+                    b'l be responsible for:\nz\x02- \xfa\x01\na\xe2\x01\x00\x00\n## Performance Ex'
+                    b'pectations\n\nAs a confirmed team member, we expect you to:\n- Deliver high'
+                    b'-quality work that aligns with our strategic objectives\n- Contribute activel'
+                    b'y to team collaboration and knowledge sharing\n- Maintain professional standa'
+                    b'rds and uphold our core values\n- Continue your professional development and '
+                    b'growth\n- Demonstrate leadership qualities and initiative in your work\n\n#'
+                    b'# Next Steps\n\n1. **Performance Review**: Your next performance review wi'
+                    b'll be scheduled for a\x9e\x03\x00\x00\n2. **Career Development**: We encourag'
+                    b'e you to discuss your career goals with your manager\n3. **Training Opportuni'
+                    b'ties**: Take advantage of available training and development programs\n4. **F'
+                    b'eedback**: Continue to provide and receive constructive feedback for continu'
+                    b'ous improvement\n\n## Support and Resources\n\nYou will continue to have acc'
+                    b'ess to:\n- All necessary tools and resources for your role\n- Professional'
+                    b' development opportunities\n- Support from your manager and team members\n'
+                    b'- Company benefits and policies as outlined in your employment contract\n'
+                    b'\nYour employment terms and conditions remain unchanged as per your initial c'
+                    b'ontract unless communicated otherwise. Should you have any questions or requ'
+                    b'ire further clarification, please do not hesitate to reach out to your manag'
+                    b'er or the HR team.\n\n## Core Values Reminder\n\nAs a confirmed member of ou'
+                    b'r team, we remind you of our core values that guide everything we do:\n\nz'
+                    b'\x04- **z\x04**: \xda\x0bdescriptionz\x9b\nOnce again, congratulations on th'
+                    b'is achievement! We look forward to your continued success and are excited to'
+                    b' see the great things you will accomplish at zq.\n\n## Contact Information'
+                    b'\n\nIf you have any questions about your confirmation or need support, ple'
+                    b'ase contact:\n\n**z\x05**  \n\xda\x05titlez\n  \nEmail: \xda\x05emailz\n '
+                    b' \nPhone: \xda\x05phonez\x15\n\nSincerely,\n\n---\n\n**z\x03  \nzm\n\n---\n'
+                    b'\n*This confirmation letter is part of your employment records and should be '
+                    b'kept for future reference.*)\x06\xda\x12resolve_or_missing\xda\tundefined'
+                    b'\xda\x06concatr\t\x00\x00\x00\xda\x03str\xda\x07getattr)\x17\xda\x07conte'
+                    b'xtr\x0e\x00\x00\x00\xda\x0benvironment\xda\x07resolver%\x00\x00\x00r&'
+                    b'\x00\x00\x00\xda\x13cond_expr_undefined\xda\x15l_0_confirmation_date\xda'
+                    b'\x11l_0_employee_name\xda\rl_0_job_title\xda\x0bl_0_company\xda\x12l_0_effe'
+                    b'ctive_date\xda\x11l_0_personal_note\xda\x08l_0_team\xda\x10l_0_career_leve'
+                    b'l\xda\x10l_0_reporting_to\xda\x18l_0_key_responsibilities\xda\x14l_0_next_'
+                    b'review_date\xda\x0fl_0_core_values\xda\x0el_0_hr_contact\xda\x12l_1_respon'
+                    b'sibility\xda\n_loop_vars\xda\tl_1_values\x17\x00\x00\x00                    '
+                    b'   \xfa\x19templates/confirmation.md\xda\x04rootr>\x00\x00\x00\x04\x00\x00'
+                    b'\x00sq\x08\x00\x00\xe8\x00\xe8\x00\x80\x00\xd8\x0e\x15\xd4\x0e(\x80G'
+                    b'\xd8\x10\x1b\xd4\x10%\x80I\xd8\r\x18\xd4\r\x1f\x80F\xdd\x1a#\xd0'
+                    b'\x04\x17\xd8\x04\x14\xd8\x1c#\x98G\xd0$7\xd1\x1c8\xd4\x1c8\xd0'
+                    b'\x04\x19\xd8\x18\x1f\x98\x07\xa0\x0f\xd1\x180\xd4\x180\xd0\x04\x15\xd8\x14'
+                    b"\x1b\x90G\x98K\xd1\x14(\xd4\x14(\x80M\xd8\x12\x19\x90'\x98)\xd1\x12$\xd4"
+                    b'\x12$\x80K\xd8\x19 \x98\x17\xd0!1\xd1\x192\xd4\x192\xd0\x04\x16\xd8\x18\x1f'
+                    b'\x98\x07\xa0\x0f\xd1\x180\xd4\x180\xd0\x04\x15\xd8\x0f\x16\x88w\x90v'
+                    b'\x89\x7f\x8c\x7f\x80H\xd8\x17\x1e\x90w\x98~\xd1\x17.\xd4\x17.\xd0'
+                    b'\x04\x14\xd8\x17\x1e\x90w\x98~\xd1\x17.\xd4\x17.\xd0\x04\x14\xd8\x1f'
+                    b'&\x98w\xd0\'=\xd1\x1f>\xd4\x1f>\xd0\x04\x1c\xd8\x1b"\x987\xd0#5\xd1'
+                    b'\x1b6\xd4\x1b6\xd0\x04\x18\xd8\x16\x1d\x90g\x98m\xd1\x16,\xd4\x16,\x80O\xd8'
+                    b'\x15\x1c\x90W\x98\\\xd1\x15*\xd4\x15*\x80N\xd8\x04\x08\xd8\n2\xd0\x042\xd0'
+                    b'\x042\xd0\x042\xdd\n\r\xd06K\xc8w\xd06V\xd06V\x88y\x88y\xd0\x1e1\xd0\x0f'
+                    b'2\xd1\x0f2\xd4\x0f2\xd0\x0f2\xd0\\q\xd1\ns\xd4\ns\xd0\x04s\xd0\x04s\xd0\x04s'
+                    b'\xd8\n\x18\xd0\x04\x18\xd0\x04\x18\xd0\x04\x18\xdd\n\r\xd02C\xc0w\xd02N\xd0'
+                    b'2N\x88y\x88y\x98o\xd0\x0f.\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng\xd4\n'
+                    b'g\xd0\x04g\xd0\x04g\xd0\x04g\xd8\n<\xd0\x04<\xd0\x04<\xd0\x04<\xdd\n'
+                    b'\r\xa8m\xb8w\xd0.F\xd0.F\x88y\x88y\x98k\xd0\x0f*\xd1\x0f*\xd4\x0f*\xd0\x0f'
+                    b'*\xc8M\xd1\n[\xd4\n[\xd0\x04[\xd0\x04[\xd0\x04[\xd8\n\x15\xd0\x04\x15'
+                    b'\xd0\x04\x15\xd0\x04\x15\xdd\n\r\xd02C\xc0w\xd02N\xd02N\x88y\x88y'
+                    b'\x98o\xd0\x0f.\xd1\x0f.\xd4\x0f.\xd0\x0f.\xd0Te\xd1\ng\xd4\ng\xd0'
+                    b'\x04g\xd0\x04g\xd0\x04g\xd8\nT\xd0\x04T\xd0\x04T\xd0\x04T\xdd\n\r\xa8'
+                    b'm\xb8w\xd0.F\xd0.F\x88y\x88y\x98k\xd0\x0f*\xd1\x0f*\xd4\x0f*\xd0\x0f*\xc8'
+                    b'M\xd1\n[\xd4\n[\xd0\x04[\xd0\x04[\xd0\x04[\xd8\n\x10\x80L\x80L\x80L\xdd\n\r'
+                    b'\x88k\xd7\x0e!\xd2\x0e!\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa09\xb0)\xd0#<\xd1'
+                    b'#<\xd4#<\xd0#<\xd0\\g\xd0jp\xd1\x0eq\xd4\x0eq\xd1\nr\xd4\nr\xd0\x04r\xd0\x04r'
+                    b'\xd0\x04r\xd8\n\x18\xd0\x04\x18\xd0\x04\x18\xd0\x04\x18\xdd\n\r\xd03'
+                    b'E\xc8\x17\xd03P\xd03P\x88y\x88y\xd0\x1e.\xd0\x0f/\xd1\x0f/\xd4\x0f/\xd0\x0f/'
+                    b'\xd0Vh\xd1\nj\xd4\nj\xd0\x04j\xd0\x04j\xd0\x04j\xf0\x02\x00\x0bk\x05'
+                    b'\xf0\x00\x00\x05k\x05\xf0\x00\x00\x05k\x05\xf0\x00\x00\x05k\x05\xd8+'
+                    b"<\xc0\x07\xd0+G\xd0+G\x88\t\x88\t\x90\x7f\xd0\x08'\xd1\x08'\xd4\x08'"
+                    b'\xd0+G\xd0+G\xd0M^\xd0+G\xd8\x08\x0c\xdd\x0e\x11\xd06G\xc87\xd06R\xd06'
+                    b'R\x909\x909\xa0/\xd0\x132\xd1\x132\xd4\x132\xd0\x132\xd0Xi\xd1\x0ek\xd4\x0ek'
+                    b'\xd0\x08k\xd0\x08k\xd0\x08k\xd8\x0e\x14\x88\x0c\x88\x0c\x88\x0c\xd8\n'
+                    b'<\xd0\x04<\xd0\x04<\xd0\x04<\xdd\n\r\xa8m\xb8w\xd0.F\xd0.F\x88y\x88y\x98'
+                    b'k\xd0\x0f*\xd1\x0f*\xd4\x0f*\xd0\x0f*\xc8M\xd1\n[\xd4\n[\xd0\x04['
+                    b'\xd0\x04[\xd0\x04[\xd8\n\x1a\xd0\x04\x1a\xd0\x04\x1a\xd0\x04\x1a\xdd\n'
+                    b'\r\xa8\x18\xb0W\xd0)<\xd0)<\x88y\x88y\x98f\xd0\x0f%\xd1\x0f%\xd4\x0f%\xd0\x0f'
+                    b'%\xc0(\xd1\nL\xd4\nL\xd0\x04L\xd0\x04L\xd0\x04L\xd8\n"\xd0\x04"\xd0\x04"\xd0'
+                    b'\x04"\xdd\n\r\xd01A\xc0W\xd01L\xd01L\x88y\x88y\x98n\xd0\x0f-\xd1\x0f-'
+                    b'\xd4\x0f-\xd0\x0f-\xd0Rb\xd1\nd\xd4\nd\xd0\x04d\xd0\x04d\xd0\x04d\xd8\n"\xd0'
+                    b'\x04"\xd0\x04"\xd0\x04"\xdd\n\r\xd01A\xc0W\xd01L\xd01L\x88y\x88y\x98n'
+                    b'\xd0\x0f-\xd1\x0f-\xd4\x0f-\xd0\x0f-\xd0Rb\xd1\nd\xd4\nd\xd0\x04d'
+                    b'\xd0\x04d\xd0\x04d\xd8\n$\xd0\x04$\xd0\x04$\xd0\x04$\xdd\n\r\xd03E'
+                    b'\xc8\x17\xd03P\xd03P\x88y\x88y\xd0\x1e.\xd0\x0f/\xd1\x0f/\xd4\x0f/'
+                    b'\xd0\x0f/\xd0Vh\xd1\nj\xd4\nj\xd0\x04j\xd0\x04j\xd0\x04j\xd8\na\xd0\x04a\xd0'
+                    b'\x04a\xd0\x04a\xd8Ia\xd0el\xd0Il\xd0Il\x98y\x98y\xd0.D\xd0\x1fE\xd1'
+                    b'\x1fE\xd4\x1fE\xd0\x1fE\xf0\x00\x00s\x01K\x02\xf0\x00\x05\x05\x13'
+                    b'\xf0\x00\x05\x05\x13\xd0\x08\x1a\xd8\x15\x17\x88\n\xd8\x08\x0c'
+                    b'\xd8\x0e\x12\x88\n\x88\n\x88\n\xdd\x0e\x11\xd0\x12$\xd1\x0e%\xd4\x0e'
+                    b'%\xd0\x08%\xd0\x08%\xd0\x08%\xd8\x0e\x12\x88\n\x88\n\x88\n\x88\n\xd8\x19 '
+                    b'\xd0\x04\x16\xf0\x02\x00\x0b{\x07\xf0\x00\x00\x05{\x07\xf0\x00\x00\x05{'
+                    b'\x07\xf0\x00\x00\x05{\x07\xdd\n\r\xd05I\xc8W\xd05T\xd05T\x88y\x88y\xd0\x1e0'
+                    b'\xd0\x0f1\xd1\x0f1\xd4\x0f1\xd0\x0f1\xd0Zn\xd1\np\xd4\np\xd0\x04p'
+                    b'\xd0\x04p\xd0\x04p\xf0\x02\x00\x0b~\x0e\xf0\x00\x00\x05~\x0e\xf0\x00'
+                    b"\x00\x05~\x0e\xf0\x00\x00\x05~\x0e\xd87F\xc8'\xd07Q\xd07Q\x90i\x90i\xa0]\xd0"
+                    b'\x163\xd1\x163\xd4\x163\xd0\x163\xd0Wf\xf0\x00\x07\x05\x13\xf0'
+                    b'\x00\x07\x05\x13\x88\t\xd8\x15\x17\x88\n\xd8\x08\x0c\xd8\x0e\x14\x88\x0c\x88'
+                    b'\x0c\x88\x0c\xdd\x0e\x11\x90+\xd7\x12%\xd2\x12%\xa0i\xb0\x16\xd1\x12'
+                    b'8\xd4\x128\xd1\x0e9\xd4\x0e9\xd0\x089\xd0\x089\xd0\x089\xd8\x0e\x14\x88\x0c'
+                    b'\x88\x0c\x88\x0c\xdd\x0e\x11\x90+\xd7\x12%\xd2\x12%\xa0i\xb0\x1d\xd1'
+                    b'\x12?\xd4\x12?\xd1\x0e@\xd4\x0e@\xd0\x08@\xd0\x08@\xd0\x08@\xd8\x0e\x12\x88'
+                    b'\n\x88\n\x88\n\x88\n\xd8\x10\x17\x80I\xf0\x02\x00\x0bi\x02\xf0\x00'
+                    b'\x00\x05i\x02\xf0\x00\x00\x05i\x02\xf0\x00\x00\x05i\x02\xdd\n\r\x88k\xd7\x0e!'
+                    b'\xd2\x0e!\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa09\xb0)\xd0#<\xd1#<\xd4#<\xd0#<\xd0'
+                    b'\\g\xd0jp\xd1\x0eq\xd4\x0eq\xd1\nr\xd4\nr\xd0\x04r\xd0\x04r\xd0\x04r\xf0\x02'
+                    b'\x00\x0bD\x02\xf0\x00\x00\x05D\x02\xf0\x00\x00\x05D\x02\xf0\x00\x00\x05'
+                    b'D\x02\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0>\xd0U\\\xd0C\\\xd0C\\\xa09\xa09'
+                    b'\xb0,\xd0#?\xd1#?\xd4#?\xd0#?\xd0bp\xd0sy\xd1\x0ez\xd4\x0ez\xd1\n{\xd4\n{'
+                    b'\xd0\x04{\xd0\x04{\xd0\x04{\xd8\n\x12\x80N\x80N\x80N\xdd\n\r\x88k\xd7'
+                    b'\x0e!\xd2\x0e!\xc0>\xd0U\\\xd0C\\\xd0C\\\xa09\xa09\xb0,\xd0#?\xd1#?\xd4#?\xd0'
+                    b'#?\xd0bp\xd0sz\xd1\x0e{\xd4\x0e{\xd1\n|\xd4\n|\xd0\x04|\xd0\x04|\xd0\x04'
+                    b'|\xd8\n\x17\xd0\x04\x17\xd0\x04\x17\xd0\x04\x17\xdd\n\r\x88k\xd7\x0e'
+                    b'!\xd2\x0e!\xc0>\xd0U\\\xd0C\\\xd0C\\\xa09\xa09\xb0,\xd0#?\xd1#?\xd4#?\xd0#'
+                    b'?\xd0bp\xd0sz\xd1\x0e{\xd4\x0e{\xd1\n|\xd4\n|\xd0\x04|\xd0\x04|\xd0\x04|'
+                    b'\xd8\n\x17\xd0\x04\x17\xd0\x04\x17\xd0\x04\x17\xdd\n\r\x88k\xd7\x0e!'
+                    b'\xd2\x0e!\xc0>\xd0U\\\xd0C\\\xd0C\\\xa09\xa09\xb0,\xd0#?\xd1#?\xd4#?\xd0#?'
+                    b'\xd0bp\xd0sz\xd1\x0e{\xd4\x0e{\xd1\n|\xd4\n|\xd0\x04|\xd0\x04|\xd0\x04|\xd8'
+                    b"\n'\xd0\x04'\xd0\x04'\xd0\x04'\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0>\xd0U\\\xd0"
+                    b'C\\\xd0C\\\xa09\xa09\xb0,\xd0#?\xd1#?\xd4#?\xd0#?\xd0bp\xd0sy\xd1\x0ez'
+                    b'\xd4\x0ez\xd1\n{\xd4\n{\xd0\x04{\xd0\x04{\xd0\x04{\xd8\n\x12\x80N\x80'
+                    b'N\x80N\xdd\n\r\x88k\xd7\x0e!\xd2\x0e!\xc0>\xd0U\\\xd0C\\\xd0C\\\xa09\xa0'
+                    b'9\xb0,\xd0#?\xd1#?\xd4#?\xd0#?\xd0bp\xd0sz\xd1\x0e{\xd4\x0e{\xd1\n|\xd4\n'
+                    b'|\xd0\x04|\xd0\x04|\xd0\x04|\xd8\n\x10\x80L\x80L\x80L\xdd\n\r\x88k'
+                    b'\xd7\x0e!\xd2\x0e!\xc0\x0b\xc8w\xd0@V\xd0@V\xa09\xa09\xb0)\xd0#<\xd1#<'
+                    b'\xd4#<\xd0#<\xd0\\g\xd0jp\xd1\x0eq\xd4\x0eq\xd1\nr\xd4\nr\xd0\x04r\xd0'
+                    b'\x04r\xd0\x04r\xd8\n}\xd0\x04}\xd0\x04}\xd0\x04}\xd0\x04}\xd0\x04}\xf3'
+                    b'\x00\x00\x00\x00z\x913=25&5=27&7=29&9=31&11=33&15=39&16=41&21=44&22=46&23=4'
+                    b'8&24=50&25=52&30=54&31=58&45=62&64=64&65=68&68=74&74=76&75=78&76=80&77=82&83'
+                    b'=84&84=86&85=88N)\x14\xda\x0ejinja2.runtimer\x02\x00\x00\x00r\x03\x00\x00\x00'
+                    b'r\x04\x00\x00\x00r\x05\x00\x00\x00r\x06\x00\x00\x00r\x07\x00\x00\x00'
+                    b'r\x08\x00\x00\x00r\t\x00\x00\x00r\n\x00\x00\x00r\x0b\x00\x00\x00r\x0c\x00\x00'
+                    b'\x00r\r\x00\x00\x00r\x0e\x00\x00\x00r\x0f\x00\x00\x00r\x1e\x00\x00\x00r*\x00'
+                    b'\x00\x00r>\x00\x00\x00\xda\x06blocks\xda\ndebug_info\xa9\x00r?\x00\x00\x00r='
+                    b'\x00\x00\x00\xfa\x08<module>rD\x00\x00\x00\x01\x00\x00\x00s\xff'
+                    b'\x00\x00\x00\xf0\x03\x01\x01\x01\xf0\x02\x00\x01G\x03\xf0\x00\x00\x01G\x03'
+                    b'\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00'
+                    b'\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01'
+                    b'G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03'
+                    b'\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00'
+                    b'\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01'
+                    b'G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03'
+                    b'\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00'
+                    b'\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01'
+                    b'G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03\xf0\x00\x00\x01G\x03'
+                    b'\xd8\x07\x18\x80\x04\xe0\x1a!\xa8{\xf0\x00U\x01\x01~\x01\xf0\x00U'
+                    b'\x01\x01~\x01\xf0\x00U\x01\x01~\x01\xf0\x00U\x01\x01~\x01\xf0n\x02\x00\n\x0c'
+                    b'\x80\x06\xf0\x02\x00\x0ea\x02\x80\n\x80\n\x80\nr?\x00\x00\x00'}
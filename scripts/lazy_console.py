@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Lazy Rich Console
+Defers importing rich until something is actually printed
+"""
+
+from typing import Any
+
+class LazyConsole:
+    """Proxy for ``rich.console.Console`` that is created on first use"""
+
+    def __init__(self, **kwargs: Any):
+        object.__setattr__(self, '_kwargs', kwargs)
+        object.__setattr__(self, '_console', None)
+
+    @property
+    def instance(self):
+        """The real Console (pass this to Rich widgets such as ``Progress``)"""
+        if self._console is None:
+            from rich.console import Console
+            object.__setattr__(self, '_console', Console(**self._kwargs))
+        return self._console
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.instance, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.instance, name, value)
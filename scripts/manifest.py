@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Document Manifest for HR Document Generation
+Sharded output layout and SQLite index of generated documents
+"""
+
+import re
+import json
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+MANIFEST_FILENAME = "manifest.sqlite"
+
+# Placeholder IDs that must not be used as a storage key
+_MISSING_IDS = {"", "nan", "none", "id number"}
+
+# Row fields that tell apart same-name employees without an ID
+IDENTITY_FIELDS = ('job_title', 'team', 'career_level', 'start_date', 'reporting_to', 'work_location')
+
+def employee_key(employee_id: Any, employee_name: str = "", details: Optional[Dict[str, Any]] = None) -> str:
+    """Return the stable key used to place an employee in the output tree
+
+    Without a usable ID the key is ``name-<name>-<hash>``, hashing the name
+    and the row's ``IDENTITY_FIELDS`` (from ``details``), so same-name hires
+    without IDs get their own directory and manifest rows.
+    """
+    key = str(employee_id if employee_id is not None else "").strip()
+    if key.lower() in _MISSING_IDS:
+        name = str(employee_name or 'employee').strip()
+        details = details or {}
+        identity = "\x1f".join([name] + [str(details.get(field) or "").strip() for field in IDENTITY_FIELDS])
+        key = f"name-{name}-{hashlib.sha1(identity.encode('utf-8')).hexdigest()[:8]}"
+    return key
+
+def shard_path(key: str) -> Path:
+    """Return the relative directory for a key, e.g. ``ab/cd/ID123456``"""
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    safe_key = re.sub(r'[^A-Za-z0-9._-]+', '_', key).strip('._') or digest[:12]
+    return Path(digest[:2], digest[2:4], safe_key)
+
+def content_hash(content: str) -> str:
+    """SHA-256 of document content"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+class DocumentManifest:
+    """SQLite index of generated documents keyed on employee and document type"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            employee_id TEXT NOT NULL,
+            employee_name TEXT,
+            team TEXT,
+            career_level TEXT,
+            doc_type TEXT NOT NULL,
+            path TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            generated_at TEXT NOT NULL,
+            valid INTEGER,
+            issues TEXT,
+            PRIMARY KEY (employee_id, doc_type)
+        );
+        CREATE INDEX IF NOT EXISTS idx_documents_type_team ON documents (doc_type, team);
+        CREATE INDEX IF NOT EXISTS idx_documents_name ON documents (employee_name);
+    """
+
+    COLUMNS = ("employee_id", "employee_name", "team", "career_level", "doc_type",
+               "path", "content_hash", "generated_at", "valid", "issues")
+
+    def __init__(self, db_path: str):
+        """Open (and create if needed) the manifest database"""
+        import sqlite3
+        
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def record(self, employee_id: str, employee_name: str, team: Optional[str],
+               career_level: Optional[str], documents: Dict[str, str], paths: Dict[str, str],
+               validation_results: Optional[Dict[str, Any]] = None) -> None:
+        """Insert or replace the manifest rows for one employee's documents"""
+        generated_at = datetime.now().isoformat(timespec='seconds')
+        validation_results = validation_results or {}
+        rows = []
+        for doc_type, content in documents.items():
+            validation = validation_results.get(doc_type)
+            rows.append((
+                employee_id,
+                employee_name,
+                team,
+                career_level,
+                doc_type,
+                paths[doc_type],
+                content_hash(content),
+                generated_at,
+                None if validation is None else int(bool(validation.get('valid'))),
+                None if validation is None else json.dumps(validation.get('issues', []))
+            ))
+        self.insert_rows(rows)
+
+    def insert_rows(self, rows: List[tuple]) -> None:
+        """Insert or replace raw rows (in ``COLUMNS`` order)"""
+        placeholders = ", ".join("?" for _ in self.COLUMNS)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO documents ({', '.join(self.COLUMNS)}) VALUES ({placeholders})",
+                rows
+            )
+
+    def find_employee(self, employee_id: str) -> List[Dict[str, Any]]:
+        """Return all documents recorded for an employee ID"""
+        return self._query("SELECT * FROM documents WHERE employee_id = ? ORDER BY doc_type", (employee_id,))
+
+    def find_by_name(self, employee_name: str) -> List[Dict[str, Any]]:
+        """Return all documents recorded for an employee name"""
+        return self._query("SELECT * FROM documents WHERE employee_name = ? ORDER BY employee_id, doc_type",
+                           (employee_name,))
+
+    def list_documents(self, doc_type: Optional[str] = None, team: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List documents, optionally filtered by document type and team"""
+        clauses, params = [], []
+        if doc_type:
+            clauses.append("doc_type = ?")
+            params.append(doc_type)
+        if team:
+            clauses.append("team = ?")
+            params.append(team)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._query(f"SELECT * FROM documents{where} ORDER BY employee_name, doc_type", tuple(params))
+
+    def _query(self, sql: str, params: tuple) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
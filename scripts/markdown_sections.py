@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Markdown Sections for HR Document Generation
+Split rendered documents on heading boundaries so sections can be processed independently
+"""
+
+import re
+from typing import List, Tuple
+
+_HEADING = re.compile(r"^(#{1,6})\s+\S")
+
+def split_sections(content: str, max_level: int = 2) -> List[str]:
+    """Split ``content`` before every heading of level <= ``max_level``
+
+    Sections keep their exact text (including trailing whitespace), so
+    ``"".join(split_sections(content)) == content``. Text before the first
+    heading is its own section.
+    """
+    sections, current = [], []
+    for line in content.splitlines(keepends=True):
+        match = _HEADING.match(line)
+        if match and len(match.group(1)) <= max_level and current:
+            sections.append("".join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append("".join(current))
+    return sections
+
+def split_padding(section: str) -> Tuple[str, str, str]:
+    """Split a section into (leading whitespace, body, trailing whitespace)"""
+    body = section.strip()
+    if not body:
+        return section, "", ""
+    start = section.index(body)
+    return section[:start], body, section[start + len(body):]
+
+def has_text(section: str) -> bool:
+    """Whether a section has anything worth sending to a model"""
+    return any(ch.isalnum() for ch in section)
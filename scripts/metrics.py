@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+In-process Metrics for HR Document Generation
+Counters, gauges and histograms rendered in the Prometheus text format
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Tuple, Optional, Sequence
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{_escape(extra[1])}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric:
+    """Base class for labelled metrics"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def series(self) -> List[Tuple[Dict[str, str], float]]:
+        """Every recorded label set with its value"""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(dict(zip(self.labelnames, k)), v) for k, v in items]
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    kind = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    @contextmanager
+    def track_inprogress(self, **labels: str):
+        """Increment for the duration of the enclosed block"""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels: str):
+        """Observe the duration of the enclosed block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), []))
+
+    def series(self) -> List[Tuple[Dict[str, str], int, float]]:
+        """Every recorded label set with its observation count and sum"""
+        with self._lock:
+            items = sorted((k, sum(v), self._sums[k]) for k, v in self._counts.items())
+        return [(dict(zip(self.labelnames, k)), count, total) for k, count, total in items]
+
+    def _samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = sorted((k, list(v), self._sums[k]) for k, v in self._counts.items())
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+class Registry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered with a different definition")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# Process-wide registry and the metrics shared by the CLI and the web app
+REGISTRY = Registry()
+
+AI_CALL_DURATION = REGISTRY.histogram(
+    "hr_ai_call_duration_seconds", "Latency of OpenAI chat-completion calls",
+    ("call_type", "model", "outcome"))
+AI_TOKENS = REGISTRY.counter(
+    "hr_ai_tokens_total", "Tokens consumed by OpenAI calls", ("call_type", "model", "kind"))
+AI_BUDGET_TOKENS = REGISTRY.counter(
+    "hr_ai_budget_tokens_total", "Content sized, completion tokens budgeted and actually used by sized AI calls",
+    ("call_type", "kind"))
+AI_CALLS_IN_FLIGHT = REGISTRY.gauge(
+    "hr_ai_calls_in_flight", "OpenAI calls currently awaiting a response")
+AI_QUEUE_DEPTH = REGISTRY.gauge(
+    "hr_ai_queue_depth", "AI calls waiting for a scheduler slot", ("priority",))
+AI_QUEUE_WAIT = REGISTRY.histogram(
+    "hr_ai_queue_wait_seconds", "Time AI calls spent queued in the scheduler", ("priority",))
+AI_CANCELLED = REGISTRY.counter(
+    "hr_ai_cancelled_total", "AI calls abandoned because their job was cancelled", ("stage",))
+JOBS_CANCELLED = REGISTRY.counter(
+    "hr_jobs_cancelled_total", "Web generation jobs cancelled before finishing", ("reason",))
+FALLBACKS = REGISTRY.counter(
+    "hr_fallback_total", "Documents or fields produced without AI", ("reason",))
+CACHE_REQUESTS = REGISTRY.counter(
+    "hr_cache_requests_total", "Cache lookups by outcome", ("cache", "result"))
+CACHE_HIT_RATIO = REGISTRY.gauge(
+    "hr_cache_hit_ratio", "Fraction of cache lookups that were hits", ("cache",))
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a cache lookup and refresh its hit ratio"""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+    hits = CACHE_REQUESTS.value(cache=cache, result="hit")
+    misses = CACHE_REQUESTS.value(cache=cache, result="miss")
+    CACHE_HIT_RATIO.set(hits / (hits + misses), cache=cache)
+
+def record_ai_call(call_type: str, model: str, duration: float, outcome: str = "ok",
+                   usage: Optional[object] = None) -> None:
+    """Record latency and (if available) token usage of one AI call"""
+    AI_CALL_DURATION.observe(duration, call_type=call_type, model=model, outcome=outcome)
+    if usage is not None:
+        AI_TOKENS.inc(getattr(usage, 'prompt_tokens', 0) or 0, call_type=call_type, model=model, kind="prompt")
+        AI_TOKENS.inc(getattr(usage, 'completion_tokens', 0) or 0, call_type=call_type, model=model, kind="completion")
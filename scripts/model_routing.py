@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Model Routing for HR Document Generation
+Per-call-type model, budget and fallback chain from the ``model_routing`` table in ai-prompts.json
+"""
+
+import os
+import sys
+import logging
+from typing import Dict, List, Any, Optional, Callable
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import FALLBACKS
+
+logger = logging.getLogger(__name__)
+
+# Used when ai-prompts.json has no model_routing table (or no "default" entry)
+DEFAULT_ROUTE = {
+    "model": "gpt-4o-mini",
+    "max_tokens": 800,
+    "temperature": 0.3,
+    "timeout": 60,
+    "fallback": []
+}
+
+class Route:
+    """Settings for one call type; ``models`` is the primary model followed by the fallback chain"""
+
+    __slots__ = ("call_type", "model", "max_tokens", "temperature", "timeout", "fallback")
+
+    def __init__(self, call_type: str, model: str, max_tokens: int, temperature: float,
+                 timeout: float, fallback: List[str]):
+        self.call_type = call_type
+        self.model = model
+        self.max_tokens = int(max_tokens)
+        self.temperature = float(temperature)
+        self.timeout = float(timeout)
+        self.fallback = list(fallback)
+
+    @property
+    def models(self) -> List[str]:
+        chain = []
+        for model in [self.model] + self.fallback:
+            if model not in chain:
+                chain.append(model)
+        return chain
+
+    def __repr__(self) -> str:
+        return (f"Route({self.call_type!r}, model={self.model!r}, max_tokens={self.max_tokens}, "
+                f"temperature={self.temperature}, timeout={self.timeout}, fallback={self.fallback!r})")
+
+def resolve_route(prompts: Dict[str, Any], call_type: str) -> Route:
+    """Route for ``call_type``: the exact entry over its prefix (``slots`` for ``slots.contract``) over ``default``"""
+    table = prompts.get("model_routing") or {}
+    settings = dict(DEFAULT_ROUTE)
+    settings.update(table.get("default") or {})
+    parts = call_type.split(".")
+    for depth in range(1, len(parts) + 1):
+        settings.update(table.get(".".join(parts[:depth])) or {})
+    return Route(call_type, settings["model"], settings["max_tokens"], settings["temperature"],
+                 settings["timeout"], settings.get("fallback") or [])
+
+def response_text(response: Any) -> str:
+    """Message content of the first choice ('' if absent)"""
+    try:
+        return (response.choices[0].message.content or "").strip()
+    except (AttributeError, IndexError):
+        return ""
+
+def complete_with_fallback(route: Route, create: Callable[..., Any], messages: List[Dict[str, str]],
+                           accept: Optional[Callable[[Any], bool]] = None, **kwargs: Any) -> Any:
+    """Call ``create`` with each model in the route's chain until a response is accepted
+
+    ``create(model=..., messages=..., max_tokens=..., temperature=..., timeout=..., **kwargs)``
+    performs one completion. A model is escalated past when the call raises or
+    ``accept(response)`` is false (default: the response has text). The last
+    response is returned if none is accepted; the last error is raised if every
+    call failed.
+    """
+    accept = accept or (lambda response: bool(response_text(response)))
+    params = {"max_tokens": route.max_tokens, "temperature": route.temperature, "timeout": route.timeout}
+    params.update(kwargs)
+    models = route.models
+    last_response, last_error = None, None
+    for position, model in enumerate(models):
+        try:
+            response = create(model=model, messages=messages, **params)
+        except Exception as e:
+            last_error = e
+            logger.warning(f"{route.call_type} failed on {model}: {e}")
+        else:
+            if accept(response):
+                return response
+            last_response = response
+            logger.info(f"{route.call_type}: response from {model} rejected")
+        if position + 1 < len(models):
+            FALLBACKS.inc(reason="model_escalation")
+    if last_response is not None:
+        return last_response
+    raise last_error
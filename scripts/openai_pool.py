@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Shared OpenAI Client for HR Document Generation
+One keep-alive connection pool per process, reused by every AI helper, worker thread and web entry point
+"""
+
+import os
+import sys
+import logging
+import threading
+import importlib.util
+from typing import Dict, Any, Optional
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_scheduler import get_scheduler
+
+logger = logging.getLogger(__name__)
+
+# Idle connections are kept this many seconds so bursts reuse their TLS sessions
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+_http_client: Any = None
+_clients: Dict[tuple, Any] = {}
+_lock = threading.Lock()
+
+def pool_size() -> int:
+    """Connections to keep open: the scheduler's concurrency cap unless ``OPENAI_POOL_SIZE`` is set"""
+    configured = os.getenv('OPENAI_POOL_SIZE')
+    if configured:
+        return max(1, int(configured))
+    return get_scheduler().max_concurrency
+
+def build_http_client() -> Any:
+    """Pooled httpx client for the OpenAI SDK (None when httpx is unavailable: the SDK default is used)
+
+    ``OPENAI_HTTP2=1`` multiplexes calls over HTTP/2 when the ``h2`` package
+    is installed and falls back to HTTP/1.1 keep-alive otherwise.
+    """
+    try:
+        import httpx
+        import openai
+    except ImportError:
+        logger.info("httpx not importable; OpenAI clients use the SDK's default connection pool")
+        return None
+    size = pool_size()
+    http2 = os.getenv('OPENAI_HTTP2', '').lower() in ('1', 'true', 'yes')
+    if http2 and importlib.util.find_spec('h2') is None:
+        logger.warning("OPENAI_HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
+        http2 = False
+    limits = httpx.Limits(max_connections=size, max_keepalive_connections=size,
+                          keepalive_expiry=float(os.getenv('OPENAI_KEEPALIVE_EXPIRY', str(DEFAULT_KEEPALIVE_EXPIRY))))
+    # DefaultHttpxClient keeps the SDK's own timeout and redirect defaults
+    factory = getattr(openai, 'DefaultHttpxClient', httpx.Client)
+    return factory(limits=limits, http2=http2)
+
+def shared_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> Any:
+    """Process-wide ``openai.OpenAI`` client for an API key and base URL
+
+    Defaults come from ``OPENAI_API_KEY`` and ``OPENAI_BASE_URL``. Every client
+    returned here sends through the same HTTP connection pool, so parallel
+    workers and web requests reuse warm connections instead of opening their own.
+    """
+    api_key = api_key or os.getenv('OPENAI_API_KEY')
+    base_url = base_url or os.getenv('OPENAI_BASE_URL') or None
+    key = (api_key, base_url)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            import openai
+            global _http_client
+            if _http_client is None:
+                _http_client = build_http_client()
+            pooled = {} if _http_client is None else {"http_client": _http_client}
+            client = _clients[key] = openai.OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                max_retries=int(os.getenv('OPENAI_MAX_RETRIES', '2')),
+                timeout=float(os.getenv('OPENAI_TIMEOUT', '60')),
+                **pooled
+            )
+    return client
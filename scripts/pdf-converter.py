@@ -10,24 +10,30 @@ import argparse
 import logging
 from pathlib import Path
 from typing import List, Optional
-import markdown
-from weasyprint import HTML, CSS
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+
+# markdown, weasyprint and rich are imported where they are first needed so
+# that --help and non-PDF callers do not pay their import cost
+
+# Add the scripts directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from profiling import Profiler, NULL_PROFILER
+from lazy_console import LazyConsole
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Initialize Rich console
-console = Console()
+# Initialize Rich console (rich is imported on first print)
+console = LazyConsole()
 
 class PDFConverter:
     """Convert Markdown documents to PDF"""
     
-    def __init__(self):
+    def __init__(self, profiler: Optional[Profiler] = None):
         """Initialize the PDF converter"""
         self.css_styles = self._get_default_css()
+        self.profiler = profiler or NULL_PROFILER
     
     def _get_default_css(self) -> str:
         """Get default CSS styles for PDF generation"""
@@ -144,6 +150,8 @@ class PDFConverter:
     
     def markdown_to_html(self, markdown_content: str) -> str:
         """Convert Markdown content to HTML"""
+        import markdown
+        
         # Configure Markdown extensions
         extensions = [
             'markdown.extensions.tables',
@@ -175,6 +183,8 @@ class PDFConverter:
     def html_to_pdf(self, html_content: str, output_path: str) -> bool:
         """Convert HTML content to PDF"""
         try:
+            from weasyprint import HTML, CSS
+            
             # Create HTML object
             html = HTML(string=html_content)
             
@@ -198,19 +208,25 @@ class PDFConverter:
                 logger.error(f"Input file not found: {input_path}")
                 return False
             
+            # Spans are grouped by the employee directory the file lives in
+            employee = input_file.parent.name
+            
             # Read Markdown content
-            with open(input_file, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
+            with self.profiler.span("read", employee):
+                with open(input_file, 'r', encoding='utf-8') as f:
+                    markdown_content = f.read()
             
             # Convert to HTML
-            html_content = self.markdown_to_html(markdown_content)
+            with self.profiler.span("markdown_to_html", employee):
+                html_content = self.markdown_to_html(markdown_content)
             
             # Determine output path
             if output_path is None:
                 output_path = input_file.with_suffix('.pdf')
             
             # Convert to PDF
-            success = self.html_to_pdf(html_content, str(output_path))
+            with self.profiler.span("html_to_pdf", employee):
+                success = self.html_to_pdf(html_content, str(output_path))
             
             if success:
                 console.print(f"[green]✓ Converted: {input_path} → {output_path}[/green]")
@@ -244,12 +260,14 @@ class PDFConverter:
             console.print(f"[yellow]No Markdown files found in {input_dir}[/yellow]")
             return []
         
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
         converted_files = []
         
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=console.instance
         ) as progress:
             task = progress.add_task("Converting files...", total=len(markdown_files))
             
@@ -280,12 +298,14 @@ class PDFConverter:
             console.print(f"[yellow]No Markdown files found in {employee_dir}[/yellow]")
             return False
         
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
         success_count = 0
         
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=console.instance
         ) as progress:
             task = progress.add_task("Converting employee documents...", total=len(markdown_files))
             
@@ -308,11 +328,19 @@ def main():
     parser.add_argument('input', help='Input file or directory')
     parser.add_argument('--output', help='Output file or directory')
     parser.add_argument('--employee', help='Convert documents for specific employee directory')
+    parser.add_argument('--profile', action='store_true', help='Record per-stage timing spans and print a summary table')
+    parser.add_argument('--profile-pstats', metavar='FILE', help='Also dump cProfile statistics to FILE (implies --profile)')
+    parser.add_argument('--profile-trace', metavar='FILE', help='Also write a Chrome-trace JSON file (implies --profile)')
     
     args = parser.parse_args()
     
+    profiler = None
+    if args.profile or args.profile_pstats or args.profile_trace:
+        profiler = Profiler(cprofile=bool(args.profile_pstats))
+        profiler.start()
+    
     try:
-        converter = PDFConverter()
+        converter = PDFConverter(profiler=profiler)
         
         if args.employee:
             # Convert documents for specific employee
@@ -342,6 +370,16 @@ def main():
         console.print(f"[bold red]Error: {e}[/bold red]")
         logger.error(f"Application error: {e}")
         sys.exit(1)
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            profiler.print_report(console, employee_stage="html_to_pdf")
+            if args.profile_pstats:
+                profiler.dump_pstats(args.profile_pstats)
+                console.print(f"cProfile statistics written to {args.profile_pstats}")
+            if args.profile_trace:
+                profiler.write_chrome_trace(args.profile_trace)
+                console.print(f"Chrome trace written to {args.profile_trace}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Profiling Helpers for HR Document Generation
+Timing spans per employee and per stage, with table, pstats and Chrome-trace output
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Any, Optional
+
+class Profiler:
+    """Collects timing spans and optionally runs cProfile"""
+
+    enabled = True
+
+    def __init__(self, cprofile: bool = False):
+        """Initialize the profiler; ``cprofile`` also records a function-level profile"""
+        self.spans: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._cprofile = None
+        if cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+
+    def start(self) -> None:
+        """Start cProfile (if requested)"""
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        """Stop cProfile (if requested)"""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+    @contextmanager
+    def span(self, name: str, employee: Optional[str] = None):
+        """Time the enclosed block as stage ``name`` for ``employee``"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.spans.append({
+                    "name": name,
+                    "employee": employee,
+                    "start": start - self._origin,
+                    "duration": end - start,
+                    "thread": threading.get_ident()
+                })
+
+    def aggregate(self) -> List[Dict[str, Any]]:
+        """Per-stage totals, sorted by total time"""
+        stages: Dict[str, List[float]] = {}
+        with self._lock:
+            for span in self.spans:
+                stages.setdefault(span["name"], []).append(span["duration"])
+
+        rows = []
+        for name, durations in stages.items():
+            durations.sort()
+            total = sum(durations)
+            rows.append({
+                "stage": name,
+                "count": len(durations),
+                "total_s": total,
+                "mean_ms": total / len(durations) * 1000,
+                "p95_ms": durations[min(len(durations) - 1, int(len(durations) * 0.95))] * 1000,
+                "max_ms": durations[-1] * 1000
+            })
+        return sorted(rows, key=lambda r: r["total_s"], reverse=True)
+
+    def employee_totals(self, stage: str) -> List[Dict[str, Any]]:
+        """Total time of ``stage`` spans per employee, slowest first"""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for span in self.spans:
+                if span["name"] == stage and span["employee"] is not None:
+                    totals[span["employee"]] = totals.get(span["employee"], 0.0) + span["duration"]
+        return [{"employee": k, "total_s": v} for k, v in sorted(totals.items(), key=lambda kv: kv[1], reverse=True)]
+
+    def print_report(self, console, top_employees: int = 5, employee_stage: str = "employee") -> None:
+        """Print the aggregated stage table (and slowest employees) to a Rich console"""
+        from rich.table import Table
+
+        table = Table(title="Profile: time per stage")
+        table.add_column("Stage", style="cyan")
+        table.add_column("Count", justify="right")
+        table.add_column("Total (s)", justify="right")
+        table.add_column("Mean (ms)", justify="right")
+        table.add_column("p95 (ms)", justify="right")
+        table.add_column("Max (ms)", justify="right")
+        for row in self.aggregate():
+            table.add_row(row["stage"], str(row["count"]), f"{row['total_s']:.3f}",
+                          f"{row['mean_ms']:.2f}", f"{row['p95_ms']:.2f}", f"{row['max_ms']:.2f}")
+        console.print(table)
+
+        slowest = self.employee_totals(employee_stage)[:top_employees]
+        if slowest:
+            table = Table(title=f"Profile: slowest {len(slowest)} ({employee_stage})")
+            table.add_column("Employee", style="cyan")
+            table.add_column("Total (s)", justify="right")
+            for row in slowest:
+                table.add_row(row["employee"], f"{row['total_s']:.3f}")
+            console.print(table)
+
+    def dump_pstats(self, path: str) -> None:
+        """Write the cProfile statistics (load with ``python -m pstats``)"""
+        if self._cprofile is None:
+            raise RuntimeError("cProfile was not enabled for this profiler")
+        self._cprofile.dump_stats(path)
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write spans in Chrome trace format (open in chrome://tracing or Perfetto)"""
+        pid = os.getpid()
+        with self._lock:
+            events = [{
+                "name": span["name"],
+                "cat": span["name"].split('.')[0],
+                "ph": "X",
+                "ts": round(span["start"] * 1e6, 3),
+                "dur": round(span["duration"] * 1e6, 3),
+                "pid": pid,
+                "tid": span["thread"],
+                "args": {"employee": span["employee"]} if span["employee"] is not None else {}
+            } for span in self.spans]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+class NullProfiler:
+    """Profiler stand-in used when profiling is off; spans cost a single method call"""
+
+    enabled = False
+    _span = nullcontext()
+
+    def span(self, name: str, employee: Optional[str] = None):
+        return self._span
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+NULL_PROFILER = NullProfiler()
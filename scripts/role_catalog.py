@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Role Catalog for HR Document Generation
+Structures derived from job-roles.json that every entry point shares
+"""
+
+from typing import Dict, Any
+
+KPI_AREAS = ("Vision", "Delivery", "Financial", "Quality", "LnD", "ICO")
+
+def normalize_kpis(kpi_breakdown: Dict[str, Any]) -> Dict[str, int]:
+    """Normalize KPI keys from config to simple keys used by templates"""
+    mapping = {area: 0 for area in KPI_AREAS}
+    for raw_key, val in (kpi_breakdown or {}).items():
+        key = raw_key.lower()
+        if "vision" in key:
+            mapping["Vision"] = val
+        elif "delivery" in key:
+            mapping["Delivery"] = val
+        elif "financial" in key or "fin" in key:
+            mapping["Financial"] = val
+        elif "quality" in key or "qua" in key:
+            mapping["Quality"] = val
+        elif "learning" in key or "lnd" in key:
+            mapping["LnD"] = val
+        elif "internal" in key or "ico" in key or "communications" in key:
+            mapping["ICO"] = val
+    return mapping
+
+def build_role_catalog(job_roles: Dict[str, Any]) -> Dict[str, Any]:
+    """Precompute per-level KPIs/responsibilities and per-team focus areas"""
+    career_levels = {}
+    for level, role_data in job_roles.get('career_levels', {}).items():
+        responsibilities = role_data.get('responsibilities', [])
+        career_levels[level] = {
+            'kpi_breakdown': normalize_kpis(role_data.get('kpi_breakdown', {})),
+            'responsibilities': responsibilities,
+            'key_responsibilities': responsibilities[:5]
+        }
+    teams = {team: team_data.get('focus_areas', []) for team, team_data in job_roles.get('teams', {}).items()}
+    return {'career_levels': career_levels, 'teams': teams}
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Role-Level Warm-up for HR Document Generation
+A persisted cache of AI content shared by everyone at a career level and team, and a background pre-generation run
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from manifest import content_hash
+from metrics import record_cache
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, writes are still atomic
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+ROLE_CACHE_FILENAME = "role-content-cache.json"
+
+class FallbackText(str):
+    """Locally built stand-in for AI text; used for this run but never persisted"""
+
+def role_combinations(job_roles: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Every (career_level, team) pair in job-roles.json"""
+    return [(level, team) for level in job_roles.get('career_levels', {}) for team in job_roles.get('teams', {})]
+
+def base_job_title(career_level: str, team: str) -> str:
+    """Job title warmed for a level and team, e.g. ``Marketing Associate``"""
+    return f"{team} {career_level}"
+
+def config_fingerprint(*configs: Dict[str, Any]) -> str:
+    """Hash of the configs cached content was generated from (prompts, roles, company)"""
+    return content_hash(json.dumps(configs, sort_keys=True, default=str))
+
+class RoleContentCache:
+    """AI content keyed by work-unit tuples, persisted as JSON next to the outputs
+
+    Entries are only valid for the config ``fingerprint`` they were generated
+    with; a file written for other prompts or roles is ignored. ``put`` only
+    updates memory; ``flush`` (once per run, warm-up or web request) merges the
+    new entries into the file under a lock, so shard processes sharing one
+    output tree add to each other's entries instead of overwriting them.
+    """
+
+    def __init__(self, path: Path, fingerprint: str):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Any] = self._load()
+        self._dirty: Dict[str, Any] = {}
+
+    @staticmethod
+    def _key(key: tuple) -> str:
+        return json.dumps(list(key))
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable role cache {self.path}: {e}")
+            return {}
+        if stored.get("fingerprint") != self.fingerprint:
+            logger.info(f"Role cache {self.path} was built for another config version; starting fresh")
+            return {}
+        return stored.get("entries", {})
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock on ``<cache>.lock`` across processes (where fcntl is available)"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.path.with_suffix(self.path.suffix + ".lock"), 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def peek(self, key: tuple) -> Optional[Any]:
+        """Cached value without counting a cache lookup"""
+        with self._lock:
+            return self._entries.get(self._key(key))
+
+    def get(self, key: tuple, cache: str = "role_content") -> Optional[Any]:
+        value = self.peek(key)
+        record_cache(cache, value is not None)
+        return value
+
+    def put(self, key: tuple, value: Any) -> None:
+        """Cache ``value`` in memory; ``flush`` saves it"""
+        if isinstance(value, FallbackText):
+            return
+        with self._lock:
+            self._entries[self._key(key)] = value
+            self._dirty[self._key(key)] = value
+
+    def flush(self) -> int:
+        """Merge the entries put since the last flush into the file; returns how many were saved"""
+        with self._lock:
+            if not self._dirty:
+                return 0
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self._file_lock():
+                    entries = {**self._load(), **self._dirty}
+                    # A unique temp file, so concurrent writers never publish each other's partial output
+                    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.path.parent,
+                                                     prefix=self.path.name + ".", suffix=".tmp",
+                                                     delete=False) as f:
+                        json.dump({"fingerprint": self.fingerprint,
+                                   "updated_at": datetime.now().isoformat(timespec='seconds'),
+                                   "entries": entries}, f, indent=2)
+                    os.replace(f.name, self.path)
+            except OSError as e:
+                # Read-only deployments keep the cache in memory only
+                logger.warning(f"Could not save role cache {self.path}: {e}")
+                return 0
+            saved = len(self._dirty)
+            self._dirty = {}
+            self._entries = {**entries, **self._entries}
+            return saved
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+class WarmUp:
+    """Runs role-level pre-generation tasks, optionally in a background thread, and reports readiness
+
+    Each task is ``(label, func)``; a task fails when ``func`` raises or returns None.
+    ``on_done`` runs once every task has finished (e.g. to flush the role cache).
+    """
+
+    def __init__(self, tasks: List[Tuple[str, Callable[[], Any]]], workers: int = 4,
+                 on_done: Optional[Callable[[], Any]] = None):
+        self.tasks = tasks
+        self.workers = max(1, workers)
+        self.on_done = on_done
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {"status": "pending", "total": len(tasks), "done": 0, "errors": 0,
+                                       "started_at": None, "seconds": None}
+        self._thread: Optional[threading.Thread] = None
+
+    def _run_task(self, task: Tuple[str, Callable[[], Any]]) -> None:
+        label, func = task
+        try:
+            failed = func() is None
+        except Exception as e:
+            logger.warning(f"Warm-up of {label} failed: {e}")
+            failed = True
+        with self._lock:
+            self._state["done"] += 1
+            self._state["errors"] += failed
+
+    def run(self) -> Dict[str, Any]:
+        """Run every task (``workers`` at a time) and return the final status"""
+        start = time.perf_counter()
+        with self._lock:
+            self._state.update(status="running", started_at=datetime.now().isoformat(timespec='seconds'))
+        if self.tasks:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(self.tasks))) as pool:
+                list(pool.map(self._run_task, self.tasks))
+        if self.on_done is not None:
+            self.on_done()
+        with self._lock:
+            self._state.update(status="ready", seconds=round(time.perf_counter() - start, 2))
+        logger.info(f"Warm-up finished: {self._state['done']} tasks, {self._state['errors']} failed")
+        return self.status()
+
+    def start(self) -> "WarmUp":
+        """Run in a daemon thread; poll ``status()``/``ready``"""
+        self._thread = threading.Thread(target=self.run, name="role-warmup", daemon=True)
+        self._thread.start()
+        return self
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def ready(self) -> bool:
+        with self._lock:
+            return self._state["status"] == "ready"
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._state)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Batch Sharding for HR Document Generation
+Deterministic employee partitions for multi-host batches and merging of the per-shard outputs
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from manifest import DocumentManifest, MANIFEST_FILENAME
+from cohort_planner import CALL_STATS_FILENAME, load_call_stats, save_call_stats
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FILENAME = "batch-summary.json"
+
+_SHARD_SPEC = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+_SHARD_FILE = re.compile(r"\.shard-(\d+)-of-(\d+)$")
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parse ``I/N`` (1-based: ``1/4`` .. ``4/4``) into ``(I, N)``"""
+    match = _SHARD_SPEC.match(spec or "")
+    if not match:
+        raise ValueError(f"Shard must look like I/N, e.g. 1/4: {spec}")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and {count}: {spec}")
+    return index, count
+
+def shard_of(key: str, count: int) -> int:
+    """1-based shard that owns an employee key (stable across hosts and Python versions)"""
+    return int(hashlib.sha1(key.encode('utf-8')).hexdigest()[:8], 16) % count + 1
+
+def shard_file(filename: str, shard: Optional[Tuple[int, int]]) -> str:
+    """Per-shard variant of an output file name, e.g. ``manifest.shard-2-of-4.sqlite``"""
+    if shard is None:
+        return filename
+    path = Path(filename)
+    return f"{path.stem}.shard-{shard[0]}-of-{shard[1]}{path.suffix}"
+
+def _shard_files(output_dir: Path, filename: str) -> Dict[Tuple[int, int], Path]:
+    path = Path(filename)
+    found = {}
+    for candidate in output_dir.glob(f"{path.stem}.shard-*-of-*{path.suffix}"):
+        match = _SHARD_FILE.search(candidate.name[:len(candidate.name) - len(path.suffix)])
+        if match:
+            found[(int(match.group(1)), int(match.group(2)))] = candidate
+    return found
+
+def write_summary(path: Path, csv_file: str, shard: Optional[Tuple[int, int]],
+                  results: List[Dict[str, Any]]) -> None:
+    """Write a batch's per-employee outcomes (the data behind the results table)"""
+    employees = []
+    for result in results:
+        if 'error' in result:
+            info = result['employee_info']
+            employees.append({"employee": info.get('name', 'Unknown'), "employee_id": info.get('employee_id'),
+                              "status": "Error", "error": result['error']})
+        else:
+            data = result['employee_data']
+            employees.append({"employee": data['employee_name'], "employee_id": data['employee_id'],
+                              "status": "Success", "output_directory": result['output_directory']})
+    summary = {
+        "csv": str(csv_file),
+        "shard": None if shard is None else f"{shard[0]}/{shard[1]}",
+        "generated_at": datetime.now().isoformat(timespec='seconds'),
+        "employees": employees
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+
+def merge_shards(output_dir: str) -> Dict[str, Any]:
+    """Combine per-shard manifests, summaries and call stats under ``output_dir``
+
+    Manifest rows are upserted into ``manifest.sqlite`` and summaries are
+    concatenated into ``batch-summary.json``; both are safe to re-run. Shard
+    call stats are added to ``ai-call-stats.json`` once and then removed.
+    Returns the merged summary plus the shards found and any that are missing.
+    """
+    output_dir = Path(output_dir)
+    manifests = _shard_files(output_dir, MANIFEST_FILENAME)
+    summaries = _shard_files(output_dir, SUMMARY_FILENAME)
+    stats_files = _shard_files(output_dir, CALL_STATS_FILENAME)
+    shards = sorted(set(manifests) | set(summaries) | set(stats_files))
+    if not shards:
+        raise FileNotFoundError(f"No shard outputs found in {output_dir}")
+    counts = {count for _, count in shards}
+    if len(counts) > 1:
+        raise ValueError(f"Shard outputs from different shard counts in {output_dir}: {sorted(counts)}")
+    count = counts.pop()
+    missing = [index for index in range(1, count + 1) if (index, count) not in summaries]
+
+    manifest = DocumentManifest(str(output_dir / MANIFEST_FILENAME))
+    try:
+        for shard in sorted(manifests):
+            source = DocumentManifest(str(manifests[shard]))
+            try:
+                rows = source.list_documents()
+            finally:
+                source.close()
+            manifest.insert_rows([tuple(row[column] for column in DocumentManifest.COLUMNS) for row in rows])
+    finally:
+        manifest.close()
+
+    employees = []
+    for shard in sorted(summaries):
+        with open(summaries[shard], 'r', encoding='utf-8') as f:
+            employees.extend(json.load(f).get("employees", []))
+    merged = {
+        "shards": [f"{index}/{count}" for index, count in shards],
+        "missing_shards": [f"{index}/{count}" for index in missing],
+        "generated_at": datetime.now().isoformat(timespec='seconds'),
+        "employees": employees
+    }
+    with open(output_dir / SUMMARY_FILENAME, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, indent=2)
+
+    for shard in sorted(stats_files):
+        save_call_stats(output_dir / CALL_STATS_FILENAME, {}, load_call_stats(stats_files[shard]))
+        stats_files[shard].unlink()
+
+    if missing:
+        logger.warning(f"Merged {len(shards)} of {count} shards; missing: {', '.join(merged['missing_shards'])}")
+    return merged
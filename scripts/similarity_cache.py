@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Similarity Cache for HR Document Generation
+Local character n-gram TF-IDF index that reuses AI text generated for near-duplicate job titles
+"""
+
+import re
+import math
+import threading
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
+
+NGRAM_SIZES = (2, 3, 4)
+DEFAULT_THRESHOLD = 0.8
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+def tokens(text: str) -> List[str]:
+    """Lower-case word tokens ("Associate, Marketing" -> ["associate", "marketing"])"""
+    return _TOKEN.findall(text.lower())
+
+def is_abbreviation(short: str, word: str) -> bool:
+    """True when ``short`` abbreviates ``word``: same first letter, letters in order, shorter ("mktg" -> "marketing")"""
+    if len(short) < 2 or len(short) >= len(word) or short[0] != word[0]:
+        return False
+    position = 0
+    for char in short:
+        position = word.find(char, position) + 1
+        if position == 0:
+            return False
+    return True
+
+def ngrams(words: List[str]) -> Counter:
+    """Character n-grams of each padded word, so word order does not matter"""
+    grams = Counter()
+    for word in words:
+        padded = f" {word} "
+        for n in NGRAM_SIZES:
+            grams.update(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+class SimilarityIndex:
+    """Previously generated texts, looked up by job title and responsibilities within an exact bucket
+
+    Entries are bucketed by exact keys (team, career level, company); within a
+    bucket a query matches the entry whose title and responsibilities are both
+    at least ``threshold`` cosine-similar under character n-gram TF-IDF.
+    Title words that abbreviate a word already indexed (or the team name) are
+    expanded first, so "Mktg Associate" compares as "Marketing Associate".
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, max_entries: int = 1024):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._buckets: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._document_frequency: Counter = Counter()
+        self._documents = 0
+        self._vocabulary: set = set()
+        self.lookups = 0
+        self.hits = 0
+
+    def _expand(self, words: List[str], extra: List[str]) -> List[str]:
+        known = self._vocabulary | set(extra)
+        expanded = []
+        for word in words:
+            if word not in known:
+                matches = sorted(candidate for candidate in known if is_abbreviation(word, candidate))
+                if len(matches) == 1:
+                    word = matches[0]
+            expanded.append(word)
+        return expanded
+
+    def _vector(self, grams: Counter) -> Dict[str, float]:
+        # Smoothed IDF (as in scikit-learn), over every title and responsibility list indexed so far
+        total = self._documents
+        vector = {gram: count * (math.log((1 + total) / (1 + self._document_frequency[gram])) + 1)
+                  for gram, count in grams.items()}
+        norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+        return {gram: value / norm for gram, value in vector.items()}
+
+    @staticmethod
+    def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(value * b.get(gram, 0.0) for gram, value in a.items())
+
+    def _grams(self, title: str, responsibilities: List[str], bucket: tuple) -> Tuple[Counter, Counter]:
+        context = [word for part in bucket for word in tokens(str(part))]
+        return (ngrams(self._expand(tokens(title), context)),
+                ngrams(tokens(" ".join(responsibilities))))
+
+    def lookup(self, bucket: tuple, title: str, responsibilities: List[str]) -> Tuple[Optional[str], float]:
+        """Best stored text for the query and its score, or (None, best score) below the threshold"""
+        with self._lock:
+            self.lookups += 1
+            entries = self._buckets.get(bucket, [])
+            if not entries:
+                return None, 0.0
+            title_grams, duty_grams = self._grams(title, responsibilities, bucket)
+            query_title, query_duties = self._vector(title_grams), self._vector(duty_grams)
+            best_text, best_score = None, 0.0
+            for entry in entries:
+                score = min(self._cosine(query_title, self._vector(entry["title"])),
+                            self._cosine(query_duties, self._vector(entry["duties"])))
+                if score > best_score:
+                    best_text, best_score = entry["text"], score
+            if best_score >= self.threshold:
+                self.hits += 1
+                return best_text, best_score
+            return None, best_score
+
+    def add(self, bucket: tuple, title: str, responsibilities: List[str], text: str) -> None:
+        with self._lock:
+            if self._documents >= self.max_entries * 2:
+                return
+            title_grams, duty_grams = self._grams(title, responsibilities, bucket)
+            for grams in (title_grams, duty_grams):
+                self._document_frequency.update(set(grams))
+                self._documents += 1
+            self._vocabulary.update(tokens(title))
+            self._buckets.setdefault(bucket, []).append({"title": title_grams, "duties": duty_grams, "text": text})
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+                "entries": self._documents // 2,
+                "threshold": self.threshold
+            }
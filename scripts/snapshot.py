@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Config and Template Snapshot for HR Document Generation
+Builds and loads a generated Python module holding the parsed configs, the
+role catalog and precompiled Jinja template code, so cold starts skip JSON
+parsing and template compilation
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+import marshal
+import pprint
+import importlib
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+sys.path.append(str(SCRIPTS_DIR))
+
+from role_catalog import build_role_catalog
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MODULE = "hr_snapshot"
+SNAPSHOT_PATH = SCRIPTS_DIR / f"{SNAPSHOT_MODULE}.py"
+SNAPSHOT_FORMAT = 1
+
+CONFIG_FILES = ("ai-prompts.json", "company-info.json", "job-roles.json")
+TEMPLATE_FILES = ("contract.md", "roles-responsibilities.md", "confirmation.md")
+
+# Jinja options shared by every entry point; compiled code is only valid for these
+ENV_OPTIONS = {"autoescape": False, "trim_blocks": True, "lstrip_blocks": True}
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+def source_paths(root: Path = REPO_ROOT) -> Dict[str, Path]:
+    """Every config and template the snapshot is built from, keyed by relative path"""
+    paths = {f"config/{name}": root / "config" / name for name in CONFIG_FILES}
+    paths.update({f"templates/{name}": root / "templates" / name for name in TEMPLATE_FILES})
+    return paths
+
+def source_hashes(root: Path = REPO_ROOT, missing_ok: bool = False) -> Dict[str, str]:
+    """Content hashes of the snapshot sources (missing files skipped if ``missing_ok``)"""
+    return {name: _sha256(path) for name, path in source_paths(root).items()
+            if not (missing_ok and not path.exists())}
+
+def build_snapshot_source(root: Path = REPO_ROOT) -> str:
+    """Render the snapshot module source"""
+    import jinja2
+    from jinja2 import Environment, FileSystemLoader
+
+    env = Environment(loader=FileSystemLoader(str(root / "templates")), **ENV_OPTIONS)
+
+    configs = {}
+    for name in CONFIG_FILES:
+        with open(root / "config" / name, 'r', encoding='utf-8') as f:
+            configs[name] = json.load(f)
+
+    template_sources, template_code, template_bytecode = {}, {}, {}
+    for name in TEMPLATE_FILES:
+        source, _, _ = env.loader.get_source(env, name)
+        filename = f"templates/{name}"
+        raw = env.compile(source, name, filename, raw=True)
+        template_sources[name] = source
+        template_code[name] = raw
+        template_bytecode[name] = marshal.dumps(compile(raw, filename, 'exec'))
+
+    def literal(value: Any) -> str:
+        return pprint.pformat(value, width=100, sort_dicts=False)
+
+    sections = [
+        '"""',
+        "Generated by scripts/build-snapshot.py -- do not edit.",
+        "Rebuild with: python scripts/build-snapshot.py",
+        '"""',
+        "",
+        f"SNAPSHOT_FORMAT = {SNAPSHOT_FORMAT}",
+        f"JINJA2_VERSION = {jinja2.__version__!r}",
+        f"PYTHON_VERSION = {tuple(sys.version_info[:2])!r}",
+        f"ENV_OPTIONS = {literal(ENV_OPTIONS)}",
+        f"SOURCE_HASHES = {literal(source_hashes(root))}",
+        f"CONFIGS = {literal(configs)}",
+        f"ROLE_CATALOG = {literal(build_role_catalog(configs['job-roles.json']))}",
+        f"TEMPLATE_SOURCES = {literal(template_sources)}",
+        f"TEMPLATE_CODE = {literal(template_code)}",
+        f"TEMPLATE_BYTECODE = {literal(template_bytecode)}",
+        ""
+    ]
+    return "\n".join(sections)
+
+def write_snapshot(root: Path = REPO_ROOT, path: Path = SNAPSHOT_PATH) -> Path:
+    """Build the snapshot module and write it to ``path``"""
+    source = build_snapshot_source(root)
+    tmp_path = path.with_suffix(".py.tmp")
+    tmp_path.write_text(source, encoding='utf-8')
+    os.replace(tmp_path, path)
+    return path
+
+def stale_sources(snapshot: Any, root: Path = REPO_ROOT, missing_ok: bool = False) -> List[str]:
+    """Sources whose content no longer matches the snapshot
+
+    With ``missing_ok`` only sources present on disk are compared, so a deployment
+    that ships the snapshot without the raw templates (see .vercelignore) uses it.
+    """
+    recorded = getattr(snapshot, "SOURCE_HASHES", {})
+    current = source_hashes(root, missing_ok)
+    names = set(current) if missing_ok else set(recorded) | set(current)
+    return sorted(name for name in names if recorded.get(name) != current.get(name))
+
+def load_snapshot(root: Path = REPO_ROOT) -> Optional[Any]:
+    """Import the snapshot module if it exists and matches the sources on disk"""
+    try:
+        snapshot = importlib.import_module(SNAPSHOT_MODULE)
+    except ImportError:
+        return None
+
+    if getattr(snapshot, "SNAPSHOT_FORMAT", None) != SNAPSHOT_FORMAT:
+        logger.warning("Ignoring snapshot with unsupported format; rebuild with scripts/build-snapshot.py")
+        return None
+    try:
+        stale = stale_sources(snapshot, root, missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Cannot verify snapshot sources: {e}")
+        return None
+    if stale:
+        logger.warning(f"Ignoring stale snapshot ({', '.join(stale)} changed); rebuild with scripts/build-snapshot.py")
+        return None
+    return snapshot
+
+def snapshot_template(snapshot: Any, env: Any, name: str) -> Optional[Any]:
+    """Build a Jinja template from precompiled snapshot code, or None if it cannot be used"""
+    import jinja2
+
+    if snapshot is None or name not in snapshot.TEMPLATE_CODE:
+        return None
+    if snapshot.JINJA2_VERSION != jinja2.__version__:
+        return None
+    if any(getattr(env, option) != value for option, value in snapshot.ENV_OPTIONS.items()):
+        return None
+
+    if tuple(snapshot.PYTHON_VERSION) == tuple(sys.version_info[:2]):
+        code = marshal.loads(snapshot.TEMPLATE_BYTECODE[name])
+    else:
+        code = compile(snapshot.TEMPLATE_CODE[name], f"templates/{name}", 'exec')
+    return env.template_class.from_code(env, code, env.make_globals(None), None)
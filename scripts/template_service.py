@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Template Service for HR Document Generation
+One process-wide source of compiled templates and raw template text
+"""
+
+import os
+import sys
+import time
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from markdown_sections import split_sections
+from metrics import record_cache
+from snapshot import ENV_OPTIONS, load_snapshot, snapshot_template
+
+DEFAULT_CHECK_INTERVAL = 1.0
+
+class _Entry:
+    """A template's source, compiled form and when its file was last checked"""
+
+    __slots__ = ("mtime_ns", "source", "template", "variables", "sections", "checked")
+
+    def __init__(self, mtime_ns: Optional[int], source: str, checked: float):
+        self.mtime_ns = mtime_ns
+        self.source = source
+        self.template = None
+        self.variables = None
+        self.sections = {}
+        self.checked = checked
+
+class TemplateService:
+    """Serves compiled Jinja templates and their raw source, reloading on mtime change
+
+    Compiled templates come from the prebuilt snapshot when the source matches
+    it, and otherwise from Jinja with a persistent ``FileSystemBytecodeCache``
+    so that restarts skip recompilation. Files are stat'ed at most once per
+    ``check_interval`` seconds.
+    """
+
+    def __init__(self, templates_dir: str = "templates", cache_dir: Optional[str] = None,
+                 check_interval: float = DEFAULT_CHECK_INTERVAL):
+        self.templates_dir = Path(templates_dir).resolve()
+        self.cache_dir = cache_dir or os.getenv('HR_TEMPLATE_CACHE_DIR') or os.path.join(
+            tempfile.gettempdir(), 'hr-template-cache')
+        self.check_interval = check_interval
+        self.snapshot = load_snapshot()
+        self._env = None
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def env(self):
+        """The shared Jinja environment (jinja2 is imported on first use)"""
+        if self._env is None:
+            from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._env = Environment(
+                loader=FileSystemLoader(str(self.templates_dir)),
+                bytecode_cache=FileSystemBytecodeCache(self.cache_dir),
+                **ENV_OPTIONS  # Markdown templates; no autoescaping
+            )
+        return self._env
+
+    def _snapshot_source(self, name: str) -> Optional[str]:
+        if self.snapshot is not None:
+            return self.snapshot.TEMPLATE_SOURCES.get(name)
+        return None
+
+    def _entry(self, name: str) -> _Entry:
+        """Return the current entry for ``name``, reloading it if the file changed"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and now - entry.checked < self.check_interval:
+                return entry
+
+            path = self.templates_dir / name
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                # Deployments may ship only the snapshot (see .vercelignore)
+                source = self._snapshot_source(name)
+                if source is None:
+                    raise
+                mtime_ns = None
+            else:
+                source = None
+
+            if entry is not None and entry.mtime_ns == mtime_ns:
+                entry.checked = now
+                return entry
+
+            if source is None:
+                source = path.read_text(encoding='utf-8')
+            entry = _Entry(mtime_ns, source, now)
+            self._entries[name] = entry
+            return entry
+
+    def get_source(self, name: str) -> str:
+        """Raw template text"""
+        return self._entry(name).source
+
+    def get_template(self, name: str) -> Any:
+        """Compiled template, reused until the file changes"""
+        with self._lock:
+            entry = self._entry(name)
+            record_cache("templates", entry.template is not None)
+            if entry.template is None:
+                entry.template = self._compile(name, entry)
+            return entry.template
+
+    def _compile(self, name: str, entry: _Entry) -> Any:
+        snapshot = self.snapshot
+        if snapshot is not None:
+            recorded = snapshot.SOURCE_HASHES.get(f"templates/{name}")
+            if recorded == hashlib.sha256(entry.source.encode('utf-8')).hexdigest():
+                template = snapshot_template(snapshot, self.env, name)
+                if template is not None:
+                    return template
+        if entry.mtime_ns is None:
+            return self.env.from_string(entry.source)
+        return self.env.get_template(name)
+
+    def referenced_variables(self, name: str) -> frozenset:
+        """Top-level context variables the template reads (static analysis, cached until reload)"""
+        from jinja2 import meta
+
+        with self._lock:
+            entry = self._entry(name)
+            if entry.variables is None:
+                entry.variables = frozenset(meta.find_undeclared_variables(self.env.parse(entry.source)))
+            return entry.variables
+
+    def section_templates(self, name: str, max_level: int = 3) -> List[Tuple[Any, frozenset, bool]]:
+        """The template split on headings up to ``max_level``, one entry per section
+        
+        Each entry is (compiled section, referenced variables, whether the section
+        source ends with a newline). A template whose blocks span a heading is kept
+        as a single section.
+        """
+        from jinja2 import meta, TemplateSyntaxError
+
+        with self._lock:
+            entry = self._entry(name)
+            if max_level not in entry.sections:
+                try:
+                    entry.sections[max_level] = [
+                        (self.env.from_string(source),
+                         frozenset(meta.find_undeclared_variables(self.env.parse(source))),
+                         source.endswith("\n"))
+                        for source in split_sections(entry.source, max_level)
+                    ]
+                except TemplateSyntaxError:
+                    entry.sections[max_level] = [(self.get_template(name), self.referenced_variables(name), False)]
+            return entry.sections[max_level]
+
+    def render_sections(self, template_name: str, max_level: int = 3, /, **context: Any) -> List[str]:
+        """Render ``template_name`` section by section; ``"".join`` equals ``render``"""
+        sections = self.section_templates(template_name, max_level)
+        rendered = []
+        for index, (template, _, newline) in enumerate(sections):
+            text = template.render(**context)
+            if newline and index < len(sections) - 1:
+                # Jinja drops a template's final newline; only the document's last one should go
+                text += "\n"
+            rendered.append(text)
+        return rendered
+
+    def render(self, template_name: str, /, **context: Any) -> str:
+        """Render ``template_name`` with ``context``"""
+        return self.get_template(template_name).render(**context)
+
+_services: Dict[str, TemplateService] = {}
+_services_lock = threading.Lock()
+
+def get_template_service(templates_dir: str = "templates") -> TemplateService:
+    """Process-wide template service for ``templates_dir``"""
+    key = str(Path(templates_dir).resolve())
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = TemplateService(templates_dir)
+        return service
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Token Budget Planner for HR Document Generation
+Local token estimates, input-sized max_tokens per call, prompt compaction, and predicted-vs-actual learning
+"""
+
+import os
+import re
+import sys
+import math
+import logging
+import textwrap
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import AI_BUDGET_TOKENS
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+
+# Completion size relative to the content being rewritten or reviewed: (ratio, floor tokens).
+# Call types not listed (job descriptions, KPI activities, slots) keep their route's fixed max_tokens.
+COMPLETION_PROFILES = {
+    "enhance_content": (1.15, 128),
+    "personalized_content": (1.2, 128),
+    "document": (1.2, 256),
+    "validate_document": (0.3, 200)
+}
+# Margin over the expected completion, so ordinary variation is not cut off
+HEADROOM = 1.3
+# Weight of each new observation in the learned ratio
+LEARNING_RATE = 0.2
+# Learned ratio grows by this factor after a truncated reply
+TRUNCATION_BACKOFF = 1.5
+
+# Context windows and output limits (tokens) of the routed models
+MODEL_LIMITS = {
+    "gpt-4": (8192, 4096),
+    "gpt-4o": (128000, 16384),
+    "gpt-4o-mini": (128000, 16384),
+    "gpt-3.5-turbo": (16385, 4096)
+}
+
+_encoders: Dict[str, Any] = {}
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """Tokens in ``text``: exact with tiktoken when installed, otherwise about four characters per token"""
+    try:
+        import tiktoken
+    except ImportError:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    encoder = _encoders.get(model or "")
+    if encoder is None:
+        try:
+            encoder = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding("cl100k_base")
+        except KeyError:
+            encoder = tiktoken.get_encoding("cl100k_base")
+        _encoders[model or ""] = encoder
+    return len(encoder.encode(text))
+
+def compact_prompt(text: str) -> str:
+    """Dedent a prompt, strip trailing spaces and collapse runs of blank lines"""
+    text = textwrap.dedent(text)
+    text = re.sub(r"[ \t]+\n", "\n", text)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+def dedupe_fields(fields: Dict[str, Any], context: str) -> str:
+    """``- Label: value`` lines for the fields whose value is set and not already spelled out in ``context``"""
+    lines = []
+    for label, value in fields.items():
+        value = str(value or "").strip()
+        # Short values (names, levels) are kept: they label the data even if they appear in the prompt
+        if not value or (len(value) > 24 and value in context):
+            continue
+        lines.append(f"- {label}: {value}")
+    return "\n".join(lines)
+
+def route_limits(route: Any) -> Tuple[Optional[int], Optional[int]]:
+    """Smallest context window and output limit among the models a route may call (None if unknown)"""
+    known = [MODEL_LIMITS[model] for model in route.models if model in MODEL_LIMITS]
+    if not known:
+        return None, None
+    return min(limit[0] for limit in known), min(limit[1] for limit in known)
+
+def fit_context(text: str, route: Any, reserved_tokens: int) -> str:
+    """Trim the middle of ``text`` so it plus ``reserved_tokens`` fits every model in the route"""
+    context, _ = route_limits(route)
+    if context is None:
+        return text
+    available = context - reserved_tokens
+    tokens = estimate_tokens(text, route.model)
+    if tokens <= available or available <= 0:
+        return text
+    keep = int(len(text) * available / tokens * 0.95)
+    head = keep * 2 // 3
+    logger.info(f"Trimmed about {tokens - available} tokens from a {route.call_type} prompt")
+    return text[:head] + "\n\n[...]\n\n" + text[len(text) - (keep - head):]
+
+def _profile_key(call_type: str) -> Optional[str]:
+    for key in (call_type, call_type.split(".")[0]):
+        if key in COMPLETION_PROFILES:
+            return key
+    return None
+
+class TokenBudget:
+    """Completion budgets sized from input length, corrected by the usage actually observed
+
+    ``completion_budget`` predicts ``ratio × content tokens × HEADROOM`` (at
+    least the profile's floor), capped by the route's ``max_tokens`` and the
+    output limit of every model it may call. ``record`` compares each reply's
+    completion tokens with the content it was sized from and moves the call
+    type's ratio toward what was observed; truncated replies raise it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ratios: Dict[str, float] = {}
+
+    def ratio(self, call_type: str) -> Optional[float]:
+        key = _profile_key(call_type)
+        if key is None:
+            return None
+        with self._lock:
+            return self._ratios.get(key, COMPLETION_PROFILES[key][0])
+
+    def expected_completion(self, call_type: str, content_tokens: float) -> Optional[float]:
+        """Expected completion tokens (no headroom), or None for fixed-budget call types"""
+        ratio = self.ratio(call_type)
+        if ratio is None:
+            return None
+        return max(content_tokens * ratio, COMPLETION_PROFILES[_profile_key(call_type)][1] / HEADROOM)
+
+    def completion_budget(self, route: Any, content: str) -> Tuple[int, int]:
+        """``(max_tokens, content tokens)`` for a call of ``route`` that rewrites or reviews ``content``"""
+        content_tokens = estimate_tokens(content, route.model)
+        ratio = self.ratio(route.call_type)
+        if ratio is None:
+            return route.max_tokens, content_tokens
+        floor = COMPLETION_PROFILES[_profile_key(route.call_type)][1]
+        budget = max(floor, math.ceil(content_tokens * ratio * HEADROOM))
+        output_limit = route_limits(route)[1] or route.max_tokens
+        return min(budget, route.max_tokens, output_limit), content_tokens
+
+    def record(self, call_type: str, content_tokens: int, max_tokens: int, response: Any) -> None:
+        """Learn from one reply: its completion tokens against the content it was sized from"""
+        key = _profile_key(call_type)
+        usage = getattr(response, 'usage', None)
+        completion = getattr(usage, 'completion_tokens', None)
+        if key is None or not completion or content_tokens <= 0:
+            return
+        truncated = getattr(response.choices[0], 'finish_reason', None) == "length"
+        AI_BUDGET_TOKENS.inc(content_tokens, call_type=call_type, kind="content")
+        AI_BUDGET_TOKENS.inc(max_tokens, call_type=call_type, kind="predicted")
+        AI_BUDGET_TOKENS.inc(completion, call_type=call_type, kind="actual")
+        observed = completion / content_tokens
+        with self._lock:
+            current = self._ratios.get(key, COMPLETION_PROFILES[key][0])
+            if truncated:
+                self._ratios[key] = max(current, observed) * TRUNCATION_BACKOFF
+            else:
+                self._ratios[key] = current + LEARNING_RATE * (observed - current)
+
+    def seed(self, stats: Dict[str, Dict[str, float]]) -> None:
+        """Start from ratios recorded by earlier runs (``ai-call-stats.json`` budget totals)"""
+        totals: Dict[str, list] = {}
+        for call_type, entry in stats.items():
+            key = _profile_key(call_type)
+            content = entry.get("budget_content_tokens") or 0
+            if key is None or content <= 0:
+                continue
+            pair = totals.setdefault(key, [0.0, 0.0])
+            pair[0] += entry.get("budget_actual_tokens") or 0
+            pair[1] += content
+        with self._lock:
+            for key, (actual, content) in totals.items():
+                if actual > 0:
+                    self._ratios.setdefault(key, actual / content)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {key: round(self._ratios.get(key, profile[0]), 3) for key, profile in COMPLETION_PROFILES.items()}
+
+_budget = TokenBudget()
+
+def get_token_budget() -> TokenBudget:
+    """Process-wide budget planner shared by the CLI and the web app"""
+    return _budget
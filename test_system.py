@@ -7,12 +7,60 @@ Demonstrates the functionality without requiring OpenAI API
 import os
 import sys
 import json
+import time
 from pathlib import Path
 from datetime import datetime
 
+import pytest
+
 # Add scripts directory to path
 sys.path.append('scripts')
 
+@pytest.fixture
+def generator_module(request):
+    """generate-documents.py loaded as a fresh module for the test"""
+    from benchmark import load_script
+    return load_script('generate-documents.py', f"generate_documents_{request.node.name}")
+
+@pytest.fixture
+def stub_generator(generator_module, tmp_path):
+    """Factory for HRDocumentGenerator instances with AI enabled against the zero-latency StubAIHelper"""
+    from benchmark import StubAIHelper
+
+    def make(output_dir=None, **kwargs):
+        generator = generator_module.HRDocumentGenerator(output_dir=str(output_dir or tmp_path / 'out'), **kwargs)
+        generator.ai_helper = StubAIHelper(latency=0)
+        generator.ai_enabled = True
+        return generator
+    return make
+
+@pytest.fixture
+def call_counter():
+    """Wrap methods of an object; the returned list gets the method name on every call"""
+    def count(target, *methods):
+        called = []
+        for method in methods:
+            original = getattr(target, method)
+            setattr(target, method,
+                    lambda *args, _name=method, _original=original, **kwargs: called.append(_name) or _original(*args, **kwargs))
+        return called
+    return count
+
+@pytest.fixture
+def fake_openai_server():
+    """Factory starting seeded fake OpenAI servers as ``(server, base_url)``; all are shut down after the test"""
+    from fake_openai_server import start_background
+    servers = []
+
+    def start(**options):
+        server, base_url = start_background(**{'seed': 1, **options})
+        servers.append(server)
+        return server, base_url
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
 def test_system_without_ai():
     """Test the system without AI integration"""
     print("🧪 Testing HR Automation System (Without AI)")
@@ -88,23 +136,23 @@ def test_system_without_ai():
             }
         }
         
-        # Test Jinja2 template rendering
-        from jinja2 import Environment, FileSystemLoader
+        # Test Jinja2 template rendering through the shared template service
+        from template_service import get_template_service
         
-        env = Environment(loader=FileSystemLoader('templates'))
+        templates = get_template_service('templates')
         
         # Test contract template
-        contract_template = env.get_template('contract.md')
+        contract_template = templates.get_template('contract.md')
         contract_content = contract_template.render(**employee_data)
         print("✅ Contract template rendered successfully")
         
         # Test roles template
-        roles_template = env.get_template('roles-responsibilities.md')
+        roles_template = templates.get_template('roles-responsibilities.md')
         roles_content = roles_template.render(**employee_data)
         print("✅ Roles & responsibilities template rendered successfully")
         
         # Test confirmation template
-        confirmation_template = env.get_template('confirmation.md')
+        confirmation_template = templates.get_template('confirmation.md')
         confirmation_content = confirmation_template.render(**employee_data)
         print("✅ Confirmation letter template rendered successfully")
         
@@ -150,6 +198,715 @@ def test_system_without_ai():
     
     return True
 
+def test_sharded_output_manifest(tmp_path):
+    """Documents land in the sharded tree and are indexed in the manifest"""
+    from manifest import DocumentManifest, employee_key, shard_path
+
+    assert shard_path(employee_key('ID123456')) != shard_path(employee_key('ID789012'))
+    # Without an ID, same-name hires are told apart by their row details (and keep a stable key)
+    marketing, operations = {'team': 'Marketing'}, {'team': 'Operations'}
+    assert employee_key('ID Number', 'Jane Doe', marketing).startswith('name-Jane Doe-')
+    assert employee_key('ID Number', 'Jane Doe', marketing) == employee_key(None, 'Jane Doe', dict(marketing))
+    assert employee_key('ID Number', 'Jane Doe', marketing) != employee_key('ID Number', 'Jane Doe', operations)
+
+    manifest = DocumentManifest(str(tmp_path / 'manifest.sqlite'))
+    for employee_id, name, team in [('ID1', 'Jane Doe', 'Marketing'), ('ID2', 'Jane Doe', 'Operations')]:
+        documents = {'contract': f'Contract for {employee_id}', 'confirmation': 'Letter'}
+        paths = {doc_type: str(shard_path(employee_id) / f'{doc_type}.md') for doc_type in documents}
+        manifest.record(employee_id, name, team, 'Associate', documents, paths,
+                        {'contract': {'valid': True, 'issues': []}})
+
+    # Same name, different IDs: both kept
+    assert len(manifest.find_by_name('Jane Doe')) == 4
+    contracts = manifest.list_documents(doc_type='contract', team='Marketing')
+    assert [row['employee_id'] for row in contracts] == ['ID1']
+    assert contracts[0]['valid'] == 1
+    manifest.close()
+
+def test_benchmark_suite_smoke():
+    """Benchmark suite runs every stage against the stub AI and reports percentiles"""
+    from benchmark import run_benchmarks
+
+    results = run_benchmarks(iterations=3, sizes=[3])
+    for stage in ('generate_employee_data', 'render.contract.md', 'validate_documents', 'save_documents'):
+        assert results['stages'][stage]['count'] == 3
+        assert results['stages'][stage]['p95_ms'] >= results['stages'][stage]['p50_ms']
+    assert results['batch']['3']['errors'] == 0
+    assert results['batch']['3']['ai_calls'] > 0
+
+def test_fake_openai_server_round_trip(fake_openai_server):
+    """AIHelper talks to the local fake server through OPENAI_BASE_URL-style configuration"""
+    from ai_helper import AIHelper
+
+    server, base_url = fake_openai_server(latency='fixed:0', completion_tokens='fixed:20')
+    helper = AIHelper(api_key='fake', base_url=base_url)
+    description = helper.generate_job_description('Associate', 'Marketing', 'Associate', 'Mereka', ['Content'])
+    assert description and 'Associate in the Marketing team' not in description  # not the fallback
+
+    stream = helper.client.chat.completions.create(
+        model='gpt-4o-mini', messages=[{'role': 'user', 'content': 'hi'}], max_tokens=5, stream=True)
+    chunks = [c.choices[0].delta.content for c in stream if c.choices and c.choices[0].delta.content]
+    assert len(chunks) == 5
+    assert server.state.snapshot()['streamed'] == 1
+
+def test_profiler_spans_and_trace(tmp_path):
+    """Profiler aggregates spans per stage and writes a Chrome trace; the null profiler records nothing"""
+    from profiling import Profiler, NULL_PROFILER
+
+    profiler = Profiler()
+    for employee in ('A', 'B'):
+        with profiler.span('render.contract', employee):
+            pass
+    rows = {row['stage']: row for row in profiler.aggregate()}
+    assert rows['render.contract']['count'] == 2
+
+    profiler.write_chrome_trace(str(tmp_path / 'trace.json'))
+    events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+    assert {e['args']['employee'] for e in events} == {'A', 'B'}
+
+    with NULL_PROFILER.span('render.contract', 'A'):
+        pass
+    assert not NULL_PROFILER.enabled
+
+def test_metrics_endpoint():
+    """The Flask app exposes request, document and fallback metrics in Prometheus text format"""
+    from metrics import Registry
+    import app as hr_app
+
+    registry = Registry()
+    latency = registry.histogram('test_latency_seconds', 'Test latency', ('endpoint',), buckets=(0.1, 1.0))
+    latency.observe(0.05, endpoint='/x')
+    latency.observe(0.5, endpoint='/x')
+    text = registry.render()
+    assert 'test_latency_seconds_bucket{endpoint="/x",le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{endpoint="/x",le="+Inf"} 2' in text
+
+    client = hr_app.app.test_client()
+    client.post('/generate-documents', json={
+        'employeeName': 'Test Employee', 'jobTitle': 'Associate', 'team': 'Marketing',
+        'careerLevel': 'Associate', 'salary': 'RM 5000', 'startDate': '2025-03-15',
+        'reportingTo': 'Manager', 'workLocation': 'Remote', 'employeeId': 'TEST123',
+        'jobDescription': 'Test', 'documents': ['confirmation']
+    })
+    body = client.get('/metrics').get_data(as_text=True)
+    assert 'hr_http_requests_total{endpoint="/generate-documents",method="POST",status="200"}' in body
+    assert 'hr_document_generation_duration_seconds_count{document_type="confirmation"}' in body
+
+def test_startup_import_time():
+    """Startup-sensitive entry points do not import heavy dependencies (-X importtime)"""
+    from benchmark import run_startup_benchmarks
+
+    for target, result in run_startup_benchmarks().items():
+        print(f"   {target}: {result['import_ms']:.1f} ms of imports, {result['wall_ms']:.1f} ms wall")
+        assert result['returncode'] == 0, target
+        assert result['unexpected_imports'] == [], f"{target} imported {result['unexpected_imports']}"
+
+def test_snapshot_matches_sources():
+    """The prebuilt snapshot is current and renders exactly like the disk templates"""
+    from jinja2 import Environment, FileSystemLoader
+    from snapshot import ENV_OPTIONS, TEMPLATE_FILES, load_snapshot, snapshot_template
+    import app as hr_app
+
+    snapshot = load_snapshot()
+    assert snapshot is not None, "Snapshot is stale or missing; run: python scripts/build-snapshot.py"
+    with open('config/job-roles.json', 'r') as f:
+        assert snapshot.CONFIGS['job-roles.json'] == json.load(f)
+
+    env = Environment(loader=FileSystemLoader('templates'), **ENV_OPTIONS)
+    context = hr_app.build_employee_context({
+        'employeeName': 'Test Employee', 'jobTitle': 'Associate', 'team': 'Marketing',
+        'careerLevel': 'Associate', 'salary': 'RM 5000', 'startDate': '2025-03-15',
+        'reportingTo': 'Manager', 'workLocation': 'Remote', 'employeeId': 'TEST123',
+        'jobDescription': 'Test'
+    })
+    for name in TEMPLATE_FILES:
+        precompiled = snapshot_template(snapshot, env, name)
+        assert precompiled.render(**context) == env.get_template(name).render(**context)
+
+def test_template_service_reload(tmp_path):
+    """The template service caches compiled templates, writes bytecode and reloads edited files"""
+    from template_service import TemplateService
+
+    (tmp_path / 'templates').mkdir()
+    template_path = tmp_path / 'templates' / 'note.md'
+    template_path.write_text('Hello {{ name }}')
+    service = TemplateService(str(tmp_path / 'templates'), cache_dir=str(tmp_path / 'cache'), check_interval=0)
+
+    assert service.render('note.md', name='Ada') == 'Hello Ada'
+    assert service.get_template('note.md') is service.get_template('note.md')
+    assert list((tmp_path / 'cache').iterdir()), "bytecode cache was not written"
+
+    template_path.write_text('Goodbye {{ name }}')
+    stat = template_path.stat()
+    os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert service.get_source('note.md') == 'Goodbye {{ name }}'
+    assert service.render('note.md', name='Ada') == 'Goodbye Ada'
+
+def test_config_service_hot_reload(tmp_path):
+    """Config edits are picked up after the check interval and swapped in as a new version"""
+    from config_service import ConfigService
+
+    for name in ('ai-prompts.json', 'company-info.json', 'job-roles.json'):
+        (tmp_path / name).write_text(Path('config', name).read_text())
+    service = ConfigService(str(tmp_path), check_interval=3600)
+    first = service.current()
+    assert 'Associate' in first.role_catalog['career_levels']
+
+    job_roles = json.loads((tmp_path / 'job-roles.json').read_text())
+    job_roles['career_levels']['Fellow'] = {'kpi_breakdown': {'Vision': 100}, 'responsibilities': ['Research']}
+    (tmp_path / 'job-roles.json').write_text(json.dumps(job_roles))
+    stat = (tmp_path / 'job-roles.json').stat()
+    os.utime(tmp_path / 'job-roles.json', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert service.current() is first  # not re-checked within the interval
+
+    service.check_interval = 0
+    second = service.current()
+    assert second.version == first.version + 1
+    assert second.role_catalog['career_levels']['Fellow']['kpi_breakdown']['Vision'] == 100
+    assert 'Fellow' not in first.role_catalog['career_levels']
+
+    (tmp_path / 'job-roles.json').write_text('{ broken')
+    os.utime(tmp_path / 'job-roles.json', ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    assert 'Fellow' in service.current().job_roles['career_levels']  # invalid edit keeps the last good config
+
+def test_confirmation_only_skips_kpi_ai(stub_generator, call_counter):
+    """Only the context fields the requested templates reference trigger AI calls"""
+    generator = stub_generator()
+    called = call_counter(generator.ai_helper, 'generate_job_description', 'generate_kpi_activities')
+
+    assert 'vision_activities' not in generator.required_fields(['confirmation'])
+    result = generator.generate_for_employee({'name': 'Test Employee', 'employee_id': 'T1'}, ['confirmation'])
+    assert list(result['documents']) == ['confirmation']
+    assert called == []
+
+    generator.generate_for_employee({'name': 'Test Employee', 'employee_id': 'T1'}, ['roles-responsibilities'])
+    assert called.count('generate_kpi_activities') == 6 and 'generate_job_description' not in called
+
+def test_rule_based_validation_tiers(generator_module, stub_generator):
+    """Local rules catch broken documents; only flagged (or sampled) documents reach AI review"""
+    from document_rules import validate_document
+
+    broken = "\n".join([
+        "# Letter of Confirmation", "Dear {{ employee_name }},",
+        "## Role Confirmation Details", "- **Effective Date**: 01/03/2025",
+        "## Key Responsibilities", "In your confirmed role, you will be responsible for:",
+        "## Next Steps", "1. **Performance Review**: Your next performance review will be scheduled for 01/04/2025",
+        "## Strategic Area KPI Breakdown", "### Vision (VIS) : 30%", "### Delivery (DEL) : 30%",
+        "- **Salary**: five thousand; and", "x" * 100
+    ])
+    codes = {issue['code'] for issue in validate_document(broken, 'confirmation')['issues']}
+    assert codes == {'unrendered_placeholder', 'missing_section', 'empty_list', 'review_date',
+                     'kpi_total', 'salary_format'}
+
+    generator = stub_generator(ai_review_rate=0)
+    data = generator.generate_employee_data({'name': 'Test Employee', 'salary': 'RM 5,000', 'start_date': '01/03/2025'})
+    documents = {doc: generator.templates.render(name, **data) for doc, name in generator_module.DOCUMENT_TEMPLATES.items()}
+
+    calls = generator.ai_helper.calls
+    results = generator.validate_documents(documents)
+    assert all(result['valid'] and result['checked_by'] == 'rules' for result in results.values()), results
+    assert generator.ai_helper.calls == calls
+
+    results = generator.validate_documents({'confirmation': broken})
+    assert results['confirmation']['checked_by'] == 'rules+ai' and not results['confirmation']['valid']
+    assert generator.ai_helper.calls == calls + 1
+
+def test_sectioned_enhancement(fake_openai_server):
+    """Enhancement runs per Markdown section, caches by content and keeps truncated sections intact"""
+    from ai_helper import AIHelper
+    from markdown_sections import split_sections
+
+    document = "Preamble text\n\n## Pay\n\nSalary is RM 5000.\n\n### Detail\n\nMonthly.\n\n## Leave\n\n14 days.\n"
+    assert split_sections(document) == ["Preamble text\n\n", "## Pay\n\nSalary is RM 5000.\n\n### Detail\n\nMonthly.\n\n",
+                                         "## Leave\n\n14 days.\n"]
+
+    server, base_url = fake_openai_server(latency='fixed:0.2', completion_tokens='fixed:10')
+    helper = AIHelper(api_key='fake', base_url=base_url)
+    enhanced = helper.enhance_content(document, 'professional_tone')
+    stats = server.state.snapshot()
+    assert stats['requests'] == 3 and stats['max_in_flight'] > 1  # sections run concurrently
+    assert enhanced != document and enhanced.endswith("\n")
+    assert helper.enhance_content(document, 'professional_tone') == enhanced
+    assert server.state.snapshot()['requests'] == 3  # served from the section cache
+    # Replies are reassembled in section order (each section's rewrite is deterministic)
+    one_by_one = AIHelper(api_key='fake', base_url=base_url)
+    assert "".join(one_by_one.enhance_content(section, 'professional_tone')
+                   for section in split_sections(document)) == enhanced
+
+    _, base_url = fake_openai_server(latency='fixed:0', completion_tokens='fixed:5000')
+    helper = AIHelper(api_key='fake', base_url=base_url)
+    assert helper.enhance_content(document, 'professional_tone') == document
+
+def test_boilerplate_sections_enhanced_once(generator_module, stub_generator):
+    """Company-invariant contract sections are enhanced once and reused for later employees"""
+    generator = stub_generator()
+
+    sections = generator.templates.section_templates('contract.md')
+    invariant = sum(variables <= generator_module.COMPANY_FIELDS for _, variables, _ in sections)
+    assert invariant > len(sections) / 2
+
+    sent = []
+    for name in ('Employee One', 'Employee Two', 'Employee Three'):
+        data = generator.generate_employee_data({'name': name, 'employee_id': name}, {'employee_name'})
+        before = generator.ai_helper.calls
+        contract = generator.generate_contract(data)
+        sent.append(generator.ai_helper.calls - before)
+        assert contract == generator.templates.render('contract.md', **data)  # stub rewrites are identity
+    assert sent == [len(sections), len(sections) - invariant, len(sections) - invariant]
+
+def test_slot_filling_renders_template_locally(monkeypatch, tmp_path, fake_openai_server):
+    """Slot mode asks the model only for free-text fields and renders the template around them"""
+    import openai
+    import app as hr_app
+
+    server, base_url = fake_openai_server(latency='fixed:0', completion_tokens='fixed:60')
+    monkeypatch.setenv('HR_ROLE_CACHE_FILE', str(tmp_path / 'role-content-cache.json'))
+    monkeypatch.setattr(hr_app, '_role_cache', None)
+    monkeypatch.setattr(hr_app, 'DEMO_MODE', False)
+    monkeypatch.setattr(hr_app, '_openai_client', openai.OpenAI(api_key='fake', base_url=base_url))
+    response = hr_app.app.test_client().post('/generate-documents', json={
+        'employeeName': 'Test Employee', 'jobTitle': 'Associate', 'team': 'Marketing',
+        'careerLevel': 'Associate', 'salary': 'RM 5000', 'startDate': '2025-03-15',
+        'reportingTo': 'Manager', 'workLocation': 'Remote', 'employeeId': 'TEST123',
+        'jobDescription': 'Test', 'documents': ['confirmation', 'roles']
+    })
+    documents = {doc['type']: doc['content'] for doc in response.get_json()['documents']}
+    stats = server.state.snapshot()
+
+    assert stats['requests'] == 2 and stats['completion_tokens'] == 120
+    context = hr_app.build_employee_context({
+        'employeeName': 'Test Employee', 'jobTitle': 'Associate', 'team': 'Marketing',
+        'careerLevel': 'Associate', 'salary': 'RM 5000', 'startDate': '2025-03-15',
+        'reportingTo': 'Manager', 'workLocation': 'Remote', 'employeeId': 'TEST123', 'jobDescription': 'Test'
+    })
+    plain = hr_app.render_template_with_context('confirmation.md', context)
+    confirmation = documents['Confirmation']
+    assert confirmation != plain and len(confirmation) > len(plain)
+    assert confirmation.startswith(plain.split('## Role Confirmation Details')[0].rstrip('\n'))
+    assert '{{' not in documents['Roles Responsibilities'] and '### Vision (VIS)' in documents['Roles Responsibilities']
+
+def test_model_routing_escalation(fake_openai_server):
+    """Routes merge default < prefix < call type, and rejected replies escalate along the fallback chain"""
+    from ai_helper import AIHelper
+    from model_routing import resolve_route
+
+    prompts = {"model_routing": {
+        "default": {"model": "small", "max_tokens": 100, "fallback": ["large"]},
+        "slots": {"max_tokens": 600, "timeout": 5},
+        "slots.contract": {"max_tokens": 400}
+    }}
+    route = resolve_route(prompts, "slots.contract")
+    assert (route.model, route.max_tokens, route.timeout, route.models) == ("small", 400, 5, ["small", "large"])
+    assert resolve_route(prompts, "slots.confirmation").max_tokens == 600
+    assert resolve_route({}, "anything").models == ["gpt-4o-mini"]
+
+    for tokens, expected_requests in (('fixed:2', 2), ('fixed:40', 1)):
+        server, base_url = fake_openai_server(latency='fixed:0', completion_tokens=tokens)
+        helper = AIHelper(api_key='fake', base_url=base_url)
+        assert helper.route("job_description").models == ["gpt-4o-mini", "gpt-4o"]
+        description = helper.generate_job_description("Associate", "Marketing", "Associate", "Co", ["Test"])
+        assert description and server.state.snapshot()['requests'] == expected_requests
+
+def test_cohort_plan_dedupes_context_units(tmp_path, stub_generator, call_counter):
+    """The batch plan collects each context unit once, calls nothing, and runs the units before the documents"""
+    from benchmark import write_csv
+
+    generator = stub_generator()
+    called = call_counter(generator.ai_helper, 'generate_job_description', 'generate_kpi_activities')
+
+    csv_path = tmp_path / 'cohort.csv'
+    write_csv([{'name': f'Employee {i}', 'employee_id': f'E{i}', 'job_title': 'Associate', 'team': 'Marketing',
+                'career_level': 'Associate', 'salary': 'RM 5000', 'start_date': '01/03/2025'} for i in range(4)], csv_path)
+    documents = ['contract', 'roles-responsibilities']
+    batch = generator.read_batch(str(csv_path))
+    plan = generator.plan_batch(batch.employees, documents)
+    assert generator.ai_helper.calls == 0 and plan.renders == 8
+    assert sorted(unit[0] for unit in plan.units) == ['job_description'] + ['kpi_activities'] * 6
+    assert plan.requested_calls > plan.ai_calls == plan.totals()['calls']
+    assert plan.totals()['cost'] > 0 and plan.totals()['seconds'] > 0
+
+    reads = []
+    generator.read_batch = lambda csv_file: reads.append(csv_file)
+    results = generator.generate_batch(str(csv_path), documents, plan, batch=batch)
+    assert not reads, "the CSV already read for the plan is reused"
+    assert all('error' not in result for result in results)
+    assert called.count('generate_job_description') == 1 and called.count('generate_kpi_activities') == 6
+
+def test_batch_progress_modes(tmp_path, capsys, generator_module):
+    """Batch progress is one display for the whole run; quiet mode prints nothing and JSON lines carry rates"""
+    import io
+    from batch_progress import JsonLinesProgress
+    from benchmark import write_csv
+
+    stream = io.StringIO()
+    with JsonLinesProgress(2, 3, stream=stream, interval=0) as progress:
+        progress.advance(3)
+        progress.advance(0, error="bad date", employee="Employee 2")
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [event['event'] for event in events] == ['start', 'progress', 'error', 'progress', 'done']
+    assert events[-1]['employees_done'] == 2 and events[-1]['documents_done'] == 3 and events[-1]['errors'] == 1
+    assert events[2]['employee'] == 'Employee 2' and 'eta_s' in events[1]
+
+    generator = generator_module.HRDocumentGenerator(output_dir=str(tmp_path / 'out'))
+    generator.ai_enabled = False
+    csv_path = tmp_path / 'cohort.csv'
+    write_csv([{'name': f'Employee {i}', 'employee_id': f'E{i}', 'start_date': '01/03/2025'} for i in range(3)], csv_path)
+    capsys.readouterr()
+    results = generator.generate_batch(str(csv_path), progress='quiet')
+    assert len(results) == 3 and all('error' not in result for result in results)
+    assert capsys.readouterr().out == ''
+
+def test_batch_preflight_rejects_bad_rows(tmp_path, stub_generator):
+    """Pre-flight reports every bad row at once, normalizes the rest, and only clean rows are generated"""
+    import re
+
+    csv_path = tmp_path / 'cohort.csv'
+    csv_path.write_text(
+        "name,job_title,team,career_level,salary,start_date,employee_id\n"
+        " Clean One ,Associate,Marketing,Associate,\"RM 5,000\",1/3/2025,E1\n"
+        "Bad Date,Associate,Marketing,Associate,RM 5000,31/02/2025,E2\n"
+        "Bad Role,Associate,Nowhere,Boss,five,01/03/2025,E3\n"
+        "Dup A,Associate,Marketing,Associate,RM 5000,01/03/2025,E4\n"
+        "Dup B,Associate,Marketing,Associate,RM 5000,01/03/2025,E4\n"
+        "No Extras,,,,,,E5\n", encoding='utf-8')
+
+    generator = stub_generator()
+
+    batch = generator.read_batch(str(csv_path))
+    assert [employee['name'] for employee in batch.employees] == ['Clean One', 'No Extras']
+    clean = batch.employees[0]
+    assert (clean['start_date'], clean['end_date'], clean['next_review_date']) == ('01/03/2025', '01/03/2026', '30/05/2025')
+    assert 'salary' not in batch.employees[1]  # NaN cells are dropped, not passed on as "nan"
+    assert {(issue['row'], issue['field']) for issue in batch.issues} == {
+        (3, 'start_date'), (4, 'team'), (4, 'career_level'), (4, 'salary'), (5, 'employee_id'), (6, 'employee_id')}
+
+    results = generator.generate_batch(str(csv_path), progress='quiet')
+    assert sum('error' in result for result in results) == 4
+    generated = [result for result in results if 'error' not in result]
+    assert len(generated) == 2 and not re.search(r"\bnan\b", generated[1]['documents']['contract'])
+    assert generator.ai_helper.calls > 0
+
+    # Rows without a name or ID are rejected for the name only, not as duplicates of each other
+    blank_path = tmp_path / 'blank.csv'
+    blank_path.write_text(
+        "name,job_title,team,career_level,salary,start_date,employee_id\n"
+        ",Associate,Marketing,Associate,RM 5000,01/03/2025,\n"
+        ",Associate,Marketing,Associate,RM 5000,01/03/2025,\n"
+        "employee,Associate,Marketing,Associate,RM 5000,01/03/2025,\n"
+        "Jane Doe,Associate,Marketing,Associate,RM 5000,01/03/2025,\n"
+        "Jane Doe,Associate,Operations,Associate,RM 5000,01/03/2025,\n"
+        "Jane Doe,Associate,Operations,Associate,RM 5000,01/03/2025,\n", encoding='utf-8')
+    batch = generator.read_batch(str(blank_path))
+    assert [employee['name'] for employee in batch.employees] == ['employee', 'Jane Doe']
+    assert {(issue['row'], issue['field']) for issue in batch.issues} == {
+        (2, 'name'), (3, 'name'), (6, 'employee_id'), (7, 'employee_id')}
+    # Same-name hires without IDs are saved side by side, not over each other
+    hires_path = tmp_path / 'hires.csv'
+    hires_path.write_text(
+        "name,job_title,team,career_level,start_date\n"
+        "Jane Doe,Associate,Marketing,Associate,01/03/2025\n"
+        "Jane Doe,Associate,Operations,Associate,01/03/2025\n", encoding='utf-8')
+    results = generator.generate_batch(str(hires_path), ['confirmation'], progress='quiet')
+    assert len({result['output_directory'] for result in results}) == 2
+    assert len(generator.manifest.find_by_name('Jane Doe')) == 2
+
+def test_sharded_batch_and_merge(tmp_path, generator_module):
+    """Shards partition a batch deterministically by employee ID and merge back into one manifest and summary"""
+    from benchmark import write_csv
+    from manifest import DocumentManifest
+    from sharding import merge_shards, parse_shard
+
+    assert parse_shard('2/4') == (2, 4)
+    for bad in ('0/4', '5/4', '1-4'):
+        try:
+            parse_shard(bad)
+            assert False, bad
+        except ValueError:
+            pass
+
+    csv_path = tmp_path / 'cohort.csv'
+    write_csv([{'name': f'Employee {i}', 'employee_id': f'E{i}', 'start_date': '01/03/2025'} for i in range(12)], csv_path)
+    output = tmp_path / 'out'
+    owned = []
+    for index in (1, 2, 3):
+        generator = generator_module.HRDocumentGenerator(output_dir=str(output), shard=(index, 3))
+        generator.ai_enabled = False
+        results = generator.generate_batch(str(csv_path), ['confirmation'], progress='quiet')
+        generator.manifest.close()
+        owned.append({result['employee_data']['employee_id'] for result in results})
+        assert owned[-1] == {employee['employee_id'] for employee in generator.read_batch(str(csv_path)).employees}
+    assert sum(map(len, owned)) == 12 and set().union(*owned) == {f'E{i}' for i in range(12)}
+
+    merged = merge_shards(str(output))
+    assert merged['shards'] == ['1/3', '2/3', '3/3'] and merged['missing_shards'] == []
+    assert sorted(row['employee_id'] for row in merged['employees']) == sorted(f'E{i}' for i in range(12))
+    manifest = DocumentManifest(str(output / 'manifest.sqlite'))
+    assert len(manifest.list_documents('confirmation')) == 12
+    manifest.close()
+
+def test_ai_scheduler_prioritizes_interactive():
+    """Bulk calls stay within their share of slots, and queued interactive calls overtake a bulk backlog"""
+    import threading
+    from ai_scheduler import AIScheduler
+
+    def wait_until(predicate):
+        deadline = time.time() + 10
+        while not predicate():
+            assert time.time() < deadline, "scheduler never reached the expected state"
+            time.sleep(0.005)
+
+    scheduler = AIScheduler(max_concurrency=4, bulk_share=0.5)
+    peak, lock, gate = [0], threading.Lock(), threading.Event()
+
+    def bulk_call():
+        with scheduler.slot('bulk'):
+            with lock:
+                peak[0] = max(peak[0], scheduler.snapshot()['in_flight']['bulk'])
+            gate.wait(10)
+
+    batch = [threading.Thread(target=bulk_call) for _ in range(16)]
+    for thread in batch:
+        thread.start()
+    wait_until(lambda: scheduler.snapshot()['queued']['bulk'] == 14)
+    # Bulk holds its two slots; the other two stay free, so interactive calls start without queueing
+    for _ in range(2):
+        scheduler.acquire('interactive')
+    state = scheduler.snapshot()
+    assert state['in_flight'] == {'interactive': 2, 'bulk': 2} and state['queued']['bulk'] == 14
+    for _ in range(2):
+        scheduler.release('interactive')
+    gate.set()
+    for thread in batch:
+        thread.join()
+    assert peak[0] == 2
+
+    scheduler = AIScheduler(max_concurrency=1, bulk_share=1)
+    order = []
+
+    def call(priority):
+        with scheduler.slot(priority):
+            order.append(priority)
+
+    scheduler.acquire('bulk')
+    queued = [threading.Thread(target=call, args=('bulk',)) for _ in range(3)]
+    for thread in queued:
+        thread.start()
+    wait_until(lambda: scheduler.snapshot()['queued']['bulk'] == 3)
+    queued.append(threading.Thread(target=call, args=('interactive',)))
+    queued[-1].start()
+    wait_until(lambda: scheduler.snapshot()['queued']['interactive'] == 1)
+    scheduler.release('bulk')
+    for thread in queued:
+        thread.join()
+    assert order == ['interactive', 'bulk', 'bulk', 'bulk']
+
+def test_shared_openai_client_pool(fake_openai_server):
+    """AI helpers for the same key and server share one client and connection pool, sized to the scheduler"""
+    from ai_helper import AIHelper
+    from openai_pool import build_http_client, pool_size, shared_client
+    from ai_scheduler import get_scheduler
+
+    assert pool_size() == get_scheduler().max_concurrency
+    _, base_url = fake_openai_server(latency='fixed:0')
+    first, second = AIHelper(api_key='fake', base_url=base_url), AIHelper(api_key='fake', base_url=base_url)
+    assert first.client is second.client is shared_client('fake', base_url)
+    assert shared_client('other', base_url) is not first.client
+    assert first.generate_job_description("Associate", "Marketing", "Associate", "Co", ["Test"])
+
+    http_client = build_http_client()
+    try:
+        import httpx
+    except ImportError:
+        assert http_client is None
+    else:
+        assert isinstance(http_client, httpx.Client)
+        assert first.client._client is shared_client('other', base_url)._client
+
+def test_web_job_cancellation(monkeypatch, tmp_path, fake_openai_server):
+    """DELETE /jobs/<id> and a newer request from the same session free the worker of an in-flight AI call"""
+    import threading
+    import openai
+    import app as hr_app
+    from ai_scheduler import get_scheduler
+    from metrics import AI_CALLS_IN_FLIGHT, AI_CANCELLED, JOBS_CANCELLED
+
+    server, base_url = fake_openai_server(latency='fixed:1.5')
+    monkeypatch.setenv('HR_ROLE_CACHE_FILE', str(tmp_path / 'role-content-cache.json'))
+    monkeypatch.setattr(hr_app, '_role_cache', None)
+    monkeypatch.setattr(hr_app, 'DEMO_MODE', False)
+    monkeypatch.setattr(hr_app, '_openai_client', openai.OpenAI(api_key='fake', base_url=base_url, max_retries=0))
+    employee = {
+        'employeeName': 'Test Employee', 'jobTitle': 'Associate', 'team': 'Marketing',
+        'careerLevel': 'Associate', 'salary': 'RM 5000', 'startDate': '2025-03-15',
+        'reportingTo': 'Manager', 'workLocation': 'Remote', 'employeeId': 'TEST123',
+        'jobDescription': 'Test', 'documents': ['confirmation', 'roles']
+    }
+    results = {}
+
+    def post(job_id, session=None):
+        headers = {'X-Job-Id': job_id, **({'X-Session-Id': session} if session else {})}
+        response = hr_app.app.test_client().post('/generate-documents', json=employee, headers=headers)
+        results[job_id] = (response.status_code, response.get_json())
+
+    def wait_for_requests(count):
+        deadline = time.time() + 5
+        while server.state.snapshot()['requests'] < count and time.time() < deadline:
+            time.sleep(0.01)
+
+    in_flight = AI_CANCELLED.value(stage='in_flight')
+    deleted = JOBS_CANCELLED.value(reason='deleted')
+    superseded = JOBS_CANCELLED.value(reason='superseded')
+    first = threading.Thread(target=post, args=('job-1',))
+    first.start()
+    wait_for_requests(1)
+    assert hr_app.app.test_client().delete('/jobs/job-1').status_code == 200
+    first.join()
+    assert hr_app.app.test_client().delete('/jobs/job-1').status_code == 404
+    # The abandoned call still holds its scheduler slot and in-flight count until it really ends
+    assert get_scheduler().snapshot()['in_flight']['interactive'] == 1
+    assert AI_CALLS_IN_FLIGHT.value() == 1
+
+    older = threading.Thread(target=post, args=('job-2', 'tab'))
+    older.start()
+    wait_for_requests(2)
+    newer = threading.Thread(target=post, args=('job-3', 'tab'))
+    newer.start()
+    older.join()
+    newer.join()
+    deadline = time.time() + 5
+    while get_scheduler().snapshot()['in_flight']['interactive'] and time.time() < deadline:
+        time.sleep(0.01)
+    assert AI_CALLS_IN_FLIGHT.value() == 0
+
+    status, body = results['job-1']
+    assert status == 409 and body['reason'] == 'deleted' and body['job_id'] == 'job-1'
+    assert results['job-2'][0] == 409 and results['job-2'][1]['reason'] == 'superseded'
+    assert results['job-3'][0] == 200 and results['job-3'][1]['job_id'] == 'job-3'
+    assert AI_CANCELLED.value(stage='in_flight') == in_flight + 2
+    assert JOBS_CANCELLED.value(reason='deleted') == deleted + 1
+    assert JOBS_CANCELLED.value(reason='superseded') == superseded + 1
+    assert hr_app.JOBS.active() == 0
+
+def test_role_warmup_persists_role_content(monkeypatch, tmp_path, stub_generator, fake_openai_server):
+    """Warm-up fills the persisted role cache, so later runs and the first web request are cache hits"""
+    import openai
+    import app as hr_app
+    from role_warmup import RoleContentCache, FallbackText, role_combinations
+
+    cache = RoleContentCache(tmp_path / 'cache.json', 'v1')
+    cache.put(('kpi_activities', 'Vision', 10, 'Associate'), FallbackText('- local'))
+    cache.put(('kpi_activities', 'Vision', 10, 'Manager'), '- from AI')
+    assert len(RoleContentCache(tmp_path / 'cache.json', 'v1')) == 0
+    assert cache.flush() == 1 and cache.flush() == 0
+    assert len(RoleContentCache(tmp_path / 'cache.json', 'v1')) == 1
+    # Writers sharing the file (e.g. shard processes) merge instead of overwriting each other
+    other = RoleContentCache(tmp_path / 'cache.json', 'v1')
+    cache.put(('kpi_activities', 'Vision', 10, 'Lead'), '- lead')
+    other.put(('kpi_activities', 'Vision', 10, 'Director'), '- director')
+    cache.flush()
+    other.flush()
+    assert len(RoleContentCache(tmp_path / 'cache.json', 'v1')) == 3
+    assert not list(tmp_path.glob('*.tmp'))
+    assert len(RoleContentCache(tmp_path / 'cache.json', 'v2')) == 0
+
+    generator = stub_generator()
+    status = generator.warm_up_roles().run()
+    combos = len(role_combinations(generator.job_roles))
+    assert status['status'] == 'ready' and status['done'] == combos and status['errors'] == 0
+    calls = generator.ai_helper.calls
+    assert calls > 0
+
+    later = stub_generator()
+    data = later.generate_employee_data({'name': 'New Hire', 'job_title': 'Marketing Associate',
+                                         'team': 'Marketing', 'career_level': 'Associate'})
+    assert later.ai_helper.calls == 0 and data['job_description']
+    plan = later.plan_batch([{'name': 'New Hire', 'job_title': 'Marketing Associate', 'team': 'Marketing',
+                              'career_level': 'Associate'}], ['confirmation'])
+    assert not plan.units
+
+    server, base_url = fake_openai_server(latency='fixed:0', completion_tokens='fixed:60')
+    monkeypatch.setenv('HR_ROLE_CACHE_FILE', str(tmp_path / 'web-cache.json'))
+    monkeypatch.setattr(hr_app, '_role_cache', None)
+    monkeypatch.setattr(hr_app, 'DEMO_MODE', False)
+    monkeypatch.setattr(hr_app, '_openai_client', openai.OpenAI(api_key='fake', base_url=base_url))
+    warm_up = hr_app.warm_up_roles()
+    monkeypatch.setattr(hr_app, 'WARMUP', warm_up)
+    assert hr_app.app.test_client().get('/health/ready').status_code == 503
+    warm_up.start().join(30)
+    warmed = server.state.snapshot()['requests']
+    response = hr_app.app.test_client().post('/generate-documents', json={
+        'employeeName': 'Test Employee', 'jobTitle': 'Associate', 'team': 'Marketing',
+        'careerLevel': 'Associate', 'salary': 'RM 5000', 'startDate': '2025-03-15',
+        'reportingTo': 'Manager', 'workLocation': 'Remote', 'employeeId': 'TEST123',
+        'jobDescription': 'Test', 'documents': ['roles']
+    })
+    assert response.status_code == 200 and server.state.snapshot()['requests'] == warmed
+    health = hr_app.app.test_client().get('/health/ready')
+    assert warmed == combos and health.status_code == 200 and health.get_json()['warmup']['done'] == combos
+
+def test_job_description_similarity_cache(fake_openai_server):
+    """Trivially different job titles reuse one generated description; different roles still call the model"""
+    from ai_helper import AIHelper
+    from similarity_cache import is_abbreviation
+
+    assert is_abbreviation('mktg', 'marketing') and not is_abbreviation('design', 'marketing')
+    server, base_url = fake_openai_server(latency='fixed:0', completion_tokens='fixed:40')
+    helper = AIHelper(api_key='fake', base_url=base_url)
+    duties = ["Content creation", "Social media management"]
+    first = helper.generate_job_description("Marketing Associate", "Marketing", "Associate", "Co", duties)
+    for variant in ("Associate, Marketing", "Mktg Associate"):
+        assert helper.generate_job_description(variant, "Marketing", "Associate", "Co", duties) == first
+    assert server.state.snapshot()['requests'] == 1
+    helper.generate_job_description("Design Associate", "Marketing", "Associate", "Co", duties)
+    helper.generate_job_description("Marketing Associate", "Marketing", "Manager", "Co", duties)
+    assert server.state.snapshot()['requests'] == 3
+    stats = helper.get_usage_stats()['job_description_similarity']
+    assert (stats['lookups'], stats['hits'], stats['hit_rate']) == (5, 2, 0.4)
+
+def test_token_budget_sizes_max_tokens(fake_openai_server):
+    """Completion budgets follow the input length, respect every model's limit and learn from usage"""
+    import math
+    from types import SimpleNamespace
+    from ai_helper import AIHelper
+    from cohort_planner import call_stats_snapshot
+    from model_routing import Route
+    from token_budget import TokenBudget, dedupe_fields, estimate_tokens, fit_context
+
+    budget = TokenBudget()
+    enhance = Route("enhance_content", "gpt-4o-mini", 4000, 0.5, 60, [])
+    assert budget.completion_budget(enhance, "Short clause.")[0] == 128
+    long_text = "The employee shall comply with company policy. " * 200
+    tokens = estimate_tokens(long_text)
+    assert budget.completion_budget(enhance, long_text) == (math.ceil(tokens * 1.15 * 1.3), tokens)
+    # A gpt-4 fallback caps the budget at gpt-4's output limit
+    document = Route("document.contract", "gpt-4o-mini", 8000, 0.3, 60, ["gpt-4"])
+    assert budget.completion_budget(document, long_text * 10)[0] == 4096
+
+    def reply(completion_tokens, finish_reason):
+        return SimpleNamespace(usage=SimpleNamespace(completion_tokens=completion_tokens),
+                               choices=[SimpleNamespace(finish_reason=finish_reason)])
+
+    budget.record("enhance_content", 100, 150, reply(100, "stop"))
+    assert abs(budget.ratio("enhance_content") - 1.12) < 1e-9
+    budget.record("enhance_content", 100, 150, reply(150, "length"))
+    assert abs(budget.ratio("enhance_content") - 2.25) < 1e-9
+    seeded = TokenBudget()
+    seeded.seed({"document.contract": {"budget_content_tokens": 1000, "budget_actual_tokens": 900}})
+    assert seeded.ratio("document.roles") == 0.9
+
+    duties = "Own the quarterly marketing plan and campaigns"
+    fields = {"Name": "Ada", "Job Description": duties, "Salary": ""}
+    assert dedupe_fields(fields, f"Responsibilities: {duties}") == "- Name: Ada"
+    validate = Route("validate_document", "gpt-4o", 2000, 0.3, 60, ["gpt-4"])
+    trimmed = fit_context(long_text * 10, validate, 2200)
+    assert "[...]" in trimmed and estimate_tokens(trimmed) <= 8192 - 2200
+
+    _, base_url = fake_openai_server(latency='fixed:0', completion_tokens='fixed:40')
+    helper = AIHelper(api_key='fake', base_url=base_url)
+    before = call_stats_snapshot().get('validate_document', {}).get('budget_actual_tokens', 0)
+    helper.validate_document(long_text, 'completeness')
+    assert call_stats_snapshot()['validate_document']['budget_actual_tokens'] == before + 40
+
 def show_system_overview():
     """Show system overview and capabilities"""
     print("🚀 HR Automation System Overview")
@@ -175,7 +932,7 @@ def show_system_overview():
     print("• Interactive mode: python scripts/generate-documents.py --interactive")
     print("• Quick generation: python scripts/generate-documents.py --employee 'John Doe' --role 'Marketing Associate'")
     print("• Batch processing: python scripts/generate-documents.py --batch sample_employees.csv")
-    print("• PDF conversion: python scripts/pdf-converter.py output/employee_name/")
+    print("• PDF conversion: python scripts/pdf-converter.py output/<ab>/<cd>/<employee_id>/")
     
     print("\n🤖 AI Integration:")
     print("• Dynamic job description generation")